@@ -29,15 +29,16 @@
     COMPANY_CAP,
     REPO_ROOT,
     VALID_TRANSITIONS,
+    FieldEdit,
     check_company_cap,
     days_until,
     get_deadline,
     get_effort,
     get_score,
+    last_touched_edit,
     load_entries,
     load_profile,
-    update_last_touched,
-    update_yaml_field,
+    write_field_edits,
 )
 
 # Map target status to timeline field to set
@@ -118,23 +119,13 @@ def advance_entry(filepath, entry_id: str, target_status: str, reason: str | Non
     current_data = _yaml.safe_load(content) or {}
     from_status = current_data.get("status", "?")
 
-    # Update status
-    content = update_yaml_field(content, "status", target_status)
-
-    # Update last_touched
-    content = update_last_touched(content)
-
-    # Update timeline field if applicable
+    # Status, last_touched and the timeline field are written as one edit
+    edits = [FieldEdit("status", target_status), last_touched_edit()]
     tl_field = STATUS_TIMELINE_FIELD.get(target_status)
     if tl_field:
-        try:
-            content = update_yaml_field(
-                content, tl_field, f"'{today_str}'", nested=True,
-            )
-        except ValueError:
-            pass  # Field may not exist in this entry
-
-    filepath.write_text(content)
+        # Field may not exist in this entry
+        edits.append(FieldEdit(tl_field, f"'{today_str}'", nested=True, optional=True))
+    write_field_edits(filepath, edits, content=content)
 
     # Log signal-action for audit trail
     try:
@@ -170,18 +170,14 @@ def extract_text_from_html(html: str) -> str:
 
 def fetch_page_text(url: str) -> str | None:
     """Fetch a URL and extract readable text. Returns None on failure."""
-    import urllib.error
-    import urllib.request
+    import http_client
 
     try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; application-pipeline/1.0)",
-                "Accept": "text/html,application/xhtml+xml",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        headers = {
+            "User-Agent": "Mozilla/5.0 (compatible; application-pipeline/1.0)",
+            "Accept": "text/html,application/xhtml+xml",
+        }
+        with http_client.request(url, headers=headers, timeout=15) as resp:
             content_type = resp.headers.get("Content-Type", "")
             if "html" not in content_type.lower() and "text" not in content_type.lower():
                 return None
@@ -0,0 +1,72 @@
+"""Per-board manifest of fetched posting details.
+
+fetch_greenhouse_jobs lists a board (one request) and then fetches the
+detail page of every posting that passes the title filter, on every scan.
+Most of those postings are unchanged since the previous scan. BoardManifest
+remembers, per board, each posting's ``updated_at``, a hash of its listing
+record and the description taken from its detail page. A posting whose
+listing hash is unchanged reuses the stored description, so a quiet board
+costs only its list request.
+
+Manifests live in CACHE_DIR/ats-manifests, one pickle per portal and board,
+and only keep postings that were still listed on the last scan. Like the
+other caches they are derived data: an unreadable manifest is treated as
+empty and write failures are ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+import pipeline_entry_cache as _entry_cache
+
+MANIFEST_DIR = _entry_cache.CACHE_DIR / "ats-manifests"
+
+
+def posting_fingerprint(listing: dict) -> str:
+    """Hash of a posting's listing record; any edit changes updated_at and so the hash."""
+    encoded = json.dumps(listing, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class BoardManifest:
+    """Stored details for one board: ``{job_id: (updated_at, fingerprint, description)}``."""
+
+    def __init__(self, portal: str, board: str, directory: Path | None = None):
+        self.path = (directory or MANIFEST_DIR) / f"{portal}--{board}.pickle"
+        self._stored: dict[str, tuple] = _entry_cache._read_pickle(self.path) or {}
+        self._current: dict[str, tuple] = {}
+
+    def lookup(self, job_id: str, fingerprint: str) -> str | None:
+        """The stored description when the posting is unchanged, else None."""
+        record = self._stored.get(job_id)
+        if record is None or record[1] != fingerprint:
+            return None
+        self._current[job_id] = record
+        return record[2]
+
+    def record(self, job_id: str, updated_at: str, fingerprint: str, description: str) -> None:
+        """Store a freshly fetched description."""
+        self._current[job_id] = (updated_at, fingerprint, description)
+
+    def save(self, listed: Iterable[str]) -> None:
+        """Write the manifest, keeping only postings in *listed* (the board's current ids).
+
+        Postings listed but not looked up this scan (e.g. filtered out by
+        title here but fetched by another caller) keep their stored record.
+        """
+        manifest = {}
+        for job_id in listed:
+            record = self._current.get(job_id) or self._stored.get(job_id)
+            if record is not None:
+                manifest[job_id] = record
+        if manifest == self._stored:
+            return
+        try:
+            _entry_cache._write_pickle(self.path, manifest)
+        except OSError:
+            pass
+        self._stored = manifest
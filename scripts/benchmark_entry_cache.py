@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Benchmark load_entries with and without the parsed-entry cache.
+
+Builds a synthetic pipeline directory of N entries (cloned from the real
+tree, with unique ids) in a temp dir and times four passes:
+
+    uncached  — load_entries(use_cache=False), the historical behaviour
+    parallel  — uncached, parallel=True (libyaml loader + process pool)
+    cold      — first cached load (parses everything and writes the cache)
+    warm      — second cached load (served from the cache)
+
+Usage:
+    python scripts/benchmark_entry_cache.py                 # 2k and 20k entries
+    python scripts/benchmark_entry_cache.py --sizes 500 2000
+    python scripts/benchmark_entry_cache.py --real          # the real tree, in place
+    python scripts/benchmark_entry_cache.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pipeline_repository as _repository
+from pipeline_entry_cache import EntryCache
+from pipeline_lib import ALL_PIPELINE_DIRS_WITH_POOL, load_entries
+
+
+def _source_files() -> list[Path]:
+    files = []
+    for pipeline_dir in ALL_PIPELINE_DIRS_WITH_POOL:
+        if pipeline_dir.exists():
+            files.extend(p for p in sorted(pipeline_dir.glob("*.yaml")) if not p.name.startswith("_"))
+    return files
+
+
+def build_fixture(target_dir: Path, count: int, sources: list[Path]) -> None:
+    """Populate target_dir with `count` entry files cloned from sources."""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        src = sources[i % len(sources)]
+        shutil.copyfile(src, target_dir / f"{src.stem}-bench{i:05d}.yaml")
+
+
+def _timed(fn) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, len(result)
+
+
+def run_benchmark(count: int, sources: list[Path]) -> dict:
+    """Time uncached, cold-cache and warm-cache loads of `count` entries.
+
+    The cold and warm passes also report the cache hits and misses they
+    caused (``cold_hits``/``cold_misses``, ``warm_hits``/``warm_misses``).
+    """
+    with tempfile.TemporaryDirectory(prefix="entry-cache-bench-") as tmp:
+        tmp_path = Path(tmp)
+        entries_dir = tmp_path / "entries"
+        build_fixture(entries_dir, count, sources)
+        cache_path = tmp_path / "entries.pickle"
+        counts: list[tuple[int, int]] = []
+
+        def cached_load():
+            import pipeline_entry_cache
+
+            original = pipeline_entry_cache.ENTRY_CACHE_PATH
+            pipeline_entry_cache.ENTRY_CACHE_PATH = cache_path
+            try:
+                cache = _repository.get_repository().cache
+                hits, misses = cache.hits, cache.misses
+                entries = load_entries(dirs=[entries_dir])
+                counts.append((cache.hits - hits, cache.misses - misses))
+                return entries
+            finally:
+                pipeline_entry_cache.ENTRY_CACHE_PATH = original
+
+        uncached_s, loaded = _timed(lambda: load_entries(dirs=[entries_dir], use_cache=False))
+        parallel_s, _ = _timed(lambda: load_entries(dirs=[entries_dir], use_cache=False, parallel=True))
+        cold_s, _ = _timed(cached_load)
+        warm_s, _ = _timed(cached_load)
+        cache_bytes = cache_path.stat().st_size if cache_path.exists() else 0
+        return {
+            "entries": loaded,
+            "uncached_s": round(uncached_s, 3),
+            "parallel_s": round(parallel_s, 3),
+            "cold_s": round(cold_s, 3),
+            "warm_s": round(warm_s, 3),
+            "speedup": round(uncached_s / warm_s, 1) if warm_s else None,
+            "cache_bytes": cache_bytes,
+            "cached_records": len(EntryCache(cache_path)),
+            "cold_hits": counts[0][0],
+            "cold_misses": counts[0][1],
+            "warm_hits": counts[1][0],
+            "warm_misses": counts[1][1],
+        }
+
+
+def run_real_benchmark() -> dict:
+    """Time serial vs parallel uncached loads of the real tree and compare results."""
+    dirs = list(ALL_PIPELINE_DIRS_WITH_POOL)
+    start = time.perf_counter()
+    serial = load_entries(dirs=dirs, use_cache=False)
+    serial_s = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = load_entries(dirs=dirs, use_cache=False, parallel=True)
+    parallel_s = time.perf_counter() - start
+    return {
+        "entries": len(serial),
+        "uncached_s": round(serial_s, 3),
+        "parallel_s": round(parallel_s, 3),
+        "speedup": round(serial_s / parallel_s, 1) if parallel_s else None,
+        "identical": serial == parallel,
+        "workers": os.cpu_count() or 1,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the parsed-entry cache")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000],
+                        help="Entry counts to benchmark (default: 2000 20000)")
+    parser.add_argument("--real", action="store_true",
+                        help="Benchmark serial vs parallel parsing of the real tree instead")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    if args.real:
+        result = run_real_benchmark()
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(
+                f"{result['entries']} entries, {result['workers']} worker(s): serial {result['uncached_s']:.2f}s, "
+                f"parallel {result['parallel_s']:.2f}s ({result['speedup']}x), identical={result['identical']}"
+            )
+        return 0
+
+    sources = _source_files()
+    if not sources:
+        print("No pipeline entries found to clone.", file=sys.stderr)
+        return 1
+
+    results = [run_benchmark(n, sources) for n in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'entries':>8}  {'uncached':>9}  {'parallel':>9}  {'cold':>8}  {'warm':>8}  {'speedup':>8}  {'cache':>10}")
+    for r in results:
+        print(
+            f"{r['entries']:>8}  {r['uncached_s']:>8.2f}s  {r['parallel_s']:>8.2f}s  {r['cold_s']:>7.2f}s  "
+            f"{r['warm_s']:>7.2f}s  {r['speedup']:>7}x  {r['cache_bytes'] / 1e6:>8.1f}MB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Benchmark per-call urlopen against the pooled keep-alive client.
+
+Starts a local HTTPS stand-in (self-signed certificate for 127.0.0.1,
+HTTP/1.1 keep-alive, gzip when asked) serving a board-sized JSON body, then
+issues the same number of sequential GETs two ways:
+
+    urlopen — urllib.request.urlopen per request, the historical behaviour
+              (new TCP connection and TLS handshake every time)
+    pooled  — http_client.HTTPClient, one connection reused throughout
+
+and reports requests per second for each, plus the TCP connections the
+stand-in accepted per pass and the pooled client's opened/reused counts.
+
+Usage:
+    python scripts/benchmark_http_client.py                   # 200 requests over HTTPS
+    python scripts/benchmark_http_client.py --requests 1000
+    python scripts/benchmark_http_client.py --plain           # HTTP, no TLS
+    python scripts/benchmark_http_client.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import gzip
+import ipaddress
+import json
+import ssl
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from http_client import HTTPClient
+
+BODY = json.dumps({
+    "jobs": [{"id": i, "title": f"Software Engineer {i}", "location": {"name": "Remote"}} for i in range(200)]
+}).encode("utf-8")
+
+
+class _BoardHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment, as production servers do; split
+    # small writes on a kept-alive connection stall on delayed ACKs.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        body = BODY
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(BODY, compresslevel=6)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def write_self_signed(directory: Path) -> tuple[Path, Path]:
+    """Write a certificate and key for 127.0.0.1 into *directory*."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.IPv4Address("127.0.0.1"))]), False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    return cert_path, key_path
+
+
+def _requests_per_second(fetch, url: str, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        if fetch(url) != BODY:
+            raise RuntimeError("stand-in returned an unexpected body")
+    return count / (time.perf_counter() - start)
+
+
+def run_benchmark(count: int, tls: bool = True) -> dict:
+    """Time `count` sequential GETs with urlopen and with the pooled client."""
+    with tempfile.TemporaryDirectory(prefix="http-client-bench-") as tmp:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _BoardHandler)
+        server.daemon_threads = True
+        server.connections = set()
+        client_context = None
+        if tls:
+            cert_path, key_path = write_self_signed(Path(tmp))
+            server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            server_context.load_cert_chain(cert_path, key_path)
+            server.socket = server_context.wrap_socket(server.socket, server_side=True)
+            client_context = ssl.create_default_context(cafile=str(cert_path))
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        url = f"{'https' if tls else 'http'}://127.0.0.1:{server.server_address[1]}/boards/acme/jobs"
+
+        def urlopen_get(target: str) -> bytes:
+            with urllib.request.urlopen(target, timeout=10, context=client_context) as resp:
+                return resp.read()
+
+        client = HTTPClient(ssl_context=client_context)
+        try:
+            urlopen_rps = _requests_per_second(urlopen_get, url, count)
+            urlopen_connections = len(server.connections)
+            server.connections.clear()
+            pooled_rps = _requests_per_second(lambda target: client.request(target, timeout=10).read(), url, count)
+            pooled_connections = len(server.connections)
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+    return {
+        "requests": count,
+        "scheme": "https" if tls else "http",
+        "urlopen_rps": round(urlopen_rps, 1),
+        "pooled_rps": round(pooled_rps, 1),
+        "speedup": round(pooled_rps / urlopen_rps, 1) if urlopen_rps else None,
+        "urlopen_connections": urlopen_connections,
+        "pooled_connections": pooled_connections,
+        "connections_opened": client.opened,
+        "connections_reused": client.reused,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark urlopen against the pooled HTTP client")
+    parser.add_argument("--requests", type=int, default=200, help="Sequential GETs per client (default: 200)")
+    parser.add_argument("--plain", action="store_true", help="Serve plain HTTP instead of HTTPS")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.requests, tls=not args.plain)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(
+        f"{result['requests']} {result['scheme'].upper()} GETs: urlopen {result['urlopen_rps']:.0f} req/s, "
+        f"pooled {result['pooled_rps']:.0f} req/s ({result['speedup']}x, "
+        f"{result['connections_opened']} connection(s) opened)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
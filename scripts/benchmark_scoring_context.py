@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark batch scoring with and without a shared ScoringContext.
+
+Builds N in-memory entries (cloned from the real tree, with unique ids) and
+times, per size:
+
+    context_build  — ScoringContext over all N entries (once per run)
+    cross_signals  — org-count and track-experience signals for all N
+                     entries against the shared context
+    dims           — compute_dimensions per entry with the shared context
+    dims_list      — compute_dimensions per entry given the raw list, which
+                     re-aggregates all N entries on every call (the
+                     pre-context cost)
+
+``dims`` and ``dims_list`` are timed on a sample and reported per entry: a
+flat ``dims`` column across sizes means a full run scales linearly, while
+``dims_list`` grows with N. ``identical`` checks the context's counts for
+the sampled entries against a full scan of all N entries, the per-entry
+work the context replaced. The network-graph lookup is disabled
+(PIPELINE_METRICS_SOURCE=fallback) so only scoring work is timed.
+
+Usage:
+    python scripts/benchmark_scoring_context.py               # 2k, 10k, 50k
+    python scripts/benchmark_scoring_context.py --sizes 2000 --sample 20
+    python scripts/benchmark_scoring_context.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from pipeline_lib import ALL_PIPELINE_DIRS_WITH_POOL, load_entries
+from score import _tr_track_experience, compute_dimensions, score_network_proximity
+from score_context import SUBMITTED_STATUSES, ScoringContext
+
+
+def build_entries(count: int, sources: list[dict]) -> list[dict]:
+    """Return `count` shallow clones of sources with unique ids."""
+    entries = []
+    for i in range(count):
+        entry = dict(sources[i % len(sources)])
+        entry["id"] = f"{entry.get('id', 'entry')}-bench{i:05d}"
+        entries.append(entry)
+    return entries
+
+
+def _scan_counts(entry: dict, entries: list[dict]) -> tuple[int, int]:
+    """(org count, submitted-in-track count) for *entry* by scanning *entries*."""
+    org = (entry.get("target") or {}).get("organization")
+    track = entry.get("track", "")
+    others = [e for e in entries if e.get("id") != entry.get("id")]
+    return (
+        sum(1 for e in others if org is not None and (e.get("target") or {}).get("organization") == org),
+        sum(1 for e in others if e.get("track") == track and e.get("status") in SUBMITTED_STATUSES),
+    )
+
+
+def _context_counts(entry: dict, context: ScoringContext) -> tuple[int, int]:
+    org = (entry.get("target") or {}).get("organization")
+    return (
+        context.org_count(org, entry.get("id")) if org is not None else 0,
+        context.submitted_in_track(entry.get("track", ""), entry.get("id")),
+    )
+
+
+def _per_entry(fn, entries: list[dict]) -> float:
+    start = time.perf_counter()
+    for entry in entries:
+        fn(entry)
+    return (time.perf_counter() - start) / max(1, len(entries))
+
+
+def run_benchmark(count: int, sources: list[dict], sample: int = 50) -> dict:
+    """Time context build, cross-entry signals and sampled compute_dimensions."""
+    entries = build_entries(count, sources)
+    step = max(1, count // sample)
+    sampled = entries[::step][:sample]
+
+    previous = os.environ.get("PIPELINE_METRICS_SOURCE")
+    os.environ["PIPELINE_METRICS_SOURCE"] = "fallback"
+    try:
+        start = time.perf_counter()
+        context = ScoringContext(entries)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for entry in entries:
+            score_network_proximity(entry, context)
+            _tr_track_experience(entry, context)
+        signals_s = time.perf_counter() - start
+
+        dims_s = _per_entry(lambda e: compute_dimensions(e, context), sampled)
+        dims_list_s = _per_entry(lambda e: compute_dimensions(e, entries), sampled)
+        identical = all(_context_counts(e, context) == _scan_counts(e, entries) for e in sampled)
+    finally:
+        if previous is None:
+            os.environ.pop("PIPELINE_METRICS_SOURCE", None)
+        else:
+            os.environ["PIPELINE_METRICS_SOURCE"] = previous
+
+    return {
+        "entries": count,
+        "sample": len(sampled),
+        "context_build_s": round(build_s, 4),
+        "cross_signals_s": round(signals_s, 4),
+        "dims_ms_per_entry": round(dims_s * 1000, 3),
+        "dims_list_ms_per_entry": round(dims_list_s * 1000, 3),
+        "est_run_s": round(build_s + dims_s * count, 2),
+        "est_list_run_s": round(dims_list_s * count, 2),
+        "identical": identical,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ScoringContext batch scoring")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 10000, 50000])
+    parser.add_argument("--sample", type=int, default=50, help="Entries timed per compute_dimensions column")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args(argv)
+
+    sources = load_entries(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
+    if not sources:
+        print("No pipeline entries to clone.", file=sys.stderr)
+        return 1
+
+    results = [run_benchmark(n, sources, sample=args.sample) for n in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'entries':>8s} {'build':>8s} {'signals':>8s} {'dims/e':>9s} {'list/e':>9s} "
+          f"{'est run':>9s} {'est list':>10s}  same")
+    for r in results:
+        print(f"{r['entries']:>8,d} {r['context_build_s']:>7.3f}s {r['cross_signals_s']:>7.3f}s "
+              f"{r['dims_ms_per_entry']:>7.2f}ms {r['dims_list_ms_per_entry']:>7.2f}ms "
+              f"{r['est_run_s']:>8.1f}s {r['est_list_run_s']:>9.1f}s  {'yes' if r['identical'] else 'NO'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
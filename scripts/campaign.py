@@ -627,7 +627,7 @@ def main():
     from pipeline_freshness import flush_stale_active_jobs
     flush_stale_active_jobs()
 
-    entries = load_entries(include_filepath=True)
+    entries = load_entries(include_filepath=True, header_only=True)
 
     if args.json:
         import json
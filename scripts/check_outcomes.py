@@ -31,6 +31,7 @@
     load_entries,
     load_entry_by_id,
     parse_date,
+    query_entries,
     update_last_touched,
 )
 
@@ -108,11 +109,11 @@ def infer_rejection_signal(time_to_response_days: int | None, note: str = "") ->
 
 def get_submitted_entries() -> list[dict]:
     """Load all entries with submitted or acknowledged status."""
-    entries = load_entries(
+    return query_entries(
+        status=["submitted", "acknowledged", "interview"],
         dirs=[PIPELINE_DIR_SUBMITTED],
         include_filepath=True,
     )
-    return [e for e in entries if e.get("status") in ("submitted", "acknowledged", "interview")]
 
 
 def days_since_submission(entry: dict) -> int | None:
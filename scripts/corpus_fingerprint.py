@@ -14,11 +14,12 @@
 import re
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import text_match as _text_match  # noqa: E402
 from pipeline_lib import REPO_ROOT  # noqa: E402
 from text_match import (  # noqa: E402
     compute_idf,
@@ -26,6 +27,7 @@
     cosine_similarity,
     tfidf_vector,
     tokenize,
+    vector_norm,
 )
 
 # ---------------------------------------------------------------------------
@@ -58,6 +60,10 @@ class CorpusFingerprint:
     term_count: int
     source_file_count: int
     built_at: float  # time.time() timestamp
+    # (uniform corpus vector, its key set, its norm), built on first batch use
+    _corpus_side: tuple[dict[str, float], set[str], float] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def score_description(self, description: str) -> float:
         """Compute cosine similarity between this fingerprint and a job description.
@@ -96,6 +102,51 @@ def score_description(self, description: str) -> float:
 
         return cosine_similarity(corpus_vec, desc_vec)
 
+    def score_descriptions(self, descriptions: list[str]) -> list[float]:
+        """Score many descriptions against this fingerprint in one pass.
+
+        Returns the same floats as score_description for each description.
+        With the default MIN_DF/MAX_DF_RATIO no term can pass the two-document
+        IDF filter, so score_description always takes its raw-TF fallback;
+        here the corpus side of that comparison (vector, key set, norm) is
+        built once and only the descriptions are vectorized. If the filters
+        are configured so the two-document IDF can be non-empty, each
+        description goes through score_description instead.
+        """
+        if not self.tfidf_vector:
+            return [0.0] * len(descriptions)
+        max_df = int(2 * _text_match.MAX_DF_RATIO)
+        if any(_text_match.MIN_DF <= df <= max_df for df in (1, 2)):
+            return [self.score_description(d) for d in descriptions]
+
+        corpus_tf, corpus_keys, corpus_norm = self._uniform_corpus_side()
+        scores = []
+        for description in descriptions:
+            desc_tokens = tokenize(description) if description and description.strip() else []
+            if not desc_tokens:
+                scores.append(0.0)
+                continue
+            desc_tf = compute_tf(desc_tokens)
+            # Same operations, in the same order, as cosine_similarity(corpus_tf, desc_tf)
+            shared_keys = corpus_keys & set(desc_tf)
+            if not shared_keys:
+                scores.append(0.0)
+                continue
+            dot = sum(corpus_tf[k] * desc_tf[k] for k in shared_keys)
+            desc_norm = vector_norm(desc_tf)
+            if corpus_norm == 0.0 or desc_norm == 0.0:
+                scores.append(0.0)
+                continue
+            scores.append(dot / (corpus_norm * desc_norm))
+        return scores
+
+    def _uniform_corpus_side(self) -> tuple[dict[str, float], set[str], float]:
+        if self._corpus_side is None:
+            corpus_tokens = list(self.tfidf_vector.keys())
+            corpus_tf = {t: 1.0 / len(corpus_tokens) for t in corpus_tokens}
+            self._corpus_side = (corpus_tf, set(corpus_tf), vector_norm(corpus_tf))
+        return self._corpus_side
+
 
 # ---------------------------------------------------------------------------
 # Text helpers
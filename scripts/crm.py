@@ -654,21 +654,25 @@ def main():
         return
 
     if args.wire_proximity:
-        from pipeline_lib import load_entries, load_entry_by_id, update_yaml_field
+        from pipeline_lib import FieldEdit, load_entries, load_entries_by_ids, write_field_edits_bulk
         entries = load_entries()
         suggestions = suggest_all_proximity(contacts, entries)
         if not suggestions:
             print("All entries already have matching network_proximity scores.")
             return
+        located = load_entries_by_ids([s["id"] for s in suggestions])
+        edit_sets = {}
         for s in suggestions:
-            path, entry = load_entry_by_id(s["id"])
-            if path:
-                content = path.read_text()
-                content = update_yaml_field(content, "network_proximity", str(s["suggested"]),
-                                            nested=True, parent_key="dimensions")
-                path.write_text(content)
+            if s["id"] in located:
+                path = located[s["id"]][0]
+                edit_sets[path] = [FieldEdit("network_proximity", str(s["suggested"]),
+                                             nested=True, parent_key="dimensions")]
+        failures = write_field_edits_bulk(edit_sets)
+        for s in suggestions:
+            path = located.get(s["id"], (None, None))[0]
+            if path in edit_sets and path not in failures:
                 print(f"  {s['id']}: {s['current']} → {s['suggested']}")
-        print(f"\nUpdated {len(suggestions)} entries.")
+        print(f"\nUpdated {len(edit_sets) - len(failures)} entries.")
         return
 
     if args.due:
@@ -26,7 +26,7 @@
     load_entries,
     update_last_touched,
 )
-from score import analyze_reachability
+from score import ScoringContext, analyze_reachability
 
 
 def get_cultivation_candidates(entries: list[dict], all_entries: list[dict],
@@ -35,6 +35,7 @@ def get_cultivation_candidates(entries: list[dict], all_entries: list[dict],
 
     Returns list of dicts with reachability info, sorted by gap (smallest first).
     """
+    all_entries = ScoringContext.of(all_entries)
     candidates = []
     for entry in entries:
         status = entry.get("status", "")
@@ -48,13 +48,14 @@ def _advance_built_entries(entry_ids: list[str], dry_run: bool = True) -> dict:
     if dry_run or not entry_ids:
         return {"advanced": [], "errors": []}
 
-    from pipeline_lib import load_entry_by_id
+    from pipeline_lib import load_entries_by_ids
 
     advanced = []
     errors = []
 
+    loaded = load_entries_by_ids(entry_ids)
     for eid in entry_ids:
-        filepath, entry = load_entry_by_id(eid)
+        filepath, entry = loaded.get(eid, (None, None))
         if not filepath or not entry:
             continue
 
@@ -99,11 +100,12 @@ def _log_follow_up_actions(entry_ids: list[str], dry_run: bool = True) -> int:
 
     from datetime import date
 
-    from pipeline_lib import load_entry_by_id
+    from pipeline_lib import load_entries_by_ids
 
     logged = 0
+    loaded = load_entries_by_ids(entry_ids)
     for eid in entry_ids:
-        filepath, entry = load_entry_by_id(eid)
+        filepath, entry = loaded.get(eid, (None, None))
         if not filepath or not entry:
             continue
 
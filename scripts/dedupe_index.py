@@ -0,0 +1,148 @@
+"""Persistent dedupe index for job sourcing.
+
+source_jobs, discover_jobs, scan_orchestrator and ingest_top_roles used to
+load every pipeline entry on each scan just to collect ids and application
+URLs. DedupeIndex reads the dedupe keys that pipeline_index keeps per entry
+file instead: the entry id, its normalized application URL and a
+(company, title) key (pipeline_index.extract_dedupe_keys). The SQLite index
+refreshes itself incrementally, so entries written, edited or moved between
+directories are picked up by a stat sweep, and only changed files are
+re-read.
+
+Keys are held in a set, so checking a sourced job is a constant-time
+membership test. A directory with at least BLOOM_MIN_KEYS keys (the
+historical closed set) is fronted by a Bloom filter instead of a set: a
+negative answer is final, and a positive one is confirmed against SQLite,
+so membership stays exact. The filter is persisted and only rebuilt when
+that directory's rows change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable
+from pathlib import Path
+
+import pipeline_entry_cache as _entry_cache
+import pipeline_index as _index
+
+BLOOM_PATH = _entry_cache.CACHE_DIR / "dedupe-bloom.pickle"
+# Directories with at least this many keys are held in a Bloom filter.
+BLOOM_MIN_KEYS = 20_000
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+BLOOM_DIR_NAMES = ("closed",)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (blake2b double hashing)."""
+
+    def __init__(self, capacity: int, false_positive_rate: float = BLOOM_FALSE_POSITIVE_RATE):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+def job_keys(job: dict) -> list[str]:
+    """Dedupe keys of a sourced job: normalized URL and company + title."""
+    keys = [
+        _index.normalize_url(job.get("url") or ""),
+        _index.title_key(job.get("company_display") or job.get("company") or "", job.get("title") or ""),
+    ]
+    return [key for key in keys if key]
+
+
+def _dir_signature(conn, pipeline_dir: Path) -> tuple:
+    """Changes whenever a file in *pipeline_dir* is added, removed or rewritten."""
+    row = conn.execute(
+        "SELECT COUNT(*), MAX(mtime_ns), TOTAL(mtime_ns), TOTAL(size) FROM entries WHERE dir_path = ?",
+        (str(pipeline_dir),),
+    ).fetchone()
+    return tuple(row)
+
+
+class DedupeIndex:
+    """Membership test over the dedupe keys of every entry in *dirs*.
+
+    ``key in index`` accepts entry ids, ``url:``/``title:`` keys and raw
+    application URLs (normalized on the way in), so it drops in wherever
+    the old set of ids and URLs was used.
+    """
+
+    def __init__(
+        self,
+        dirs: Iterable[Path] | None = None,
+        *,
+        path: Path | None = None,
+        bloom_path: Path | None = None,
+        bloom_min_keys: int = BLOOM_MIN_KEYS,
+    ):
+        self.path = path
+        self.dirs = list(dirs or _index.DEFAULT_INDEX_DIRS)
+        self._keys: set[str] = set()
+        self._blooms: list[tuple[Path, BloomFilter]] = []
+        bloom_path = bloom_path or BLOOM_PATH
+        stored = _entry_cache._read_pickle(bloom_path) or {}
+        blooms = {}
+        conn = _index.connect(path)
+        try:
+            _index.refresh_index(conn, self.dirs)
+            for pipeline_dir in self.dirs:
+                keys = conn.execute(
+                    "SELECT key FROM dedupe_keys WHERE dir_path = ?", (str(pipeline_dir),)
+                )
+                if pipeline_dir.name not in BLOOM_DIR_NAMES:
+                    self._keys.update(row["key"] for row in keys)
+                    continue
+                signature = _dir_signature(conn, pipeline_dir)
+                cached = stored.get(str(pipeline_dir))
+                if cached and cached[0] == signature:
+                    bloom = cached[1]
+                else:
+                    keys = [row["key"] for row in keys]
+                    if len(keys) < bloom_min_keys:
+                        self._keys.update(keys)
+                        continue
+                    bloom = BloomFilter(len(keys))
+                    for key in keys:
+                        bloom.add(key)
+                blooms[str(pipeline_dir)] = (signature, bloom)
+                self._blooms.append((pipeline_dir, bloom))
+        finally:
+            conn.close()
+        if blooms.keys() != stored.keys() or any(stored[d][0] != blooms[d][0] for d in blooms):
+            try:
+                _entry_cache._write_pickle(bloom_path, blooms)
+            except OSError:
+                pass
+
+    def _confirm(self, key: str, pipeline_dir: Path) -> bool:
+        conn = _index.connect(self.path)
+        try:
+            return conn.execute(
+                "SELECT 1 FROM dedupe_keys WHERE key = ? AND dir_path = ? LIMIT 1", (key, str(pipeline_dir))
+            ).fetchone() is not None
+        finally:
+            conn.close()
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str) or not key:
+            return False
+        if "://" in key:
+            key = _index.normalize_url(key) or key
+        if key in self._keys:
+            return True
+        return any(key in bloom and self._confirm(key, pipeline_dir) for pipeline_dir, bloom in self._blooms)
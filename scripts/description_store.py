@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Content-addressed blob store for posting descriptions.
+
+``target.description`` HTML is several kilobytes per entry, frequently
+repeated company boilerplate, and is rewritten every time an unrelated field
+of the entry changes. This module moves it out of the entry YAML into
+gzip-compressed blobs under ``pipeline/blobs/``, named by the SHA-256 of the
+text. The entry keeps only ``target.description_ref: sha256:<hex>``.
+
+Readers do not need to know: pipeline_entry_cache.parse_entry_file (and so
+load_entries / query_entries) attaches the resolved text back as a lazily
+loaded ``target.description``, and resolve_description() covers entries
+loaded some other way.
+
+Usage:
+    python scripts/description_store.py --stats
+    python scripts/description_store.py --migrate --dry-run
+    python scripts/description_store.py --migrate
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+from pipeline_entry_fields import LazyDict, _cut_child_block, _top_level_blocks
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BLOB_DIR = REPO_ROOT / "pipeline" / "blobs"
+
+REF_KEY = "description_ref"
+REF_PREFIX = "sha256:"
+
+
+def description_ref(text: str) -> str:
+    """Return the content address of a description."""
+    return REF_PREFIX + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def blob_path(ref: str, blob_dir: Path | None = None) -> Path:
+    """Return the blob file for *ref*; raises ValueError on a malformed ref."""
+    digest = ref[len(REF_PREFIX):] if isinstance(ref, str) and ref.startswith(REF_PREFIX) else ""
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise ValueError(f"Invalid description reference: {ref!r}")
+    return (blob_dir or BLOB_DIR) / digest[:2] / f"{digest}.gz"
+
+
+def store_description(text: str, blob_dir: Path | None = None) -> tuple[str, int]:
+    """Store *text* and return ``(ref, bytes_written)``.
+
+    Identical descriptions share one blob, so ``bytes_written`` is 0 when the
+    blob already exists.
+    """
+    ref = description_ref(text)
+    path = blob_path(ref, blob_dir)
+    if path.exists():
+        return ref, 0
+    # mtime=0 keeps the blob bytes a pure function of the text.
+    payload = gzip.compress(text.encode("utf-8"), compresslevel=9, mtime=0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp", prefix=f".{path.name}.")
+    try:
+        with open(fd, "wb") as f:
+            f.write(payload)
+        Path(tmp_path).replace(path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return ref, len(payload)
+
+
+def load_description(ref: str, blob_dir: Path | None = None) -> str:
+    """Return the description stored under *ref*.
+
+    Raises FileNotFoundError if the blob is missing and ValueError if the ref
+    is malformed or the blob does not match its address.
+    """
+    path = blob_path(ref, blob_dir)
+    text = gzip.decompress(path.read_bytes()).decode("utf-8")
+    if description_ref(text) != ref:
+        raise ValueError(f"Description blob {path} does not match {ref}")
+    return text
+
+
+def resolve_description(entry: dict) -> str:
+    """Return an entry's posting description, inline or from the blob store.
+
+    Returns "" when the entry has neither, or its blob cannot be read.
+    """
+    target = entry.get("target") if isinstance(entry, dict) else None
+    if not isinstance(target, dict):
+        return ""
+    text = target.get("description")
+    if text:
+        return text
+    ref = target.get(REF_KEY)
+    if not ref:
+        return ""
+    try:
+        return load_description(ref)
+    except (OSError, ValueError, EOFError):
+        return ""
+
+
+def attach_description(data: object) -> object:
+    """Expose a blob-backed ``target.description`` on a parsed entry.
+
+    The description is resolved on first access and, being derived from
+    ``description_ref``, is not written back when the entry is dumped.
+    """
+    if not isinstance(data, dict):
+        return data
+    target = data.get("target")
+    if not isinstance(target, dict) or not target.get(REF_KEY) or "description" in target:
+        return data
+    ref = target[REF_KEY]
+
+    def load():
+        try:
+            return load_description(ref)
+        except (OSError, ValueError, EOFError):
+            return ""
+
+    if isinstance(target, LazyDict):
+        target.add_loader("description", load, derived=True)
+    else:
+        data["target"] = LazyDict(target, {"description": load}, derived=("description",))
+    return data
+
+
+def externalize_description(entry: dict, blob_dir: Path | None = None) -> int:
+    """Move ``target.description`` of an in-memory entry into the blob store.
+
+    The ``description_ref`` takes the description's key position. Returns the
+    number of blob bytes written (0 if nothing was stored or the blob existed).
+    """
+    target = entry.get("target")
+    if not isinstance(target, dict):
+        return 0
+    text = target.get("description")
+    if not isinstance(text, str) or not text:
+        return 0
+    ref, written = store_description(text, blob_dir)
+    entry["target"] = {
+        (REF_KEY if key == "description" else key): (ref if key == "description" else value)
+        for key, value in target.items()
+    }
+    return written
+
+
+def migrate_text(text: str, blob_dir: Path | None = None) -> tuple[str, int] | None:
+    """Rewrite one entry's YAML text to reference its description by hash.
+
+    Only the description lines are replaced, so comments, quoting and key
+    order elsewhere are preserved. Returns ``(new_text, blob_bytes_written)``,
+    or None when there is nothing to migrate or the text cannot be edited
+    safely (the result is verified to parse to the same entry).
+    """
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError:
+        return None
+    target = data.get("target") if isinstance(data, dict) else None
+    if not isinstance(target, dict):
+        return None
+    description = target.get("description")
+    if not isinstance(description, str) or not description:
+        return None
+
+    ref = description_ref(description)
+    new_blocks = []
+    replaced = False
+    for key, block in _top_level_blocks(text):
+        if key == "target" and not replaced:
+            block, replaced = _cut_child_block(block, "description", f"{REF_KEY}: {ref}")
+        new_blocks.append(block)
+    if not replaced:
+        return None
+    new_text = _leading_text(text) + "".join(new_blocks)
+
+    expected = dict(data)
+    expected["target"] = {
+        (REF_KEY if k == "description" else k): (ref if k == "description" else v) for k, v in target.items()
+    }
+    try:
+        if yaml.safe_load(new_text) != expected:
+            return None
+    except yaml.YAMLError:
+        return None
+    _, written = store_description(description, blob_dir)
+    return new_text, written
+
+
+def _leading_text(text: str) -> str:
+    """Return the comment/blank lines before the first top-level key."""
+    blocks = _top_level_blocks(text)
+    return text[:text.index(blocks[0][1])] if blocks else text
+
+
+def migrate_entries(
+    dirs: list[Path] | None = None,
+    *,
+    dry_run: bool = False,
+    blob_dir: Path | None = None,
+) -> dict:
+    """Externalize inline descriptions for every entry file in *dirs*.
+
+    Returns counters: ``scanned``, ``migrated``, ``skipped`` (could not be
+    rewritten safely), ``inline_bytes`` (YAML bytes removed), ``blob_bytes``
+    (new compressed blob bytes), ``blobs`` (distinct descriptions) and
+    ``saved_bytes`` (net). A dry run computes the same numbers without
+    writing anything.
+    """
+    from pipeline_lib import ALL_PIPELINE_DIRS_WITH_POOL, atomic_write
+    from pipeline_segments import entry_paths, read_entry_text
+
+    stats = {"scanned": 0, "migrated": 0, "skipped": 0, "inline_bytes": 0, "blob_bytes": 0, "blobs": 0}
+    seen_refs: set[str] = set()
+    dry_blob_dir = None
+    if dry_run:
+        dry_tmp = tempfile.TemporaryDirectory(prefix="description-blobs-")
+        dry_blob_dir = Path(dry_tmp.name)
+    try:
+        for pipeline_dir in dirs or ALL_PIPELINE_DIRS_WITH_POOL:
+            if not pipeline_dir.exists():
+                continue
+            for filepath in entry_paths(pipeline_dir):
+                stats["scanned"] += 1
+                text = read_entry_text(filepath)
+                if "description:" not in text:
+                    continue
+                result = migrate_text(text, dry_blob_dir or blob_dir)
+                if result is None:
+                    if _has_inline_description(text):
+                        stats["skipped"] += 1
+                    continue
+                new_text, written = result
+                ref = _ref_in(new_text)
+                if dry_run and written and blob_path(ref, blob_dir).exists():
+                    # Count what a real run would add to the real store.
+                    written = 0
+                if ref not in seen_refs:
+                    seen_refs.add(ref)
+                    stats["blobs"] += 1
+                stats["migrated"] += 1
+                stats["blob_bytes"] += written
+                stats["inline_bytes"] += len(text.encode("utf-8")) - len(new_text.encode("utf-8"))
+                if not dry_run:
+                    atomic_write(filepath, new_text)
+    finally:
+        if dry_run:
+            dry_tmp.cleanup()
+    stats["saved_bytes"] = stats["inline_bytes"] - stats["blob_bytes"]
+    return stats
+
+
+def _ref_in(text: str) -> str:
+    return text.split(f"{REF_KEY}: ", 1)[1].split("\n", 1)[0].strip()
+
+
+def _has_inline_description(text: str) -> bool:
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError:
+        return False
+    target = data.get("target") if isinstance(data, dict) else None
+    return isinstance(target, dict) and bool(target.get("description"))
+
+
+def store_stats(blob_dir: Path | None = None) -> dict:
+    """Return blob count and total compressed bytes in the store."""
+    root = blob_dir or BLOB_DIR
+    blobs = list(root.glob("*/*.gz")) if root.exists() else []
+    return {"blobs": len(blobs), "bytes": sum(p.stat().st_size for p in blobs)}
+
+
+def _fmt_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024 or unit == "MB":
+            return f"{n:,.0f} {unit}" if unit == "B" else f"{n:,.1f} {unit}"
+        n /= 1024
+    return f"{n:,.1f} MB"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Content-addressed storage for posting descriptions")
+    parser.add_argument("--migrate", action="store_true",
+                        help="Move inline target.description text into the blob store")
+    parser.add_argument("--dry-run", action="store_true", help="With --migrate: report without writing")
+    parser.add_argument("--stats", action="store_true", help="Show blob store size")
+    args = parser.parse_args(argv)
+
+    if args.migrate:
+        stats = migrate_entries(dry_run=args.dry_run)
+        label = "Would migrate" if args.dry_run else "Migrated"
+        print(f"{label} {stats['migrated']} of {stats['scanned']} entries "
+              f"({stats['blobs']} distinct descriptions, {stats['skipped']} skipped)")
+        print(f"  Inline YAML removed: {_fmt_bytes(stats['inline_bytes'])}")
+        print(f"  Blob bytes added:    {_fmt_bytes(stats['blob_bytes'])}")
+        print(f"  Net bytes saved:     {_fmt_bytes(stats['saved_bytes'])}")
+        return 0
+
+    stats = store_stats()
+    print(f"Description blobs: {stats['blobs']} ({_fmt_bytes(stats['bytes'])}) in {BLOB_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,13 +25,13 @@
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+from http_cache import report as http_cache_report
 from ingest_top_roles import pre_score
 from pipeline_lib import (
-    ALL_PIPELINE_DIRS_WITH_POOL,
     http_request_with_retry,
-    load_entries,
 )
 from source_jobs import (
+    _get_existing_ids,
     _slugify,
     create_pipeline_entry,
     deduplicate,
@@ -109,6 +109,7 @@ def fetch_remotive(search: str, category: str | None = None) -> list[dict]:
         url,
         headers={"User-Agent": "application-pipeline/1.0"},
         timeout=15,
+        cached=True,
     )
     if not raw:
         return []
@@ -156,6 +157,7 @@ def fetch_himalayas(keywords: str) -> list[dict]:
         url,
         headers={"User-Agent": "application-pipeline/1.0"},
         timeout=15,
+        cached=True,
     )
     if not raw:
         return []
@@ -207,6 +209,7 @@ def fetch_themuse(category: str, page: int = 0) -> list[dict]:
         url,
         headers={"User-Agent": "application-pipeline/1.0"},
         timeout=15,
+        cached=True,
     )
     if not raw:
         return []
@@ -342,19 +345,6 @@ def discover_for_position(
     return results
 
 
-def _get_existing_ids() -> set[str]:
-    """Get IDs and application URLs of existing pipeline entries."""
-    entries = load_entries(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
-    ids = set()
-    for e in entries:
-        if e.get("id"):
-            ids.add(e["id"])
-        target = e.get("target", {})
-        if isinstance(target, dict) and target.get("application_url"):
-            ids.add(target["application_url"])
-    return ids
-
-
 def create_discovery_entry(job: dict) -> tuple[str, dict]:
     """Create a pipeline entry dict tailored for discovery results.
 
@@ -433,6 +423,10 @@ def main():
         "--apis", type=str, default="",
         help="Comma-separated list of APIs to query (default: all enabled in config)",
     )
+    parser.add_argument(
+        "--blob-descriptions", action="store_true",
+        help="Store posting descriptions in pipeline/blobs/ and keep only a hash in the entry",
+    )
     args = parser.parse_args()
 
     # Default to dry-run if --yes not given
@@ -504,6 +498,9 @@ def main():
     print(f"\n{'=' * 60}")
     print(f"Discovered: {len(all_results)} raw → {len(new_jobs)} new")
     print(f"{'=' * 60}")
+    cache_report = http_cache_report()
+    if cache_report:
+        print(cache_report)
 
     if not new_jobs:
         print("\nNo new jobs to add.")
@@ -517,7 +514,7 @@ def main():
     if is_write:
         for job in new_jobs:
             entry_id, entry = create_discovery_entry(job)
-            write_pipeline_entry(entry_id, entry)
+            write_pipeline_entry(entry_id, entry, blob_description=args.blob_descriptions)
             created.append(entry_id)
 
         print(f"\n{'=' * 60}")
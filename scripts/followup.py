@@ -31,6 +31,7 @@
     get_tier,
     load_entries,
     parse_date,
+    query_entries,
 )
 from yaml_mutation import YAMLEditor
 
@@ -77,11 +78,11 @@ def get_submitted_entries() -> list[dict]:
     Searches both submitted/ and closed/ directories to find all entries
     that have been submitted, including those that may have been moved.
     """
-    entries = load_entries(
+    return query_entries(
+        status=["submitted", "acknowledged"],
         dirs=[PIPELINE_DIR_SUBMITTED, PIPELINE_DIR_CLOSED],
         include_filepath=True,
     )
-    return [e for e in entries if e.get("status") in ("submitted", "acknowledged")]
 
 
 def get_submission_date(entry: dict) -> date | None:
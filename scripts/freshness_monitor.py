@@ -22,12 +22,14 @@
 from datetime import date
 from pathlib import Path
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 import yaml
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import http_client
+from http_cache import cached_get
+from http_cache import report as http_cache_report
 from pipeline_lib import (
     ACTIONABLE_STATUSES,
     PIPELINE_DIR_ACTIVE,
@@ -76,8 +78,7 @@ def check_url_liveness(url: str, timeout: int = HTTP_TIMEOUT) -> dict:
     if not url:
         return {"url": url, "status": "error", "code": None, "detail": "empty URL"}
     try:
-        req = Request(url, method="HEAD", headers={"User-Agent": USER_AGENT})
-        with urlopen(req, timeout=timeout) as resp:
+        with http_client.request(url, method="HEAD", headers={"User-Agent": USER_AGENT}, timeout=timeout) as resp:
             code = resp.getcode()
             if code and 200 <= code < 300:
                 return {"url": url, "status": "live", "code": code, "detail": "OK"}
@@ -168,17 +169,15 @@ def _check_greenhouse_posting(entry_id: str, url: str, portal: str) -> dict:
         jobs_idx = parts.index("jobs")
         board_token = parts[jobs_idx - 1]
         api_url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs/{job_id}"
-        req = Request(api_url, method="GET", headers={"User-Agent": USER_AGENT})
-        with urlopen(req, timeout=HTTP_TIMEOUT) as resp:
-            if resp.getcode() == 200:
-                return {"entry_id": entry_id, "portal": portal, "status": "active", "detail": "posting live"}
+        # Always revalidated (ttl=0): a 304 is answered from cache, any non-200/304 raises.
+        cached_get(api_url, headers={"User-Agent": USER_AGENT}, timeout=HTTP_TIMEOUT, ttl=0)
+        return {"entry_id": entry_id, "portal": portal, "status": "active", "detail": "posting live"}
     except HTTPError as e:
         if e.code == 404:
             return {"entry_id": entry_id, "portal": portal, "status": "closed", "detail": "posting not found (404)"}
         return {"entry_id": entry_id, "portal": portal, "status": "error", "detail": f"HTTP {e.code}"}
     except (URLError, TimeoutError, OSError, ValueError, IndexError) as e:
         return {"entry_id": entry_id, "portal": portal, "status": "error", "detail": str(e)}
-    return {"entry_id": entry_id, "portal": portal, "status": "unknown", "detail": "unexpected state"}
 
 
 def _check_lever_posting(entry_id: str, url: str, portal: str) -> dict:
@@ -666,6 +665,9 @@ def main():
         print("  URL LIVENESS CHECK")
         print(f"{'='*60}\n")
         check_urls_batch(limit=args.limit)
+        cache_report = http_cache_report()
+        if cache_report:
+            print(f"\n{cache_report}")
         record_check_run()
         print(f"\n  Recorded check timestamp to {FRESHNESS_CHECK_FILE.name}")
 
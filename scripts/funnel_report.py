@@ -71,12 +71,12 @@ def wilson_interval(successes: int, total: int, z: float = 1.96) -> tuple[float,
 
 def load_all_entries() -> list[dict]:
     """Load operational pipeline entries (excludes research pool)."""
-    return load_entries(dirs=ALL_PIPELINE_DIRS, include_filepath=True)
+    return load_entries(dirs=ALL_PIPELINE_DIRS, include_filepath=True, header_only=True)
 
 
 def load_pool_entries() -> list[dict]:
     """Load research pool entries."""
-    return load_entries(dirs=[PIPELINE_DIR_RESEARCH_POOL], include_filepath=True)
+    return load_entries(dirs=[PIPELINE_DIR_RESEARCH_POOL], include_filepath=True, header_only=True)
 
 
 def load_conversion_log() -> list[dict]:
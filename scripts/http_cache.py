@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Disk-backed conditional-GET cache for ATS board and posting fetches.
+
+source_jobs, discover_jobs, hygiene --check-postings and freshness_monitor
+re-download the same board listings and posting details on every run, most
+of which have not changed. HTTPCache keeps the last body of every GET under
+CACHE_DIR/http (gzip-compressed, one pickle per URL) together with its ETag
+and Last-Modified headers:
+
+- within the host's TTL the stored body is served without a request;
+- after it, the request carries If-None-Match / If-Modified-Since and a
+  304 Not Modified is answered from the stored body;
+- anything else is fetched and stored as usual.
+
+Errors (404s included) are raised exactly as urlopen raises them and are
+never cached. Like the entry cache, the store is derived data: unreadable
+records are treated as missing and write failures are ignored.
+
+TTLs default to DEFAULT_TTL seconds (PIPELINE_HTTP_CACHE_TTL overrides it),
+with per-host values in HOST_TTLS; PIPELINE_HTTP_CACHE=0 disables caching.
+Liveness checks pass ttl=0 so they always revalidate.
+
+A record file is rewritten on every fetch and every 304, so its mtime is the
+last time the server confirmed it. Records untouched for MAX_AGE seconds
+(PIPELINE_HTTP_CACHE_MAX_AGE overrides it) are pruned: by --prune, and at
+most once per PRUNE_INTERVAL when a process first uses the shared cache.
+
+Usage:
+    python scripts/http_cache.py --stats               # Stored responses per host
+    python scripts/http_cache.py --prune               # Drop responses older than MAX_AGE
+    python scripts/http_cache.py --clear               # Drop every stored response
+    python scripts/http_cache.py --clear --host api.lever.co
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+import http_client
+import pipeline_entry_cache as _entry_cache
+
+HTTP_CACHE_DIR = _entry_cache.CACHE_DIR / "http"
+
+# Seconds a stored response is served without revalidating.
+DEFAULT_TTL = 600.0
+HOST_TTLS: dict[str, float] = {
+    # Board listings change a few times a day; detail pages rarely.
+    "boards-api.greenhouse.io": 900.0,
+    "api.lever.co": 900.0,
+    "api.ashbyhq.com": 900.0,
+    "api.smartrecruiters.com": 900.0,
+    "apply.workable.com": 900.0,
+    # Aggregator searches are cheap to repeat but shift quickly.
+    "remotive.com": 300.0,
+    "himalayas.app": 300.0,
+    "www.themuse.com": 300.0,
+}
+
+# Stored responses not refreshed for this long are pruned.
+MAX_AGE = 7 * 86400.0
+# Opportunistic pruning runs at most this often per cache directory.
+PRUNE_INTERVAL = 86400.0
+PRUNE_MARKER = ".last-prune"
+
+# Per-host counters: served fresh from disk, answered by a 304, or fetched in full.
+OUTCOMES = ("fresh", "revalidated", "fetched")
+
+
+def cache_enabled() -> bool:
+    """Return False when PIPELINE_HTTP_CACHE is set to 0/false/off."""
+    return os.environ.get("PIPELINE_HTTP_CACHE", "1").strip().lower() not in {"0", "false", "off", "no"}
+
+
+def _default_ttl() -> float:
+    try:
+        return float(os.environ["PIPELINE_HTTP_CACHE_TTL"])
+    except (KeyError, ValueError):
+        return DEFAULT_TTL
+
+
+def _max_age() -> float:
+    try:
+        return float(os.environ["PIPELINE_HTTP_CACHE_MAX_AGE"])
+    except (KeyError, ValueError):
+        return MAX_AGE
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).hostname or ""
+
+
+class HTTPCache:
+    """Conditional-GET response cache rooted at *directory*.
+
+    Records are ``{"url", "etag", "last_modified", "stored", "body"}`` where
+    ``stored`` is the time.time() of the last full or 304 response and
+    ``body`` is gzip-compressed. Safe to share between threads; concurrent
+    processes at worst both refetch the same URL.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        default_ttl: float | None = None,
+        host_ttls: dict[str, float] | None = None,
+    ):
+        self.directory = directory or HTTP_CACHE_DIR
+        self.default_ttl = _default_ttl() if default_ttl is None else default_ttl
+        self.host_ttls = dict(HOST_TTLS if host_ttls is None else host_ttls)
+        self.stats: dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def ttl_for(self, host: str) -> float:
+        return self.host_ttls.get(host, self.default_ttl)
+
+    def path_for(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.pickle"
+
+    def _load(self, url: str) -> dict | None:
+        record = _entry_cache._read_pickle(self.path_for(url))
+        return record if record and record.get("url") == url else None
+
+    def _save(self, record: dict) -> None:
+        try:
+            _entry_cache._write_pickle(self.path_for(record["url"]), record)
+        except OSError:
+            pass
+
+    def _count(self, host: str, outcome: str) -> None:
+        with self._lock:
+            self.stats[host][outcome] += 1
+
+    def get(
+        self,
+        url: str,
+        headers: dict | None = None,
+        timeout: float = 15,
+        ttl: float | None = None,
+        retries: int = 0,
+    ) -> bytes:
+        """GET *url*, answering from the cache where the TTL or a 304 allows.
+
+        Raises HTTPError / URLError like urlopen for anything but 200 and 304.
+        """
+        host = _host(url)
+        ttl = self.ttl_for(host) if ttl is None else ttl
+        record = self._load(url)
+        if record is not None and time.time() - record["stored"] < ttl:
+            self._count(host, "fresh")
+            return gzip.decompress(record["body"])
+
+        request_headers = dict(headers or {})
+        if record is not None:
+            if record.get("etag"):
+                request_headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                request_headers["If-Modified-Since"] = record["last_modified"]
+        try:
+            resp = http_client.request(url, headers=request_headers, timeout=timeout, retries=retries)
+            body = resp.read()
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+        except HTTPError as exc:
+            if exc.code != 304 or record is None:
+                raise
+            exc.close()
+            record["stored"] = time.time()
+            self._save(record)
+            self._count(host, "revalidated")
+            return gzip.decompress(record["body"])
+
+        self._count(host, "fetched")
+        if etag or last_modified or ttl > 0:
+            self._save({
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "stored": time.time(),
+                "body": gzip.compress(body, compresslevel=6),
+            })
+        return body
+
+    def summary(self) -> dict[str, dict]:
+        """Per-host request counts by outcome plus hit_rate (fresh or 304 over all)."""
+        report = {}
+        with self._lock:
+            for host in sorted(self.stats):
+                counts = self.stats[host]
+                requests = sum(counts[outcome] for outcome in OUTCOMES)
+                if not requests:
+                    continue
+                hits = counts["fresh"] + counts["revalidated"]
+                report[host] = {
+                    **{outcome: counts[outcome] for outcome in OUTCOMES},
+                    "requests": requests,
+                    "hit_rate": round(hits / requests, 3),
+                }
+        return report
+
+    def report(self) -> str:
+        """Text table of summary(), or "" when nothing went through the cache."""
+        summary = self.summary()
+        if not summary:
+            return ""
+        lines = [
+            "HTTP cache",
+            f"  {'Host':<32s} {'Requests':>8s} {'Fresh':>6s} {'304':>6s} {'Fetched':>8s} {'Hit %':>6s}",
+        ]
+        for host, row in summary.items():
+            lines.append(
+                f"  {host:<32s} {row['requests']:>8d} {row['fresh']:>6d} {row['revalidated']:>6d} "
+                f"{row['fetched']:>8d} {row['hit_rate'] * 100:>5.0f}%"
+            )
+        return "\n".join(lines)
+
+    def records(self) -> list[dict]:
+        """Every readable stored record (bodies still compressed)."""
+        if not self.directory.is_dir():
+            return []
+        found = []
+        for path in sorted(self.directory.glob("*.pickle")):
+            record = _entry_cache._read_pickle(path)
+            if record and "url" in record:
+                found.append(record)
+        return found
+
+    def prune(self, max_age: float | None = None) -> int:
+        """Remove responses not fetched or revalidated within *max_age* seconds; returns the count."""
+        if not self.directory.is_dir():
+            return 0
+        cutoff = time.time() - (_max_age() if max_age is None else max_age)
+        removed = 0
+        for path in self.directory.glob("*.pickle"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def prune_if_due(self) -> int:
+        """prune() unless it already ran within PRUNE_INTERVAL (tracked by a marker file)."""
+        marker = self.directory / PRUNE_MARKER
+        try:
+            if time.time() - marker.stat().st_mtime < PRUNE_INTERVAL:
+                return 0
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return 0
+        removed = self.prune()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass
+        return removed
+
+    def clear(self, host: str | None = None) -> int:
+        """Remove stored responses (only *host*'s when given); returns the count."""
+        removed = 0
+        for record in self.records():
+            if host is None or _host(record["url"]) == host:
+                self.path_for(record["url"]).unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+_DEFAULT: HTTPCache | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_cache() -> HTTPCache:
+    """The process-wide cache shared by every fetcher."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = HTTPCache()
+            _DEFAULT.prune_if_due()
+        return _DEFAULT
+
+
+def cached_get(
+    url: str,
+    headers: dict | None = None,
+    timeout: float = 15,
+    ttl: float | None = None,
+    retries: int = 0,
+) -> bytes:
+    """GET *url* through the default cache (a plain GET when caching is off)."""
+    if not cache_enabled():
+        return http_client.request(url, headers=headers, timeout=timeout, retries=retries).read()
+    return default_cache().get(url, headers=headers, timeout=timeout, ttl=ttl, retries=retries)
+
+
+def report() -> str:
+    """Per-host hit-rate table for this process, or "" if nothing was fetched."""
+    return default_cache().report() if _DEFAULT is not None else ""
+
+
+def show_stats(cache: HTTPCache) -> None:
+    by_host: dict[str, list[dict]] = defaultdict(list)
+    for record in cache.records():
+        by_host[_host(record["url"])].append(record)
+    if not by_host:
+        print(f"HTTP cache is empty ({cache.directory})")
+        return
+    now = time.time()
+    print(f"HTTP cache: {cache.directory}")
+    print(f"  {'Host':<32s} {'Entries':>7s} {'KiB':>8s} {'Validators':>10s} {'Oldest':>8s} {'TTL':>6s}")
+    for host in sorted(by_host):
+        records = by_host[host]
+        size = sum(len(r["body"]) for r in records) / 1024
+        validated = sum(1 for r in records if r.get("etag") or r.get("last_modified"))
+        oldest = max(now - r["stored"] for r in records) / 60
+        print(
+            f"  {host:<32s} {len(records):>7d} {size:>8.1f} {validated:>10d} "
+            f"{oldest:>7.0f}m {cache.ttl_for(host):>5.0f}s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect or clear the conditional-GET HTTP cache")
+    parser.add_argument("--stats", action="store_true", help="Show stored responses per host")
+    parser.add_argument("--clear", action="store_true", help="Remove stored responses")
+    parser.add_argument("--prune", action="store_true", help="Remove responses older than --max-age")
+    parser.add_argument("--max-age", type=float, help=f"Seconds, for --prune (default: {MAX_AGE:.0f})")
+    parser.add_argument("--host", help="Limit --clear to one host")
+    args = parser.parse_args()
+
+    cache = HTTPCache()
+    if args.clear:
+        removed = cache.clear(args.host)
+        print(f"Removed {removed} stored response(s)" + (f" for {args.host}" if args.host else ""))
+    elif args.prune:
+        removed = cache.prune(args.max_age)
+        print(f"Pruned {removed} stored response(s)")
+    else:
+        show_stats(cache)
+
+
+if __name__ == "__main__":
+    main()
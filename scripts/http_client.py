@@ -0,0 +1,313 @@
+"""Shared keep-alive HTTP client with per-host connection pools.
+
+Every fetch in the pipeline used to go through urllib.request.urlopen,
+which opens (and for HTTPS, TLS-handshakes) a new connection per request
+and closes it afterwards. HTTPClient keeps idle http.client connections per
+(scheme, host, port) and reuses them, asks for gzip and decodes it, follows
+redirects for GET/HEAD, and retries transient failures (connection errors,
+timeouts, 429 and 5xx) with jittered exponential backoff.
+
+It is a drop-in for the urlopen call sites: a non-2xx answer raises
+urllib.error.HTTPError and a connection failure raises URLError (or
+TimeoutError), and the returned Response supports ``with``, ``read()``,
+``status``, ``getcode()`` and ``headers``.
+
+A reused connection that turns out to be closed by the server is replaced
+and the request sent again, but only when that cannot deliver it twice:
+for GET/HEAD, or when the failure happened while sending. A POST whose
+response never arrived raises URLError instead.
+
+Proxies are taken from urllib.request.getproxies() (HTTP_PROXY,
+HTTPS_PROXY, ...) and bypassed per NO_PROXY, as urlopen does: plain HTTP
+goes through the proxy with absolute-URI requests, HTTPS through a CONNECT
+tunnel. Credentials in the proxy URL are sent as Proxy-Authorization.
+
+Connections are checked out by one thread at a time, so a client can be
+shared across a thread pool. A client used after fork() starts with empty
+pools rather than sharing the parent's sockets.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import http.client
+import os
+import random
+import ssl
+import threading
+import time
+import zlib
+from io import BytesIO
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+DEFAULT_TIMEOUT = 15.0
+# Idle connections kept per host, and how long one may sit idle before it
+# is assumed closed by the server.
+MAX_IDLE_PER_HOST = 8
+IDLE_TIMEOUT = 30.0
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods that may be resent after the response was lost.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# (scheme, host, port, proxy URL or "")
+PoolKey = tuple[str, str, int, str]
+
+
+def proxy_for(scheme: str, host: str) -> str | None:
+    """The proxy URL urlopen would use for *scheme*://*host*, or None."""
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _proxy_headers(proxy: str) -> dict[str, str]:
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")}
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Seconds to wait before retry *attempt* (0-based): half fixed, half jitter."""
+    delay = min(cap, base * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _retry_after(exc: HTTPError) -> float:
+    try:
+        return float(exc.headers.get("Retry-After", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _decode(body: bytes, encoding: str | None) -> bytes:
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class Response:
+    """A fully read response; the body is already decoded."""
+
+    def __init__(self, url: str, status: int, reason: str, headers: http.client.HTTPMessage, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def read(self) -> bytes:
+        return self.body
+
+    def getcode(self) -> int:
+        return self.status
+
+    def __enter__(self) -> Response:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+class HTTPClient:
+    """Pooled keep-alive client; see the module docstring."""
+
+    def __init__(
+        self,
+        retries: int = 0,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        max_idle_per_host: int = MAX_IDLE_PER_HOST,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_idle_per_host = max_idle_per_host
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.opened = 0
+        self.reused = 0
+        self._idle: dict[PoolKey, list[tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    # -- pool ---------------------------------------------------------------
+
+    def _checkout(self, key: PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            if self._pid != os.getpid():
+                self._idle = {}
+                self._pid = os.getpid()
+            idle = self._idle.get(key) or []
+            while idle:
+                conn, since = idle.pop()
+                if now - since < IDLE_TIMEOUT:
+                    self.reused += 1
+                    break
+                conn.close()
+            else:
+                conn = None
+                self.opened += 1
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host, port, proxy = key
+        if proxy:
+            proxy_parts = urlsplit(proxy)
+            proxy_host, proxy_port = proxy_parts.hostname, proxy_parts.port or 80
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=self.ssl_context)
+                conn.set_tunnel(host, port, headers=_proxy_headers(proxy))
+                return conn, False
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout), False
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _checkin(self, key: PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host and self._pid == os.getpid():
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn, _ in idle:
+                conn.close()
+
+    # -- requests -----------------------------------------------------------
+
+    def _send(self, method: str, url: str, data: bytes | None, headers: dict, timeout: float) -> Response:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise URLError(f"unsupported URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = proxy_for(scheme, parts.hostname) or ""
+        key = (scheme, parts.hostname, port, proxy)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        if proxy and scheme == "http":
+            # Plain HTTP through a proxy: absolute-URI request to the proxy.
+            path = f"http://{parts.netloc.rpartition('@')[2]}{path}"
+            headers = {**_proxy_headers(proxy), **headers}
+
+        while True:
+            conn, reused = self._checkout(key, timeout)
+            sent = False
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                body = resp.read()
+            except (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine) as exc:
+                conn.close()
+                # A pooled connection the server closed while it sat idle:
+                # try again on a fresh connection, unless the request may
+                # already have been received and is not safe to repeat.
+                if reused and (not sent or method in IDEMPOTENT_METHODS):
+                    continue
+                raise URLError(exc) from exc
+            except TimeoutError:
+                conn.close()
+                raise
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                raise URLError(exc) from exc
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            try:
+                body = _decode(body, resp.getheader("Content-Encoding"))
+            except (OSError, EOFError, zlib.error) as exc:
+                raise URLError(f"undecodable response body: {exc}") from exc
+            return Response(url, resp.status, resp.reason, resp.msg, body)
+
+    def _request_once(self, url: str, method: str, data: bytes | None, headers: dict, timeout: float) -> Response:
+        for _ in range(MAX_REDIRECTS + 1):
+            resp = self._send(method, url, data, headers, timeout)
+            location = resp.headers.get("Location")
+            if resp.status in REDIRECT_CODES and location and method in ("GET", "HEAD"):
+                url = urljoin(url, location)
+                continue
+            if not 200 <= resp.status < 300:
+                raise HTTPError(url, resp.status, resp.reason, resp.headers, BytesIO(resp.body))
+            return resp
+        raise HTTPError(url, resp.status, "too many redirects", resp.headers, BytesIO(resp.body))
+
+    def request(
+        self,
+        url: str,
+        method: str = "GET",
+        data: bytes | None = None,
+        headers: dict | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int | None = None,
+    ) -> Response:
+        """Send one request, retrying transient failures up to *retries* times.
+
+        Raises HTTPError for a non-2xx final answer, URLError or
+        TimeoutError when the host cannot be reached.
+        """
+        retries = self.retries if retries is None else retries
+        request_headers = {"Accept-Encoding": "gzip", **(headers or {})}
+        attempt = 0
+        while True:
+            try:
+                return self._request_once(url, method, data, request_headers, timeout)
+            except HTTPError as exc:
+                if attempt >= retries or exc.code not in RETRY_STATUSES:
+                    raise
+                delay = max(_retry_after(exc), backoff_delay(attempt, self.backoff, self.max_backoff))
+            except (URLError, TimeoutError):
+                if attempt >= retries:
+                    raise
+                delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+            time.sleep(min(delay, self.max_backoff))
+            attempt += 1
+
+
+_DEFAULT: HTTPClient | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_client() -> HTTPClient:
+    """The process-wide client shared by every fetcher."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = HTTPClient()
+        return _DEFAULT
+
+
+def request(
+    url: str,
+    method: str = "GET",
+    data: bytes | None = None,
+    headers: dict | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = 0,
+) -> Response:
+    """HTTPClient.request on the shared client."""
+    return default_client().request(url, method=method, data=data, headers=headers, timeout=timeout, retries=retries)
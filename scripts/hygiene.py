@@ -20,17 +20,18 @@
 from datetime import date
 from pathlib import Path
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 import yaml
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import http_client
 from ats_verification import (
     NATIVE_CAREER_PAGES,
     resolve_application_url,
     verify_posting_accepts_applications,
 )
+from http_cache import report as http_cache_report
 from pipeline_lib import (
     ACTIONABLE_STATUSES,
     COMPANY_CAP,
@@ -115,8 +116,8 @@ def check_url_liveness(url: str) -> tuple[str, int | None]:
         return "ok", 200
     # Retry failed — try to distinguish error type
     try:
-        req = Request(url, method="HEAD", headers={"User-Agent": "application-pipeline/1.0"})
-        with urlopen(req, timeout=HTTP_TIMEOUT) as resp:
+        headers = {"User-Agent": "application-pipeline/1.0"}
+        with http_client.request(url, method="HEAD", headers=headers, timeout=HTTP_TIMEOUT) as resp:
             code = resp.getcode()
             if code and 200 <= code < 400:
                 return "ok", code
@@ -217,23 +218,24 @@ def run_check_postings(entries: list[dict]) -> list[dict]:
         elif portal == "ashby":
             board_jobs.setdefault(("ashby", org), []).append(e)
 
-    # Fetch live postings per board and check
+    # Fetch live postings per board and check; listings always revalidate
+    # (conditional GET) so a posting taken down is never reported from cache.
     for (portal, board), board_entries in board_jobs.items():
         live_urls = set()
         live_ids = set()
 
         if portal == "greenhouse":
-            jobs = fetch_greenhouse_jobs(board)
+            jobs = fetch_greenhouse_jobs(board, listing_ttl=0)
             for j in jobs:
                 live_urls.add(j.get("url", ""))
                 live_ids.add(str(j.get("id", "")))
         elif portal == "lever":
-            jobs = fetch_lever_jobs(board)
+            jobs = fetch_lever_jobs(board, listing_ttl=0)
             for j in jobs:
                 live_urls.add(j.get("url", ""))
                 live_ids.add(str(j.get("id", "")))
         elif portal == "ashby":
-            jobs = fetch_ashby_jobs(board)
+            jobs = fetch_ashby_jobs(board, listing_ttl=0)
             for j in jobs:
                 live_urls.add(j.get("url", ""))
                 live_ids.add(str(j.get("id", "")))
@@ -278,6 +280,9 @@ def run_check_postings(entries: list[dict]) -> list[dict]:
 
     print()
     print(f"Results: {len(ats_entries) - len(issues)} live, {len(issues)} closed/missing")
+    cache_report = http_cache_report()
+    if cache_report:
+        print(cache_report)
     return issues
 
 
@@ -153,16 +153,23 @@ def _call_llm(system_prompt: str, user_prompt: str) -> str:
 def fetch_posting_text(entry: dict) -> str:
     """Fetch the full job posting description from the ATS API.
 
-    Supports Greenhouse, Lever, and Ashby portals. Falls back to
-    entry notes/title if the API call fails.
+    Supports Greenhouse, Lever, and Ashby portals. Falls back to the
+    description stored with the entry (inline or in the blob store), then
+    to entry notes/title, if the API call fails.
     """
     import json as _json
     import urllib.error
     import urllib.request
 
+    from description_store import resolve_description
+
     portal = entry.get("target", {}).get("portal", "")
     app_url = entry.get("target", {}).get("application_url", "")
-    fallback = entry.get("notes", "") or entry.get("target", {}).get("title", "")
+    stored = resolve_description(entry)
+    if stored:
+        import re
+        stored = re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", stored)).strip()
+    fallback = stored or entry.get("notes", "") or entry.get("target", {}).get("title", "")
 
     try:
         if portal == "greenhouse":
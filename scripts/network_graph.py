@@ -31,7 +31,9 @@
 
 import argparse
 import json
+import os
 import sys
+import tempfile
 from collections import defaultdict, deque
 from datetime import date
 from pathlib import Path
@@ -40,6 +42,7 @@
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import pipeline_entry_cache as _entry_cache
 from pipeline_lib import (
     ALL_PIPELINE_DIRS,
     SIGNALS_DIR,
@@ -49,6 +52,10 @@
 
 NETWORK_FILE = SIGNALS_DIR / "network.yaml"
 
+# Per-org proximity table derived from NETWORK_FILE (see load_proximity_table)
+PROXIMITY_CACHE_PATH = _entry_cache.CACHE_DIR / "network-proximity.json"
+PROXIMITY_CACHE_VERSION = 1
+
 # --- Hop-to-score decay (from research) ---
 # 1-hop referral: ~30% hire rate (7-15x cold)
 # 2-hop warm intro: ~3-5x cold
@@ -279,7 +286,11 @@ def score_org_proximity(network: dict, source: str, target_org: str) -> dict:
     """
     paths = all_paths_to_org(network, source, target_org, max_hops=3)
     members = get_org_members(network, target_org)
+    return _proximity_result(network, paths, members)
+
 
+def _proximity_result(network: dict, paths: list[list[str]], members: list[str]) -> dict:
+    """Score an org from its paths (sorted by length) and member names."""
     if not paths:
         return {
             "score": COLD_SCORE,
@@ -335,6 +346,113 @@ def score_org_proximity(network: dict, source: str, target_org: str) -> dict:
     }
 
 
+def org_proximity_table(network: dict, source: str, max_hops: int = 3) -> dict[str, dict]:
+    """Return score_org_proximity for every organization in one traversal.
+
+    Keyed by lower-cased organization name. Enumerates the simple paths
+    from *source* once, in the same order all_paths_to_org would, and files
+    each path under the orgs of its last node unless an earlier node on it
+    already belongs to that org (all_paths_to_org stops at the first member).
+    Orgs absent from the table score as cold.
+    """
+    adj = build_adjacency(network)
+    node_orgs: dict[str, set[str]] = defaultdict(set)
+    members: dict[str, list[str]] = defaultdict(list)
+    for n in network["nodes"]:
+        org = n.get("organization", "").lower()
+        node_orgs[n["name"].lower()].add(org)
+        members[org].append(n["name"])
+
+    paths_by_org: dict[str, list[list[str]]] = defaultdict(list)
+
+    def dfs(current: str, path: list[str], visited: set[str], passed: frozenset[str]):
+        for neighbor, _strength in adj.get(current, []):
+            neighbor_lower = neighbor.lower()
+            if neighbor_lower in visited:
+                continue
+            path.append(neighbor)
+            orgs = node_orgs.get(neighbor_lower, set())
+            for org in orgs - passed:
+                paths_by_org[org].append(list(path))
+            if len(path) - 1 < max_hops:
+                visited.add(neighbor_lower)
+                dfs(neighbor, path, visited, passed | orgs)
+                visited.discard(neighbor_lower)
+            path.pop()
+
+    dfs(source, [source], {source.lower()}, frozenset())
+    return {
+        org: _proximity_result(network, sorted(paths_by_org.get(org, []), key=len), org_members)
+        for org, org_members in members.items()
+    }
+
+
+def lookup_org_proximity(table: dict[str, dict], target_org: str) -> dict:
+    """Return the table row for *target_org*, or the cold result."""
+    row = table.get(target_org.lower())
+    return row if row is not None else _proximity_result({}, [], [])
+
+
+_PROXIMITY_MEMO: dict[tuple, dict[str, dict]] = {}
+
+
+def _network_signature() -> list[int] | None:
+    try:
+        st = NETWORK_FILE.stat()
+    except FileNotFoundError:
+        return None
+    # atomic_write replaces the file, so the inode changes on every save.
+    return [st.st_ino, st.st_mtime_ns, st.st_size]
+
+
+def load_proximity_table(source: str) -> dict[str, dict]:
+    """Per-org proximity for *source*, loading the graph once per version.
+
+    Scoring asks for one org per entry; parsing network.yaml and walking the
+    graph each time dominated network_proximity. The table is memoized for
+    the process and persisted to PROXIMITY_CACHE_PATH, both keyed by the
+    network file's inode, mtime and size, so an edited graph is reloaded.
+    """
+    signature = _network_signature()
+    key = (str(NETWORK_FILE), source, tuple(signature or ()))
+    table = _PROXIMITY_MEMO.get(key)
+    if table is not None:
+        return table
+
+    stamp = {"version": PROXIMITY_CACHE_VERSION, "network": str(NETWORK_FILE),
+             "signature": signature, "source": source}
+    try:
+        cached = json.loads(PROXIMITY_CACHE_PATH.read_text())
+        if isinstance(cached, dict) and cached.get("stamp") == stamp:
+            table = cached["table"]
+    except (OSError, ValueError, KeyError):
+        table = None
+
+    if table is None:
+        table = org_proximity_table(load_network(), source)
+        if signature is not None:
+            _write_proximity_cache({"stamp": stamp, "table": table})
+
+    _PROXIMITY_MEMO.clear()
+    _PROXIMITY_MEMO[key] = table
+    return table
+
+
+def _write_proximity_cache(payload: dict) -> None:
+    """Best-effort atomic write of the on-disk proximity table."""
+    try:
+        PROXIMITY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=PROXIMITY_CACHE_PATH.parent, prefix=".network-proximity.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp, PROXIMITY_CACHE_PATH)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+
+
 # --- Ingest from existing data ---
 
 def ingest_from_contacts_and_outreach(network: dict, me: str | None = None) -> int:
@@ -541,10 +659,8 @@ def display_org_reachability(network: dict, source: str):
     print(f"  {'Organization':30s} {'Score':>5s} {'Hops':>5s} {'Paths':>5s} {'Label':>18s}")
     print(f"  {'-' * 65}")
 
-    results = []
-    for org in sorted(orgs):
-        r = score_org_proximity(network, source, org)
-        results.append((org, r))
+    table = org_proximity_table(network, source)
+    results = [(org, lookup_org_proximity(table, org)) for org in sorted(orgs)]
 
     results.sort(key=lambda x: -x[1]["score"])
 
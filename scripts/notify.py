@@ -16,7 +16,6 @@
 import ssl
 import sys
 import urllib.error
-import urllib.request
 from datetime import datetime
 from email.mime.text import MIMEText
 from pathlib import Path
@@ -25,6 +24,7 @@
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import http_client
 from pipeline_lib import REPO_ROOT, SIGNALS_DIR
 
 CONFIG_PATH = REPO_ROOT / "strategy" / "notifications.yaml"
@@ -53,13 +53,8 @@ def dispatch_webhook(payload: dict, url: str) -> tuple[bool, str]:
     """POST JSON payload to a webhook URL. Returns (success, message)."""
     try:
         data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
+        headers = {"Content-Type": "application/json"}
+        with http_client.request(url, method="POST", data=data, headers=headers, timeout=10) as resp:
             return True, f"HTTP {resp.status}"
     except urllib.error.URLError as e:
         return False, f"Webhook failed: {e}"
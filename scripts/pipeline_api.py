@@ -41,8 +41,10 @@
     from .pipeline_lib import (
         load_entries as load_all_entries,
     )
+    from .pipeline_segments import entry_paths
     from .score import (
         ALL_PIPELINE_DIRS_WITH_POOL,
+        ScoringContext,
         _load_entries_raw,
         compute_composite,
         compute_dimensions,
@@ -80,8 +82,10 @@
     from pipeline_lib import (
         load_entries as load_all_entries,
     )
+    from pipeline_segments import entry_paths
     from score import (
         ALL_PIPELINE_DIRS_WITH_POOL,
+        ScoringContext,
         _load_entries_raw,
         compute_composite,
         compute_dimensions,
@@ -248,7 +252,7 @@ def score_entry(
                     entry_id="batch",
                     error="no entries found",
                 )
-            all_raw = _load_entries_raw(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
+            all_raw = ScoringContext(_load_entries_raw(dirs=ALL_PIPELINE_DIRS_WITH_POOL))
             updated = 0
             for filepath, data in entries:
                 dims = compute_dimensions(data, all_raw)
@@ -593,9 +597,7 @@ def validate_entry(
         for pipeline_dir in PIPELINE_DIRS:
             if not pipeline_dir.exists():
                 continue
-            for filepath in sorted(pipeline_dir.glob("*.yaml")):
-                if filepath.name.startswith("_"):
-                    continue
+            for filepath in entry_paths(pipeline_dir):
                 file_count += 1
                 warnings: list[str] = []
                 errors = validate_file_entry(filepath, warnings=warnings)
@@ -0,0 +1,431 @@
+"""On-disk cache of parsed pipeline entries used by pipeline_lib.load_entries.
+
+Parsing ~2,000 YAML documents with the pure-Python loader dominates the
+start-up time of standup, score and funnel. This module keeps the parsed
+result of every entry file in a single pickle keyed by path, validated per
+file by (mtime_ns, size) with a content digest as the tie-breaker, so a warm
+run only re-parses files that actually changed.
+
+Heavy fields (pipeline_entry_fields.HEAVY_FIELDS, i.e. target.description)
+are kept in a side file that is only read when a full entry is requested,
+so header-only loads never touch the description blobs.
+
+The cache is derived data and never the source of truth: a missing,
+unreadable, corrupt or version-mismatched cache file is treated as empty,
+and write failures are swallowed so loading always falls back to parsing.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import yaml
+from description_store import attach_description
+from pipeline_entry_fields import attach_lazy, project_entry_text, select_fields, split_heavy
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+CACHE_DIR = Path(os.environ.get("PIPELINE_CACHE_DIR") or REPO_ROOT / ".pipeline-cache")
+ENTRY_CACHE_PATH = CACHE_DIR / "entries.pickle"
+CACHE_VERSION = 2
+
+# Files modified this close to the moment they were cached cannot be trusted
+# on (mtime, size) alone — a same-size rewrite within the filesystem's
+# timestamp granularity would look unchanged. Those are re-hashed instead.
+RACY_WINDOW_NS = 2_000_000_000
+
+# Parallel cold loads (parse_entry_files). Below PARALLEL_MIN_FILES files to
+# parse, process start-up costs more than it saves, so parsing stays serial.
+PARALLEL_MIN_FILES = 400
+PARALLEL_CHUNK_SIZE = 64
+
+# libyaml's C loader when PyYAML was built with it. It shares SafeLoader's
+# constructor and resolver, so it yields the same Python objects.
+FAST_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def cache_enabled() -> bool:
+    """Return False when PIPELINE_ENTRY_CACHE is set to 0/false/off."""
+    return os.environ.get("PIPELINE_ENTRY_CACHE", "1").strip().lower() not in {"0", "false", "off", "no"}
+
+
+def parallel_enabled() -> bool:
+    """Return True when PIPELINE_PARALLEL_LOAD opts in to parallel parsing."""
+    return os.environ.get("PIPELINE_PARALLEL_LOAD", "").strip().lower() in {"1", "true", "on", "yes"}
+
+
+def content_digest(raw: bytes) -> str:
+    """Return the content hash used to validate a cached entry."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def heavy_path_for(path: Path) -> Path:
+    """Return the side file holding heavy-field payloads for cache *path*."""
+    return path.with_name(path.stem + ".heavy" + path.suffix)
+
+
+def _read_pickle(path: Path) -> dict | None:
+    try:
+        with open(path, "rb") as f:
+            blob = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(blob, dict) or blob.get("version") != CACHE_VERSION:
+        return None
+    records = blob.get("records")
+    return records if isinstance(records, dict) else None
+
+
+def _write_pickle(path: Path, records: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp", prefix=f".{path.name}.")
+    try:
+        with open(fd, "wb") as f:
+            pickle.dump({"version": CACHE_VERSION, "records": records}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp_path).replace(path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class EntryCache:
+    """Per-file parsed-entry cache backed by two pickle files.
+
+    Records map the absolute file path to
+    ``(mtime_ns, size, digest, checked_ns, payload, heavy_paths)`` where
+    ``payload`` is the pickled entry dict minus its heavy fields. The heavy
+    side file maps the same path to ``(digest, heavy_payload)`` and is only
+    loaded when a full entry or a lazy heavy field is requested. Payloads are
+    unpickled on every hit so callers always receive a fresh, independently
+    mutable dict.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or ENTRY_CACHE_PATH
+        self.heavy_path = heavy_path_for(self.path)
+        self._records: dict[str, tuple] = _read_pickle(self.path) or {}
+        self._heavy: dict[str, tuple] | None = None
+        self._seen: set[str] = set()
+        self._scanned_dirs: set[str] = set()
+        self._dirty = False
+        self._heavy_dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _heavy_records(self) -> dict[str, tuple]:
+        if self._heavy is None:
+            self._heavy = _read_pickle(self.heavy_path) or {}
+        return self._heavy
+
+    def lookup(self, filepath: Path, *, light: bool = False) -> tuple[dict | None, bytes | None]:
+        """Return ``(entry, None)`` on a hit, or ``(None, raw_bytes)`` on a miss.
+
+        On a miss the file has already been read, so the caller parses the
+        returned bytes and hands them back via :meth:`store`. With ``light``
+        the entry's heavy fields are attached as lazily loaded keys.
+        """
+        key = str(filepath)
+        self._seen.add(key)
+        st = filepath.stat()
+        record = self._records.get(key)
+
+        if record is not None:
+            mtime_ns, size, _digest, checked_ns, _payload, _heavy_paths = record
+            if (
+                mtime_ns == st.st_mtime_ns
+                and size == st.st_size
+                and checked_ns - mtime_ns > RACY_WINDOW_NS
+            ):
+                data = self._hit(filepath, record, light=light)
+                if data is not None:
+                    return data, None
+
+        raw = filepath.read_bytes()
+        if record is not None and record[2] == content_digest(raw):
+            # Touched but unchanged: refresh the stat key, keep the payload.
+            record = (st.st_mtime_ns, st.st_size, record[2], time.time_ns(), record[4], record[5])
+            self._records[key] = record
+            self._dirty = True
+            data = self._hit(filepath, record, light=light)
+            if data is not None:
+                return data, None
+
+        self.misses += 1
+        return None, raw
+
+    def store(self, filepath: Path, raw: bytes, data: dict, *, light: bool = False) -> dict:
+        """Record a freshly parsed entry for *filepath*.
+
+        Returns the entry to hand to the caller: *data* itself, or with
+        ``light`` a copy whose heavy fields are lazily loaded.
+        """
+        key = str(filepath)
+        st = filepath.stat()
+        digest = content_digest(raw)
+        light_data, heavy = split_heavy(data)
+        self._records[key] = (
+            st.st_mtime_ns, st.st_size, digest, time.time_ns(),
+            pickle.dumps(light_data, protocol=pickle.HIGHEST_PROTOCOL),
+            tuple(heavy),
+        )
+        self._dirty = True
+        if heavy:
+            self._heavy_records()[key] = (digest, pickle.dumps(heavy, protocol=pickle.HIGHEST_PROTOCOL))
+            self._heavy_dirty = True
+        if light:
+            return attach_lazy(light_data, heavy, functools.partial(self.heavy_value, filepath))
+        return data
+
+    def _hit(self, filepath: Path, record: tuple, *, light: bool) -> dict | None:
+        try:
+            data = pickle.loads(record[4])
+        except Exception:
+            return None
+        if not isinstance(data, dict):
+            return None
+        heavy_paths = record[5]
+        if heavy_paths:
+            if light:
+                attach_lazy(data, heavy_paths, functools.partial(self.heavy_value, filepath))
+            else:
+                heavy = self._heavy_blob(str(filepath), record[2])
+                if heavy is None:
+                    return None
+                _merge_heavy(data, heavy)
+        self.hits += 1
+        return data
+
+    def _heavy_blob(self, key: str, digest: str) -> dict | None:
+        stored = self._heavy_records().get(key)
+        if stored is None or stored[0] != digest:
+            return None
+        try:
+            return pickle.loads(stored[1])
+        except Exception:
+            return None
+
+    def heavy_value(self, filepath: Path, path: tuple[str, str]) -> object:
+        """Return one heavy field of *filepath*; raises KeyError if absent.
+
+        Served from the heavy side file when it matches the cached record,
+        otherwise the file is re-parsed.
+        """
+        record = self._records.get(str(filepath))
+        heavy = self._heavy_blob(str(filepath), record[2]) if record is not None else None
+        if heavy is not None and path in heavy:
+            return heavy[path][1]
+        return _heavy_from_file(filepath, path)
+
+    def mark_scanned(self, directory: Path) -> None:
+        """Record that every entry file in *directory* is being looked up.
+
+        On the next pruning save, records for files in *directory* that were
+        not looked up (i.e. deleted files) are dropped.
+        """
+        self._scanned_dirs.add(str(directory))
+
+    def forget(self, filepath: Path) -> None:
+        """Drop the record for *filepath* so its next lookup re-reads the file."""
+        key = str(filepath)
+        if self._records.pop(key, None) is not None:
+            self._dirty = True
+        if self._heavy is not None and self._heavy.pop(key, None) is not None:
+            self._heavy_dirty = True
+
+    def save(self, *, prune: bool = True) -> None:
+        """Persist the cache if anything changed.
+
+        With ``prune`` (the default) records for files in a directory passed
+        to :meth:`mark_scanned` that were not looked up since the last save
+        are dropped. Either way the scan bookkeeping starts over, so one
+        EntryCache can serve many loads.
+        """
+        stale = [
+            key for key in self._records
+            if key not in self._seen and str(Path(key).parent) in self._scanned_dirs
+        ] if prune else []
+        self._seen.clear()
+        self._scanned_dirs.clear()
+        for key in stale:
+            del self._records[key]
+        if self._heavy_dirty:
+            # Drop heavy payloads whose record is gone or no longer has heavy fields.
+            for key in [k for k in self._heavy if not (self._records.get(k) or (0,) * 6)[5]]:
+                del self._heavy[key]
+        try:
+            if self._heavy_dirty and self._heavy is not None:
+                _write_pickle(self.heavy_path, self._heavy)
+                self._heavy_dirty = False
+            if self._dirty or stale:
+                _write_pickle(self.path, self._records)
+                self._dirty = False
+        except OSError:
+            # The cache is an optimisation; never fail a load because of it.
+            return
+
+
+def _merge_heavy(data: dict, heavy: dict) -> None:
+    """Put heavy values back into *data* at their original key positions."""
+    for (parent, child), (position, value) in heavy.items():
+        block = data.get(parent)
+        if not isinstance(block, dict):
+            continue
+        items = list(block.items())
+        items.insert(position, (child, value))
+        data[parent] = dict(items)
+
+
+def _heavy_from_file(filepath: Path, path: tuple[str, str]) -> object:
+    with open(filepath) as f:
+        data = yaml.safe_load(f)
+    parent, child = path
+    block = data.get(parent) if isinstance(data, dict) else None
+    if not isinstance(block, dict) or child not in block:
+        raise KeyError(path)
+    return block[child]
+
+
+def parse_entry_file(
+    filepath: Path,
+    cache: EntryCache | None = None,
+    *,
+    fields: Iterable[str] | None = None,
+    header_only: bool = False,
+) -> object:
+    """Parse one entry file, serving it from *cache* when unchanged.
+
+    With ``fields`` only those top-level keys (plus ``id``) are returned;
+    with ``fields`` or ``header_only`` heavy fields are deferred and load on
+    first access. Descriptions kept in the blob store (description_store)
+    are attached the same way. Returns whatever the YAML document holds
+    (callers check for dict) and propagates yaml.YAMLError for unparseable
+    files, which are never cached.
+    """
+    light = header_only or fields is not None
+    if cache is None:
+        if not light:
+            with open(filepath) as f:
+                return attach_description(yaml.safe_load(f))
+        data, deferred = project_entry_text(filepath.read_text(), fields)
+        if isinstance(data, dict) and deferred:
+            attach_lazy(data, deferred, functools.partial(_heavy_from_file, filepath))
+        return attach_description(data)
+
+    data, raw = cache.lookup(filepath, light=light)
+    if data is None:
+        data = yaml.safe_load(raw)
+        if isinstance(data, dict):
+            data = cache.store(filepath, raw, data, light=light)
+    if isinstance(data, dict) and fields is not None:
+        select_fields(data, fields)
+    return attach_description(data)
+
+
+def clear_entry_cache(path: Path | None = None) -> bool:
+    """Delete the on-disk entry cache. Returns True if a file was removed."""
+    target = path or ENTRY_CACHE_PATH
+    removed = False
+    for candidate in (target, heavy_path_for(target)):
+        try:
+            candidate.unlink()
+        except FileNotFoundError:
+            continue
+        removed = True
+    return removed
+
+
+def _parse_chunk(raws: list[bytes]) -> list[tuple[bool, object]]:
+    """Worker: parse raw YAML documents with the fast loader.
+
+    Returns ``(True, data)`` or ``(False, error message)`` per document so a
+    bad file never fails the whole chunk.
+    """
+    parsed = []
+    for raw in raws:
+        try:
+            parsed.append((True, yaml.load(raw, Loader=FAST_LOADER)))
+        except yaml.YAMLError as e:
+            parsed.append((False, str(e)))
+    return parsed
+
+
+def _parse_raws(raws: list[bytes], workers: int | None) -> list[tuple[bool, object]]:
+    workers = workers or os.cpu_count() or 1
+    chunks = [raws[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(raws), PARALLEL_CHUNK_SIZE)]
+    if workers <= 1 or len(chunks) <= 1:
+        # No second core to fan out to; the C loader alone is the win.
+        return [item for chunk in chunks for item in _parse_chunk(chunk)]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return [item for result in pool.map(_parse_chunk, chunks) for item in result]
+
+
+def parse_entry_files(
+    filepaths: list[Path],
+    cache: EntryCache | None = None,
+    *,
+    fields: Iterable[str] | None = None,
+    header_only: bool = False,
+    parallel: bool = False,
+    workers: int | None = None,
+) -> list[object]:
+    """Parse many entry files, returning results in the order given.
+
+    Each result is what parse_entry_file would return, or the yaml.YAMLError
+    it would raise. With ``parallel``, files that miss *cache* are parsed
+    with the libyaml loader, fanned out in chunks to a process pool when
+    there are at least PARALLEL_MIN_FILES of them; otherwise (and always
+    without ``parallel``) each file goes through parse_entry_file.
+    """
+    if not parallel or len(filepaths) < PARALLEL_MIN_FILES:
+        return [_parse_or_error(fp, cache, fields, header_only) for fp in filepaths]
+
+    light = header_only or fields is not None
+    results: list[object] = [None] * len(filepaths)
+    missed: list[tuple[int, Path, bytes]] = []
+    for i, filepath in enumerate(filepaths):
+        if cache is not None:
+            data, raw = cache.lookup(filepath, light=light)
+            if data is not None:
+                results[i] = data
+                continue
+        else:
+            raw = filepath.read_bytes()
+        missed.append((i, filepath, raw))
+
+    if len(missed) < PARALLEL_MIN_FILES:
+        parsed = _parse_raws([raw for _, _, raw in missed], workers=1)
+    else:
+        parsed = _parse_raws([raw for _, _, raw in missed], workers)
+    for (i, filepath, raw), (ok, data) in zip(missed, parsed):
+        if not ok:
+            results[i] = yaml.YAMLError(data)
+            continue
+        if isinstance(data, dict) and cache is not None:
+            data = cache.store(filepath, raw, data, light=light)
+        results[i] = data
+
+    for i, data in enumerate(results):
+        if isinstance(data, dict):
+            if fields is not None:
+                select_fields(data, fields)
+            results[i] = attach_description(data)
+    return results
+
+
+def _parse_or_error(filepath: Path, cache: EntryCache | None, fields, header_only: bool) -> object:
+    try:
+        return parse_entry_file(filepath, cache, fields=fields, header_only=header_only)
+    except yaml.YAMLError as e:
+        return e
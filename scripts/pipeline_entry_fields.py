@@ -0,0 +1,292 @@
+"""Field projection and lazy heavy fields for pipeline entries.
+
+Closed and research-pool entries carry multi-kilobyte ``target.description``
+HTML that analytics commands never read. This module lets loaders skip it:
+
+- project_entry_text() parses only selected top-level keys out of raw YAML
+  text, cutting heavy sub-blocks out before the YAML parser ever sees them.
+- LazyDict is a dict whose heavy keys are filled in by a loader on first
+  access, so code that does read them keeps working unchanged.
+
+Used by pipeline_entry_cache.parse_entry_file and load_entries(fields=...,
+header_only=...).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+
+import yaml
+
+# (parent key, child key) pairs that are deferred in header-only loads.
+HEAVY_FIELDS: tuple[tuple[str, str], ...] = (("target", "description"),)
+
+_TOP_LEVEL_KEY_RE = re.compile(r"^([A-Za-z_][\w-]*)\s*:", re.MULTILINE)
+
+_MISSING = object()
+
+
+class LazyDict(dict):
+    """A dict with some keys resolved on first access.
+
+    ``loaders`` maps key → zero-arg callable. A loader is called at most
+    once; its value is stored as an ordinary item. Any whole-dict operation
+    (iteration, len, equality, copy, repr) materializes every pending key
+    first, so the object is indistinguishable from the fully loaded dict.
+
+    Keys listed in ``derived`` are computed from other on-disk fields (e.g. a
+    description resolved from its blob reference) and are left out when the
+    dict is dumped back to YAML, unless they are explicitly assigned.
+    """
+
+    __slots__ = ("_loaders", "_derived")
+
+    def __init__(
+        self,
+        data=(),
+        loaders: dict[str, Callable[[], object]] | None = None,
+        derived: Iterable[str] = (),
+    ):
+        super().__init__(data)
+        self._loaders = dict(loaders or {})
+        self._derived = frozenset(derived)
+
+    def _resolve(self, key) -> None:
+        loader = self._loaders.pop(key, None)
+        if loader is None:
+            return
+        value = loader()
+        if value is not _MISSING:
+            dict.__setitem__(self, key, value)
+
+    def _resolve_all(self) -> None:
+        for key in list(self._loaders):
+            self._resolve(key)
+
+    def add_loader(self, key, loader: Callable[[], object], *, derived: bool = False) -> None:
+        """Register a loader for *key* unless the key is already present."""
+        if dict.__contains__(self, key) or key in self._loaders:
+            return
+        self._loaders[key] = loader
+        if derived:
+            self._derived = self._derived | {key}
+
+    @property
+    def pending(self) -> frozenset:
+        """Keys whose loaders have not run yet."""
+        return frozenset(self._loaders)
+
+    def __getitem__(self, key):
+        self._resolve(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        self._resolve(key)
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        self._resolve(key)
+        return dict.__contains__(self, key)
+
+    def __setitem__(self, key, value):
+        self._loaders.pop(key, None)
+        self._derived = self._derived - {key}
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._resolve(key)
+        self._derived = self._derived - {key}
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self._resolve(key)
+        self._derived = self._derived - {key}
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        self._resolve(key)
+        return dict.setdefault(self, key, default)
+
+    def __iter__(self):
+        self._resolve_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._resolve_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._resolve_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._resolve_all()
+        return dict.values(self)
+
+    def items(self):
+        self._resolve_all()
+        return dict.items(self)
+
+    def copy(self):
+        self._resolve_all()
+        return dict(self)
+
+    def __eq__(self, other):
+        self._resolve_all()
+        if isinstance(other, LazyDict):
+            other._resolve_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._resolve_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        self._resolve_all()
+        return (dict, (dict(self),))
+
+    def stored_items(self) -> dict:
+        """Return the items as they are stored on disk (without derived keys)."""
+        for key in [k for k in self._loaders if k not in self._derived]:
+            self._resolve(key)
+        return {k: v for k, v in dict.items(self) if k not in self._derived}
+
+
+# Let yaml.dump / yaml.safe_dump serialize lazily-loaded entries like plain dicts.
+yaml.SafeDumper.add_representer(LazyDict, lambda dumper, data: dumper.represent_dict(data.stored_items()))
+yaml.Dumper.add_representer(LazyDict, lambda dumper, data: dumper.represent_dict(data.stored_items()))
+
+
+def split_heavy(data: dict) -> tuple[dict, dict[tuple[str, str], tuple[int, object]]]:
+    """Return ``(light, heavy)`` without mutating *data*.
+
+    ``light`` is a shallow copy with heavy fields removed; ``heavy`` maps
+    each removed (parent, child) path to ``(key_position, value)`` so the
+    field can be re-inserted where it was.
+    """
+    light = dict(data)
+    heavy = {}
+    for parent, child in HEAVY_FIELDS:
+        block = light.get(parent)
+        if isinstance(block, dict) and child in block:
+            keys = list(block)
+            heavy[(parent, child)] = (keys.index(child), block[child])
+            light[parent] = {k: v for k, v in block.items() if k != child}
+    return light, heavy
+
+
+def attach_lazy(data: dict, paths: Iterable[tuple[str, str]], loader: Callable[[tuple[str, str]], object]) -> dict:
+    """Re-attach heavy field *paths* to *data* as lazily loaded keys.
+
+    ``loader(path)`` is called on first access and should return the value
+    (or raise KeyError if it no longer exists).
+    """
+    by_parent: dict[str, list[str]] = {}
+    for parent, child in paths:
+        by_parent.setdefault(parent, []).append(child)
+    for parent, children in by_parent.items():
+        block = data.get(parent)
+        if not isinstance(block, dict):
+            continue
+        loaders = {child: _guarded(loader, (parent, child)) for child in children}
+        data[parent] = LazyDict(block, loaders)
+    return data
+
+
+def _guarded(loader: Callable[[tuple[str, str]], object], path: tuple[str, str]) -> Callable[[], object]:
+    def load():
+        try:
+            return loader(path)
+        except KeyError:
+            return _MISSING
+    return load
+
+
+def select_fields(data: dict, fields: Iterable[str] | None) -> dict:
+    """Keep only the given top-level keys (``id`` is always kept)."""
+    if fields is None:
+        return data
+    wanted = set(fields) | {"id"}
+    for key in [k for k in data if k not in wanted]:
+        del data[key]
+    return data
+
+
+def _top_level_blocks(text: str) -> list[tuple[str, str]]:
+    matches = list(_TOP_LEVEL_KEY_RE.finditer(text))
+    blocks = []
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        blocks.append((m.group(1), text[m.start():end]))
+    return blocks
+
+
+def _cut_child_block(block: str, child: str, replacement: str = "") -> tuple[str, bool]:
+    """Remove ``child:`` and its continuation lines from a block mapping.
+
+    With ``replacement`` the removed lines are replaced by
+    ``<indent><replacement>`` (a ``key: value`` line) at the same position.
+    """
+    lines = block.splitlines(keepends=True)
+    for i, line in enumerate(lines[1:], start=1):
+        stripped = line.lstrip(" ")
+        indent = len(line) - len(stripped)
+        if indent == 0 or not stripped.startswith(f"{child}:"):
+            continue
+        j = i + 1
+        while j < len(lines):
+            nxt = lines[j]
+            body = nxt.strip()
+            if body and len(nxt) - len(nxt.lstrip(" ")) <= indent:
+                break
+            j += 1
+        inserted = [f"{' ' * indent}{replacement}\n"] if replacement else []
+        return "".join(lines[:i] + inserted + lines[j:]), True
+    return block, False
+
+
+def project_entry_text(text: str, fields: Iterable[str] | None = None) -> tuple[object, list[tuple[str, str]]]:
+    """Parse only the requested top-level keys of an entry's YAML text.
+
+    Heavy sub-fields (HEAVY_FIELDS) are cut out of the text before parsing.
+    Returns ``(data, deferred_paths)`` where ``deferred_paths`` lists the
+    heavy fields that were present and skipped. Falls back to a full parse
+    whenever the text does not split cleanly (flow style, anchors, etc.).
+    """
+    wanted = None if fields is None else set(fields) | {"id"}
+    kept: list[str] = []
+    deferred: list[tuple[str, str]] = []
+    heavy_children: dict[str, list[str]] = {}
+    for parent, child in HEAVY_FIELDS:
+        heavy_children.setdefault(parent, []).append(child)
+
+    for key, block in _top_level_blocks(text):
+        if wanted is not None and key not in wanted:
+            continue
+        for child in heavy_children.get(key, []):
+            block, cut = _cut_child_block(block, child)
+            if cut:
+                deferred.append((key, child))
+        kept.append(block)
+
+    try:
+        data = yaml.safe_load("".join(kept)) if kept else {}
+    except yaml.YAMLError:
+        # e.g. an alias whose anchor lived in a dropped block
+        data = None
+    if not isinstance(data, dict):
+        data = yaml.safe_load(text)
+        if not isinstance(data, dict):
+            return data, []
+        light, heavy = split_heavy(data)
+        return select_fields(light, fields), list(heavy)
+    # Flow-style blocks keep heavy children on one line; split them here.
+    data, heavy = split_heavy(data)
+    return data, deferred + list(heavy)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import date, datetime
 from typing import TypeAlias
 
@@ -52,6 +53,96 @@ def format_amount(amount: AmountData | None) -> str:
     return f"${value:,}"
 
 
+class Entry(Mapping):
+    """Read-only, slotted view of one entry with its hot fields precomputed.
+
+    Analytics loops read the same handful of nested fields (org, track,
+    status, score, submission date, blocks) from every entry, often once per
+    other entry. An Entry resolves them once into slots, so each later read is
+    a plain attribute load instead of a chain of ``.get`` calls and
+    isinstance checks. Values are stored as found in the YAML; callers apply
+    their own defaults (``entry.portal or "unknown"``).
+
+    The view is also a Mapping over the original dict, so code that only
+    calls ``.get`` or indexes keeps working, and to_dict() returns that dict.
+    """
+
+    __slots__ = (
+        "_data", "id", "status", "track", "org", "portal", "identity_position",
+        "outcome", "score", "submitted", "blocks_used",
+    )
+
+    def __init__(self, data: EntryData):
+        self._data = data
+        self.id = data.get("id")
+        self.status = data.get("status")
+        self.track = data.get("track")
+        self.outcome = data.get("outcome")
+
+        target = data.get("target")
+        if isinstance(target, dict):
+            self.org = target.get("organization")
+            self.portal = target.get("portal")
+        else:
+            self.org = self.portal = None
+
+        fit = data.get("fit")
+        self.identity_position = None
+        self.score = None
+        if isinstance(fit, dict):
+            self.identity_position = fit.get("identity_position")
+            raw = fit.get("score")
+            if raw is not None:
+                try:
+                    self.score = float(raw)
+                except (ValueError, TypeError):
+                    pass
+
+        timeline = data.get("timeline")
+        self.submitted = parse_date(timeline.get("submitted")) if isinstance(timeline, dict) else None
+
+        submission = data.get("submission")
+        blocks = submission.get("blocks_used") if isinstance(submission, dict) else None
+        if isinstance(blocks, dict):
+            self.blocks_used = tuple(blocks.values())
+        elif isinstance(blocks, list):
+            self.blocks_used = tuple(blocks)
+        else:
+            self.blocks_used = ()
+
+    @classmethod
+    def of(cls, entry: EntryData | Entry) -> Entry:
+        """Return *entry* itself if it is already a view, else a new view of it."""
+        return entry if isinstance(entry, cls) else cls(entry)
+
+    def to_dict(self) -> EntryData:
+        """Return the entry dict this view was built from (not a copy)."""
+        return self._data
+
+    def __getitem__(self, key: str) -> object:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: object = None) -> object:
+        return self._data.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"Entry(id={self.id!r}, status={self.status!r})"
+
+
+def entry_views(entries: Iterable[EntryData | Entry]) -> list[Entry]:
+    """Wrap each entry in an Entry view, reusing entries that already are one."""
+    return [Entry.of(entry) for entry in entries]
+
+
 def get_effort(entry: EntryData) -> str:
     """Get effort level from submission, defaulting to 'standard'."""
     submission = entry.get("submission", {})
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from datetime import UTC, date, datetime
 from pathlib import Path
@@ -41,12 +42,16 @@ def flush_stale_active_jobs(*, quiet: bool = False) -> int:
     """Move job-track entries in active/ older than 72h to research_pool/.
 
     Called automatically by morning.py and standup.py before rendering output
-    so the user only ever sees hot leads.
+    so the user only ever sees hot leads. PIPELINE_FRESHNESS_FLUSH=0 turns
+    the flush off (test runs against the real tree).
 
     Returns the number of entries flushed.
     """
     import yaml
 
+    if os.environ.get("PIPELINE_FRESHNESS_FLUSH") == "0":
+        return 0
+
     _, _, stale_hours = _load_freshness_thresholds()
     flushed = 0
 
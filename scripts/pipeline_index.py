@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""SQLite index of pipeline entry header fields, mirrored from the YAML tree.
+
+Most commands load every entry only to filter on a handful of fields. This
+index holds those fields (id, status, track, organization, fit score,
+deadline, last_touched, submitted date) plus the file path, so a query such
+as "all staged jobs with score >= 7" is one indexed SELECT instead of
+parsing ~2,000 documents.
+
+The index is a rebuildable cache, never the source of truth. Every query
+first refreshes it incrementally: files whose (mtime_ns, size) differ from
+the stored row are re-read, vanished files are dropped. Deleting the
+database (or ``--rebuild``) is always safe.
+
+Alongside the header fields, every entry's dedupe keys (its id, its
+normalized application URL and a company + title key; extract_dedupe_keys)
+are kept in their own table for dedupe_index, so job sourcing can check
+membership without loading entries.
+
+resolve_ids() doubles as the id → path map behind load_entry_by_id: it
+rescans only directories whose mtime moved (files added, removed or
+renamed) and stat-checks just the rows it returns, so a lookup does not
+touch the rest of the tree.
+
+Entries packed into segments (pipeline_segments) are indexed under the path
+they would have as loose files, with the segment's mtime and size as their
+stat key.
+
+Usage:
+    python scripts/pipeline_index.py --stats     # Row counts per dir/status
+    python scripts/pipeline_index.py --rebuild   # Drop and rebuild from YAML
+    python scripts/pipeline_index.py --status staged --track job --min-score 7
+    python scripts/pipeline_index.py --mismatches  # Files whose name != <id>.yaml
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pipeline_entry_cache as _entry_cache
+import pipeline_repository as _repository
+import pipeline_segments as _segments
+from pipeline_entry_cache import RACY_WINDOW_NS
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+INDEX_PATH = _entry_cache.CACHE_DIR / "entry-index.sqlite"
+SCHEMA_VERSION = 2
+
+# Scanned when callers do not pass dirs — mirrors ALL_PIPELINE_DIRS_WITH_POOL.
+DEFAULT_INDEX_DIRS = [
+    REPO_ROOT / "pipeline" / "active",
+    REPO_ROOT / "pipeline" / "submitted",
+    REPO_ROOT / "pipeline" / "closed",
+    REPO_ROOT / "pipeline" / "research_pool",
+]
+
+INDEXED_FIELDS = (
+    "id", "status", "track", "organization", "score",
+    "deadline", "deadline_type", "last_touched", "submitted",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    dir_path TEXT NOT NULL,
+    dir TEXT NOT NULL,
+    file TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    id TEXT,
+    status TEXT,
+    track TEXT,
+    organization TEXT,
+    score REAL,
+    deadline TEXT,
+    deadline_type TEXT,
+    last_touched TEXT,
+    submitted TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_status ON entries(status);
+CREATE INDEX IF NOT EXISTS idx_entries_track ON entries(track);
+CREATE INDEX IF NOT EXISTS idx_entries_org ON entries(organization);
+CREATE INDEX IF NOT EXISTS idx_entries_score ON entries(score);
+CREATE INDEX IF NOT EXISTS idx_entries_id ON entries(id);
+CREATE INDEX IF NOT EXISTS idx_entries_dir ON entries(dir_path);
+CREATE TABLE IF NOT EXISTS dedupe_keys (
+    path TEXT NOT NULL,
+    dir_path TEXT NOT NULL,
+    key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dedupe_key ON dedupe_keys(key);
+CREATE INDEX IF NOT EXISTS idx_dedupe_path ON dedupe_keys(path);
+"""
+
+# Query parameters that identify a visit, not a posting.
+_TRACKING_PARAMS = {"gh_src", "ref", "source", "src", "lever-source", "lever-origin"}
+# Hosts serving the same postings under another name.
+_HOST_ALIASES = {"job-boards.greenhouse.io": "boards.greenhouse.io"}
+# Form pages of a posting (Lever, Ashby) dedupe with the posting itself.
+_APPLY_SUFFIXES = ("/apply", "/application")
+
+# Paths rewritten by this process since they were last indexed (note_write).
+_WRITTEN_PATHS: set[str] = set()
+
+
+def _iso(value) -> str | None:
+    """Normalize a YAML date/datetime/string into an ISO date string."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, date):
+        return value.isoformat()[:10]
+    return str(value)[:10]
+
+
+def extract_index_row(data: dict) -> dict:
+    """Project an entry dict onto the indexed header fields."""
+    target = data.get("target") if isinstance(data.get("target"), dict) else {}
+    fit = data.get("fit") if isinstance(data.get("fit"), dict) else {}
+    deadline = data.get("deadline") if isinstance(data.get("deadline"), dict) else {}
+    timeline = data.get("timeline") if isinstance(data.get("timeline"), dict) else {}
+    try:
+        score = float(fit.get("score")) if fit.get("score") is not None else None
+    except (TypeError, ValueError):
+        score = None
+    return {
+        "id": str(data["id"]) if data.get("id") is not None else None,
+        "status": data.get("status"),
+        "track": data.get("track"),
+        "organization": target.get("organization"),
+        "score": score,
+        "deadline": _iso(deadline.get("date")),
+        "deadline_type": deadline.get("type"),
+        "last_touched": _iso(data.get("last_touched")),
+        "submitted": _iso(timeline.get("submitted")),
+    }
+
+
+def normalize_url(url: str) -> str | None:
+    """Dedupe key of an application URL, or None if *url* is not one.
+
+    Scheme, ``www.``, trailing slashes, apply-form suffixes and tracking
+    parameters are dropped; the remaining parameters are sorted.
+    """
+    try:
+        parts = urlsplit(str(url).strip())
+    except ValueError:
+        return None
+    if not parts.hostname:
+        return None
+    host = parts.hostname.removeprefix("www.")
+    host = _HOST_ALIASES.get(host, host)
+    path = parts.path.rstrip("/")
+    for suffix in _APPLY_SUFFIXES:
+        path = path.removesuffix(suffix)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_")
+    )
+    return f"url:{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def _words(text: str) -> str:
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", str(text).lower()).split())
+
+
+def title_key(organization: str, title: str) -> str | None:
+    """Dedupe key of a (company, title) pair, ignoring case and punctuation."""
+    org, role = _words(organization or ""), _words(title or "")
+    if not org or not role:
+        return None
+    return f"title:{org}|{role}"
+
+
+def extract_dedupe_keys(data: dict) -> list[str]:
+    """An entry's dedupe keys: id, normalized application URL, company + title.
+
+    Entries store their title inside ``name`` ("<Company> <Title>"), so the
+    organization is stripped from the front of it.
+    """
+    keys = []
+    if data.get("id") is not None:
+        keys.append(str(data["id"]))
+    target = data.get("target") if isinstance(data.get("target"), dict) else {}
+    url_key = normalize_url(target.get("application_url") or "")
+    if url_key:
+        keys.append(url_key)
+    org = _words(target.get("organization") or "")
+    name = _words(data.get("name") or "")
+    if org and name.startswith(org + " "):
+        name_key = title_key(org, name[len(org):])
+        if name_key:
+            keys.append(name_key)
+    return keys
+
+
+def connect(path: Path | None = None) -> sqlite3.Connection:
+    """Open (creating if needed) the index database.
+
+    A database with a different schema version, or one SQLite cannot read,
+    is discarded and recreated.
+    """
+    db_path = path or INDEX_PATH
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        conn = _open(db_path)
+    except sqlite3.DatabaseError:
+        db_path.unlink(missing_ok=True)
+        conn = _open(db_path)
+    return conn
+
+
+def _open(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None or row["value"] != str(SCHEMA_VERSION):
+        conn.execute("DELETE FROM entries")
+        conn.execute("DELETE FROM dedupe_keys")
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+        conn.commit()
+    return conn
+
+
+def _scan_dir(pipeline_dir: Path) -> dict[str, os.stat_result]:
+    if not pipeline_dir.exists():
+        return {}
+    found = {}
+    with os.scandir(pipeline_dir) as it:
+        for de in it:
+            if de.name.endswith(".yaml") and not de.name.startswith(("_", ".")) and de.is_file():
+                found[str(Path(de.path))] = de.stat()
+    for name in _segments.packed_names(pipeline_dir):
+        path = pipeline_dir / name
+        if str(path) not in found:
+            found[str(path)] = _segments.segment_for(path).stat()
+    return found
+
+
+def refresh_index(
+    conn: sqlite3.Connection,
+    dirs: Iterable[Path] | None = None,
+) -> dict[str, int]:
+    """Bring the index in line with the YAML tree for the given dirs.
+
+    Only files whose (mtime_ns, size) changed, or that were written in this
+    process (note_write), are re-read; parsing goes through the parsed-entry
+    cache. Returns counts of added/updated/removed rows.
+    """
+    stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+    cache = _repository.get_repository().cache if _entry_cache.cache_enabled() else None
+    for pipeline_dir in (dirs or DEFAULT_INDEX_DIRS):
+        listed_ns = time.time_ns()
+        on_disk = _scan_dir(pipeline_dir)
+        stored = {
+            row["path"]: (row["mtime_ns"], row["size"])
+            for row in conn.execute(
+                "SELECT path, mtime_ns, size FROM entries WHERE dir_path = ?", (str(pipeline_dir),)
+            )
+        }
+        gone = [p for p in stored if p not in on_disk]
+        if gone:
+            conn.executemany("DELETE FROM entries WHERE path = ?", [(p,) for p in gone])
+            conn.executemany("DELETE FROM dedupe_keys WHERE path = ?", [(p,) for p in gone])
+            stats["removed"] += len(gone)
+
+        for path_str, st in on_disk.items():
+            prev = stored.get(path_str)
+            if prev == (st.st_mtime_ns, st.st_size) and path_str not in _WRITTEN_PATHS:
+                stats["unchanged"] += 1
+                continue
+            _index_file(conn, Path(path_str), pipeline_dir, st, cache)
+            stats["updated" if prev else "added"] += 1
+        _record_dir_scan(conn, pipeline_dir, listed_ns)
+    conn.commit()
+    if cache is not None:
+        # Only changed files were looked up, so nothing may be pruned.
+        cache.save(prune=False)
+    return stats
+
+
+def _index_file(
+    conn: sqlite3.Connection,
+    filepath: Path,
+    pipeline_dir: Path,
+    st: os.stat_result,
+    cache: _entry_cache.EntryCache | None,
+) -> dict:
+    """Parse one entry file and upsert its row. Returns the indexed fields."""
+    try:
+        data = _entry_cache.parse_entry_file(filepath, cache)
+    except FileNotFoundError:
+        data = _segments.packed_entry(filepath)
+    except (OSError, yaml.YAMLError):
+        data = None
+    row = extract_index_row(data) if isinstance(data, dict) else dict.fromkeys(INDEXED_FIELDS)
+    conn.execute(
+        "INSERT OR REPLACE INTO entries (path, dir_path, dir, file, mtime_ns, size, "
+        + ", ".join(INDEXED_FIELDS)
+        + ") VALUES (?, ?, ?, ?, ?, ?, "
+        + ", ".join("?" for _ in INDEXED_FIELDS)
+        + ")",
+        (str(filepath), str(pipeline_dir), pipeline_dir.name, filepath.name, st.st_mtime_ns, st.st_size,
+         *(row[f] for f in INDEXED_FIELDS)),
+    )
+    conn.execute("DELETE FROM dedupe_keys WHERE path = ?", (str(filepath),))
+    if isinstance(data, dict):
+        conn.executemany(
+            "INSERT INTO dedupe_keys (path, dir_path, key) VALUES (?, ?, ?)",
+            [(str(filepath), str(pipeline_dir), key) for key in dict.fromkeys(extract_dedupe_keys(data))],
+        )
+    _WRITTEN_PATHS.discard(str(filepath))
+    return row
+
+
+def _record_dir_scan(conn: sqlite3.Connection, pipeline_dir: Path, listed_ns: int) -> None:
+    try:
+        mtime_ns = pipeline_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = 0
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+        (f"dir:{pipeline_dir}", f"{mtime_ns}:{listed_ns}"),
+    )
+
+
+def _dir_changed(conn: sqlite3.Connection, pipeline_dir: Path) -> bool:
+    """True if files may have been added, removed or renamed since the last scan.
+
+    Any create/delete/rename bumps the directory mtime, so an unchanged
+    directory mtime (outside the racy window) means its set of files is
+    exactly what the index holds.
+    """
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"dir:{pipeline_dir}",)).fetchone()
+    try:
+        mtime_ns = pipeline_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = 0
+    if row is None:
+        return True
+    stored_mtime, _, listed_ns = row["value"].partition(":")
+    return int(stored_mtime) != mtime_ns or int(listed_ns) - mtime_ns <= RACY_WINDOW_NS
+
+
+def note_write(filepath: Path) -> None:
+    """Mark *filepath* as rewritten so the index re-reads it on next use.
+
+    Called from pipeline_lib.atomic_write. Needed only for rewrites that keep
+    size and mtime identical; every other change is caught by stat.
+    """
+    _WRITTEN_PATHS.add(str(filepath))
+
+
+def resolve_ids(
+    entry_ids: Iterable[str],
+    dirs: Iterable[Path] | None = None,
+    *,
+    path: Path | None = None,
+) -> dict[str, Path]:
+    """Map entry ids to their YAML files in one pass.
+
+    Lookup is by the ``id`` field, not the file name, so files whose name
+    drifted from their id are still found. When an id exists in several
+    dirs the first dir in *dirs* wins. Only directories whose mtime changed
+    are rescanned and only the matched files are stat-checked, so resolving
+    one id or hundreds costs a single query. Ids with no entry are omitted.
+    """
+    scan_dirs = list(dirs or DEFAULT_INDEX_DIRS)
+    wanted = list(dict.fromkeys(str(i) for i in entry_ids))
+    if not wanted:
+        return {}
+    conn = connect(path)
+    try:
+        changed = [d for d in scan_dirs if _dir_changed(conn, d)]
+        if changed:
+            refresh_index(conn, changed)
+        rows = _rows_for_ids(conn, wanted, scan_dirs)
+        stale_dirs = {Path(r["dir_path"]) for r in rows if not _row_current(r)}
+        if stale_dirs:
+            refresh_index(conn, [d for d in scan_dirs if d in stale_dirs])
+            rows = _rows_for_ids(conn, wanted, scan_dirs)
+    finally:
+        conn.close()
+
+    order = {str(d): i for i, d in enumerate(scan_dirs)}
+    rows.sort(key=lambda r: (order[r["dir_path"]], r["path"]))
+    resolved: dict[str, Path] = {}
+    for r in rows:
+        resolved.setdefault(r["id"], Path(r["path"]))
+    return resolved
+
+
+def _rows_for_ids(conn: sqlite3.Connection, ids: list[str], dirs: list[Path]) -> list[dict]:
+    rows = []
+    dir_params = [str(d) for d in dirs]
+    # Stay well under SQLite's bound-parameter limit.
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        sql = (
+            "SELECT path, dir_path, id, mtime_ns, size FROM entries "
+            f"WHERE id IN ({', '.join('?' for _ in chunk)}) "
+            f"AND dir_path IN ({', '.join('?' for _ in dir_params)})"
+        )
+        rows.extend(dict(r) for r in conn.execute(sql, [*chunk, *dir_params]))
+    return rows
+
+
+def _row_current(row: dict) -> bool:
+    if row["path"] in _WRITTEN_PATHS:
+        return False
+    try:
+        st = os.stat(row["path"])
+    except FileNotFoundError:
+        return _segments.packed_stat(Path(row["path"])) == (row["mtime_ns"], row["size"])
+    return (st.st_mtime_ns, st.st_size) == (row["mtime_ns"], row["size"])
+
+
+def id_mismatches(dirs: Iterable[Path] | None = None, path: Path | None = None) -> list[dict]:
+    """Return rows whose file name is not ``<id>.yaml`` (or that have no id)."""
+    scan_dirs = list(dirs or DEFAULT_INDEX_DIRS)
+    conn = connect(path)
+    try:
+        refresh_index(conn, scan_dirs)
+        sql = (
+            "SELECT path, dir, file, id FROM entries "
+            f"WHERE dir_path IN ({', '.join('?' for _ in scan_dirs)}) "
+            "AND (id IS NULL OR file != id || '.yaml') ORDER BY path"
+        )
+        return [dict(r) for r in conn.execute(sql, [str(d) for d in scan_dirs])]
+    finally:
+        conn.close()
+
+
+def rebuild_index(dirs: Iterable[Path] | None = None, path: Path | None = None) -> dict[str, int]:
+    """Drop every row and rebuild the index from the YAML tree."""
+    conn = connect(path)
+    try:
+        conn.execute("DELETE FROM entries")
+        conn.execute("DELETE FROM dedupe_keys")
+        conn.commit()
+        return refresh_index(conn, dirs)
+    finally:
+        conn.close()
+
+
+def _as_tuple(value: str | Iterable[str] | None) -> tuple[str, ...] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def query_index(
+    *,
+    status: str | Iterable[str] | None = None,
+    track: str | Iterable[str] | None = None,
+    organization: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    deadline_before: str | date | None = None,
+    touched_before: str | date | None = None,
+    dirs: Iterable[Path] | None = None,
+    refresh: bool = True,
+    path: Path | None = None,
+) -> list[dict]:
+    """Return index rows matching every given filter, ordered by path.
+
+    Rows are plain dicts with ``path``, ``dir``, ``file`` and the indexed
+    fields. Pass ``refresh=False`` to skip the incremental mtime scan when
+    the caller has just refreshed.
+    """
+    scan_dirs = list(dirs or DEFAULT_INDEX_DIRS)
+    conn = connect(path)
+    try:
+        if refresh:
+            refresh_index(conn, scan_dirs)
+        clauses = [f"dir_path IN ({', '.join('?' for _ in scan_dirs)})"]
+        params: list = [str(d) for d in scan_dirs]
+        for column, value in (("status", _as_tuple(status)), ("track", _as_tuple(track))):
+            if value is not None:
+                clauses.append(f"{column} IN ({', '.join('?' for _ in value)})")
+                params.extend(value)
+        if organization is not None:
+            clauses.append("organization = ?")
+            params.append(organization)
+        if min_score is not None:
+            clauses.append("score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("score <= ?")
+            params.append(max_score)
+        if deadline_before is not None:
+            clauses.append("deadline IS NOT NULL AND deadline < ?")
+            params.append(_iso(deadline_before))
+        if touched_before is not None:
+            clauses.append("last_touched IS NOT NULL AND last_touched < ?")
+            params.append(_iso(touched_before))
+        sql = f"SELECT * FROM entries WHERE {' AND '.join(clauses)} ORDER BY path"
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def index_stats(path: Path | None = None) -> dict:
+    """Summarize the index: rows per dir and per status."""
+    conn = connect(path)
+    try:
+        refresh_index(conn)
+        by_dir = {r["dir"]: r["n"] for r in conn.execute("SELECT dir, COUNT(*) AS n FROM entries GROUP BY dir")}
+        by_status = {
+            (r["status"] or "unknown"): r["n"]
+            for r in conn.execute("SELECT status, COUNT(*) AS n FROM entries GROUP BY status ORDER BY n DESC")
+        }
+        return {"path": str(path or INDEX_PATH), "total": sum(by_dir.values()), "by_dir": by_dir, "by_status": by_status}
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SQLite entry index (derived cache of pipeline YAML)")
+    parser.add_argument("--rebuild", action="store_true", help="Drop and rebuild the index from scratch")
+    parser.add_argument("--stats", action="store_true", help="Show row counts per dir and status")
+    parser.add_argument("--status", nargs="+", help="Filter by status")
+    parser.add_argument("--track", nargs="+", help="Filter by track")
+    parser.add_argument("--org", help="Filter by target organization")
+    parser.add_argument("--min-score", type=float, help="Minimum fit score")
+    parser.add_argument("--mismatches", action="store_true",
+                        help="List entries whose file name does not match their id")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    if args.mismatches:
+        rows = id_mismatches()
+        if args.json:
+            print(json.dumps(rows, indent=2))
+            return 0
+        for row in rows:
+            print(f"  {row['dir']}/{row['file']:<55} id: {row['id'] or '(missing)'}")
+        print(f"{len(rows)} id/filename mismatch(es)")
+        return 1 if rows else 0
+
+    if args.rebuild:
+        stats = rebuild_index()
+        print(f"Rebuilt entry index: {stats['added']} rows → {INDEX_PATH}")
+        return 0
+
+    if args.stats or not (args.status or args.track or args.org or args.min_score is not None):
+        stats = index_stats()
+        if args.json:
+            print(json.dumps(stats, indent=2))
+            return 0
+        print(f"Entry index: {stats['total']} rows ({stats['path']})")
+        for d, n in sorted(stats["by_dir"].items()):
+            print(f"  {d:<15} {n:>5}")
+        print("By status:")
+        for s, n in stats["by_status"].items():
+            print(f"  {s:<15} {n:>5}")
+        return 0
+
+    rows = query_index(status=args.status, track=args.track, organization=args.org, min_score=args.min_score)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    for row in rows:
+        score = f"{row['score']:.1f}" if row["score"] is not None else "—"
+        print(f"  {row['id'] or row['file']:<50} {row['status'] or '?':<12} {score:>5}  {row['organization'] or ''}")
+    print(f"{len(rows)} match(es)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
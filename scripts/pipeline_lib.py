@@ -10,11 +10,17 @@
 import json
 import os
 import re
+import sqlite3
 from datetime import date
 from pathlib import Path
+from typing import NamedTuple
 
+import pipeline_entry_cache as _entry_cache
 import pipeline_entry_state as _entry_state
 import pipeline_freshness as _pipeline_freshness
+import pipeline_index as _entry_index
+import pipeline_repository as _repository
+import pipeline_segments as _segments
 import yaml
 from pipeline_market import build_market_intelligence_loader
 from pipeline_market import http_request_with_retry as _http_request_with_retry
@@ -40,6 +46,8 @@
 is_actionable = _entry_state.is_actionable
 is_deferred = _entry_state.is_deferred
 can_advance = _entry_state.can_advance
+Entry = _entry_state.Entry
+entry_views = _entry_state.entry_views
 
 # ═══════════════════════════════════════════
 # IDENTITY — single source of truth for all personal data
@@ -203,42 +211,34 @@ def get_operator_name(default: str = "unknown") -> str:
 # --- Safe YAML field mutation helpers ---
 
 
-def update_yaml_field(
-    content: str,
-    field: str,
-    new_value: str,
-    *,
-    nested: bool = False,
-    parent_key: str | None = None,
-) -> str:
-    """Replace a scalar YAML field's value in raw text with verification.
+class FieldEdit(NamedTuple):
+    """One scalar field replacement, as taken by update_yaml_field.
 
-    Uses targeted regex to preserve file formatting (comments, key order,
-    quoting style) while validating the result is still parseable YAML.
+    ``optional`` edits are skipped when the field is missing; ``create``
+    edits append a top-level field when it is missing (ensure_yaml_field).
+    """
 
-    Args:
-        content: Raw YAML text.
-        field: Field name (e.g. "status", "score", "submitted").
-        new_value: Replacement value string (caller handles quoting).
-        nested: If True, field is expected to be indented under a parent key.
-        parent_key: If provided, scope the replacement to within the parent key's
-            block only — avoids ambiguous first-match when multiple blocks share
-            a field name (e.g. `date` under `deadline` vs `timeline`).
+    field: str
+    value: str
+    nested: bool = False
+    parent_key: str | None = None
+    optional: bool = False
+    create: bool = False
 
-    Returns:
-        Modified YAML text.
 
-    Raises:
-        ValueError: If the field is not found or the result is invalid YAML.
-    """
-    if parent_key is not None:
+def _replace_yaml_field(content: str, edit: FieldEdit) -> str:
+    """Apply one FieldEdit to raw text without re-validating the YAML."""
+    field, new_value = edit.field, edit.value
+    if edit.create and not re.search(rf'^{re.escape(field)}:', content, re.MULTILINE):
+        return content.rstrip() + f'\n{field}: {new_value}\n'
+    if edit.parent_key is not None:
         # Find the parent block, then scope the replacement within it.
         parent_pattern = re.compile(
-            rf'^({re.escape(parent_key)}:\s*)$', re.MULTILINE
+            rf'^({re.escape(edit.parent_key)}:\s*)$', re.MULTILINE
         )
         parent_match = parent_pattern.search(content)
         if not parent_match:
-            raise ValueError(f"Parent key '{parent_key}' not found in YAML")
+            raise ValueError(f"Parent key '{edit.parent_key}' not found in YAML")
         start = parent_match.end()
         # Block ends at next top-level key (non-indented, non-blank line)
         end_match = re.search(r'^\S', content[start:], re.MULTILINE)
@@ -248,7 +248,7 @@ def update_yaml_field(
         field_pattern = rf'^([ \t]+{re.escape(field)}:[ \t]+).*$'
         if not re.search(field_pattern, block, re.MULTILINE):
             raise ValueError(
-                f"Field '{field}' not found under parent '{parent_key}'"
+                f"Field '{field}' not found under parent '{edit.parent_key}'"
             )
         new_block = re.sub(
             field_pattern,
@@ -257,41 +257,86 @@ def update_yaml_field(
             count=1,
             flags=re.MULTILINE,
         )
-        new_content = content[:start] + new_block + content[block_end:]
-    elif nested:
+        return content[:start] + new_block + content[block_end:]
+
+    if edit.nested:
         pattern = rf'^([ \t]+{re.escape(field)}:[ \t]+).*$'
-        if not re.search(pattern, content, re.MULTILINE):
-            raise ValueError(f"Field '{field}' not found in YAML (nested={nested})")
-        new_content = re.sub(
-            pattern,
-            lambda m: m.group(1) + new_value,
-            content,
-            count=1,
-            flags=re.MULTILINE,
-        )
     else:
         pattern = rf'^({re.escape(field)}:[ \t]+).*$'
-        if not re.search(pattern, content, re.MULTILINE):
-            raise ValueError(f"Field '{field}' not found in YAML (nested={nested})")
-        new_content = re.sub(
-            pattern,
-            lambda m: m.group(1) + new_value,
-            content,
-            count=1,
-            flags=re.MULTILINE,
-        )
+    if not re.search(pattern, content, re.MULTILINE):
+        raise ValueError(f"Field '{field}' not found in YAML (nested={edit.nested})")
+    return re.sub(
+        pattern,
+        lambda m: m.group(1) + new_value,
+        content,
+        count=1,
+        flags=re.MULTILINE,
+    )
+
 
-    # Verify the result is still valid YAML
+def apply_field_edits(content: str, edits: list[FieldEdit]) -> str:
+    """Apply several field edits to raw YAML text, validating once at the end.
+
+    Equivalent to chaining update_yaml_field / ensure_yaml_field calls, but
+    the document is re-parsed once instead of once per edit. Optional edits
+    whose field (or parent block) is missing are skipped.
+
+    Raises:
+        ValueError: If a required field is not found or the result is
+            invalid YAML. Nothing is applied in either case.
+    """
+    new_content = content
+    for edit in edits:
+        try:
+            new_content = _replace_yaml_field(new_content, edit)
+        except ValueError:
+            if not edit.optional:
+                raise
     try:
         yaml.safe_load(new_content)
     except yaml.YAMLError as e:
-        raise ValueError(
-            f"YAML became invalid after updating '{field}' to '{new_value}': {e}"
-        )
-
+        if len(edits) == 1:
+            raise ValueError(
+                f"YAML became invalid after updating '{edits[0].field}' to '{edits[0].value}': {e}"
+            )
+        fields = ", ".join(edit.field for edit in edits)
+        raise ValueError(f"YAML became invalid after updating {fields}: {e}")
     return new_content
 
 
+def update_yaml_field(
+    content: str,
+    field: str,
+    new_value: str,
+    *,
+    nested: bool = False,
+    parent_key: str | None = None,
+) -> str:
+    """Replace a scalar YAML field's value in raw text with verification.
+
+    Uses targeted regex to preserve file formatting (comments, key order,
+    quoting style) while validating the result is still parseable YAML.
+    To change several fields of one file, apply_field_edits (or
+    write_field_edits) validates once for the whole batch.
+
+    Args:
+        content: Raw YAML text.
+        field: Field name (e.g. "status", "score", "submitted").
+        new_value: Replacement value string (caller handles quoting).
+        nested: If True, field is expected to be indented under a parent key.
+        parent_key: If provided, scope the replacement to within the parent key's
+            block only — avoids ambiguous first-match when multiple blocks share
+            a field name (e.g. `date` under `deadline` vs `timeline`).
+
+    Returns:
+        Modified YAML text.
+
+    Raises:
+        ValueError: If the field is not found or the result is invalid YAML.
+    """
+    return apply_field_edits(content, [FieldEdit(field, new_value, nested, parent_key)])
+
+
 def ensure_yaml_field(content: str, field: str, value: str) -> str:
     """Update a top-level field if it exists, or append it if missing."""
     if re.search(rf'^{re.escape(field)}:', content, re.MULTILINE):
@@ -301,59 +346,295 @@ def ensure_yaml_field(content: str, field: str, value: str) -> str:
 
 def update_last_touched(content: str) -> str:
     """Set last_touched to today's ISO date string."""
-    today_str = date.today().isoformat()
-    return ensure_yaml_field(content, "last_touched", f'"{today_str}"')
+    return ensure_yaml_field(content, "last_touched", last_touched_edit().value)
+
+
+def last_touched_edit() -> FieldEdit:
+    """Return the FieldEdit that sets last_touched to today (see update_last_touched)."""
+    return FieldEdit("last_touched", f'"{date.today().isoformat()}"', create=True)
+
+
+def write_field_edits(filepath: Path, edits: list[FieldEdit], content: str | None = None) -> str:
+    """Apply *edits* to one entry file as a single transaction.
+
+    The file is read once (unless *content* is given), validated once and
+    written once via atomic_write. If any required edit fails the file is
+    left untouched and ValueError is raised. Returns the new content.
+    """
+    if content is None:
+        content = filepath.read_text()
+    new_content = apply_field_edits(content, edits)
+    if new_content != content:
+        atomic_write(filepath, new_content)
+    return new_content
+
+
+def write_field_edits_bulk(edit_sets: dict[Path, list[FieldEdit]]) -> dict[Path, str]:
+    """Apply a set of edits to each of many files, one transaction per file.
+
+    Files that fail (missing required field, invalid result, unreadable)
+    are left untouched and do not stop the others. A single summary of the
+    failures is printed to stderr. Returns {filepath: error message}.
+    """
+    import sys as _sys
+
+    failures: dict[Path, str] = {}
+    for filepath, edits in edit_sets.items():
+        try:
+            write_field_edits(filepath, edits)
+        except (OSError, ValueError) as e:
+            failures[filepath] = str(e)
+    if failures:
+        print(f"[WARN] {len(failures)} of {len(edit_sets)} entry updates failed:", file=_sys.stderr)
+        for filepath, error in failures.items():
+            print(f"  {filepath.name}: {error}", file=_sys.stderr)
+    return failures
 
 
 def load_entries(
     dirs: list[Path] | None = None,
     include_filepath: bool = False,
+    *,
+    use_cache: bool = True,
+    fields: list[str] | None = None,
+    header_only: bool = False,
+    parallel: bool | None = None,
 ) -> list[dict]:
     """Load pipeline YAML entries from given directories.
 
+    Parsed entries are served from the process-wide EntryRepository (backed
+    by the on-disk cache in pipeline_entry_cache) when the file is
+    unchanged; set PIPELINE_ENTRY_CACHE=0 to bypass it.
+
     Args:
         dirs: Directories to scan. Defaults to all pipeline dirs.
         include_filepath: If True, adds _filepath key to each entry.
+        use_cache: If False, parse every file and leave the cache untouched.
+        fields: If given, only these top-level keys (plus id) are loaded.
+        header_only: If True, heavy fields such as target.description are
+            not parsed up front; they load transparently on first access.
+            Implied by ``fields``.
+        parallel: Parse files that miss the cache with the libyaml loader
+            across a process pool (only above
+            pipeline_entry_cache.PARALLEL_MIN_FILES files). Defaults to the
+            PIPELINE_PARALLEL_LOAD environment variable.
+
+    Entries packed into segments (pipeline_segments) are returned alongside
+    loose files, in file-name order; a loose file shadows a packed entry of
+    the same name. A packed entry's _filepath is the path it would have as a
+    loose file.
 
     Returns:
         List of parsed YAML dicts with _dir and _file metadata.
     """
     import sys as _sys
 
-    entries = []
+    repository = _repository.get_repository() if use_cache and _entry_cache.cache_enabled() else None
+    cache = repository.cache if repository is not None else None
+    if parallel is None:
+        parallel = _entry_cache.parallel_enabled()
+    located: list[tuple[Path, Path]] = []
+    packed: dict[Path, dict] = {}
     for pipeline_dir in (dirs or ALL_PIPELINE_DIRS):
         if not pipeline_dir.exists():
             continue
-        for filepath in sorted(pipeline_dir.glob("*.yaml")):
-            if filepath.name.startswith("_"):
-                continue
-            try:
-                with open(filepath) as f:
-                    data = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                print(f"[WARN] Skipping unparseable entry: {filepath} ({e})", file=_sys.stderr)
-                continue
-            if isinstance(data, dict):
-                data["_dir"] = pipeline_dir.name
-                data["_file"] = filepath.name
-                if include_filepath:
-                    data["_filepath"] = filepath
-                entries.append(data)
-            else:
-                print(f"[WARN] Skipping non-dict entry: {filepath}", file=_sys.stderr)
+        if repository is not None:
+            files = repository.list_files(pipeline_dir)
+            cache.mark_scanned(pipeline_dir)
+        else:
+            files = [p for p in sorted(pipeline_dir.glob("*.yaml")) if not p.name.startswith("_")]
+        loose = {p.name for p in files}
+        packed_here = [n for n in _segments.packed_names(pipeline_dir) if n not in loose]
+        if packed_here:
+            for name, data in _segments.packed_entries(pipeline_dir, packed_here, fields=fields).items():
+                packed[pipeline_dir / name] = data
+            files = sorted(files + [pipeline_dir / name for name in packed_here])
+        located.extend((pipeline_dir, filepath) for filepath in files)
+
+    parsed = iter(_entry_cache.parse_entry_files(
+        [filepath for _, filepath in located if filepath not in packed], cache,
+        fields=fields, header_only=header_only, parallel=parallel,
+    ))
+    entries = []
+    for pipeline_dir, filepath in located:
+        data = packed[filepath] if filepath in packed else next(parsed)
+        if isinstance(data, yaml.YAMLError):
+            print(f"[WARN] Skipping unparseable entry: {filepath} ({data})", file=_sys.stderr)
+            continue
+        if isinstance(data, dict):
+            data["_dir"] = pipeline_dir.name
+            data["_file"] = filepath.name
+            if include_filepath:
+                data["_filepath"] = filepath
+            entries.append(data)
+        else:
+            print(f"[WARN] Skipping non-dict entry: {filepath}", file=_sys.stderr)
+    if cache is not None:
+        cache.save()
     return entries
 
 
+def query_entries(
+    *,
+    status: str | list[str] | None = None,
+    track: str | list[str] | None = None,
+    organization: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    deadline_before: str | date | None = None,
+    touched_before: str | date | None = None,
+    dirs: list[Path] | None = None,
+    include_filepath: bool = False,
+) -> list[dict]:
+    """Load only the entries matching header-field filters, via the SQLite index.
+
+    Equivalent to filtering load_entries(dirs) on status/track/organization/
+    fit.score/deadline/last_touched, but the filter runs as one indexed query
+    (see pipeline_index) and only matching files are parsed.
+
+    Returns:
+        Parsed YAML dicts with _dir and _file metadata, ordered as load_entries.
+    """
+    import sys as _sys
+
+    scan_dirs = list(dirs or ALL_PIPELINE_DIRS)
+    filters = {
+        "status": status,
+        "track": track,
+        "organization": organization,
+        "min_score": min_score,
+        "max_score": max_score,
+        "deadline_before": deadline_before,
+        "touched_before": touched_before,
+    }
+    if not _entry_cache.cache_enabled():
+        return _filter_entries(load_entries(dirs=scan_dirs, include_filepath=include_filepath), **filters)
+    try:
+        rows = _entry_index.query_index(dirs=scan_dirs, **filters)
+    except (sqlite3.Error, OSError) as e:
+        print(f"[WARN] Entry index unavailable, loading entries: {e}", file=_sys.stderr)
+        return _filter_entries(load_entries(dirs=scan_dirs, include_filepath=include_filepath), **filters)
+    order = {str(d): i for i, d in enumerate(scan_dirs)}
+    rows.sort(key=lambda r: (order.get(r["dir_path"], len(order)), r["file"]))
+
+    cache = _repository.get_repository().cache if _entry_cache.cache_enabled() else None
+    entries = []
+    for row in rows:
+        filepath = Path(row["path"])
+        try:
+            data = _parse_entry_or_packed(filepath, cache)
+        except (OSError, yaml.YAMLError) as e:
+            print(f"[WARN] Skipping unreadable entry: {filepath} ({e})", file=_sys.stderr)
+            continue
+        if not isinstance(data, dict):
+            continue
+        data["_dir"] = row["dir"]
+        data["_file"] = row["file"]
+        if include_filepath:
+            data["_filepath"] = filepath
+        entries.append(data)
+    if cache is not None:
+        cache.save(prune=False)
+    return entries
+
+
+def _filter_entries(
+    entries: list[dict],
+    *,
+    status=None,
+    track=None,
+    organization=None,
+    min_score=None,
+    max_score=None,
+    deadline_before=None,
+    touched_before=None,
+) -> list[dict]:
+    """Apply query_entries' header filters in Python (used when the index is off)."""
+    statuses = _entry_index._as_tuple(status)
+    tracks = _entry_index._as_tuple(track)
+    deadline_before = _entry_index._iso(deadline_before)
+    touched_before = _entry_index._iso(touched_before)
+    matched = []
+    for entry in entries:
+        row = _entry_index.extract_index_row(entry)
+        if statuses is not None and row["status"] not in statuses:
+            continue
+        if tracks is not None and row["track"] not in tracks:
+            continue
+        if organization is not None and row["organization"] != organization:
+            continue
+        if min_score is not None and (row["score"] is None or row["score"] < min_score):
+            continue
+        if max_score is not None and (row["score"] is None or row["score"] > max_score):
+            continue
+        if deadline_before is not None and (row["deadline"] is None or row["deadline"] >= deadline_before):
+            continue
+        if touched_before is not None and (row["last_touched"] is None or row["last_touched"] >= touched_before):
+            continue
+        matched.append(entry)
+    return matched
+
+
+def _resolve_entry_paths(entry_ids: list[str]) -> dict[str, Path]:
+    """Map ids to files via the id index, falling back to ``<id>.yaml`` probes.
+
+    The index matches on the ``id`` field, so renamed files are found; the
+    probe keeps the historic behaviour for files whose name is the id but
+    whose ``id`` field is missing or different.
+    """
+    import sys as _sys
+
+    found = {}
+    if _entry_cache.cache_enabled():
+        try:
+            found = _entry_index.resolve_ids(entry_ids, ALL_PIPELINE_DIRS_WITH_POOL)
+        except (sqlite3.Error, OSError) as e:
+            print(f"[WARN] Entry index unavailable, probing files: {e}", file=_sys.stderr)
+    for entry_id in entry_ids:
+        if entry_id in found:
+            continue
+        for pipeline_dir in ALL_PIPELINE_DIRS_WITH_POOL:
+            filepath = pipeline_dir / f"{entry_id}.yaml"
+            if filepath.exists() or _segments.segment_for(filepath) is not None:
+                found[entry_id] = filepath
+                break
+    return found
+
+
 def load_entry_by_id(entry_id: str) -> tuple[Path | None, dict | None]:
     """Load a single pipeline entry by ID. Returns (filepath, data) or (None, None)."""
-    for pipeline_dir in ALL_PIPELINE_DIRS_WITH_POOL:
-        filepath = pipeline_dir / f"{entry_id}.yaml"
-        if filepath.exists():
-            with open(filepath) as f:
-                data = yaml.safe_load(f)
-            if isinstance(data, dict):
-                return filepath, data
-    return None, None
+    loaded = load_entries_by_ids([entry_id])
+    return loaded.get(entry_id, (None, None))
+
+
+def load_entries_by_ids(entry_ids: list[str]) -> dict[str, tuple[Path, dict]]:
+    """Load many entries by ID in one pass. Returns {id: (filepath, data)}.
+
+    Ids are resolved together through the SQLite id index (one query, no
+    per-id directory probing); unknown ids are omitted. Packed entries come
+    back with the path they would have as a loose file.
+    """
+    cache = _repository.get_repository().cache if _entry_cache.cache_enabled() else None
+    loaded = {}
+    for entry_id, filepath in _resolve_entry_paths(list(entry_ids)).items():
+        try:
+            data = _parse_entry_or_packed(filepath, cache)
+        except FileNotFoundError:
+            continue
+        if isinstance(data, dict):
+            loaded[entry_id] = (filepath, data)
+    return loaded
+
+
+def _parse_entry_or_packed(filepath: Path, cache) -> object:
+    """parse_entry_file, falling back to a packed segment when no loose file exists."""
+    try:
+        return _entry_cache.parse_entry_file(filepath, cache)
+    except FileNotFoundError:
+        data = _segments.packed_entry(filepath)
+        if data is None:
+            raise
+        return data
 
 
 def load_profile(target_id: str) -> dict | None:
@@ -908,6 +1189,9 @@ def atomic_write(filepath: Path, content: str) -> None:
     except BaseException:
         Path(tmp_path).unlink(missing_ok=True)
         raise
+    # Write-through: the next load in this process re-reads the file.
+    _repository.invalidate(filepath)
+    _entry_index.note_write(filepath)
 
 
 # STATE MACHINE QUERY FUNCTIONS are imported from pipeline_entry_state.py.
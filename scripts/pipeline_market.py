@@ -15,30 +15,36 @@ def http_request_with_retry(
     headers: dict | None = None,
     timeout: int = 15,
     max_retries: int = 3,
+    cached: bool = False,
 ) -> bytes | None:
-    """Make an HTTP request with exponential backoff retry."""
-    import time
+    """Make an HTTP request with jittered exponential backoff retry.
+
+    Requests go through the shared keep-alive client (http_client); only
+    transient failures (connection errors, 429, 5xx) are retried. With
+    ``cached=True`` a GET goes through the conditional-GET cache
+    (http_cache), so unchanged responses are served from disk or by a 304.
+    """
     import urllib.error
-    import urllib.request
+
+    import http_client
 
     headers = headers or {}
-    for attempt in range(max_retries):
-        try:
-            req = urllib.request.Request(url, data=data, headers=headers, method=method)
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return resp.read()
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as exc:
-            if attempt < max_retries - 1:
-                time.sleep(2**attempt)
-            else:
-                import sys
-
-                print(
-                    f"  HTTP {method} {url} failed after {max_retries} attempts: {exc}",
-                    file=sys.stderr,
-                )
-                return None
-    return None
+    try:
+        if cached and method == "GET" and data is None:
+            from http_cache import cached_get
+
+            return cached_get(url, headers=headers, timeout=timeout, retries=max_retries - 1)
+        return http_client.request(
+            url, method=method, data=data, headers=headers, timeout=timeout, retries=max_retries - 1
+        ).read()
+    except (urllib.error.URLError, TimeoutError) as exc:
+        import sys
+
+        print(
+            f"  HTTP {method} {url} failed after {max_retries} attempts: {exc}",
+            file=sys.stderr,
+        )
+        return None
 
 
 # Required top-level keys in market-intelligence JSON.
@@ -0,0 +1,98 @@
+"""Process-wide repository of parsed pipeline entries.
+
+A single command loads the same YAML tree many times: score.py's main and
+compute_human_dimensions, every standup section, and each MCP tool call
+served by a long-running mcp_server. EntryRepository holds one EntryCache
+and the directory listings for the life of the process, so only the first
+load reads the on-disk cache (or parses YAML). Later loads re-validate each
+file by stat and hand back fresh copies.
+
+Writes go through pipeline_lib.atomic_write, which calls invalidate() for
+the rewritten file so the next load re-reads it even if its size and mtime
+look unchanged. Files changed any other way, including by other processes,
+are still caught by the per-file stat check in EntryCache.lookup.
+
+pipeline_lib.load_entries, query_entries and load_entry_by_id all go through
+get_repository(), so callers do not need to know about it.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pipeline_entry_cache as _entry_cache
+from pipeline_entry_cache import RACY_WINDOW_NS, EntryCache
+
+
+class EntryRepository:
+    """Shared EntryCache plus directory listings, with write-through invalidation."""
+
+    def __init__(self, cache_path: Path | None = None):
+        self.cache_path = cache_path
+        self._cache: EntryCache | None = None
+        # dir path → (dir mtime_ns, listed_ns, sorted entry files)
+        self._listings: dict[str, tuple[int, int, list[Path]]] = {}
+        self.invalidations = 0
+
+    @property
+    def cache(self) -> EntryCache:
+        """The process-wide EntryCache, re-opened if the cache path changed."""
+        path = self.cache_path or _entry_cache.ENTRY_CACHE_PATH
+        if self._cache is None or self._cache.path != path:
+            self._cache = EntryCache(path)
+        return self._cache
+
+    def list_files(self, pipeline_dir: Path) -> list[Path]:
+        """Return the sorted ``*.yaml`` entry files in *pipeline_dir*.
+
+        The listing is reused while the directory's mtime is unchanged and
+        outside the racy window (files added in the same timestamp tick as
+        the listing would otherwise be missed).
+        """
+        key = str(pipeline_dir)
+        try:
+            dir_mtime = pipeline_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._listings.pop(key, None)
+            return []
+        listing = self._listings.get(key)
+        if listing is not None and listing[0] == dir_mtime and listing[1] - dir_mtime > RACY_WINDOW_NS:
+            return list(listing[2])
+        files = [p for p in sorted(pipeline_dir.glob("*.yaml")) if not p.name.startswith("_")]
+        self._listings[key] = (dir_mtime, time.time_ns(), files)
+        return list(files)
+
+    def invalidate(self, filepath: Path | None = None) -> None:
+        """Forget *filepath* (or everything) so the next load re-reads it."""
+        self.invalidations += 1
+        if filepath is None:
+            self._cache = None
+            self._listings.clear()
+            return
+        self._listings.pop(str(Path(filepath).parent), None)
+        if self._cache is not None:
+            self._cache.forget(Path(filepath))
+
+
+_REPOSITORY: EntryRepository | None = None
+
+
+def get_repository() -> EntryRepository:
+    """Return the process-wide EntryRepository, creating it on first use."""
+    global _REPOSITORY
+    if _REPOSITORY is None:
+        _REPOSITORY = EntryRepository()
+    return _REPOSITORY
+
+
+def invalidate(filepath: Path | None = None) -> None:
+    """Invalidate *filepath* in the process-wide repository, if one exists."""
+    if _REPOSITORY is not None:
+        _REPOSITORY.invalidate(filepath)
+
+
+def reset_repository() -> None:
+    """Drop the process-wide repository (tests, or after bulk external edits)."""
+    global _REPOSITORY
+    _REPOSITORY = None
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Packed segment storage for rarely-edited pipeline directories.
+
+``pipeline/closed`` holds well over a thousand small YAML files that are
+almost never modified but are read by every analytics command. Packing moves
+them into one gzip-compressed JSONL segment per month under
+``<dir>/_segments/<YYYY-MM>.jsonl.gz`` (the month of ``last_touched``, i.e.
+roughly when the entry closed). Each line holds the file name, the parsed
+entry as JSON and the original YAML text as a JSON string, tab-separated,
+so loads decode only the entry and unpacking restores every file byte for
+byte.
+
+Loose files and segments coexist: pipeline_lib.load_entries,
+query_entries and load_entry_by_id read both, as do per-file readers
+through entry_paths/read_entry_text, and a loose file always shadows a
+packed entry of the same name. Writing to a packed entry's path
+with atomic_write therefore just creates a loose override, but to hand-edit
+an entry, unpack it first:
+
+    python scripts/pipeline_segments.py --unpack some-entry-id
+    $EDITOR pipeline/closed/some-entry-id.yaml
+    python scripts/pipeline_segments.py --pack        # fold it back in
+
+Usage:
+    python scripts/pipeline_segments.py --stats
+    python scripts/pipeline_segments.py --pack --dry-run
+    python scripts/pipeline_segments.py --pack [--dir pipeline/closed]
+    python scripts/pipeline_segments.py --unpack ID [ID ...]
+    python scripts/pipeline_segments.py --unpack-all
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterable
+from datetime import date, datetime
+from pathlib import Path
+
+import yaml
+from description_store import attach_description
+from pipeline_entry_fields import select_fields
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PACK_DIR = REPO_ROOT / "pipeline" / "closed"
+
+SEGMENT_DIRNAME = "_segments"
+SEGMENT_SUFFIX = ".jsonl.gz"
+UNDATED_SEGMENT = "undated"
+
+# pipeline dir → (segment signature, {file name: (segment path, JSON line)})
+_INDEX_CACHE: dict[str, tuple[tuple, dict[str, tuple[Path, bytes]]]] = {}
+
+
+def segment_dir(pipeline_dir: Path) -> Path:
+    """Return the directory holding *pipeline_dir*'s segments."""
+    return pipeline_dir / SEGMENT_DIRNAME
+
+
+def _segment_files(pipeline_dir: Path) -> list[Path]:
+    seg_dir = segment_dir(pipeline_dir)
+    if not seg_dir.is_dir():
+        return []
+    return sorted(p for p in seg_dir.iterdir() if p.name.endswith(SEGMENT_SUFFIX))
+
+
+# --- JSON codec (YAML dates survive the round trip) ---
+
+
+def _encode_default(value):
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Cannot pack value of type {type(value).__name__}")
+
+
+def _decode_hook(obj: dict):
+    if len(obj) == 1:
+        if "$date" in obj:
+            return date.fromisoformat(obj["$date"])
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+    return obj
+
+
+def _encode_line(name: str, data: dict, text: str) -> bytes:
+    # JSON escapes tabs and newlines, so neither can occur inside a field.
+    entry = json.dumps(data, default=_encode_default, ensure_ascii=False)
+    return "\t".join((name, entry, json.dumps(text, ensure_ascii=False))).encode("utf-8")
+
+
+def _decode_entry(line: bytes) -> dict:
+    return json.loads(line.split(b"\t", 2)[1], object_hook=_decode_hook)
+
+
+def _decode_text(line: bytes) -> str:
+    return json.loads(line.split(b"\t", 2)[2])
+
+
+# --- Reading ---
+
+
+def _read_segment(path: Path) -> list[bytes]:
+    return [line for line in gzip.decompress(path.read_bytes()).split(b"\n") if line]
+
+
+def _packed_index(pipeline_dir: Path) -> dict[str, tuple[Path, bytes]]:
+    """Map file name → (segment, encoded line), re-read only when a segment changes."""
+    files = _segment_files(pipeline_dir)
+    if not files:
+        _INDEX_CACHE.pop(str(pipeline_dir), None)
+        return {}
+    signature = tuple((p.name, st.st_mtime_ns, st.st_size) for p in files for st in (p.stat(),))
+    cached = _INDEX_CACHE.get(str(pipeline_dir))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    index: dict[str, tuple[Path, bytes]] = {}
+    for path in files:
+        for line in _read_segment(path):
+            index[line.split(b"\t", 1)[0].decode("utf-8")] = (path, line)
+    _INDEX_CACHE[str(pipeline_dir)] = (signature, index)
+    return index
+
+
+def packed_names(pipeline_dir: Path) -> list[str]:
+    """Return the sorted file names packed in *pipeline_dir*'s segments."""
+    return sorted(_packed_index(pipeline_dir))
+
+
+def packed_entries(
+    pipeline_dir: Path,
+    names: list[str] | None = None,
+    *,
+    fields: Iterable[str] | None = None,
+) -> dict[str, dict]:
+    """Return freshly decoded packed entries as {file name: entry}.
+
+    With *names*, only those entries (when packed) are decoded; with
+    *fields*, only those top-level keys (plus id) are kept. Blob-backed
+    descriptions are attached as in pipeline_entry_cache.parse_entry_file.
+    """
+    index = _packed_index(pipeline_dir)
+    wanted = index if names is None else [n for n in names if n in index]
+    return {
+        name: attach_description(select_fields(_decode_entry(index[name][1]), fields))
+        for name in wanted
+    }
+
+
+def packed_entry(filepath: Path) -> dict | None:
+    """Return the packed entry stored under *filepath*'s name, or None."""
+    return packed_entries(filepath.parent, [filepath.name]).get(filepath.name)
+
+
+def entry_paths(pipeline_dir: Path) -> list[Path]:
+    """Return every entry file of *pipeline_dir*, loose and packed, sorted by name.
+
+    Packed entries are listed under the path they would have as loose files,
+    so per-file readers (validate, standards, migrations) see the whole
+    directory. Read them with read_entry_text.
+    """
+    if not pipeline_dir.is_dir():
+        return []
+    names = {p.name for p in pipeline_dir.glob("*.yaml") if not p.name.startswith("_")}
+    names.update(_packed_index(pipeline_dir))
+    return [pipeline_dir / name for name in sorted(names)]
+
+
+def read_entry_text(filepath: Path) -> str:
+    """Return the YAML text of *filepath*, or of its packed entry when no loose file exists."""
+    try:
+        return filepath.read_text()
+    except FileNotFoundError:
+        found = _packed_index(filepath.parent).get(filepath.name)
+        if found is None:
+            raise
+        return _decode_text(found[1])
+
+
+def segment_for(filepath: Path) -> Path | None:
+    """Return the segment holding the packed entry for *filepath*, or None."""
+    found = _packed_index(filepath.parent).get(filepath.name)
+    return found[0] if found is not None else None
+
+
+def packed_stat(filepath: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of the segment holding *filepath*, or None."""
+    segment = segment_for(filepath)
+    if segment is None:
+        return None
+    st = segment.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+# --- Packing / unpacking ---
+
+
+def segment_key(data: dict) -> str:
+    """Return the YYYY-MM segment an entry belongs in."""
+    timeline = data.get("timeline") if isinstance(data.get("timeline"), dict) else {}
+    for value in (data.get("last_touched"), timeline.get("date_added"), timeline.get("researched")):
+        text = value.isoformat() if isinstance(value, date) else str(value or "")
+        if len(text) >= 7 and text[:4].isdigit() and text[4] == "-" and text[5:7].isdigit():
+            return text[:7]
+    return UNDATED_SEGMENT
+
+
+def _write_segment(path: Path, lines: list[bytes]) -> int:
+    """Atomically write (or remove, when empty) one segment. Returns its size."""
+    if not lines:
+        path.unlink(missing_ok=True)
+        return 0
+    payload = gzip.compress(b"\n".join(lines) + b"\n", compresslevel=6, mtime=0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp", prefix=f".{path.name}.")
+    try:
+        with open(fd, "wb") as f:
+            f.write(payload)
+        Path(tmp_path).replace(path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return len(payload)
+
+
+def _segment_lines(pipeline_dir: Path) -> dict[str, dict[str, bytes]]:
+    """Return {segment name: {file name: line}} for the current segments."""
+    by_segment: dict[str, dict[str, bytes]] = {}
+    for name, (path, line) in _packed_index(pipeline_dir).items():
+        by_segment.setdefault(path.name, {})[name] = line
+    return by_segment
+
+
+def pack_directory(pipeline_dir: Path | None = None, *, dry_run: bool = False) -> dict:
+    """Move loose entry files of *pipeline_dir* into monthly segments.
+
+    A file is packed only if its text parses to a mapping that survives the
+    JSON round trip unchanged; anything else stays loose and is counted as
+    ``skipped``. Segments are written before the loose files are removed,
+    so an interrupted pack leaves at worst a loose copy shadowing its packed
+    twin. Returns counters: ``packed``, ``skipped``, ``segments`` (segments
+    written) and ``loose_bytes`` (YAML bytes moved).
+    """
+    import pipeline_repository as _repository
+
+    pipeline_dir = pipeline_dir or DEFAULT_PACK_DIR
+    stats = {"packed": 0, "skipped": 0, "segments": 0, "loose_bytes": 0}
+    by_segment = _segment_lines(pipeline_dir)
+    packed_in = {name: seg for seg, lines in by_segment.items() for name in lines}
+    touched: set[str] = set()
+    moved: list[Path] = []
+
+    for filepath in sorted(pipeline_dir.glob("*.yaml")):
+        if filepath.name.startswith("_"):
+            continue
+        text = filepath.read_text()
+        try:
+            data = yaml.safe_load(text)
+            line = _encode_line(filepath.name, data, text)
+        except (yaml.YAMLError, TypeError, ValueError):
+            stats["skipped"] += 1
+            continue
+        if not isinstance(data, dict) or _decode_entry(line) != data:
+            stats["skipped"] += 1
+            continue
+        segment = segment_key(data) + SEGMENT_SUFFIX
+        previous = packed_in.get(filepath.name)
+        if previous is not None and previous != segment:
+            del by_segment[previous][filepath.name]
+            touched.add(previous)
+        by_segment.setdefault(segment, {})[filepath.name] = line
+        touched.add(segment)
+        moved.append(filepath)
+        stats["packed"] += 1
+        stats["loose_bytes"] += len(text.encode("utf-8"))
+
+    stats["segments"] = len(touched)
+    if dry_run or not moved:
+        return stats
+    seg_dir = segment_dir(pipeline_dir)
+    for segment in sorted(touched):
+        lines = by_segment.get(segment, {})
+        _write_segment(seg_dir / segment, [lines[name] for name in sorted(lines)])
+    for filepath in moved:
+        filepath.unlink()
+        _repository.invalidate(filepath)
+    _INDEX_CACHE.pop(str(pipeline_dir), None)
+    return stats
+
+
+def unpack_entries(pipeline_dir: Path | None = None, entry_ids: list[str] | None = None) -> list[Path]:
+    """Restore packed entries to loose YAML files so they can be edited.
+
+    *entry_ids* match the ``id`` field or the file stem; None unpacks
+    everything. The original text is written back unchanged (via
+    atomic_write) and the entries are removed from their segments, so a
+    loose file is the only copy. Returns the restored paths.
+    """
+    from pipeline_lib import atomic_write
+
+    pipeline_dir = pipeline_dir or DEFAULT_PACK_DIR
+    wanted = None if entry_ids is None else {str(i) for i in entry_ids}
+    by_segment = _segment_lines(pipeline_dir)
+    restored: list[Path] = []
+    for segment in sorted(by_segment):
+        lines = by_segment[segment]
+        keep = {}
+        for name, line in lines.items():
+            entry_id = _decode_entry(line).get("id")
+            if wanted is not None and Path(name).stem not in wanted and str(entry_id) not in wanted:
+                keep[name] = line
+                continue
+            filepath = pipeline_dir / name
+            if not filepath.exists():
+                # A loose file already shadows this entry; it wins.
+                atomic_write(filepath, _decode_text(line))
+            restored.append(filepath)
+        if len(keep) != len(lines):
+            _write_segment(segment_dir(pipeline_dir) / segment, [keep[n] for n in sorted(keep)])
+    _INDEX_CACHE.pop(str(pipeline_dir), None)
+    return sorted(restored)
+
+
+def segment_stats(pipeline_dir: Path | None = None) -> dict:
+    """Return segment count, packed entries, compressed bytes and loose files."""
+    pipeline_dir = pipeline_dir or DEFAULT_PACK_DIR
+    files = _segment_files(pipeline_dir)
+    loose = [p for p in pipeline_dir.glob("*.yaml") if not p.name.startswith("_")] if pipeline_dir.exists() else []
+    return {
+        "segments": len(files),
+        "packed": len(_packed_index(pipeline_dir)),
+        "bytes": sum(p.stat().st_size for p in files),
+        "loose": len(loose),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Packed monthly segments for pipeline entries")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_PACK_DIR, help="Pipeline directory (default: closed/)")
+    parser.add_argument("--pack", action="store_true", help="Move loose entry files into segments")
+    parser.add_argument("--dry-run", action="store_true", help="With --pack: report without writing")
+    parser.add_argument("--unpack", nargs="+", metavar="ID", help="Restore entries to loose files for editing")
+    parser.add_argument("--unpack-all", action="store_true", help="Restore every packed entry")
+    parser.add_argument("--stats", action="store_true", help="Show segment stats")
+    args = parser.parse_args(argv)
+    pipeline_dir = args.dir if args.dir.is_absolute() else Path.cwd() / args.dir
+
+    if args.pack:
+        stats = pack_directory(pipeline_dir, dry_run=args.dry_run)
+        label = "Would pack" if args.dry_run else "Packed"
+        print(f"{label} {stats['packed']} entries ({stats['loose_bytes']:,} bytes of YAML) "
+              f"into {stats['segments']} segment(s); {stats['skipped']} left loose")
+        return 0
+    if args.unpack or args.unpack_all:
+        restored = unpack_entries(pipeline_dir, None if args.unpack_all else args.unpack)
+        for path in restored:
+            print(f"  {os.path.relpath(path)}")
+        print(f"Unpacked {len(restored)} entries")
+        if args.unpack and len(restored) < len(set(args.unpack)):
+            print("Some ids were not found in any segment", file=sys.stderr)
+            return 1
+        return 0
+
+    stats = segment_stats(pipeline_dir)
+    print(f"{pipeline_dir}: {stats['packed']} packed entries in {stats['segments']} segment(s) "
+          f"({stats['bytes']:,} bytes), {stats['loose']} loose files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
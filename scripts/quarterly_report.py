@@ -29,6 +29,8 @@
     PIPELINE_DIR_CLOSED,
     REPO_ROOT,
     SIGNALS_DIR,
+    Entry,
+    entry_views,
     load_entries,
     parse_date,
 )
@@ -82,6 +84,8 @@ def load_conversion_log() -> list[dict]:
 
 def _get_submitted_date(entry: dict) -> date | None:
     """Extract submission date from entry timeline."""
+    if isinstance(entry, Entry):
+        return entry.submitted
     timeline = entry.get("timeline", {})
     if isinstance(timeline, dict):
         return parse_date(timeline.get("submitted"))
@@ -90,6 +94,8 @@ def _get_submitted_date(entry: dict) -> date | None:
 
 def _get_identity_position(entry: dict) -> str:
     """Extract identity position from entry."""
+    if isinstance(entry, Entry):
+        return entry.identity_position or "unknown"
     fit = entry.get("fit", {})
     if isinstance(fit, dict):
         return fit.get("identity_position") or "unknown"
@@ -98,6 +104,8 @@ def _get_identity_position(entry: dict) -> str:
 
 def _get_portal(entry: dict) -> str:
     """Extract portal type from entry."""
+    if isinstance(entry, Entry):
+        return entry.portal or "unknown"
     target = entry.get("target", {})
     if isinstance(target, dict):
         return target.get("portal") or "unknown"
@@ -111,6 +119,8 @@ def _get_outcome(entry: dict) -> str | None:
 
 def _get_score(entry: dict) -> float | None:
     """Extract overall fit score from entry."""
+    if isinstance(entry, Entry):
+        return entry.score
     fit = entry.get("fit", {})
     if isinstance(fit, dict):
         raw = fit.get("score")
@@ -146,6 +156,8 @@ def _get_network_proximity(entry: dict) -> int | None:
 
 def _get_blocks_used(entry: dict) -> list[str]:
     """Extract list of block paths from entry submission."""
+    if isinstance(entry, Entry):
+        return [b for b in entry.blocks_used if isinstance(b, str)]
     sub = entry.get("submission", {})
     if not isinstance(sub, dict):
         return []
@@ -869,6 +881,7 @@ def format_markdown_report(
 
 def build_report(entries: list[dict], period_days: int, *, compare: bool = False) -> dict:
     """Build all report data sections and return as a dict."""
+    entries = entry_views(entries)
     period_entries = filter_by_period(entries, period_days)
 
     summary = executive_summary(period_entries, period_days)
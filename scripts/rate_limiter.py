@@ -0,0 +1,72 @@
+"""Token-bucket rate limiting per remote host.
+
+Callers that used to ``time.sleep`` a fixed delay after every request
+serialized all traffic, even to unrelated hosts. HostRateLimiter keeps one
+bucket per host instead: requests to different hosts never wait on each
+other, and requests to the same host are spaced to its rate, with a small
+burst allowance. Buckets are thread-safe; a waiting thread sleeps without
+holding the lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """*rate* tokens per second, holding at most *capacity*; starts full."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; returns seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (the balance may go negative) so that
+            # concurrent callers queue up behind each other.
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created on first use.
+
+    ``overrides`` maps a host to its own ``(rate, capacity)``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        overrides: dict[str, tuple[float, float]] | None = None,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.overrides = dict(overrides or {})
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, capacity = self.overrides.get(host, (self.rate, self.capacity))
+                bucket = self._buckets[host] = TokenBucket(rate, capacity)
+            return bucket
+
+    def acquire(self, host: str) -> float:
+        """Wait for a request slot on *host*; returns seconds waited."""
+        return self.bucket(host).acquire()
@@ -25,6 +25,8 @@
     DIMENSION_ORDER,
     PIPELINE_DIR_CLOSED,
     PIPELINE_DIR_SUBMITTED,
+    Entry,
+    entry_views,
     load_entries,
     parse_date,
 )
@@ -101,6 +103,8 @@ def _get_dimensions(entry: dict) -> dict[str, float]:
 
 def _get_identity_position(entry: dict) -> str:
     """Extract identity position from fit or top-level field."""
+    if isinstance(entry, Entry):
+        return entry.identity_position or entry.get("identity_position", "unknown")
     fit = entry.get("fit", {})
     if isinstance(fit, dict) and fit.get("identity_position"):
         return fit["identity_position"]
@@ -109,6 +113,8 @@ def _get_identity_position(entry: dict) -> str:
 
 def _get_portal(entry: dict) -> str:
     """Extract portal type from target field."""
+    if isinstance(entry, Entry):
+        return entry.portal or "unknown"
     target = entry.get("target", {})
     if isinstance(target, dict):
         return target.get("portal", "unknown") or "unknown"
@@ -120,6 +126,8 @@ def _get_blocks_used(entry: dict) -> list[str]:
 
     Handles both dict-style (keyed by role) and list-style blocks.
     """
+    if isinstance(entry, Entry):
+        return list(entry.blocks_used)
     submission = entry.get("submission", {})
     if not isinstance(submission, dict):
         return []
@@ -164,11 +172,15 @@ def _get_submission_timing(entry: dict) -> str | None:
 
 def _get_track(entry: dict) -> str:
     """Extract track from entry."""
+    if isinstance(entry, Entry):
+        return entry.track or "unknown"
     return entry.get("track", "unknown") or "unknown"
 
 
 def _get_composite_score(entry: dict) -> float | None:
     """Extract composite score from fit field."""
+    if isinstance(entry, Entry):
+        return entry.score
     fit = entry.get("fit", {})
     if isinstance(fit, dict):
         score = fit.get("score")
@@ -500,6 +512,7 @@ def run_full_analysis(
 
     Returns a structured dict with all analysis results.
     """
+    entries = entry_views(entries)
     groups = classify_entries(entries)
     rejected = groups["rejected"]
     # Non-rejected = everything except rejected (includes pending)
@@ -148,6 +148,9 @@
     "automation-on": ("launchd_manager.py", ["--install", "--kickstart"], "Install and activate launchd agents"),
     "automation-off": ("launchd_manager.py", ["--uninstall"], "Unload and remove launchd agents"),
     "backup":      ("backup_pipeline.py", ["list"],       "List pipeline backups"),
+    "reindex":     ("pipeline_index.py", ["--rebuild"],   "Rebuild the SQLite entry index from pipeline YAML"),
+    "descblobs":   ("description_store.py", ["--migrate", "--dry-run"], "Preview moving descriptions into the blob store"),
+    "segments":    ("pipeline_segments.py", ["--stats"],  "Packed segment stats for pipeline/closed"),
     "email":       ("check_email.py", [],                 "Check email for submission confirmations"),
     "notify":      ("notify.py", ["--config"],                "Notification dispatcher config check"),
     "weeklybrief": ("weekly_brief.py", [],                   "Weekly executive brief"),
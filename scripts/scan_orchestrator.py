@@ -3,6 +3,12 @@
 
 Combines source_jobs.py (5 ATS APIs) and discover_jobs.py (free APIs)
 into a single scan operation with deduplication, filtering, and logging.
+Boards are fetched concurrently on a bounded thread pool, paced by a token
+bucket per API host rather than a global sleep; ScanResult.source_latency
+records how long each board took. Only HOST_CONCURRENCY boards per host run
+at once: the bucket paces listing requests, but a fetcher's own follow-up
+requests (Greenhouse detail pages on an 8-thread pool) are not paced, so
+this keeps a host's load at what one board at a time used to send.
 
 Usage:
     python scripts/scan_orchestrator.py                    # Dry-run, all sources
@@ -17,6 +23,7 @@
 import json
 import sys
 import time
+from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 from datetime import date
 from pathlib import Path
@@ -28,6 +35,7 @@
 from discover_jobs import fetch_himalayas, fetch_remotive
 from ingest_top_roles import pre_score
 from pipeline_lib import SIGNALS_DIR
+from rate_limiter import HostRateLimiter
 from source_jobs import (
     _get_existing_ids,
     create_pipeline_entry,
@@ -45,7 +53,21 @@
 
 SCAN_HISTORY_PATH = SIGNALS_DIR / "scan-history.yaml"
 DEFAULT_MAX_ENTRIES = 100
-RATE_DELAY = 2.0  # seconds between API calls
+RATE_DELAY = 2.0  # seconds between API calls to the same host
+
+# Requests are rate-limited per API host, not globally.
+ATS_HOSTS = {
+    "greenhouse": "boards-api.greenhouse.io",
+    "lever": "api.lever.co",
+    "ashby": "api.ashbyhq.com",
+    "smartrecruiters": "api.smartrecruiters.com",
+    "workable": "workable.com",
+}
+FREE_HOSTS = {"remotive": "remotive.com", "himalayas": "himalayas.app"}
+HOST_BURST = 2.0  # requests a host may receive back to back before pacing applies
+SCAN_WORKERS = 8
+HOST_CONCURRENCY = 1  # boards per host in flight at once
+SOURCE_TIMEOUT = 120.0  # seconds per source, counted from its first request
 
 
 @dataclass
@@ -59,17 +81,127 @@ class ScanResult:
     total_fetched: int = 0
     total_qualified: int = 0
     scan_duration_seconds: float = 0.0
+    source_latency: dict[str, float] = field(default_factory=dict)  # "portal/name" → seconds
 
 
-def scan_ats(fresh_only: bool = True) -> tuple[list[dict], int, list[str]]:
-    """Fetch jobs from all configured ATS board APIs.
-
-    Returns (jobs, sources_queried, errors).
+@dataclass
+class _Source:
+    """One board or API queried during a scan: *fetch* is called once per query."""
+
+    label: str
+    host: str
+    fetch: Callable[[str], list[dict]]
+    queries: list[str]
+    started: float | None = None
+    finished: float | None = None
+
+    def run(self, limiter: HostRateLimiter) -> list[dict]:
+        jobs: list[dict] = []
+        try:
+            for query in self.queries:
+                limiter.acquire(self.host)
+                if self.started is None:
+                    self.started = time.monotonic()
+                jobs.extend(self.fetch(query))
+        finally:
+            self.finished = time.monotonic()
+        return jobs
+
+    def latency(self, now: float) -> float:
+        if self.started is None:
+            return 0.0
+        return round((self.finished or now) - self.started, 3)
+
+
+def _run_sources(
+    sources: list[_Source],
+    limiter: HostRateLimiter | None = None,
+    timeout: float = SOURCE_TIMEOUT,
+    workers: int = SCAN_WORKERS,
+    per_host: int = HOST_CONCURRENCY,
+) -> list[tuple[list[dict] | None, str | None]]:
+    """Run *sources* on a bounded thread pool; (jobs, error) per source, in input order.
+
+    At most *per_host* sources of one host run at a time; the next one for
+    that host is submitted when one finishes. A source that raises, or is still running *timeout* seconds after its
+    first request, yields ``(None, error)`` without affecting the others.
+    Timed-out fetches are abandoned, not interrupted; their threads end at
+    the HTTP timeout.
     """
+    if not sources:
+        return []
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    limiter = limiter or HostRateLimiter(1.0 / RATE_DELAY, HOST_BURST)
+    outcomes: list[tuple[list[dict] | None, str | None]] = [(None, None)] * len(sources)
+    queued: dict[str, list[int]] = {}
+    for i, source in enumerate(sources):
+        queued.setdefault(source.host, []).append(i)
+    pool = ThreadPoolExecutor(max_workers=min(workers, len(sources)))
+    pending: dict = {}
+
+    def submit_next(host: str) -> None:
+        if queued[host]:
+            i = queued[host].pop(0)
+            pending[pool.submit(sources[i].run, limiter)] = i
+
+    try:
+        # Round-robin across hosts, so workers are not all queued on one host.
+        for _ in range(max(1, per_host)):
+            for host in queued:
+                submit_next(host)
+        while pending:
+            done, _ = wait(pending, timeout=min(1.0, timeout), return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                try:
+                    outcomes[i] = (future.result(), None)
+                except Exception as e:
+                    outcomes[i] = (None, str(e))
+                submit_next(sources[i].host)
+            now = time.monotonic()
+            for future, i in list(pending.items()):
+                started = sources[i].started
+                if started is not None and now - started > timeout:
+                    del pending[future]
+                    outcomes[i] = (None, f"timed out after {timeout:g}s")
+                    submit_next(sources[i].host)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return outcomes
+
+
+def _collect(
+    sources: list[_Source],
+    latency: dict[str, float] | None,
+) -> tuple[list[dict], int, list[str]]:
+    """Run *sources* and merge their jobs in source order; returns (jobs, succeeded, errors)."""
     all_jobs: list[dict] = []
     errors: list[str] = []
-    sources_count = 0
+    succeeded = 0
+    outcomes = _run_sources(sources)
+    now = time.monotonic()
+    for source, (jobs, error) in zip(sources, outcomes):
+        if latency is not None:
+            latency[source.label] = source.latency(now)
+        if error is not None:
+            errors.append(f"{source.label}: {error}")
+            continue
+        all_jobs.extend(jobs)
+        succeeded += 1
+    return all_jobs, succeeded, errors
+
+
+def scan_ats(
+    fresh_only: bool = True,
+    latency: dict[str, float] | None = None,
+) -> tuple[list[dict], int, list[str]]:
+    """Fetch jobs from all configured ATS board APIs, concurrently.
 
+    Requests are paced per ATS host (see ATS_HOSTS); a failing or slow
+    board only loses its own jobs. Per-board seconds are written into
+    *latency* when given. Returns (jobs, sources_queried, errors).
+    """
     try:
         sources = load_sources()
     except (FileNotFoundError, SystemExit):
@@ -84,6 +216,7 @@ def scan_ats(fresh_only: bool = True) -> tuple[list[dict], int, list[str]]:
         "workable": fetch_workable_jobs,
     }
 
+    runs = []
     for company in companies:
         name = company.get("name", "unknown")
         portal = company.get("portal", "")
@@ -94,49 +227,26 @@ def scan_ats(fresh_only: bool = True) -> tuple[list[dict], int, list[str]]:
         fetcher = fetcher_map.get(portal)
         if not fetcher:
             continue
+        runs.append(_Source(f"{portal}/{name}", ATS_HOSTS[portal], fetcher, [board_id]))
 
-        try:
-            jobs = fetcher(board_id)
-            all_jobs.extend(jobs)
-            sources_count += 1
-            time.sleep(RATE_DELAY)
-        except Exception as e:
-            errors.append(f"{portal}/{name}: {e}")
-
+    all_jobs, sources_count, errors = _collect(runs, latency)
     all_jobs = filter_by_title(all_jobs, TITLE_KEYWORDS, TITLE_EXCLUDES)
     return all_jobs, sources_count, errors
 
 
-def scan_free() -> tuple[list[dict], int, list[str]]:
+def scan_free(latency: dict[str, float] | None = None) -> tuple[list[dict], int, list[str]]:
     """Fetch jobs from free public APIs (Remotive, Himalayas).
 
+    Both APIs are queried concurrently, each paced per host.
     Returns (jobs, sources_queried, errors).
     """
-    all_jobs: list[dict] = []
-    errors: list[str] = []
-    sources_count = 0
-
-    # Remotive
-    try:
-        for keyword in ["python", "go", "devops", "platform engineer"]:
-            jobs = fetch_remotive(keyword)
-            all_jobs.extend(jobs)
-            time.sleep(RATE_DELAY)
-        sources_count += 1
-    except Exception as e:
-        errors.append(f"remotive: {e}")
-
-    # Himalayas
-    try:
-        for keyword in ["software engineer", "platform engineer", "devops"]:
-            jobs = fetch_himalayas(keyword)
-            all_jobs.extend(jobs)
-            time.sleep(RATE_DELAY)
-        sources_count += 1
-    except Exception as e:
-        errors.append(f"himalayas: {e}")
-
-    return all_jobs, sources_count, errors
+    runs = [
+        _Source("remotive", FREE_HOSTS["remotive"], fetch_remotive,
+                ["python", "go", "devops", "platform engineer"]),
+        _Source("himalayas", FREE_HOSTS["himalayas"], fetch_himalayas,
+                ["software engineer", "platform engineer", "devops"]),
+    ]
+    return _collect(runs, latency)
 
 
 def _dedup_and_filter(jobs: list[dict]) -> list[dict]:
@@ -167,15 +277,16 @@ def scan_all(
     all_jobs: list[dict] = []
     total_sources = 0
     all_errors: list[str] = []
+    source_latency: dict[str, float] = {}
 
     if "ats" in sources:
-        ats_jobs, ats_count, ats_errors = scan_ats(fresh_only=fresh_only)
+        ats_jobs, ats_count, ats_errors = scan_ats(fresh_only=fresh_only, latency=source_latency)
         all_jobs.extend(ats_jobs)
         total_sources += ats_count
         all_errors.extend(ats_errors)
 
     if "free" in sources:
-        free_jobs, free_count, free_errors = scan_free()
+        free_jobs, free_count, free_errors = scan_free(latency=source_latency)
         all_jobs.extend(free_jobs)
         total_sources += free_count
         all_errors.extend(free_errors)
@@ -221,6 +332,7 @@ def scan_all(
         total_fetched=total_fetched,
         total_qualified=len(qualified),
         scan_duration_seconds=round(elapsed, 1),
+        source_latency=source_latency,
     )
 
 
@@ -291,6 +403,9 @@ def main():
         print(f"Duplicates skipped: {result.duplicates_skipped}")
         print(f"New entries:        {result.total_qualified}")
         print(f"Duration:           {result.scan_duration_seconds}s")
+        if result.source_latency:
+            slowest = sorted(result.source_latency.items(), key=lambda kv: kv[1], reverse=True)[:5]
+            print("Slowest sources:    " + ", ".join(f"{label} {seconds:.1f}s" for label, seconds in slowest))
         if result.errors:
             print(f"\nErrors ({len(result.errors)}):")
             for err in result.errors:
@@ -8,15 +8,20 @@
 """
 
 import argparse
+import contextlib
 import sys
 from datetime import date
 from pathlib import Path
 
 import score_auto_dimensions as _auto_dimensions
+import score_cache as _score_cache
 import score_constants as _score_constants
+import score_context as _score_context
 import score_explain as _score_explain
 import score_human_dimensions as _human_dimensions
 import score_network as _score_network
+import score_parallel as _score_parallel
+import score_profile as _score_profile
 import score_reachability as _score_reachability
 import score_telemetry as _score_telemetry
 import yaml
@@ -27,10 +32,13 @@
     PIPELINE_DIR_RESEARCH_POOL,
     PORTAL_SCORES_DEFAULT,
     STRATEGIC_BASE_DEFAULT,
+    FieldEdit,
     atomic_write,
+    last_touched_edit,
     load_entry_by_id,
     update_last_touched,
     update_yaml_field,
+    write_field_edits,
 )
 from pipeline_lib import (
     load_entries as _load_entries_raw,
@@ -41,6 +49,7 @@
 
 HIGH_PRESTIGE = _score_constants.HIGH_PRESTIGE
 ROLE_FIT_TIERS = _score_constants.ROLE_FIT_TIERS
+ScoringContext = _score_context.ScoringContext
 load_market_intelligence = _load_market_intelligence
 
 # --- Scoring rubric loader ---
@@ -178,7 +187,7 @@ def _tr_credential_track_relevance(entry: dict) -> tuple[int, str]:
     return _human_dimensions._tr_credential_track_relevance(entry)
 
 
-def _tr_track_experience(entry: dict, all_entries: list[dict]) -> tuple[int, str]:
+def _tr_track_experience(entry: dict, all_entries: list[dict] | ScoringContext) -> tuple[int, str]:
     return _human_dimensions._tr_track_experience(entry, all_entries)
 
 
@@ -247,7 +256,7 @@ def score_strategic_value(entry: dict, explain: bool = False) -> int | tuple[int
 
 def compute_human_dimensions(
     entry: dict,
-    all_entries: list[dict] | None = None,
+    all_entries: list[dict] | ScoringContext | None = None,
     explain: bool = False,
 ) -> dict[str, int] | tuple[dict[str, int], dict[str, str]]:
     return _human_dimensions.compute_human_dimensions(
@@ -268,7 +277,7 @@ def _days_since(date_str: str | None) -> int | None:
     return _score_network._days_since(date_str)
 
 
-def score_network_proximity(entry: dict, all_entries: list[dict] | None = None) -> int:
+def score_network_proximity(entry: dict, all_entries: list[dict] | ScoringContext | None = None) -> int:
     return _score_network.score_network_proximity(entry, all_entries)
 
 
@@ -276,12 +285,15 @@ def _log_network_change(entry_id: str, old_network: int, new_network: int, filep
     return _score_network._log_network_change(entry_id, old_network, new_network, filepath)
 
 
-def compute_dimensions(entry: dict, all_entries: list[dict] | None = None) -> dict[str, int]:
+def compute_dimensions(entry: dict, all_entries: list[dict] | ScoringContext | None = None) -> dict[str, int]:
     """Compute all 9 dimension scores for an entry.
 
     All dimensions are always recomputed from data. No human overrides.
     Signal-based dimensions replace the old gut-feel estimation.
+    Batch callers should pass one ScoringContext for the whole run rather
+    than the raw entry list.
     """
+    all_entries = ScoringContext.of(all_entries)
     dims = {}
 
     # Auto-derivable (always recompute)
@@ -299,6 +311,12 @@ def compute_dimensions(entry: dict, all_entries: list[dict] | None = None) -> di
     return dims
 
 
+def _score_one(entry: dict, all_entries: ScoringContext) -> tuple[dict[str, int], float]:
+    """Dimensions and composite for one entry (the unit of work for --jobs)."""
+    dimensions = compute_dimensions(entry, all_entries)
+    return dimensions, compute_composite(dimensions, entry.get("track", ""), entry=entry)
+
+
 def applicant_density_adjustment(entry: dict) -> float:
     """Compute a score adjustment based on applicant density.
 
@@ -412,7 +430,7 @@ def get_qualification_threshold(track: str) -> float:
     return JOB_QUALIFICATION_THRESHOLD if track == "job" else QUALIFICATION_THRESHOLD
 
 
-def qualify(entry: dict, all_entries: list[dict] | None = None) -> tuple[bool, str]:
+def qualify(entry: dict, all_entries: list[dict] | ScoringContext | None = None) -> tuple[bool, str]:
     """Return (should_apply, reason) based on composite score.
 
     Uses track-appropriate weights and threshold: job entries use
@@ -441,13 +459,11 @@ def update_entry_file(filepath: Path, dimensions: dict[str, int], composite: flo
 
     Preserves original_score for manual entries (non-auto-sourced) to break
     the circular dependency between fit.score and dimension estimation.
-    Uses targeted regex to preserve file formatting while verifying
-    the result is still valid YAML after each modification.
+    Uses targeted regex to preserve file formatting; the result is
+    verified to be valid YAML once, after all modifications.
     """
     import re
 
-    from pipeline_lib import update_yaml_field
-
     with open(filepath) as f:
         content = f.read()
 
@@ -478,9 +494,6 @@ def update_entry_file(filepath: Path, dimensions: dict[str, int], composite: flo
             original_line = f"\n{indent}original_score: {old_score}"
             content = content[:insert_after] + original_line + content[insert_after:]
 
-    # Update score via safe helper
-    content = update_yaml_field(content, "score", str(composite), nested=True)
-
     # Build new dimensions block
     # Detect the indentation used in the file for fit sub-keys
     fit_indent_match = re.search(r"^(\s+)score:", content, re.MULTILINE)
@@ -513,13 +526,8 @@ def update_entry_file(filepath: Path, dimensions: dict[str, int], composite: flo
             insert_pos = fit_section.end()
             content = content[:insert_pos] + new_dims_block + "\n" + content[insert_pos:]
 
-    # Verify the final content is still valid YAML
-    try:
-        yaml.safe_load(content)
-    except yaml.YAMLError as e:
-        raise ValueError(f"YAML became invalid after scoring update: {e}")
-
-    atomic_write(filepath, content)
+    # Update score and verify the final content in one pass
+    write_field_edits(filepath, [FieldEdit("score", str(composite), nested=True)], content=content)
 
     return old_score, composite
 
@@ -551,7 +559,7 @@ def run_qualify(entries: list[tuple[Path, dict]]):
     creative_apply = []
     creative_skip = []
 
-    all_raw = [d for _, d in entries]
+    all_raw = ScoringContext([d for _, d in entries])
     for filepath, data in entries:
         entry_id = data.get("id", filepath.stem)
         track = data.get("track", "")
@@ -687,7 +695,7 @@ def run_auto_qualify(dry_run: bool = False, yes: bool = False,
         return summary
 
     # Pre-load all raw entries for cross-pipeline scoring signals
-    all_raw = _load_entries_raw(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
+    all_raw = ScoringContext(_load_entries_raw(dirs=ALL_PIPELINE_DIRS_WITH_POOL))
 
     qualified_list = []
     skipped = 0
@@ -767,18 +775,14 @@ def run_auto_qualify(dry_run: bool = False, yes: bool = False,
             print(f"  [dry-run] {entry_id} (score={score}, {reason}) -> active/ as qualified")
         else:
             # Update status, score, dimensions, and timestamps
-            content = filepath.read_text()
-            content = update_yaml_field(content, "status", "qualified")
-            try:
-                content = update_yaml_field(content, "score", str(score), nested=True, parent_key="fit")
-            except ValueError:
-                pass  # fit.score field may not exist in template
-            content = update_last_touched(content)
-            try:
-                content = update_yaml_field(content, "qualified", f'"{today_str}"', nested=True)
-            except ValueError:
-                pass  # timeline section may not have a qualified field — that's OK
-            atomic_write(filepath, content)
+            write_field_edits(filepath, [
+                FieldEdit("status", "qualified"),
+                # fit.score may not exist in the template
+                FieldEdit("score", str(score), nested=True, parent_key="fit", optional=True),
+                last_touched_edit(),
+                # timeline section may not have a qualified field — that's OK
+                FieldEdit("qualified", f'"{today_str}"', nested=True, optional=True),
+            ])
             # Move to active/
             shutil.move(str(filepath), str(dest))
             print(f"  {entry_id} -> active/ (score={score}, qualified, {reason})")
@@ -812,7 +816,7 @@ def _rubric_desc(dim: str, score: int) -> str:
     return _score_explain._rubric_desc(dim, score)
 
 
-def explain_entry(entry: dict, all_entries: list[dict] | None = None) -> str:
+def explain_entry(entry: dict, all_entries: list[dict] | ScoringContext | None = None) -> str:
     return _score_explain.explain_entry(
         entry,
         all_entries,
@@ -841,7 +845,7 @@ def review_compressed(entries: list[tuple[Path, dict]], lo: float = 6.5, hi: flo
 
 def analyze_reachability(
     entry: dict,
-    all_entries: list[dict] | None = None,
+    all_entries: list[dict] | ScoringContext | None = None,
     threshold: float = 9.0,
 ) -> dict:
     return _score_reachability.analyze_reachability(
@@ -921,6 +925,13 @@ def main():
                         help="Max entries to auto-qualify (0 = unlimited)")
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="Show per-dimension breakdowns")
+    parser.add_argument("--force", action="store_true",
+                        help="Rescore entries even when their input fingerprint is unchanged")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each dimension (p50/p95/total) and store it in score telemetry")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for scoring (default: 1; 0 = one per CPU). "
+                             "Files are still written in order and output matches a serial run")
     args = parser.parse_args()
 
     if not (args.target or args.all or args.qualify or args.explain
@@ -970,7 +981,7 @@ def main():
         sys.exit(1)
 
     # Pre-load all raw entries for cross-pipeline signals (track experience)
-    all_raw = _load_entries_raw(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
+    all_raw = ScoringContext(_load_entries_raw(dirs=ALL_PIPELINE_DIRS_WITH_POOL))
 
     if args.explain:
         _, data = entries[0]
@@ -986,17 +997,36 @@ def main():
         return
 
     changes = []
-    for filepath, data in entries:
+    # Entries whose input fingerprint matches the score already on disk are
+    # not rescored (see score_cache); --force rescores everything.
+    cache = _score_cache.ScoreCache(force=args.force)
+    plan = [cache.lookup(filepath, data, all_raw) for filepath, data in entries]
+    misses = [i for i, (cached, _) in enumerate(plan) if cached is None]
+    # --profile times each dimension function; without it nothing is wrapped.
+    profiler = None
+    if args.profile:
+        profiler = _score_profile.DimensionProfiler(modules={"score": sys.modules[__name__]})
+    with profiler or contextlib.nullcontext():
+        scored = dict(zip(misses, _score_parallel.score_entries(
+            [entries[i][1] for i in misses], all_raw, _score_one, jobs=args.jobs,
+        )))
+    for i, (filepath, data) in enumerate(entries):
         entry_id = data.get("id", filepath.stem)
         track = data.get("track", "")
-        dimensions = compute_dimensions(data, all_raw)
-        composite = compute_composite(dimensions, track, entry=data)
+        cached, fingerprint = plan[i]
+        dimensions, composite = cached or scored[i]
 
         # Track network_proximity changes for ROI logging
         old_dims = data.get("fit", {}).get("dimensions", {}) if isinstance(data.get("fit"), dict) else {}
         old_network = old_dims.get("network_proximity", 1) if isinstance(old_dims, dict) else 1
 
-        old_score, new_score = update_entry_file(filepath, dimensions, composite, dry_run=args.dry_run)
+        if cached is not None:
+            # The file already holds exactly this score.
+            old_score, new_score = composite, composite
+        else:
+            old_score, new_score = update_entry_file(filepath, dimensions, composite, dry_run=args.dry_run)
+            if not args.dry_run:
+                cache.store(filepath, fingerprint, dimensions, composite)
 
         if not args.dry_run:
             _log_network_change(entry_id, old_network, dimensions.get("network_proximity", 1), filepath)
@@ -1025,12 +1055,17 @@ def main():
                 contrib = val * weight
                 print(f"  {dim:<25s} {int(val):>5d}  {weight:>5.0%}  {contrib:>7.2f}")
             print(f"  {'COMPOSITE':<25s}        {'':>6s}  {new_score:>7.1f}")
+            reason = cache.miss_reasons.get(entry_id)
+            print(f"  cache: {'hit' if cached is not None else f'miss ({reason})'}")
         else:
             print(f"  {entry_id:<40s} {new_score:>5.1f}{delta}  [{rubric}]")
 
     # Summary
     print(f"\n{'=' * 50}")
     print(f"Scored {len(changes)} entries" + (" (dry run)" if args.dry_run else ""))
+    print(cache.summary())
+    if not args.dry_run:
+        cache.save()
 
     # Model maturity indicator — count terminal outcomes for calibration status
     all_entries = _load_entries_raw(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
@@ -1053,6 +1088,16 @@ def main():
             for eid, old, new, _ in sorted(significant, key=lambda x: abs(x[2] - x[1]), reverse=True):
                 print(f"  {eid:<40s} {old} -> {new} ({new - old:+.1f})")
 
+    if profiler is not None:
+        print(f"\n{profiler.format()}")
+        _score_telemetry.log_score_run("score", {
+            "entries": len(changes),
+            "rescored": len(misses),
+            "jobs": args.jobs,
+            "dry_run": args.dry_run,
+            "dimension_timing": profiler.summary(),
+        })
+
 
 def recalibrate_weights(entries: list[dict] | None = None) -> dict[str, float] | None:
     """Analyze actual outcomes to suggest weight recalibration.
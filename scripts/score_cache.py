@@ -0,0 +1,266 @@
+"""Input fingerprints that let ``score.py`` skip unchanged entries.
+
+Every dimension is a function of the entry itself, a handful of shared
+files (rubric, market intelligence, network graph, weight calibration,
+identity, startup profile), the text-match IDF table, the corpus of blocks
+and resumes, the entry's own candidate sources (blocks_used, resumes,
+profile, research.md), two run-wide counts from ScoringContext and, for
+entries with dated deadlines or follow-ups, today's date.
+
+ScoreCache records a fingerprint of those inputs next to the dimensions
+and composite it produced, keyed by entry file. When a later run computes
+the same fingerprint and the entry file still holds that score, the entry
+is not rescored. A mismatch names the inputs that changed, so the run
+summary can say why entries were rescored.
+
+Shared files and the code of the scoring modules are hashed once per run;
+source files are hashed once per (mtime_ns, size) per process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+import pipeline_entry_cache as _entry_cache
+from pipeline_entry_fields import LazyDict
+from pipeline_lib import BLOCKS_DIR, IDENTITY_PATH, REPO_ROOT, SIGNALS_DIR
+from score_context import ScoringContext
+
+SCORE_CACHE_PATH = _entry_cache.CACHE_DIR / "score-fingerprints.pickle"
+SCORE_CACHE_VERSION = 1
+
+# fit.* keys that score.py writes; they are outputs, not inputs.
+SCORE_OUTPUT_FIELDS = frozenset({"score", "dimensions", "original_score"})
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SCORING_CODE = (
+    "score*.py",
+    "text_match*.py",
+    "corpus_fingerprint.py",
+    "description_store.py",
+    "funding_scorer.py",
+    "network_graph.py",
+    "outcome_learner.py",
+)
+
+SHARED_INPUTS = {
+    "rubric": REPO_ROOT / "strategy" / "scoring-rubric.yaml",
+    "market": REPO_ROOT / "strategy" / "market-intelligence-2026.json",
+    "startup_profile": REPO_ROOT / "strategy" / "startup-profile.yaml",
+    "network": SIGNALS_DIR / "network.yaml",
+    "calibration": SIGNALS_DIR / "weight-calibration.yaml",
+    "identity": IDENTITY_PATH,
+}
+
+RESUME_BASE_DIR = REPO_ROOT / "materials" / "resumes" / "base"
+
+_FILE_DIGESTS: dict[str, tuple[int, int, str]] = {}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """Content hash of *path* ("missing" if unreadable), memoized by stat."""
+    try:
+        st = path.stat()
+    except OSError:
+        return "missing"
+    key = str(path)
+    memo = _FILE_DIGESTS.get(key)
+    if memo is not None and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+        return memo[2]
+    try:
+        digest = _digest(path.read_bytes())
+    except OSError:
+        return "missing"
+    _FILE_DIGESTS[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def _files_digest(paths) -> str:
+    return _digest("\n".join(f"{p}:{file_digest(p)}" for p in paths).encode())
+
+
+def _corpus_signature() -> str:
+    """Stat signature of the blocks and base resumes the corpus fingerprint reads."""
+    paths = sorted(BLOCKS_DIR.rglob("*.md")) if BLOCKS_DIR.exists() else []
+    if RESUME_BASE_DIR.exists():
+        paths += sorted(RESUME_BASE_DIR.glob("*.html"))
+    parts = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        parts.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+    return _digest("\n".join(parts).encode())
+
+
+def run_inputs() -> dict[str, str]:
+    """Fingerprint components shared by every entry in a run."""
+    import score_text_match
+
+    inputs = {name: file_digest(path) for name, path in SHARED_INPUTS.items()}
+    inputs["code"] = _files_digest(sorted({p for pattern in SCORING_CODE for p in SCRIPTS_DIR.glob(pattern)}))
+    idf_data = score_text_match.get_text_match_idf()
+    inputs["idf"] = score_text_match._idf_version(idf_data) if idf_data is not None else "none"
+    inputs["corpus"] = _corpus_signature()
+    return inputs
+
+
+def _stored(value):
+    """*value* as written to disk: derived lazy keys dropped, fit outputs kept."""
+    if isinstance(value, LazyDict):
+        value = value.stored_items()
+    if isinstance(value, dict):
+        return {str(k): _stored(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_stored(v) for v in value]
+    return value
+
+
+def scoring_fields(entry: dict) -> dict:
+    """The entry without the fit fields score.py writes back."""
+    data = _stored(entry)
+    fit = data.get("fit")
+    if isinstance(fit, dict):
+        data["fit"] = {k: v for k, v in fit.items() if k not in SCORE_OUTPUT_FIELDS}
+    return data
+
+
+def _is_date_sensitive(entry: dict) -> bool:
+    """True if a dimension counts days from today for this entry."""
+    deadline = entry.get("deadline")
+    if isinstance(deadline, dict) and deadline.get("date") and deadline.get("type") not in ("rolling", "tba"):
+        return True
+    for key in ("follow_up", "outreach"):
+        items = entry.get(key)
+        if isinstance(items, list) and any(isinstance(item, dict) for item in items):
+            return True
+    return False
+
+
+def fingerprint(entry: dict, context: ScoringContext | None, inputs: dict[str, str]) -> dict[str, str]:
+    """Named digests of everything that can change *entry*'s dimensions."""
+    from text_match import WORK_DIR, candidate_source_paths
+
+    entry_id = entry.get("id", "")
+    org = (entry.get("target") or {}).get("organization", "") if isinstance(entry.get("target"), dict) else ""
+    counts = (0, 0)
+    if context is not None:
+        counts = (context.org_count(org, entry_id), context.submitted_in_track(entry.get("track", ""), entry_id))
+    sources = [*candidate_source_paths(entry), WORK_DIR / str(entry_id) / "research.md"]
+    return {
+        **inputs,
+        "entry": _digest(json.dumps(scoring_fields(entry), sort_keys=True, default=str).encode()),
+        "sources": _files_digest(sources),
+        "context": f"{counts[0]}:{counts[1]}",
+        "date": date.today().isoformat() if _is_date_sensitive(entry) else "",
+    }
+
+
+def _stored_score(entry: dict) -> tuple[dict | None, float | None, bool]:
+    """(fit.dimensions, fit.score, needs original_score backfill) as on disk."""
+    fit = entry.get("fit") if isinstance(entry.get("fit"), dict) else {}
+    dims = fit.get("dimensions") if isinstance(fit.get("dimensions"), dict) else None
+    try:
+        score = float(fit["score"]) if fit.get("score") is not None else None
+    except (TypeError, ValueError):
+        score = None
+    # update_entry_file backfills original_score for manual entries that
+    # already carry dimensions; such entries must go through it once more.
+    backfill = (
+        fit.get("original_score") is None
+        and "auto-sourced" not in (entry.get("tags") or [])
+        and dims is not None
+        and score is not None
+    )
+    return dims, score, backfill
+
+
+class ScoreCache:
+    """Fingerprint, dimensions and composite of the last scoring of each entry file.
+
+    Records map the entry file path to
+    ``(SCORE_CACHE_VERSION, fingerprint, dimensions, composite)``.
+    """
+
+    def __init__(self, path: Path | None = None, force: bool = False):
+        self.path = path or SCORE_CACHE_PATH
+        self.force = force
+        self._records: dict[str, tuple] = _entry_cache._read_pickle(self.path) or {}
+        self._inputs: dict[str, str] | None = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.reasons: Counter = Counter()
+        self.miss_reasons: dict[str, str] = {}
+
+    def inputs(self) -> dict[str, str]:
+        """run_inputs(), computed once per cache object."""
+        if self._inputs is None:
+            self._inputs = run_inputs()
+        return self._inputs
+
+    def lookup(
+        self,
+        filepath: Path,
+        entry: dict,
+        context: ScoringContext | None,
+    ) -> tuple[tuple[dict[str, int], float] | None, dict[str, str]]:
+        """Cached (dimensions, composite) for the entry, or None, plus its fingerprint."""
+        current = fingerprint(entry, context, self.inputs())
+        reason = self._miss_reason(str(filepath), entry, current)
+        if reason is None:
+            self.hits += 1
+            record = self._records[str(filepath)]
+            return (dict(record[2]), record[3]), current
+        self.misses += 1
+        self.reasons[reason] += 1
+        self.miss_reasons[entry.get("id", filepath.stem)] = reason
+        return None, current
+
+    def _miss_reason(self, key: str, entry: dict, current: dict[str, str]) -> str | None:
+        if self.force:
+            return "forced"
+        record = self._records.get(key)
+        if record is None or record[0] != SCORE_CACHE_VERSION:
+            return "new"
+        changed = [name for name, value in current.items() if record[1].get(name) != value]
+        changed += [name for name in record[1] if name not in current]
+        if changed:
+            return ",".join(changed)
+        dims, score, backfill = _stored_score(entry)
+        if dims != record[2] or score != record[3]:
+            return "stored score"
+        if backfill:
+            return "original_score"
+        return None
+
+    def store(self, filepath: Path, fp: dict[str, str], dimensions: dict[str, int], composite: float) -> None:
+        """Record the score just written to *filepath* for its fingerprint."""
+        self._records[str(filepath)] = (SCORE_CACHE_VERSION, fp, dict(dimensions), composite)
+        self._dirty = True
+
+    def summary(self) -> str:
+        """One line: hits, misses and the inputs behind the misses."""
+        line = f"Score cache: {self.hits} hit(s), {self.misses} miss(es)"
+        if self.reasons:
+            line += " (" + ", ".join(f"{reason}: {n}" for reason, n in self.reasons.most_common()) + ")"
+        return line
+
+    def save(self) -> None:
+        """Persist the records if anything was stored."""
+        if not self._dirty:
+            return
+        try:
+            _entry_cache._write_pickle(self.path, self._records)
+            self._dirty = False
+        except OSError:
+            return
@@ -0,0 +1,67 @@
+"""Run-wide aggregates for batch scoring.
+
+Two signals compare an entry against the rest of the pipeline: network
+proximity counts other entries at the same organization, and track-record
+fit counts other submitted entries in the same track. Scanning
+``all_entries`` for each scored entry made ``score.py --all`` quadratic in
+pipeline size.
+
+ScoringContext tallies those counts once per run. Pass it wherever
+``all_entries`` is accepted (compute_dimensions, qualify, explain_entry,
+analyze_reachability); a plain list still works and is wrapped on the spot.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+
+from pipeline_lib import entry_views
+
+SUBMITTED_STATUSES = frozenset({"submitted", "acknowledged", "interview", "outcome"})
+
+
+class ScoringContext:
+    """Organization and track counts over every entry in a scoring run.
+
+    Each count is kept both in total and per ``(key, id)``, so "every other
+    entry" can exclude all entries sharing the scored entry's id, exactly as
+    the per-entry scans did.
+    """
+
+    __slots__ = ("entries", "_orgs", "_org_ids", "_submitted_tracks", "_submitted_track_ids")
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        self._orgs: Counter = Counter()
+        self._org_ids: Counter = Counter()
+        self._submitted_tracks: Counter = Counter()
+        self._submitted_track_ids: Counter = Counter()
+        for view in entry_views(entries):
+            if view.org is not None:
+                self._orgs[view.org] += 1
+                self._org_ids[view.org, view.id] += 1
+            if view.status in SUBMITTED_STATUSES:
+                self._submitted_tracks[view.track] += 1
+                self._submitted_track_ids[view.track, view.id] += 1
+
+    @classmethod
+    def of(cls, all_entries: list[dict] | ScoringContext | None) -> ScoringContext | None:
+        """Return *all_entries* if it is already a context, else a context over it."""
+        if all_entries is None or isinstance(all_entries, cls):
+            return all_entries
+        return cls(all_entries)
+
+    def org_count(self, org: str, exclude_id: object = None) -> int:
+        """Entries at *org*, not counting those whose id is *exclude_id*."""
+        return self._orgs[org] - self._org_ids[org, exclude_id]
+
+    def submitted_in_track(self, track: str, exclude_id: object = None) -> int:
+        """Submitted-or-later entries in *track*, not counting id *exclude_id*."""
+        return self._submitted_tracks[track] - self._submitted_track_ids[track, exclude_id]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.entries)
@@ -16,6 +16,7 @@
     load_entries as _load_entries_raw,
 )
 from score_constants import ROLE_FIT_TIERS
+from score_context import ScoringContext
 from score_text_match import (
     evidence_match_text_signal as _em_text_coverage,
 )
@@ -325,16 +326,10 @@ def _tr_credential_track_relevance(entry: dict) -> tuple[int, str]:
     return 0, f"no credential scores for track={track} -> 0"
 
 
-def _tr_track_experience(entry: dict, all_entries: list[dict]) -> tuple[int, str]:
+def _tr_track_experience(entry: dict, all_entries: list[dict] | ScoringContext) -> tuple[int, str]:
     """Signal 2: How many entries in the same track have been submitted+."""
     track = entry.get("track", "")
-    submitted_statuses = {"submitted", "acknowledged", "interview", "outcome"}
-
-    count = 0
-    for e in all_entries:
-        if e.get("track") == track and e.get("status") in submitted_statuses:
-            if e.get("id") != entry.get("id"):
-                count += 1
+    count = ScoringContext.of(all_entries).submitted_in_track(track, entry.get("id"))
 
     if count >= 3:
         score = 3
@@ -377,7 +372,7 @@ def _tr_differentiators_coverage(entry: dict, profile: dict | None) -> tuple[int
 
 def compute_human_dimensions(
     entry: dict,
-    all_entries: list[dict] | None = None,
+    all_entries: list[dict] | ScoringContext | None = None,
     explain: bool = False,
 ) -> dict[str, int] | tuple[dict[str, int], dict[str, str]]:
     """Compute mission_alignment, evidence_match, track_record_fit from signals."""
@@ -385,7 +380,9 @@ def compute_human_dimensions(
 
     if "auto-sourced" in tags:
         # Prefer corpus-driven scoring from job description
-        description = (entry.get("target", {}).get("description", "") or "")
+        from description_store import resolve_description
+
+        description = resolve_description(entry)
         if len(description.strip()) >= 50:
             from score_text_match import score_description_against_corpus
 
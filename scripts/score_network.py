@@ -15,6 +15,7 @@
 from pathlib import Path
 
 from pipeline_lib import parse_date, load_identity
+from score_context import ScoringContext
 
 _NETWORK_DECAY = {
     "response_fresh": 30,
@@ -37,7 +38,7 @@ def _days_since(date_str: str | None) -> int | None:
     return None
 
 
-def score_network_proximity(entry: dict, all_entries: list[dict] | None = None) -> int:
+def score_network_proximity(entry: dict, all_entries: list[dict] | ScoringContext | None = None) -> int:
     """Score network proximity (1-10) based on relationship signals."""
     score = 1
 
@@ -99,12 +100,7 @@ def score_network_proximity(entry: dict, all_entries: list[dict] | None = None)
     if all_entries:
         org = (entry.get("target") or {}).get("organization", "")
         if org:
-            org_count = sum(
-                1
-                for candidate in all_entries
-                if (candidate.get("target") or {}).get("organization") == org
-                and candidate.get("id") != entry.get("id")
-            )
+            org_count = ScoringContext.of(all_entries).org_count(org, entry.get("id"))
             if org_count >= 3:
                 score = max(score, 4)
             elif org_count >= 1:
@@ -120,6 +116,8 @@ def score_network_proximity(entry: dict, all_entries: list[dict] | None = None)
 def _score_from_graph(entry: dict) -> int:
     """Query the network graph for org proximity score.
 
+    Reads the per-org proximity table (network_graph.load_proximity_table),
+    so the graph is loaded and walked once per run rather than per entry.
     Returns 1 (cold) if graph is unavailable or org not found.
     Gracefully degrades — never fails the scoring pipeline.
     Skips graph lookup when PIPELINE_METRICS_SOURCE=fallback (test isolation).
@@ -131,12 +129,9 @@ def _score_from_graph(entry: dict) -> int:
     if not org:
         return 1
     try:
-        from network_graph import load_network, score_org_proximity
-        network = load_network()
-        if not network.get("nodes"):
-            return 1
+        from network_graph import load_proximity_table, lookup_org_proximity
         me = load_identity()["person"]["short_name"]
-        result = score_org_proximity(network, me, org)
+        result = lookup_org_proximity(load_proximity_table(me), org)
         return result.get("score", 1)
     except Exception:
         return 1
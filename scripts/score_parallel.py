@@ -0,0 +1,112 @@
+"""Process-pool scoring for ``score.py --all --jobs N``.
+
+Scoring one entry reads only shared, read-only state: the run's
+ScoringContext, the rubric and market intelligence, the text-match IDF
+table and the network proximity table. score_entries() loads those once in
+the parent (warm_shared_context), batch-scores auto-sourced descriptions
+against the corpus fingerprint, then shards the entries into contiguous
+chunks across worker processes. With the fork start method the workers
+inherit the warmed state and the entries without copying; elsewhere they
+receive one pickled snapshot each through the pool initializer.
+
+Workers only compute; results come back in input order and the caller
+writes files and prints in that order, so output matches a serial run.
+Under ``--profile`` the workers' dimension timings are merged back too.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable
+
+import score_auto_dimensions as _auto_dimensions
+import score_profile as _score_profile
+import score_text_match as _score_text_match
+from pipeline_lib import load_identity, load_market_intelligence
+from score_context import ScoringContext
+
+ScoreFn = Callable[[dict, ScoringContext], tuple[dict[str, int], float]]
+
+_worker_state: tuple[ScoreFn, list[dict], ScoringContext] | None = None
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Worker count for *jobs*: 0 or less means one per CPU."""
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def warm_shared_context() -> None:
+    """Load the lazily cached read-only tables so forked workers inherit them."""
+    load_market_intelligence()
+    _auto_dimensions._get_differentiation_boost()
+    _score_text_match.get_text_match_idf()
+    if os.environ.get("PIPELINE_METRICS_SOURCE") == "fallback":
+        return
+    try:
+        from network_graph import load_proximity_table
+
+        load_proximity_table(load_identity()["person"]["short_name"])
+    except Exception:
+        return
+
+
+def _init_worker(score_fn: ScoreFn, entries: list[dict], context: ScoringContext) -> None:
+    global _worker_state
+    _worker_state = (score_fn, entries, context)
+
+
+def _score_range(bounds: tuple[int, int]) -> tuple[list[tuple[dict[str, int], float]], dict | None]:
+    score_fn, entries, context = _worker_state
+    start, stop = bounds
+    results = [score_fn(entry, context) for entry in entries[start:stop]]
+    # A profiler installed before the fork is copied into the worker; its
+    # samples go back with the results.
+    profiler = _score_profile.current()
+    return results, profiler.drain() if profiler is not None else None
+
+
+def _pool_context():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def score_entries(
+    entries: list[dict],
+    context: ScoringContext,
+    score_fn: ScoreFn,
+    jobs: int = 1,
+) -> list[tuple[dict[str, int], float]]:
+    """``score_fn(entry, context)`` for each entry, in order, over *jobs* processes.
+
+    *score_fn* must be a module-level function so spawned workers can
+    import it. With one job (or fewer than two entries) everything runs in
+    this process.
+    """
+    jobs = min(resolve_jobs(jobs), len(entries))
+    # Corpus-match scores for auto-sourced descriptions are computed in one
+    # batch up front; forked workers inherit them.
+    _score_text_match.prime_corpus_scores(entries)
+    if jobs <= 1:
+        return [score_fn(entry, context) for entry in entries]
+
+    warm_shared_context()
+    # A few chunks per worker evens out slow entries without per-entry IPC.
+    chunk = max(1, -(-len(entries) // (jobs * 4)))
+    bounds = [(start, min(start + chunk, len(entries))) for start in range(0, len(entries), chunk)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=_pool_context(),
+        initializer=_init_worker,
+        initargs=(score_fn, entries, context),
+    ) as pool:
+        scored = []
+        for results, samples in pool.map(_score_range, bounds):
+            scored.extend(results)
+            if samples:
+                _score_profile.current().merge(samples)
+        return scored
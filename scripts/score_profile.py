@@ -0,0 +1,162 @@
+"""Per-dimension timing for ``score.py --profile``.
+
+compute_dimensions calls one function per auto-derived dimension, and
+compute_human_dimensions sums five signal functions into each of mission
+alignment, evidence match and track-record fit. DimensionProfiler times
+those calls and reports p50, p95 and total per dimension or signal.
+
+Instrumentation is installed by swapping the module attributes the two
+functions look up at call time for timing wrappers, and restored on exit.
+Without --profile nothing is wrapped, so an unprofiled run executes
+exactly the original code.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from types import ModuleType
+
+# (module name, attribute, label), in report order. Dotted labels are
+# signals inside compute_human_dimensions, so part of human_dimensions' time.
+TIMED_FUNCTIONS: list[tuple[str, str, str]] = [
+    ("score", "score_deadline_feasibility", "deadline_feasibility"),
+    ("score", "score_financial_alignment", "financial_alignment"),
+    ("score", "score_portal_friction", "portal_friction"),
+    ("score", "score_effort_to_value", "effort_to_value"),
+    ("score", "score_strategic_value", "strategic_value"),
+    ("score", "score_network_proximity", "network_proximity"),
+    ("score", "compute_human_dimensions", "human_dimensions"),
+    ("score_human_dimensions", "load_profile", "human_dimensions.load_profile"),
+    ("score_text_match", "score_description_against_corpus", "human_dimensions.corpus_match"),
+    ("score_human_dimensions", "estimate_role_fit_from_title", "human_dimensions.title_fit"),
+    ("score_human_dimensions", "_ma_position_profile_match", "mission_alignment.position_profile"),
+    ("score_human_dimensions", "_ma_track_position_affinity", "mission_alignment.track_affinity"),
+    ("score_human_dimensions", "_ma_organ_position_coherence", "mission_alignment.organ_coherence"),
+    ("score_human_dimensions", "_ma_framing_specialization", "mission_alignment.framing"),
+    ("score_human_dimensions", "_ma_text_alignment", "mission_alignment.text"),
+    ("score_human_dimensions", "_em_block_portal_coverage", "evidence_match.block_portal"),
+    ("score_human_dimensions", "_em_slot_name_alignment", "evidence_match.slot_names"),
+    ("score_human_dimensions", "_em_evidence_depth", "evidence_match.depth"),
+    ("score_human_dimensions", "_em_materials_readiness", "evidence_match.materials"),
+    ("score_human_dimensions", "_em_text_coverage", "evidence_match.text"),
+    ("score_human_dimensions", "_tr_credential_track_relevance", "track_record_fit.credentials"),
+    ("score_human_dimensions", "_tr_track_experience", "track_record_fit.track_experience"),
+    ("score_human_dimensions", "_tr_position_depth", "track_record_fit.position_depth"),
+    ("score_human_dimensions", "_tr_differentiators_coverage", "track_record_fit.differentiators"),
+    ("score_human_dimensions", "_tr_text_fit", "track_record_fit.text"),
+]
+
+_CURRENT: DimensionProfiler | None = None
+
+
+def current() -> DimensionProfiler | None:
+    """The installed profiler, or None when profiling is off."""
+    return _CURRENT
+
+
+def _percentile(sorted_ns: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, -(-len(sorted_ns) * pct // 100))
+    return sorted_ns[int(rank) - 1]
+
+
+class DimensionProfiler:
+    """Wall-clock samples (ns) per label, collected while installed.
+
+    Use as a context manager around a scoring run::
+
+        with DimensionProfiler() as profiler:
+            ...
+        print(profiler.format())
+    """
+
+    def __init__(
+        self,
+        functions: list[tuple[str, str, str]] | None = None,
+        modules: dict[str, ModuleType] | None = None,
+    ):
+        self.functions = TIMED_FUNCTIONS if functions is None else functions
+        # Modules to patch by name, e.g. {"score": __main__} when score.py runs as a script
+        self.modules = modules or {}
+        self.samples: dict[str, list[int]] = defaultdict(list)
+        self._patched: list[tuple[ModuleType, str, Callable]] = []
+
+    def _wrap(self, fn: Callable, label: str) -> Callable:
+        samples = self.samples[label]
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                samples.append(clock() - start)
+
+        timed.__wrapped__ = fn
+        return timed
+
+    def __enter__(self) -> DimensionProfiler:
+        global _CURRENT
+        import importlib
+
+        for module_name, attr, label in self.functions:
+            module = self.modules.get(module_name) or importlib.import_module(module_name)
+            original = getattr(module, attr)
+            self._patched.append((module, attr, original))
+            setattr(module, attr, self._wrap(original, label))
+        _CURRENT = self
+        return self
+
+    def __exit__(self, *exc) -> None:
+        global _CURRENT
+        for module, attr, original in reversed(self._patched):
+            setattr(module, attr, original)
+        self._patched.clear()
+        _CURRENT = None
+
+    def drain(self) -> dict[str, list[int]]:
+        """Return the samples taken so far and start afresh (worker → parent)."""
+        drained = {label: list(values) for label, values in self.samples.items() if values}
+        for values in self.samples.values():
+            values.clear()
+        return drained
+
+    def merge(self, samples: dict[str, list[int]]) -> None:
+        """Add samples drained from another process."""
+        for label, values in samples.items():
+            self.samples[label].extend(values)
+
+    def summary(self) -> dict[str, dict]:
+        """calls, p50_ms, p95_ms and total_ms per label, in TIMED_FUNCTIONS order."""
+        report = {}
+        for _, _, label in self.functions:
+            values = sorted(self.samples.get(label) or ())
+            if not values or label in report:
+                continue
+            report[label] = {
+                "calls": len(values),
+                "p50_ms": round(_percentile(values, 50) / 1e6, 3),
+                "p95_ms": round(_percentile(values, 95) / 1e6, 3),
+                "total_ms": round(sum(values) / 1e6, 1),
+            }
+        return report
+
+    def format(self) -> str:
+        """Text table of summary(); signals are indented under their dimension."""
+        report = self.summary()
+        if not report:
+            return "Dimension timing: no dimensions were computed"
+        lines = [
+            "Dimension timing",
+            f"  {'Dimension':<40s} {'Calls':>6s} {'p50 ms':>8s} {'p95 ms':>8s} {'Total ms':>10s}",
+            f"  {'-' * 40} {'-' * 6} {'-' * 8} {'-' * 8} {'-' * 10}",
+        ]
+        for label, row in report.items():
+            shown = f"  {label}" if "." in label else label
+            lines.append(
+                f"  {shown:<40s} {row['calls']:>6d} {row['p50_ms']:>8.3f} "
+                f"{row['p95_ms']:>8.3f} {row['total_ms']:>10.1f}"
+            )
+        return "\n".join(lines)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from score_context import ScoringContext
+
 _NETWORK_LEVELS = [
     ("acquaintance", 4),
     ("warm", 7),
@@ -12,7 +14,7 @@
 
 def analyze_reachability(
     entry: dict,
-    all_entries: list[dict] | None = None,
+    all_entries: list[dict] | ScoringContext | None = None,
     threshold: float = 9.0,
     *,
     compute_dimensions,
@@ -74,8 +76,9 @@ def run_reachable(
     unreachable = []
     already_above = []
 
+    context = ScoringContext(entries_raw)
     for entry in actionable:
-        result = analyze_reachability_fn(entry, entries_raw, threshold)
+        result = analyze_reachability_fn(entry, context, threshold)
         if result["current_composite"] >= threshold:
             already_above.append(result)
         elif result["reachable_with"]:
@@ -154,7 +157,7 @@ def run_triage_staged(
             "demote_threshold": demote_threshold,
         }
 
-    all_raw = load_entries_raw(dirs=all_pipeline_dirs_with_pool)
+    all_raw = ScoringContext(load_entries_raw(dirs=all_pipeline_dirs_with_pool))
 
     submit_ready = []
     hold = []
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime
+from pathlib import Path
 
 import yaml
 from pipeline_lib import SIGNALS_DIR
 
-TELEMETRY_PATH = SIGNALS_DIR / "score-telemetry.yaml"
+TELEMETRY_PATH_ENV = "PIPELINE_SCORE_TELEMETRY_PATH"
+# Overridable via env so test runs do not append to the repo-tracked log.
+TELEMETRY_PATH = Path(os.getenv(TELEMETRY_PATH_ENV, "").strip() or SIGNALS_DIR / "score-telemetry.yaml")
 MAX_RUNS = 500
 
 
 def log_score_run(operation: str, payload: dict) -> None:
     """Append a structured telemetry record for score command operations."""
-    SIGNALS_DIR.mkdir(parents=True, exist_ok=True)
+    TELEMETRY_PATH.parent.mkdir(parents=True, exist_ok=True)
     record = {
         "timestamp": datetime.now().isoformat(timespec="seconds"),
         "operation": operation,
@@ -1,10 +1,42 @@
-"""Text-match scoring signals for score.py."""
+"""Text-match scoring signals for score.py.
+
+The three text signals (mission, evidence, track record) all read one
+text_match.analyze_entry result. text_match_result memoizes it per entry,
+keyed by the research text, the entry's blocks_used/materials_attached, the
+candidate source files' stat and the IDF table, so each entry is analyzed
+once per run. The research text and its hash are memoized per entry too,
+revalidated by stat, so building that key does not re-read research.md for
+every signal. With PIPELINE_TEXT_MATCH_CACHE=1 the results also persist
+across runs in the pipeline cache directory.
+"""
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pipeline_entry_cache as _entry_cache
+
 _TEXT_MATCH_IDF: tuple[dict[str, float], int] | None = None
 _text_match_available = True
 
+RESULT_CACHE_PATH = _entry_cache.CACHE_DIR / "text-match-results.pickle"
+RESULT_CACHE_VERSION = 1
+
+# entry id → (cache key, TextMatchResult | None); one live result per entry
+_RESULTS: dict[str, tuple[tuple, object]] = {}
+_results_loaded = False
+_results_dirty = False
+_save_registered = False
+_IDF_VERSION: tuple[object, str] | None = None  # (idf_data, content hash)
+# entry id → (research.md stat key, text, digest); one read per entry per run
+_RESEARCH: dict[str, tuple[tuple, str | None, str]] = {}
+# (fingerprint, {description: corpus scores}) from the last prime_corpus_scores.
+_PRIMED: tuple[object, dict[str, dict[str, int]]] | None = None
+
 
 def get_text_match_idf() -> tuple[dict[str, float], int] | None:
     """Lazy-load IDF table from text_match module."""
@@ -25,8 +57,97 @@ def get_text_match_idf() -> tuple[dict[str, float], int] | None:
     return None
 
 
+def persist_enabled() -> bool:
+    """True when PIPELINE_TEXT_MATCH_CACHE=1 asks for results to persist across runs."""
+    return os.environ.get("PIPELINE_TEXT_MATCH_CACHE") == "1"
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _idf_version(idf_data: tuple[dict[str, float], int]) -> str:
+    """Content hash of the IDF table, computed once per loaded table."""
+    global _IDF_VERSION
+    if _IDF_VERSION is None or _IDF_VERSION[0] is not idf_data:
+        idf, corpus_size = idf_data
+        _IDF_VERSION = (idf_data, _digest(json.dumps([corpus_size, sorted(idf.items())])))
+    return _IDF_VERSION[1]
+
+
+def _stat_key(path: Path) -> tuple:
+    try:
+        st = path.stat()
+    except OSError:
+        return (str(path), None)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _research(entry_id: str) -> tuple[str | None, str]:
+    """(research text, digest) for *entry_id*, re-read only when research.md changes."""
+    from text_match import WORK_DIR, research_text_from_file
+
+    path = WORK_DIR / entry_id / "research.md"
+    stat = _stat_key(path)
+    cached = _RESEARCH.get(entry_id)
+    if cached is not None and cached[0] == stat:
+        return cached[1], cached[2]
+    text = research_text_from_file(path)
+    digest = _digest(text) if text else ""
+    _RESEARCH[entry_id] = (stat, text, digest)
+    return text, digest
+
+
+def text_match_key(entry: dict, research_digest: str, idf_version: str) -> tuple:
+    """Cache key for an entry's analyze_entry result."""
+    from text_match import candidate_source_paths
+
+    submission = entry.get("submission") or {}
+    inputs = {}
+    if isinstance(submission, dict):
+        inputs = {"blocks_used": submission.get("blocks_used"), "materials": submission.get("materials_attached")}
+    return (
+        RESULT_CACHE_VERSION,
+        research_digest,
+        _digest(json.dumps(inputs, sort_keys=True, default=str)),
+        tuple(_stat_key(p) for p in candidate_source_paths(entry)),
+        idf_version,
+    )
+
+
+def _load_results() -> None:
+    global _results_loaded, _save_registered
+    _results_loaded = True
+    if not persist_enabled():
+        return
+    _RESULTS.update(_entry_cache._read_pickle(RESULT_CACHE_PATH) or {})
+    if not _save_registered:
+        _save_registered = True
+        atexit.register(save_text_match_cache)
+
+
+def save_text_match_cache() -> None:
+    """Write memoized results to RESULT_CACHE_PATH if persistence is on.
+
+    Runs at interpreter exit once persistence is enabled; call it directly
+    to flush earlier.
+    """
+    global _results_dirty
+    if not _results_dirty or not persist_enabled():
+        return
+    _results_dirty = False
+    try:
+        _entry_cache._write_pickle(RESULT_CACHE_PATH, _RESULTS)
+    except OSError:
+        pass
+
+
 def text_match_result(entry: dict):
-    """Compute text-match result for an entry, or None on failure."""
+    """Compute text-match result for an entry, or None on failure.
+
+    Memoized: the three text signals for one entry share one analysis.
+    """
+    global _results_dirty
     idf_data = get_text_match_idf()
     if idf_data is None:
         return None
@@ -35,11 +156,32 @@ def text_match_result(entry: dict):
         from text_match import analyze_entry
 
         entry_id = entry.get("id", "")
-        return analyze_entry(entry_id, entry, idf, corpus_size)
+        research_text, research_digest = _research(entry_id)
+        if not research_text:
+            return None
+        if not _results_loaded:
+            _load_results()
+        key = text_match_key(entry, research_digest, _idf_version(idf_data))
+        cached = _RESULTS.get(entry_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = analyze_entry(entry_id, entry, idf, corpus_size, research_text=research_text)
+        _RESULTS[entry_id] = (key, result)
+        _results_dirty = True
+        return result
     except Exception:
         return None
 
 
+def clear_text_match_cache() -> None:
+    """Forget memoized results (tests, or after editing research/blocks in-process)."""
+    global _results_loaded, _results_dirty
+    _RESULTS.clear()
+    _RESEARCH.clear()
+    _results_loaded = False
+    _results_dirty = False
+
+
 def mission_alignment_text_signal(entry: dict) -> tuple[int, str]:
     """Signal for mission alignment from text similarity."""
     result = text_match_result(entry)
@@ -67,6 +209,33 @@ def track_record_text_signal(entry: dict) -> tuple[int, str]:
     return score, f"text fit -> {score} (cosine={result.overall_similarity:.3f})"
 
 
+def _corpus_similarity_to_score(s: float) -> int:
+    """Map fingerprint cosine similarity to a 1-10 dimension score.
+
+    Calibrated against real descriptions (1000+ chars) with 4800+ term corpus:
+      Real Greenhouse DevEx/TechWriter (5000 chars): sim ~0.11  → 10
+      Synthetic DevEx (500 chars):                   sim ~0.09  → 9
+      Generic SWE (500 chars):                       sim ~0.07  → 7
+      iOS/mobile (500 chars):                        sim ~0.05  → 5
+      No overlap:                                    sim ~0.03  → 3
+    """
+    if s >= 0.10:
+        return 10
+    if s >= 0.09:
+        return 9
+    if s >= 0.08:
+        return 8
+    if s >= 0.07:
+        return 7
+    if s >= 0.06:
+        return 6
+    if s >= 0.05:
+        return 5
+    if s >= 0.04:
+        return 4
+    return 3
+
+
 def score_description_against_corpus(description: str) -> dict[str, int]:
     """Score a job description against the living corpus fingerprint.
 
@@ -77,43 +246,66 @@ def score_description_against_corpus(description: str) -> dict[str, int]:
     enough text for meaningful TF-IDF signal. Real Greenhouse/Lever/Ashby
     descriptions are typically 1000-5000 chars.
     """
-    if not description or len(description.strip()) < 200:
-        # Short descriptions don't have enough tokens for reliable TF-IDF scoring.
-        # Return neutral defaults rather than misleading scores.
-        return {"mission_alignment": 5, "evidence_match": 5, "track_record_fit": 4}
+    if _PRIMED is not None and description in _PRIMED[1]:
+        from corpus_fingerprint import get_fingerprint
+
+        if get_fingerprint() is _PRIMED[0]:
+            return dict(_PRIMED[1][description])
+    return score_descriptions_against_corpus([description])[0]
+
+
+def score_descriptions_against_corpus(descriptions: list[str]) -> list[dict[str, int]]:
+    """Batch form of score_description_against_corpus, in input order.
+
+    All descriptions long enough to score share one
+    CorpusFingerprint.score_descriptions pass.
+    """
+    # Short descriptions don't have enough tokens for reliable TF-IDF scoring.
+    # Return neutral defaults rather than misleading scores.
+    results = [
+        {"mission_alignment": 5, "evidence_match": 5, "track_record_fit": 4}
+        for _ in descriptions
+    ]
+    scorable = [i for i, d in enumerate(descriptions) if d and len(d.strip()) >= 200]
+    if not scorable:
+        return results
+
+    from corpus_fingerprint import get_fingerprint
+
+    similarities = get_fingerprint().score_descriptions([descriptions[i] for i in scorable])
+    for i, similarity in zip(scorable, similarities):
+        score = _corpus_similarity_to_score(similarity)
+        results[i] = {
+            "mission_alignment": score,
+            "evidence_match": score,
+            "track_record_fit": max(3, score - 1),
+        }
+    return results
+
+
+def prime_corpus_scores(entries: list[dict]) -> int:
+    """Batch-score the descriptions of auto-sourced *entries* ahead of a scoring run.
+
+    score_description_against_corpus then answers each entry from this
+    batch instead of scoring it alone. Primed scores are tied to the
+    current fingerprint and ignored once it is rebuilt. Returns the number
+    of descriptions scored.
+    """
+    global _PRIMED
+    from description_store import resolve_description
+
+    descriptions = []
+    for entry in entries:
+        if "auto-sourced" in (entry.get("tags") or []):
+            description = resolve_description(entry)
+            if len(description.strip()) >= 200:
+                descriptions.append(description)
+    descriptions = list(dict.fromkeys(descriptions))
+    if not descriptions:
+        return 0
 
     from corpus_fingerprint import get_fingerprint
 
-    fp = get_fingerprint()
-    similarity = fp.score_description(description)
-
-    # Map similarity to 1-10 scores
-    # Calibrated against real descriptions (1000+ chars) with 4800+ term corpus:
-    #   Real Greenhouse DevEx/TechWriter (5000 chars): sim ~0.11  → 10
-    #   Synthetic DevEx (500 chars):                   sim ~0.09  → 9
-    #   Generic SWE (500 chars):                       sim ~0.07  → 7
-    #   iOS/mobile (500 chars):                        sim ~0.05  → 5
-    #   No overlap:                                    sim ~0.03  → 3
-    def sim_to_score(s: float) -> int:
-        if s >= 0.10:
-            return 10
-        if s >= 0.09:
-            return 9
-        if s >= 0.08:
-            return 8
-        if s >= 0.07:
-            return 7
-        if s >= 0.06:
-            return 6
-        if s >= 0.05:
-            return 5
-        if s >= 0.04:
-            return 4
-        return 3
-
-    score = sim_to_score(similarity)
-    return {
-        "mission_alignment": score,
-        "evidence_match": score,
-        "track_record_fit": max(3, score - 1),
-    }
+    fingerprint = get_fingerprint()
+    _PRIMED = (fingerprint, dict(zip(descriptions, score_descriptions_against_corpus(descriptions))))
+    return len(descriptions)
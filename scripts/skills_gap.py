@@ -11,6 +11,7 @@
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
@@ -32,6 +33,12 @@ def _tokenize(text: str) -> list[str]:
     return re.findall(r"[a-z][a-z0-9+#.-]{1,30}", text.lower())
 
 
+@functools.lru_cache(maxsize=4)
+def _content_tokens(content: str) -> frozenset[str]:
+    """Token set of portfolio content, computed once per content string."""
+    return frozenset(_tokenize(content))
+
+
 def _load_research_md(entry_id: str) -> str:
     """Load research.md for an entry if it exists."""
     for subdir in ("active", "submitted", "research_pool"):
@@ -102,7 +109,7 @@ def compute_coverage(required: list[str], content: str) -> dict:
 
     Returns dict with coverage_pct, matched, missing, and suggested_blocks.
     """
-    content_tokens = set(_tokenize(content))
+    content_tokens = _content_tokens(content)
     matched = [s for s in required if s in content_tokens]
     missing = [s for s in required if s not in content_tokens]
     coverage_pct = len(matched) / len(required) * 100 if required else 100.0
@@ -25,12 +25,12 @@
     ACTIONABLE_STATUSES,
     PIPELINE_DIR_ACTIVE,
     PIPELINE_DIR_RESEARCH_POOL,
-    atomic_write,
+    FieldEdit,
     get_effort,
     get_score,
     load_entries,
     parse_date,
-    update_yaml_field,
+    write_field_edits,
 )
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -266,12 +266,10 @@ def auto_archive(
             print(f"  [dry-run] {entry_id} (score={decay_score:.1f}) -> {action_desc} (status={new_status})")
         else:
             # Update internal status before moving
-            content = filepath.read_text()
-            content = update_yaml_field(content, "status", new_status)
+            edits = [FieldEdit("status", new_status)]
             if new_status == "outcome":
-                content = update_yaml_field(content, "outcome", "withdrawn") # Default for triage-closed
-            
-            atomic_write(filepath, content)
+                edits.append(FieldEdit("outcome", "withdrawn"))  # Default for triage-closed
+            write_field_edits(filepath, edits)
             shutil.move(str(filepath), str(dest))
             print(f"  ARCHIVED {entry_id} (score={decay_score:.1f}) -> {action_desc}")
         
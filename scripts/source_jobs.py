@@ -16,29 +16,39 @@
     python scripts/source_jobs.py --fetch --limit 10   # Top 10 only
     python scripts/source_jobs.py --list-sources       # Show configured companies
     python scripts/source_jobs.py --stats              # Show last fetch stats
+    python scripts/source_jobs.py --fetch --yes --blob-descriptions  # Descriptions → pipeline/blobs/
+    python scripts/source_jobs.py --fetch --refresh-details  # Ignore stored Greenhouse details
 """
 
 import argparse
 import html as html_lib
 import json
 import re
+import sqlite3
 import sys
 from datetime import UTC, date, datetime
 from pathlib import Path
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 import yaml
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import http_client
+from ats_manifest import BoardManifest, posting_fingerprint
+from dedupe_index import DedupeIndex, job_keys
+from http_cache import cached_get
+from http_cache import report as http_cache_report
+from pipeline_index import extract_dedupe_keys
 from pipeline_lib import (
     ALL_PIPELINE_DIRS,
     ALL_PIPELINE_DIRS_WITH_POOL,
     JOB_STALE_HOURS,
     PIPELINE_DIR_RESEARCH_POOL,
+    atomic_write,
     load_entries,
 )
+from pipeline_segments import entry_paths, read_entry_text
 from source_jobs_constants import (
     HTTP_TIMEOUT,
     JOBSPY_DEFAULT_SITES,
@@ -410,27 +420,22 @@ def load_sources() -> dict:
     return data or {}
 
 
-def _http_get(url: str) -> bytes:
-    """GET request with User-Agent header and timeout."""
-    req = Request(url, headers={"User-Agent": "application-pipeline/1.0"})
-    with urlopen(req, timeout=HTTP_TIMEOUT) as resp:
-        return resp.read()
+def _http_get(url: str, ttl: float | None = None) -> bytes:
+    """GET request with User-Agent header and timeout, via the conditional-GET cache.
+
+    *ttl* overrides the host's cache TTL; 0 always revalidates with the server.
+    """
+    return cached_get(url, headers={"User-Agent": "application-pipeline/1.0"}, timeout=HTTP_TIMEOUT, ttl=ttl)
 
 
 def _http_post_json(url: str, body: dict) -> bytes:
     """POST JSON request with timeout."""
     data = json.dumps(body).encode("utf-8")
-    req = Request(
-        url,
-        data=data,
-        headers={
-            "User-Agent": "application-pipeline/1.0",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
-    with urlopen(req, timeout=HTTP_TIMEOUT) as resp:
-        return resp.read()
+    headers = {
+        "User-Agent": "application-pipeline/1.0",
+        "Content-Type": "application/json",
+    }
+    return http_client.request(url, method="POST", data=data, headers=headers, timeout=HTTP_TIMEOUT).read()
 
 
 def _strip_html(text: str) -> str:
@@ -445,6 +450,8 @@ def fetch_greenhouse_jobs(
     board: str,
     title_keywords: list[str] | None = None,
     title_excludes: list[str] | None = None,
+    refresh_details: bool = False,
+    listing_ttl: float | None = None,
 ) -> list[dict]:
     """Fetch jobs from Greenhouse public job board API.
 
@@ -452,10 +459,14 @@ def fetch_greenhouse_jobs(
 
     If title_keywords and title_excludes are provided, descriptions are fetched
     only for jobs that pass the title filter (avoids fetching 15K detail pages).
+    Descriptions of postings unchanged since the last scan come from the
+    board's manifest (ats_manifest) instead; refresh_details refetches them all.
+    listing_ttl overrides the HTTP cache TTL of the board listing (0 for
+    liveness checks, which must not be answered from a stale listing).
     """
     url = f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
     try:
-        raw = _http_get(url)
+        raw = _http_get(url, ttl=listing_ttl)
         data = json.loads(raw)
     except (HTTPError, URLError, json.JSONDecodeError) as e:
         print(f"  [greenhouse/{board}] Error: {e}", file=sys.stderr)
@@ -463,7 +474,9 @@ def fetch_greenhouse_jobs(
 
     jobs = data.get("jobs", [])
     results = []
+    listing_versions: dict[str, tuple[str, str]] = {}
     for job in jobs:
+        listing_versions[str(job.get("id", ""))] = (job.get("updated_at", ""), posting_fingerprint(job))
         # Prefer first_published (true posting date) over updated_at (last edit)
         raw_date = job.get("first_published") or job.get("updated_at", "")
         posting_date = raw_date[:10] if raw_date else None
@@ -489,40 +502,54 @@ def fetch_greenhouse_jobs(
     else:
         candidate_ids = {j["id"] for j in results}
 
+    # Reuse stored descriptions of postings unchanged since the last scan
+    manifest = BoardManifest("greenhouse", board)
+    jobs_to_fetch = []
+    for j in results:
+        if j["id"] not in candidate_ids:
+            continue
+        stored = None if refresh_details else manifest.lookup(j["id"], listing_versions[j["id"]][1])
+        if stored is None:
+            jobs_to_fetch.append(j)
+        else:
+            j["description"] = stored
+
     # Parallel detail fetches — Greenhouse public API handles concurrent GETs fine
-    jobs_to_fetch = [j for j in results if j["id"] in candidate_ids]
     if jobs_to_fetch:
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        def _fetch_description(job_id: str) -> tuple[str, str]:
+        def _fetch_description(job_id: str) -> tuple[str, str | None]:
             detail_url = f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs/{job_id}"
             try:
                 detail_raw = _http_get(detail_url)
                 detail = json.loads(detail_raw)
                 return job_id, _strip_html(detail.get("content", "") or "")
             except (HTTPError, URLError, json.JSONDecodeError):
-                return job_id, ""
+                return job_id, None
 
         with ThreadPoolExecutor(max_workers=8) as pool:
             futures = {pool.submit(_fetch_description, j["id"]): j for j in jobs_to_fetch}
             for future in as_completed(futures):
                 job_id, desc = future.result()
-                for j in results:
-                    if j["id"] == job_id:
-                        j["description"] = desc
-                        break
+                futures[future]["description"] = desc or ""
+                # Failed fetches stay out of the manifest and are retried next scan
+                if desc is not None:
+                    updated_at, fingerprint = listing_versions[job_id]
+                    manifest.record(job_id, updated_at, fingerprint, desc)
 
+    manifest.save(listing_versions)
     return results
 
 
-def fetch_lever_jobs(company: str) -> list[dict]:
+def fetch_lever_jobs(company: str, listing_ttl: float | None = None) -> list[dict]:
     """Fetch jobs from Lever public postings API.
 
-    Returns list of normalized job dicts.
+    Returns list of normalized job dicts. listing_ttl is as in
+    fetch_greenhouse_jobs.
     """
     url = f"https://api.lever.co/v0/postings/{company}?mode=json"
     try:
-        raw = _http_get(url)
+        raw = _http_get(url, ttl=listing_ttl)
         jobs = json.loads(raw)
     except (HTTPError, URLError, json.JSONDecodeError) as e:
         print(f"  [lever/{company}] Error: {e}", file=sys.stderr)
@@ -560,14 +587,15 @@ def fetch_lever_jobs(company: str) -> list[dict]:
     return results
 
 
-def fetch_ashby_jobs(company: str) -> list[dict]:
+def fetch_ashby_jobs(company: str, listing_ttl: float | None = None) -> list[dict]:
     """Fetch jobs from Ashby public job board API.
 
-    Returns list of normalized job dicts.
+    Returns list of normalized job dicts. listing_ttl is as in
+    fetch_greenhouse_jobs.
     """
     url = f"https://api.ashbyhq.com/posting-api/job-board/{company}"
     try:
-        raw = _http_get(url)
+        raw = _http_get(url, ttl=listing_ttl)
         data = json.loads(raw)
     except (HTTPError, URLError, json.JSONDecodeError) as e:
         print(f"  [ashby/{company}] Error: {e}", file=sys.stderr)
@@ -793,29 +821,31 @@ def _slugify(text: str) -> str:
     return text.strip('-')[:60]
 
 
-def _get_existing_ids() -> set[str]:
-    """Get IDs and application URLs of existing pipeline entries (including research pool)."""
-    entries = load_entries(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
+def _get_existing_ids() -> DedupeIndex | set[str]:
+    """Dedupe keys of existing pipeline entries (including research pool).
+
+    Served from the persistent dedupe index; if the index database cannot be
+    opened, the keys are collected from freshly loaded entries instead.
+    """
+    try:
+        return DedupeIndex(ALL_PIPELINE_DIRS_WITH_POOL)
+    except sqlite3.Error as e:
+        print(f"[WARN] Dedupe index unavailable, loading entries: {e}", file=sys.stderr)
     ids = set()
-    for e in entries:
-        if e.get("id"):
-            ids.add(e["id"])
-        # Also track by application URL for dedup
-        target = e.get("target", {})
-        if isinstance(target, dict) and target.get("application_url"):
-            ids.add(target["application_url"])
+    for e in load_entries(dirs=ALL_PIPELINE_DIRS_WITH_POOL):
+        ids.update(extract_dedupe_keys(e))
     return ids
 
 
-def deduplicate(jobs: list[dict], existing_ids: set[str]) -> list[dict]:
-    """Remove jobs that are already in the pipeline (by ID or URL)."""
+def deduplicate(jobs: list[dict], existing_ids: DedupeIndex | set[str]) -> list[dict]:
+    """Remove jobs that are already in the pipeline (by ID, URL or company + title)."""
     unique = []
     seen_slugs = set()
     for job in jobs:
         slug = f"{_slugify(job['company_display'])}-{_slugify(job['title'])}"
         if slug in existing_ids or slug in seen_slugs:
             continue
-        if job["url"] in existing_ids:
+        if job["url"] in existing_ids or any(key in existing_ids for key in job_keys(job)):
             continue
         seen_slugs.add(slug)
         unique.append(job)
@@ -969,12 +999,19 @@ def create_pipeline_entry(job: dict) -> tuple[str, dict]:
     return entry_id, entry
 
 
-def write_pipeline_entry(entry_id: str, entry: dict) -> Path:
-    """Write a pipeline entry YAML file to pipeline/research_pool/."""
+def write_pipeline_entry(entry_id: str, entry: dict, *, blob_description: bool = False) -> Path:
+    """Write a pipeline entry YAML file to pipeline/research_pool/.
+
+    With ``blob_description`` the posting description is stored in the
+    content-addressed blob store and the entry keeps only its reference.
+    """
     PIPELINE_DIR_RESEARCH_POOL.mkdir(parents=True, exist_ok=True)
+    if blob_description:
+        from description_store import externalize_description
+
+        externalize_description(entry)
     filepath = PIPELINE_DIR_RESEARCH_POOL / f"{entry_id}.yaml"
-    with open(filepath, "w") as f:
-        yaml.dump(entry, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    atomic_write(filepath, yaml.dump(entry, default_flow_style=False, sort_keys=False, allow_unicode=True))
     return filepath
 
 
@@ -1021,12 +1058,8 @@ def backfill_locations(dry_run: bool = False) -> int:
     for pipeline_dir in ALL_PIPELINE_DIRS:
         if not pipeline_dir.exists():
             continue
-        for filepath in sorted(pipeline_dir.glob("*.yaml")):
-            if filepath.name.startswith("_"):
-                continue
-
-            with open(filepath) as f:
-                content = f.read()
+        for filepath in entry_paths(pipeline_dir):
+            content = read_entry_text(filepath)
 
             data = yaml.safe_load(content)
             if not isinstance(data, dict):
@@ -1122,8 +1155,8 @@ def backfill_locations(dry_run: bool = False) -> int:
                       file=sys.stderr)
                 continue
 
-            with open(filepath, "w") as f:
-                f.write(content)
+            # A packed entry gets a loose override, folded back by the next --pack.
+            atomic_write(filepath, content)
 
             print(f"  {filepath.stem}: {location!r} -> {loc_class}")
             updated += 1
@@ -1174,6 +1207,10 @@ def main():
                         help="Include results from JobSpy multi-platform scraper (LinkedIn, Indeed, Glassdoor)")
     parser.add_argument("--jobspy-sites", default="linkedin,indeed,glassdoor",
                         help="Comma-separated JobSpy sites (default: linkedin,indeed,glassdoor)")
+    parser.add_argument("--blob-descriptions", action="store_true",
+                        help="Store posting descriptions in pipeline/blobs/ and keep only a hash in the entry")
+    parser.add_argument("--refresh-details", action="store_true",
+                        help="Refetch every Greenhouse posting detail, ignoring the stored board manifests")
     args = parser.parse_args()
 
     if args.list_sources:
@@ -1217,7 +1254,12 @@ def _fetch_board(portal: str, key: str) -> tuple[str, str, list[dict], list[dict
             """Fetch and filter a single board. Returns (portal/key, display, all_jobs, filtered)."""
             display = COMPANY_DISPLAY_NAMES.get(key, key)
             if portal == "greenhouse":
-                jobs = fetch_greenhouse_jobs(key, title_keywords=TITLE_KEYWORDS, title_excludes=TITLE_EXCLUDES)
+                jobs = fetch_greenhouse_jobs(
+                    key,
+                    title_keywords=TITLE_KEYWORDS,
+                    title_excludes=TITLE_EXCLUDES,
+                    refresh_details=args.refresh_details,
+                )
             elif portal == "lever":
                 jobs = fetch_lever_jobs(key)
             elif portal == "ashby":
@@ -1304,6 +1346,9 @@ def _fetch_board(portal: str, key: str) -> tuple[str, str, list[dict], list[dict
         if args.limit:
             print(f"Limited to:    {args.limit}")
         print(f"{'=' * 60}")
+        cache_report = http_cache_report()
+        if cache_report:
+            print(cache_report)
 
         # Auto-source balance check: alert if >80% are tech jobs
         if unique_jobs:
@@ -1334,7 +1379,7 @@ def _fetch_board(portal: str, key: str) -> tuple[str, str, list[dict], list[dict
             age_str = _format_posting_age(job)
 
             if args.yes and not args.dry_run:
-                write_pipeline_entry(entry_id, entry)
+                write_pipeline_entry(entry_id, entry, blob_description=args.blob_descriptions)
                 created.append(entry_id)
                 print(f"  + {entry_id}")
                 print(f"    {company} — {title} {age_str}")
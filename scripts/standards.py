@@ -256,11 +256,11 @@ def _run_subprocess_gate(gate_name: str, command: list[str]) -> GateResult:
 def _get_pipeline_files() -> list[Path]:
     """Get all pipeline YAML files for schema validation."""
     from pipeline_lib import ALL_PIPELINE_DIRS_WITH_POOL
+    from pipeline_segments import entry_paths
     files = []
     for d in ALL_PIPELINE_DIRS_WITH_POOL:
-        if d.exists():
-            files.extend(sorted(d.glob("*.yaml")))
-    return [f for f in files if not f.name.startswith("_")]
+        files.extend(entry_paths(d))
+    return files
 
 
 # ---------------------------------------------------------------------------
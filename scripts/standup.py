@@ -775,7 +775,7 @@ def run_standup(hours: float, section: str | None, do_log: bool, track_filter: s
     from pipeline_freshness import flush_stale_active_jobs
     flush_stale_active_jobs()
 
-    entries = load_entries()
+    entries = load_entries(header_only=True)
     if not entries:
         print("No pipeline entries found.")
         sys.exit(1)
@@ -892,7 +892,7 @@ def run_triage():
 
     For each entry, prompts: advance / withdraw / defer / skip.
     """
-    entries = load_entries(include_filepath=True)
+    entries = load_entries(include_filepath=True, header_only=True)
     today = date.today()
 
     # Find stagnant + actionable entries, sorted by staleness
@@ -1017,7 +1017,7 @@ def collect_standup_data(hours: float = 3.0, section: str | None = None) -> dict
     import contextlib
     import io
 
-    entries = load_entries()
+    entries = load_entries(header_only=True)
     if not entries:
         return {"error": "No pipeline entries found"}
 
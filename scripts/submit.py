@@ -27,6 +27,7 @@
     REPO_ROOT,
     SIGNALS_DIR,
     VARIANTS_DIR,
+    atomic_write,
     count_chars,
     count_words,
     days_until,
@@ -548,7 +549,7 @@ def record_submission(filepath: Path, entry: dict) -> None:
         data["status_meta"] = status_meta
         content = yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
-    filepath.write_text(content)
+    atomic_write(filepath, content)
 
     # Move to submitted directory
     PIPELINE_DIR_SUBMITTED.mkdir(parents=True, exist_ok=True)
@@ -11,6 +11,7 @@
 
 Usage:
     python scripts/text_match.py --build-corpus
+    python scripts/text_match.py --stats
     python scripts/text_match.py --target <id>
     python scripts/text_match.py --target <id> --gaps
     python scripts/text_match.py --all
@@ -23,28 +24,28 @@
 import math
 import re
 import sys
+import time
 from collections import Counter
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
-import yaml
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+from pipeline_entry_cache import CACHE_DIR
 from pipeline_lib import (
-    SIGNALS_DIR,
-    load_block,
-    load_block_index,
+    BLOCKS_DIR,
+    PROFILE_ID_MAP,
+    PROFILES_DIR,
     load_entries,
     load_entry_by_id,
-    load_profile,
 )
 
 # --- Constants ---
 
 WORK_DIR = Path(__file__).resolve().parent / ".alchemize-work"
 
-CORPUS_CACHE_PATH = SIGNALS_DIR / "text-match-corpus.yaml"
+CORPUS_CACHE_PATH = CACHE_DIR / "text-match-corpus.pickle"
 
 MIN_DF = 2          # terms in only 1 doc are noise
 MAX_DF_RATIO = 0.80  # terms in >80% of docs are too generic
@@ -154,8 +155,6 @@ def compute_idf(corpus_tokens: list[list[str]]) -> dict[str, float]:
     """
     if not corpus_tokens:
         return {}
-    n = len(corpus_tokens)
-    max_df = int(n * MAX_DF_RATIO)
 
     # Document frequency: number of docs containing each term
     df: dict[str, int] = Counter()
@@ -164,6 +163,15 @@ def compute_idf(corpus_tokens: list[list[str]]) -> dict[str, float]:
         for term in unique_terms:
             df[term] += 1
 
+    return idf_from_df(df, len(corpus_tokens))
+
+
+def idf_from_df(df: Mapping[str, int], n: int) -> dict[str, float]:
+    """IDF from document frequencies over *n* docs, with compute_idf's filters."""
+    if not n:
+        return {}
+    max_df = int(n * MAX_DF_RATIO)
+
     idf = {}
     for term, freq in df.items():
         if freq < MIN_DF:
@@ -185,8 +193,32 @@ def tfidf_vector(tokens: list[str], idf: dict[str, float]) -> dict[str, float]:
     }
 
 
-def cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float]) -> float:
-    """Compute cosine similarity between two sparse vectors."""
+def tfidf_from_counts(counts: dict[str, int], total: int, idf: dict[str, float]) -> dict[str, float]:
+    """tfidf_vector from precomputed token counts (same floats, same key order)."""
+    if not total:
+        return {}
+    return {
+        term: count / total * idf[term]
+        for term, count in counts.items()
+        if term in idf
+    }
+
+
+def vector_norm(vec: dict[str, float]) -> float:
+    """Euclidean magnitude of a sparse vector."""
+    return math.sqrt(sum(v * v for v in vec.values()))
+
+
+def cosine_similarity(
+    vec_a: dict[str, float],
+    vec_b: dict[str, float],
+    norm_a: float | None = None,
+    norm_b: float | None = None,
+) -> float:
+    """Compute cosine similarity between two sparse vectors.
+
+    norm_a/norm_b may pass precomputed vector_norm values.
+    """
     if not vec_a or not vec_b:
         return 0.0
 
@@ -197,8 +229,8 @@ def cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float]) -> float
 
     dot = sum(vec_a[k] * vec_b[k] for k in shared_keys)
 
-    mag_a = math.sqrt(sum(v * v for v in vec_a.values()))
-    mag_b = math.sqrt(sum(v * v for v in vec_b.values()))
+    mag_a = vector_norm(vec_a) if norm_a is None else norm_a
+    mag_b = vector_norm(vec_b) if norm_b is None else norm_b
 
     if mag_a == 0.0 or mag_b == 0.0:
         return 0.0
@@ -236,7 +268,11 @@ def _html_to_text(html_text: str) -> str:
 
 def load_research_text(entry_id: str) -> str | None:
     """Load research.md for an entry, stripping the Custom Questions section."""
-    research_path = WORK_DIR / entry_id / "research.md"
+    return research_text_from_file(WORK_DIR / entry_id / "research.md")
+
+
+def research_text_from_file(research_path: Path) -> str | None:
+    """Read a research.md file, stripping the Custom Questions section."""
     if not research_path.exists():
         return None
     text = research_path.read_text(encoding="utf-8", errors="replace")
@@ -269,63 +305,59 @@ def build_corpus() -> tuple[dict[str, float], list[list[str]], int]:
     return idf, corpus_tokens, len(corpus_tokens)
 
 
-def save_corpus_cache(idf: dict[str, float], corpus_size: int) -> None:
-    """Save IDF table to YAML cache."""
-    SIGNALS_DIR.mkdir(parents=True, exist_ok=True)
-    from datetime import datetime
-    cache_data = {
-        "generated": datetime.now().isoformat(),
-        "corpus_size": corpus_size,
-        "term_count": len(idf),
-        "idf": {k: round(v, 6) for k, v in sorted(idf.items())},
-    }
-    CORPUS_CACHE_PATH.write_text(
-        yaml.dump(cache_data, default_flow_style=False, allow_unicode=True),
-        encoding="utf-8",
-    )
+def load_corpus_index(force_rebuild: bool = False, update: bool = True):
+    """Return the cached IDF corpus index, updated for changed research files.
 
+    Only research files added or changed since the last call are
+    re-tokenized; force_rebuild starts the index over from scratch. With
+    update=False the stored index is returned as is (None if there is
+    none) and the cache file is left untouched.
+    """
+    from text_match_corpus import CorpusIndex
 
-def load_corpus_cache() -> tuple[dict[str, float], int] | None:
-    """Load cached IDF table if fresh (< 7 days old)."""
-    if not CORPUS_CACHE_PATH.exists():
-        return None
+    index = None if force_rebuild else CorpusIndex.load(CORPUS_CACHE_PATH)
+    if not update:
+        return index
+    if index is None:
+        index = CorpusIndex(CORPUS_CACHE_PATH)
+    index.update(WORK_DIR)
+    index.save()
+    return index
 
-    from datetime import datetime
-    try:
-        data = yaml.safe_load(CORPUS_CACHE_PATH.read_text(encoding="utf-8"))
-    except Exception:
-        return None
 
-    if not isinstance(data, dict) or "idf" not in data:
+def load_corpus_cache() -> tuple[dict[str, float], int] | None:
+    """Read the cached IDF table without refreshing it; None if nothing is cached."""
+    index = load_corpus_index(update=False)
+    if index is None:
         return None
-
-    generated = data.get("generated", "")
-    if generated:
-        try:
-            gen_dt = datetime.fromisoformat(generated)
-            age_days = (datetime.now() - gen_dt).days
-            if age_days > 7:
-                return None
-        except (ValueError, TypeError):
-            return None
-
-    return data["idf"], data.get("corpus_size", 0)
+    idf = index.idf()
+    return (idf, index.corpus_size) if idf else None
 
 
 def get_idf(force_rebuild: bool = False) -> tuple[dict[str, float], int]:
-    """Get IDF table, using cache if fresh.
+    """Get IDF table from the incrementally updated corpus cache.
 
     Returns (idf_table, corpus_size).
     """
-    if not force_rebuild:
-        cached = load_corpus_cache()
-        if cached is not None:
-            return cached
-
-    idf, _, corpus_size = build_corpus()
-    if idf:
-        save_corpus_cache(idf, corpus_size)
-    return idf, corpus_size
+    index = load_corpus_index(force_rebuild)
+    return index.idf(), index.corpus_size
+
+
+def _format_corpus_stats(stats: dict, load_ms: float) -> str:
+    """Format CorpusIndex.stats() for --stats."""
+    pending = stats["pending_added"] + stats["pending_changed"] + stats["pending_removed"]
+    return "\n".join([
+        "Text Match Corpus",
+        "=" * 60,
+        f"  cache:       {stats['path']} ({stats['bytes']:,} bytes)",
+        f"  load time:   {load_ms:.1f} ms",
+        f"  documents:   {stats['documents']}",
+        f"  vocabulary:  {stats['vocabulary']:,} terms ({stats['idf_terms']:,} after DF filtering)",
+        f"  updated:     {stats['updated'] or 'never'}"
+        + (f" ({stats['age_hours']}h ago)" if stats["age_hours"] is not None else ""),
+        f"  staleness:   {pending} pending "
+        f"(+{stats['pending_added']} new, ~{stats['pending_changed']} changed, -{stats['pending_removed']} removed)",
+    ])
 
 
 # --- Content Assembly ---
@@ -336,75 +368,91 @@ def get_idf(force_rebuild: bool = False) -> tuple[dict[str, float], int]:
 _FIT_PREFIXES = ()  # fit uses resumes + profile, not blocks
 
 
-def assemble_candidate_content(entry: dict, content_type: str) -> str:
-    """Build text from blocks, profiles, and resumes for a content type.
+def candidate_parts(entry: dict, content_type: str, store=None) -> list:
+    """Tokenized pieces of a content type's candidate text, in assembly order.
 
-    content_type: "mission", "evidence", or "fit"
+    content_type: "mission", "evidence", or "fit". Pieces come from the
+    text_match_vectors store, so each block, resume and profile is read and
+    tokenized once.
     """
+    if store is None:
+        from text_match_vectors import get_vector_store
+
+        store = get_vector_store()
     parts = []
     entry_id = entry.get("id", "")
     submission = entry.get("submission", {}) or {}
     blocks_used = submission.get("blocks_used", {}) or {}
 
-    if content_type == "mission":
-        # Identity + framing blocks
+    if content_type in ("mission", "evidence"):
+        # Identity + framing blocks, or evidence + methodology + project blocks
+        prefixes = _MISSION_PREFIXES if content_type == "mission" else _EVIDENCE_PREFIXES
         for key, block_path in blocks_used.items():
             if not block_path:
                 continue
             bp = str(block_path)
-            if any(bp.startswith(p) for p in _MISSION_PREFIXES):
-                content = load_block(bp)
-                if content:
-                    parts.append(_strip_frontmatter(content))
-
-        # Artist statements from profile
-        profile = load_profile(entry_id)
-        if profile:
-            for stmt_key in ("artist_statement_long", "artist_statement_medium", "artist_statement_short"):
-                stmt = profile.get(stmt_key, "")
-                if stmt:
-                    parts.append(stmt)
-
-    elif content_type == "evidence":
-        # Evidence + methodology + project blocks
-        for key, block_path in blocks_used.items():
-            if not block_path:
-                continue
-            bp = str(block_path)
-            if any(bp.startswith(p) for p in _EVIDENCE_PREFIXES):
-                content = load_block(bp)
-                if content:
-                    parts.append(_strip_frontmatter(content))
+            if any(bp.startswith(p) for p in prefixes):
+                part = store.block(bp)
+                if part is not None:
+                    parts.append(part)
 
-    elif content_type == "fit":
+    if content_type == "fit":
         # Resume HTML → text
         materials = submission.get("materials_attached", []) or []
         for mat in materials:
             mat_str = str(mat)
             if "resume" in mat_str.lower() and mat_str.endswith(".html"):
-                resume_path = Path(__file__).resolve().parent.parent / "materials" / mat_str.removeprefix("materials/")
-                if not resume_path.exists():
-                    # Try relative from repo root
-                    resume_path = Path(__file__).resolve().parent.parent / mat_str
-                if resume_path.exists():
-                    html_text = resume_path.read_text(encoding="utf-8", errors="replace")
-                    parts.append(_html_to_text(html_text))
-
-        # Profile highlights
-        profile = load_profile(entry_id)
-        if profile:
-            highlights = profile.get("evidence_highlights", [])
-            if highlights:
-                parts.append(" ".join(str(h) for h in highlights))
-            work_samples = profile.get("work_samples", [])
-            if work_samples:
-                for ws in work_samples:
-                    if isinstance(ws, dict):
-                        desc = ws.get("description", "")
-                        if desc:
-                            parts.append(desc)
-
-    return " ".join(parts)
+                part = store.resume(_resume_path(mat_str))
+                if part is not None:
+                    parts.append(part)
+
+    if content_type in ("mission", "fit"):
+        # Artist statements (mission) or highlights + work samples (fit)
+        parts.extend(store.profile(entry_id).get(content_type, []))
+
+    return parts
+
+
+def assemble_candidate_content(entry: dict, content_type: str) -> str:
+    """Build text from blocks, profiles, and resumes for a content type.
+
+    content_type: "mission", "evidence", or "fit"
+    """
+    return " ".join(part.text for part in candidate_parts(entry, content_type))
+
+
+def _resume_path(mat_str: str) -> Path:
+    """Resolve a materials_attached resume reference to a file path."""
+    resume_path = Path(__file__).resolve().parent.parent / "materials" / mat_str.removeprefix("materials/")
+    if not resume_path.exists():
+        # Try relative from repo root
+        resume_path = Path(__file__).resolve().parent.parent / mat_str
+    return resume_path
+
+
+def candidate_source_paths(entry: dict) -> list[Path]:
+    """Files whose contents feed analyze_entry's candidate side for *entry*.
+
+    Blocks in blocks_used, attached resumes, the target profile and the
+    block index. Callers caching analyze_entry results stat these to know
+    when a cached result is stale.
+    """
+    entry_id = entry.get("id", "")
+    submission = entry.get("submission", {}) or {}
+    paths = []
+    for block_path in (submission.get("blocks_used", {}) or {}).values():
+        if block_path:
+            full_path = (BLOCKS_DIR / str(block_path)).resolve()
+            paths.append(full_path if full_path.suffix else full_path.with_suffix(".md"))
+    for mat in submission.get("materials_attached", []) or []:
+        mat_str = str(mat)
+        if "resume" in mat_str.lower() and mat_str.endswith(".html"):
+            paths.append(_resume_path(mat_str))
+    paths.append(PROFILES_DIR / f"{entry_id}.json")
+    if entry_id in PROFILE_ID_MAP:
+        paths.append(PROFILES_DIR / f"{PROFILE_ID_MAP[entry_id]}.json")
+    paths.append(BLOCKS_DIR / "_index.yaml")
+    return paths
 
 
 def _similarity_to_score(similarity: float) -> int:
@@ -465,17 +513,34 @@ def _find_blocks_for_term(term: str, tag_index: dict[str, list[str]]) -> list[st
 
 # --- Entry Analysis ---
 
-def analyze_entry(
+_CONTENT_TYPES = ("mission", "evidence", "fit")
+
+
+@dataclass
+class _PreparedEntry:
+    """The vectors analyze_entry compares, before any similarity is taken."""
+    entry_id: str
+    posting_word_count: int
+    posting_vec: dict[str, float]
+    posting_norm: float
+    slice_vecs: dict[str, dict[str, float]]
+    all_vec: dict[str, float]
+    all_total: int
+    blocks: list[tuple[str, dict[str, float], float]]  # (block path, vector, norm)
+
+
+def _prepare_entry(
     entry_id: str,
     entry: dict,
     idf: dict[str, float],
-    corpus_size: int,
-) -> TextMatchResult | None:
-    """Run full text match analysis for a single entry.
+    store,
+    research_text: str | None = None,
+) -> _PreparedEntry | None:
+    """Posting, slice, combined and per-block vectors for one entry.
 
-    Returns TextMatchResult or None if no research text available.
+    *research_text* is the entry's already-loaded research.md text, if any.
     """
-    posting_text = load_research_text(entry_id)
+    posting_text = research_text or load_research_text(entry_id)
     if not posting_text:
         return None
 
@@ -487,71 +552,148 @@ def analyze_entry(
     if not posting_vec:
         return None
 
-    # Compute similarity for each content slice
-    content_types = ["mission", "evidence", "fit"]
-    similarities = {}
-    content_vecs = {}
-
-    for ct in content_types:
-        content_text = assemble_candidate_content(entry, ct)
-        if content_text.strip():
-            ct_tokens = tokenize(content_text)
-            ct_vec = tfidf_vector(ct_tokens, idf)
-            sim = cosine_similarity(posting_vec, ct_vec)
-            similarities[ct] = sim
-            content_vecs[ct] = ct_vec
-        else:
-            similarities[ct] = 0.0
-            content_vecs[ct] = {}
+    from text_match_vectors import join_counts
 
-    # Overall: average of non-zero slices, or combined
-    all_content = " ".join(
-        assemble_candidate_content(entry, ct) for ct in content_types
-    )
-    all_tokens = tokenize(all_content)
-    all_vec = tfidf_vector(all_tokens, idf)
-    overall_sim = cosine_similarity(posting_vec, all_vec)
+    # Slice vectors are summed from the store's per-file token counts
+    # instead of re-tokenizing.
+    slices = {ct: candidate_parts(entry, ct, store) for ct in _CONTENT_TYPES}
+    slice_vecs = {ct: tfidf_from_counts(*join_counts(slices[ct]), idf) for ct in _CONTENT_TYPES}
+    all_counts, all_total = join_counts([part for ct in _CONTENT_TYPES for part in slices[ct]])
 
-    # Per-block similarity
-    per_block = {}
+    blocks = []
     submission = entry.get("submission", {}) or {}
     blocks_used = submission.get("blocks_used", {}) or {}
     for key, block_path in blocks_used.items():
         if not block_path:
             continue
-        content = load_block(str(block_path))
-        if content:
-            b_tokens = tokenize(_strip_frontmatter(content))
-            b_vec = tfidf_vector(b_tokens, idf)
-            b_sim = cosine_similarity(posting_vec, b_vec)
-            per_block[str(block_path)] = round(b_sim, 4)
+        part = store.block(str(block_path))
+        if part is not None:
+            blocks.append((str(block_path), *store.part_vector(part, idf)))
 
+    return _PreparedEntry(
+        entry_id=entry_id,
+        posting_word_count=len(posting_tokens),
+        posting_vec=posting_vec,
+        posting_norm=vector_norm(posting_vec),
+        slice_vecs=slice_vecs,
+        all_vec=tfidf_from_counts(all_counts, all_total, idf),
+        all_total=all_total,
+        blocks=blocks,
+    )
+
+
+def _entry_result(
+    prepared: _PreparedEntry,
+    similarities: dict[str, float],
+    overall_sim: float,
+    per_block: dict[str, float],
+    idf: dict[str, float],
+    corpus_size: int,
+    store,
+) -> TextMatchResult:
+    """Gap analysis and score mapping for one entry's similarities."""
     # Gap analysis (against combined content)
     tag_index = {}
     try:
-        idx = load_block_index()
-        tag_index = idx.get("tag_index", {})
+        tag_index = store.tag_index()
     except Exception as e:
         print(f"  Warning: Could not load block index for gap analysis: {e}")
 
-    gaps = _compute_gaps(posting_vec, all_vec, idf)
+    gaps = _compute_gaps(prepared.posting_vec, prepared.all_vec, idf)
     for gap in gaps:
         gap.suggested_blocks = _find_blocks_for_term(gap.term, tag_index)
 
     return TextMatchResult(
-        entry_id=entry_id,
+        entry_id=prepared.entry_id,
         overall_similarity=round(overall_sim, 4),
         mission_score=_similarity_to_score(similarities["mission"]),
         evidence_score=_similarity_to_score(similarities["evidence"]),
         fit_score=_similarity_to_score(similarities["fit"]),
         gap_terms=gaps,
         per_block_similarity=per_block,
-        posting_word_count=len(posting_tokens),
-        candidate_word_count=len(all_tokens),
+        posting_word_count=prepared.posting_word_count,
+        candidate_word_count=prepared.all_total,
         corpus_size=corpus_size,
     )
 
 
+def analyze_entry(
+    entry_id: str,
+    entry: dict,
+    idf: dict[str, float],
+    corpus_size: int,
+    research_text: str | None = None,
+) -> TextMatchResult | None:
+    """Run full text match analysis for a single entry.
+
+    Returns TextMatchResult or None if no research text available.
+    Callers that already read research.md pass it as *research_text*.
+    """
+    from text_match_vectors import get_vector_store
+
+    store = get_vector_store()
+    p = _prepare_entry(entry_id, entry, idf, store, research_text)
+    if p is None:
+        return None
+
+    # Similarity for each content slice, and overall against the combined content
+    similarities = {ct: cosine_similarity(p.posting_vec, p.slice_vecs[ct], p.posting_norm) for ct in _CONTENT_TYPES}
+    overall_sim = cosine_similarity(p.posting_vec, p.all_vec, p.posting_norm)
+    per_block = {
+        block_path: round(cosine_similarity(p.posting_vec, vec, p.posting_norm, norm), 4)
+        for block_path, vec, norm in p.blocks
+    }
+    return _entry_result(p, similarities, overall_sim, per_block, idf, corpus_size, store)
+
+
+def analyze_entries(
+    entries: list[dict],
+    idf: dict[str, float],
+    corpus_size: int,
+) -> list[TextMatchResult | None]:
+    """analyze_entry for every entry with an id, aligned with *entries*.
+
+    With the optional NumPy/SciPy backend (text_match_sparse) the slice,
+    overall and per-block similarities of all entries come from sparse
+    matrix products over one vocabulary; otherwise each entry goes through
+    analyze_entry.
+    """
+    from text_match_sparse import VocabularyIndex, cosine_matrix, rowwise_cosine, sparse_available
+
+    if not sparse_available():
+        return [analyze_entry(e["id"], e, idf, corpus_size) if e.get("id") else None for e in entries]
+
+    from text_match_vectors import get_vector_store
+
+    store = get_vector_store()
+    prepared = [_prepare_entry(e["id"], e, idf, store) if e.get("id") else None for e in entries]
+    live = [p for p in prepared if p is not None]
+    if not live:
+        return [None] * len(entries)
+
+    vocab = VocabularyIndex(idf)
+    postings = [p.posting_vec for p in live]
+    slice_sims = {ct: rowwise_cosine(postings, [p.slice_vecs[ct] for p in live], vocab) for ct in _CONTENT_TYPES}
+    overall = rowwise_cosine(postings, [p.all_vec for p in live], vocab)
+
+    # All postings × every distinct block used by any entry, in one product
+    block_columns: dict[str, int] = {}
+    block_vecs = []
+    for p in live:
+        for block_path, vec, _norm in p.blocks:
+            if block_path not in block_columns:
+                block_columns[block_path] = len(block_vecs)
+                block_vecs.append(vec)
+    block_sims = cosine_matrix(postings, block_vecs, vocab)
+
+    results = {}
+    for i, p in enumerate(live):
+        similarities = {ct: slice_sims[ct][i] for ct in _CONTENT_TYPES}
+        per_block = {block_path: round(block_sims[i][block_columns[block_path]], 4) for block_path, _, _ in p.blocks}
+        results[id(p)] = _entry_result(p, similarities, overall[i], per_block, idf, corpus_size, store)
+    return [results[id(p)] if p is not None else None for p in prepared]
+
+
 # --- CLI ---
 
 def _format_result(result: TextMatchResult, show_gaps: bool = False, show_blocks: bool = False) -> str:
@@ -592,19 +734,35 @@ def main():
     parser.add_argument("--blocks", action="store_true", help="Show per-block similarity")
     parser.add_argument("--json", action="store_true", help="JSON output")
     parser.add_argument("--top", type=int, default=0, help="Show only top N results by similarity")
+    parser.add_argument("--stats", action="store_true", help="Show IDF corpus cache size, load time and staleness")
     args = parser.parse_args()
 
     if args.build_corpus:
         print("Building TF-IDF corpus from research files...")
-        idf, _, corpus_size = build_corpus()
-        if idf:
-            save_corpus_cache(idf, corpus_size)
-            print(f"  corpus: {corpus_size} documents, {len(idf)} terms")
+        index = load_corpus_index(force_rebuild=True)
+        if index.corpus_size:
+            print(f"  corpus: {index.corpus_size} documents, {len(index.idf())} terms")
             print(f"  cached to: {CORPUS_CACHE_PATH}")
         else:
             print("  no research files found in .alchemize-work/")
         return
 
+    if args.stats:
+        from text_match_corpus import CorpusIndex
+
+        start = time.perf_counter()
+        index = CorpusIndex.load(CORPUS_CACHE_PATH)
+        load_ms = (time.perf_counter() - start) * 1000
+        if index is None:
+            print("No corpus cache. Run --build-corpus first.")
+            sys.exit(1)
+        stats = index.stats(WORK_DIR)
+        if args.json:
+            print(json.dumps({**stats, "load_ms": round(load_ms, 2)}, indent=2))
+        else:
+            print(_format_corpus_stats(stats, load_ms))
+        return
+
     if not args.target and not args.all:
         parser.print_help()
         sys.exit(1)
@@ -629,14 +787,11 @@ def main():
             sys.exit(0)
 
     elif args.all:
-        entries = load_entries()
-        for entry in entries:
-            eid = entry.get("id", "")
-            if not eid:
-                continue
-            result = analyze_entry(eid, entry, idf, corpus_size)
-            if result:
-                results.append(result)
+        results = [r for r in analyze_entries(load_entries(), idf, corpus_size) if r]
+
+    from text_match_vectors import get_vector_store
+
+    get_vector_store().save()
 
     if args.top > 0:
         results.sort(key=lambda r: r.overall_similarity, reverse=True)
@@ -0,0 +1,190 @@
+"""Incrementally maintained IDF corpus for text_match.
+
+The IDF table is derived from one document per ``.alchemize-work/<id>/research.md``.
+Rebuilding it means re-tokenizing every research file, so the old YAML
+cache was kept for up to seven days and then thrown away wholesale.
+
+CorpusIndex instead keeps, for every document, its (mtime_ns, size) stamp
+and the set of terms it contains, plus the document frequency of every term.
+update() re-tokenizes only documents that were added or changed since the
+last run and adjusts the frequencies by the difference, so the table is
+always current with the research files without a full rebuild.
+
+The index is pickled with each document's terms stored as an array of ids
+into one shared vocabulary, which keeps the file compact. Terms whose
+frequency drops to zero keep their id until the next ``--build-corpus``.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+
+import pipeline_entry_cache as _entry_cache
+from pipeline_entry_cache import RACY_WINDOW_NS
+
+CORPUS_FORMAT = 1
+
+
+class CorpusIndex:
+    """Per-document term sets and document frequencies for the IDF corpus.
+
+    ``docs`` maps a research directory name to
+    ``(mtime_ns, size, checked_ns, term_ids)``. Documents with no tokens are
+    recorded with an empty ``term_ids`` so they are not re-read, but do not
+    count towards the corpus size, as in text_match.build_corpus.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.vocab: list[str] = []
+        self.df = array("I")
+        self.docs: dict[str, tuple[int, int, int, array]] = {}
+        self.updated = 0.0
+        self._ids: dict[str, int] = {}
+        self._idf: dict[str, float] | None = None
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> CorpusIndex | None:
+        """Read the index at *path*; None if it is missing, corrupt or outdated."""
+        records = _entry_cache._read_pickle(path)
+        if not records or records.get("format") != CORPUS_FORMAT:
+            return None
+        index = cls(path)
+        try:
+            index.vocab = list(records["vocab"])
+            index.df = records["df"]
+            index.docs = dict(records["docs"])
+            index.updated = float(records["updated"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        index._ids = {term: i for i, term in enumerate(index.vocab)}
+        return index
+
+    @property
+    def corpus_size(self) -> int:
+        """Number of documents with at least one token."""
+        return sum(1 for record in self.docs.values() if record[3])
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct terms across the corpus (before DF filtering)."""
+        return sum(1 for freq in self.df if freq)
+
+    def scan(self, work_dir: Path) -> dict[str, tuple[int, int]]:
+        """Stamp of every ``research.md`` under *work_dir*, by directory name."""
+        if not work_dir.exists():
+            return {}
+        stamps = {}
+        for entry_dir in sorted(work_dir.iterdir()):
+            if not entry_dir.is_dir():
+                continue
+            try:
+                st = (entry_dir / "research.md").stat()
+            except OSError:
+                continue
+            stamps[entry_dir.name] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def pending(self, work_dir: Path) -> tuple[list[str], list[str], list[str]]:
+        """Documents (added, changed, removed) since the index was last updated."""
+        return self._diff(self.scan(work_dir))
+
+    def _diff(self, stamps: dict[str, tuple[int, int]]) -> tuple[list[str], list[str], list[str]]:
+        added, changed = [], []
+        for name, (mtime_ns, size) in stamps.items():
+            record = self.docs.get(name)
+            if record is None:
+                added.append(name)
+            elif record[0] != mtime_ns or record[1] != size or record[2] - record[0] <= RACY_WINDOW_NS:
+                changed.append(name)
+        removed = [name for name in self.docs if name not in stamps]
+        return added, changed, removed
+
+    def update(self, work_dir: Path) -> tuple[int, int, int]:
+        """Bring the index in line with *work_dir*; returns (added, changed, removed)."""
+        from text_match import research_text_from_file, tokenize
+
+        stamps = self.scan(work_dir)
+        added, changed, removed = self._diff(stamps)
+        for name in removed:
+            self._discard(name)
+        for name in added + changed:
+            self._discard(name)
+            text = research_text_from_file(work_dir / name / "research.md")
+            terms = set(tokenize(text)) if text else set()
+            mtime_ns, size = stamps[name]
+            self.docs[name] = (mtime_ns, size, time.time_ns(), self._count(terms))
+        if added or changed or removed:
+            self._dirty = True
+            self._idf = None
+            self.updated = time.time()
+        return len(added), len(changed), len(removed)
+
+    def _count(self, terms: set[str]) -> array:
+        ids = array("I")
+        for term in sorted(terms):
+            term_id = self._ids.get(term)
+            if term_id is None:
+                term_id = self._ids[term] = len(self.vocab)
+                self.vocab.append(term)
+                self.df.append(0)
+            self.df[term_id] += 1
+            ids.append(term_id)
+        return ids
+
+    def _discard(self, name: str) -> None:
+        record = self.docs.pop(name, None)
+        if record is None:
+            return
+        for term_id in record[3]:
+            self.df[term_id] -= 1
+
+    def idf(self) -> dict[str, float]:
+        """IDF table over the current documents, as text_match.compute_idf builds it."""
+        if self._idf is None:
+            from text_match import idf_from_df
+
+            df = {term: freq for term, freq in zip(self.vocab, self.df) if freq}
+            self._idf = idf_from_df(df, self.corpus_size)
+        return self._idf
+
+    def save(self) -> None:
+        """Persist the index if update() changed it."""
+        if not self._dirty:
+            return
+        records = {
+            "format": CORPUS_FORMAT,
+            "vocab": self.vocab,
+            "df": self.df,
+            "docs": self.docs,
+            "updated": self.updated,
+        }
+        try:
+            _entry_cache._write_pickle(self.path, records)
+            self._dirty = False
+        except OSError:
+            return
+
+    def stats(self, work_dir: Path) -> dict:
+        """Vocabulary size, corpus size and staleness against *work_dir*."""
+        added, changed, removed = self.pending(work_dir)
+        try:
+            size_bytes = self.path.stat().st_size
+        except OSError:
+            size_bytes = 0
+        return {
+            "path": str(self.path),
+            "bytes": size_bytes,
+            "documents": self.corpus_size,
+            "vocabulary": self.vocabulary_size,
+            "idf_terms": len(self.idf()),
+            "updated": datetime.fromtimestamp(self.updated).isoformat(timespec="seconds") if self.updated else None,
+            "age_hours": round((time.time() - self.updated) / 3600, 1) if self.updated else None,
+            "pending_added": len(added),
+            "pending_changed": len(changed),
+            "pending_removed": len(removed),
+        }
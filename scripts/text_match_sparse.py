@@ -0,0 +1,114 @@
+"""Optional NumPy/SciPy sparse-matrix backend for text_match similarities.
+
+text_match compares one posting with one candidate text at a time using
+dict arithmetic. Batch jobs (``text_match --all``, per-block similarity
+across every entry) repeat that for every posting × slice and posting ×
+block pair. With NumPy and SciPy installed, this module maps terms to
+columns of a shared vocabulary, stacks TF-IDF vectors into CSR matrices
+with unit-length rows, and takes all cosines from one sparse product.
+
+Without NumPy/SciPy, or with PIPELINE_TEXT_MATCH_BACKEND=stdlib, every
+function computes the same values with text_match.cosine_similarity.
+Sparse results agree with the stdlib path to floating-point rounding
+(summation order differs), not bit for bit.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+
+from text_match import cosine_similarity
+
+try:  # pragma: no cover - depends on optional NumPy/SciPy installation
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - stdlib fallback
+    np = None
+    sparse = None
+
+
+def sparse_available() -> bool:
+    """True when NumPy and SciPy are importable and not disabled by env."""
+    if os.environ.get("PIPELINE_TEXT_MATCH_BACKEND", "").strip().lower() == "stdlib":
+        return False
+    return np is not None and sparse is not None
+
+
+def backend_name() -> str:
+    """Name of the backend the functions below will use ("sparse" or "stdlib")."""
+    return "sparse" if sparse_available() else "stdlib"
+
+
+class VocabularyIndex:
+    """Column number for each term, in first-seen order."""
+
+    def __init__(self, terms: Iterable[str] = ()):
+        self.columns: dict[str, int] = {}
+        for term in terms:
+            self.columns.setdefault(term, len(self.columns))
+
+    @classmethod
+    def of(cls, *vector_lists: list[dict[str, float]]) -> VocabularyIndex:
+        """Vocabulary covering every term in the given vectors."""
+        return cls(term for vectors in vector_lists for vec in vectors for term in vec)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+
+def tfidf_matrix(vectors: list[dict[str, float]], vocab: VocabularyIndex):
+    """CSR matrix with one L2-normalized row per vector (requires NumPy/SciPy).
+
+    Terms missing from *vocab* are dropped; all-zero rows stay zero, so
+    their cosines are 0.0 as in cosine_similarity.
+    """
+    indptr = [0]
+    indices: list[int] = []
+    data: list[float] = []
+    for vec in vectors:
+        for term, weight in vec.items():
+            column = vocab.columns.get(term)
+            if column is not None:
+                indices.append(column)
+                data.append(weight)
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(vectors), len(vocab)),
+    )
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    return sparse.csr_matrix(sparse.diags(scale) @ matrix)
+
+
+def cosine_matrix(
+    left: list[dict[str, float]],
+    right: list[dict[str, float]],
+    vocab: VocabularyIndex | None = None,
+) -> list[list[float]]:
+    """Cosine similarity of every left vector with every right vector."""
+    if not left or not right:
+        return [[] for _ in left]
+    if not sparse_available():
+        return [[cosine_similarity(a, b) for b in right] for a in left]
+    vocab = vocab or VocabularyIndex.of(left, right)
+    product = tfidf_matrix(left, vocab) @ tfidf_matrix(right, vocab).T
+    return product.toarray().tolist()
+
+
+def rowwise_cosine(
+    left: list[dict[str, float]],
+    right: list[dict[str, float]],
+    vocab: VocabularyIndex | None = None,
+) -> list[float]:
+    """Cosine similarity of left[i] with right[i] for each i."""
+    if len(left) != len(right):
+        raise ValueError(f"rowwise_cosine needs equal lengths, got {len(left)} and {len(right)}")
+    if not left:
+        return []
+    if not sparse_available():
+        return [cosine_similarity(a, b) for a, b in zip(left, right)]
+    vocab = vocab or VocabularyIndex.of(left, right)
+    products = tfidf_matrix(left, vocab).multiply(tfidf_matrix(right, vocab))
+    return np.asarray(products.sum(axis=1)).ravel().tolist()
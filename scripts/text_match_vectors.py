@@ -0,0 +1,259 @@
+"""Persistent store of tokenized candidate content for text_match.
+
+analyze_entry compares one posting against three candidate slices (mission,
+evidence, fit), their union, and each block in blocks_used. Assembling those
+from scratch re-read and re-tokenized the same blocks, resumes and profiles
+several times per entry, and again for every entry sharing them. The store
+tokenizes each source file once and keeps its term counts on disk, keyed by
+path and validated by (mtime_ns, size), so only changed files are re-read.
+
+Term counts rather than TF-IDF vectors are persisted, so rebuilding the IDF
+corpus does not invalidate the store; vectors and norms are derived once per
+IDF table in memory. A slice's vector is built by summing its parts' counts
+in order, which gives the same floats as tokenizing the joined text.
+
+Summing differs from tokenizing the join only when a part ends inside an
+HTML tag, markdown link or emphasis run that the next part would close.
+Such parts are flagged when tokenized and their slice falls back to
+tokenizing the joined text.
+"""
+
+from __future__ import annotations
+
+import atexit
+import html as html_lib
+import json
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+import pipeline_entry_cache as _entry_cache
+from pipeline_entry_cache import RACY_WINDOW_NS
+from pipeline_lib import BLOCKS_DIR, PROFILE_ID_MAP, PROFILES_DIR, load_block_index
+from text_match import _html_to_text, _strip_frontmatter, tfidf_from_counts, tokenize, vector_norm
+
+VECTOR_STORE_PATH = _entry_cache.CACHE_DIR / "text-match-vectors.pickle"
+STORE_VERSION = 1
+
+_OPEN_TAG = re.compile(r"<[^>]*$")
+_OPEN_LINK = re.compile(r"\[[^\]]*$|\]\([^)]*$")
+
+
+def _has_open_tail(text: str) -> bool:
+    """True if normalize_text could match across the end of *text* into what follows.
+
+    Replays normalize_text's substitutions up to the markdown link pass and
+    looks for an opener left without its closer.
+    """
+    if _OPEN_TAG.search(text):
+        return True
+    text = html_lib.unescape(re.sub(r"<[^>]+>", " ", text))
+    text = re.sub(r"&#?\w+;", " ", text)
+    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\*{1,3}([^*]+)\*{1,3}", r"\1", text)
+    return "*" in text or bool(_OPEN_LINK.search(text))
+
+
+class ContentPart:
+    """One piece of candidate text with its token counts.
+
+    ``counts`` keeps first-occurrence order, matching compute_tf over the
+    same tokens.
+    """
+
+    __slots__ = ("text", "counts", "total", "open_tail")
+
+    def __init__(self, text: str):
+        tokens = tokenize(text)
+        self.text = text
+        self.counts = dict(Counter(tokens))
+        self.total = len(tokens)
+        self.open_tail = _has_open_tail(text)
+
+    def __repr__(self) -> str:
+        return f"ContentPart(total={self.total}, terms={len(self.counts)})"
+
+
+def join_counts(parts: list[ContentPart]) -> tuple[dict[str, int], int]:
+    """Token counts and total for the parts joined with spaces, in order."""
+    if any(part.open_tail for part in parts[:-1]):
+        tokens = tokenize(" ".join(part.text for part in parts))
+        return dict(Counter(tokens)), len(tokens)
+    if len(parts) == 1:
+        return parts[0].counts, parts[0].total
+    counts: dict[str, int] = {}
+    total = 0
+    for part in parts:
+        for term, count in part.counts.items():
+            counts[term] = counts.get(term, 0) + count
+        total += part.total
+    return counts, total
+
+
+class CandidateVectorStore:
+    """Tokenized blocks, resumes and profiles, cached on disk per file.
+
+    Records map the absolute file path to
+    ``(STORE_VERSION, mtime_ns, size, checked_ns, payload)``. A block or
+    resume payload is a ContentPart (or None for an empty block); a profile
+    payload maps "mission" and "fit" to the profile's ContentParts.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or VECTOR_STORE_PATH
+        self._records: dict[str, tuple] = _entry_cache._read_pickle(self.path) or {}
+        self._dirty = False
+        # Per-IDF memo of part vectors: id(part) → (part, vector, norm)
+        self._vector_idf: dict[str, float] | None = None
+        self._vectors: dict[int, tuple[ContentPart, dict[str, float], float]] = {}
+        self._tag_index: tuple[tuple, dict] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _lookup(self, filepath: Path, build):
+        """Return the payload for *filepath*, rebuilding it from the file if stale."""
+        key = str(filepath)
+        st = filepath.stat()
+        record = self._records.get(key)
+        if (
+            record is not None
+            and record[0] == STORE_VERSION
+            and record[1] == st.st_mtime_ns
+            and record[2] == st.st_size
+            and record[3] - record[1] > RACY_WINDOW_NS
+        ):
+            self.hits += 1
+            return record[4]
+        self.misses += 1
+        payload = build(filepath)
+        self._records[key] = (STORE_VERSION, st.st_mtime_ns, st.st_size, time.time_ns(), payload)
+        self._dirty = True
+        return payload
+
+    def block(self, block_path: str) -> ContentPart | None:
+        """Tokenized body of a block (frontmatter stripped), as load_block resolves it."""
+        full_path = (BLOCKS_DIR / block_path).resolve()
+        if not full_path.is_relative_to(BLOCKS_DIR.resolve()):
+            return None
+        if not full_path.suffix:
+            full_path = full_path.with_suffix(".md")
+        if not full_path.exists():
+            return None
+        return self._lookup(full_path, _build_block)
+
+    def resume(self, resume_path: Path) -> ContentPart | None:
+        """Tokenized text of a resume HTML file, or None if it does not exist."""
+        if not resume_path.exists():
+            return None
+        return self._lookup(resume_path, _build_resume)
+
+    def profile(self, target_id: str) -> dict[str, list[ContentPart]]:
+        """Mission and fit parts of a target profile, resolved like load_profile."""
+        filepath = PROFILES_DIR / f"{target_id}.json"
+        if not filepath.exists():
+            mapped = PROFILE_ID_MAP.get(target_id)
+            if mapped:
+                filepath = PROFILES_DIR / f"{mapped}.json"
+        if not filepath.exists():
+            return {}
+        return self._lookup(filepath, _build_profile)
+
+    def tag_index(self) -> dict[str, list[str]]:
+        """The block index's tag_index, re-read only when _index.yaml changes."""
+        index_path = BLOCKS_DIR / "_index.yaml"
+        try:
+            st = index_path.stat()
+        except OSError:
+            return load_block_index().get("tag_index", {})
+        stamp = (str(index_path), st.st_mtime_ns, st.st_size)
+        if self._tag_index is None or self._tag_index[0] != stamp:
+            self._tag_index = (stamp, load_block_index().get("tag_index", {}))
+        return self._tag_index[1]
+
+    def part_vector(self, part: ContentPart, idf: dict[str, float]) -> tuple[dict[str, float], float]:
+        """TF-IDF vector and norm of a single part, memoized per IDF table."""
+        if idf is not self._vector_idf:
+            self._vector_idf = idf
+            self._vectors.clear()
+        memo = self._vectors.get(id(part))
+        if memo is not None and memo[0] is part:
+            return memo[1], memo[2]
+        vec = tfidf_from_counts(part.counts, part.total, idf)
+        norm = vector_norm(vec)
+        self._vectors[id(part)] = (part, vec, norm)
+        return vec, norm
+
+    def save(self) -> None:
+        """Persist the store if anything was (re)tokenized."""
+        if not self._dirty:
+            return
+        try:
+            _entry_cache._write_pickle(self.path, self._records)
+            self._dirty = False
+        except OSError:
+            return
+
+
+def _build_block(filepath: Path) -> ContentPart | None:
+    content = filepath.read_text().strip()
+    return ContentPart(_strip_frontmatter(content)) if content else None
+
+
+def _build_resume(filepath: Path) -> ContentPart:
+    return ContentPart(_html_to_text(filepath.read_text(encoding="utf-8", errors="replace")))
+
+
+def _build_profile(filepath: Path) -> dict[str, list[ContentPart]]:
+    profile = json.loads(filepath.read_text())
+    if not profile:
+        return {}
+    mission = []
+    for stmt_key in ("artist_statement_long", "artist_statement_medium", "artist_statement_short"):
+        stmt = profile.get(stmt_key, "")
+        if stmt:
+            mission.append(ContentPart(stmt))
+    fit = []
+    highlights = profile.get("evidence_highlights", [])
+    if highlights:
+        fit.append(ContentPart(" ".join(str(h) for h in highlights)))
+    for ws in profile.get("work_samples", []) or []:
+        if isinstance(ws, dict):
+            desc = ws.get("description", "")
+            if desc:
+                fit.append(ContentPart(desc))
+    return {"mission": mission, "fit": fit}
+
+
+_STORE: CandidateVectorStore | None = None
+_save_registered = False
+
+
+def get_vector_store() -> CandidateVectorStore:
+    """Return the process-wide store, re-opened if VECTOR_STORE_PATH changed.
+
+    The store is saved at interpreter exit; call save() to flush earlier.
+    """
+    global _STORE, _save_registered
+    if _STORE is None or _STORE.path != VECTOR_STORE_PATH:
+        if _STORE is not None:
+            _STORE.save()
+        _STORE = CandidateVectorStore(VECTOR_STORE_PATH)
+        if not _save_registered:
+            _save_registered = True
+            atexit.register(_save_store)
+    return _STORE
+
+
+def _save_store() -> None:
+    if _STORE is not None:
+        _STORE.save()
+
+
+def reset_vector_store() -> None:
+    """Drop the process-wide store (tests, or after bulk edits mid-process)."""
+    global _STORE
+    _STORE = None
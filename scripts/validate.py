@@ -16,6 +16,7 @@
     VALID_TRANSITIONS,
     detect_portal,
 )
+from pipeline_segments import entry_paths, read_entry_text
 
 REQUIRED_FIELDS = {"id", "name", "track", "status"}
 VALID_OUTCOMES = {"accepted", "rejected", "withdrawn", "expired", None}
@@ -107,8 +108,7 @@ def validate_entry(filepath: Path, warnings: list[str] | None = None) -> list[st
     errors = []
 
     try:
-        with open(filepath) as f:
-            data = load_yaml_strict(f.read())
+        data = load_yaml_strict(read_entry_text(filepath))
     except yaml.YAMLError as e:
         return [f"YAML parse error: {e}"]
 
@@ -791,9 +791,7 @@ def main():
     for pipeline_dir in PIPELINE_DIRS:
         if not pipeline_dir.exists():
             continue
-        for filepath in sorted(pipeline_dir.glob("*.yaml")):
-            if filepath.name.startswith("_"):
-                continue
+        for filepath in entry_paths(pipeline_dir):
             file_count += 1
             entry_warnings = []
             errors = validate_entry(filepath, warnings=entry_warnings)
@@ -886,12 +884,9 @@ def main():
         for pipeline_dir in PIPELINE_DIRS:
             if not pipeline_dir.exists():
                 continue
-            for filepath in sorted(pipeline_dir.glob("*.yaml")):
-                if filepath.name.startswith("_"):
-                    continue
+            for filepath in entry_paths(pipeline_dir):
                 try:
-                    with open(filepath) as f:
-                        entry_data = load_yaml_strict(f.read())
+                    entry_data = load_yaml_strict(read_entry_text(filepath))
                     if isinstance(entry_data, dict):
                         all_entries.append(entry_data)
                 except yaml.YAMLError:
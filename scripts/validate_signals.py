@@ -20,6 +20,7 @@
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from pipeline_lib import ALL_PIPELINE_DIRS_WITH_POOL, SIGNALS_DIR
+from pipeline_segments import entry_paths
 
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
@@ -191,11 +192,7 @@ def _collect_all_entry_ids() -> set[str]:
     """Scan all pipeline directories and return the set of known entry IDs."""
     ids: set[str] = set()
     for d in ALL_PIPELINE_DIRS_WITH_POOL:
-        if not d.exists():
-            continue
-        for fp in d.glob("*.yaml"):
-            if not fp.name.startswith("_"):
-                ids.add(fp.stem)
+        ids.update(fp.stem for fp in entry_paths(d))
     return ids
 
 
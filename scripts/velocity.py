@@ -292,7 +292,7 @@ def main():
                         help="Write report to signals/patterns.md")
     args = parser.parse_args()
 
-    entries = load_entries(dirs=ALL_PIPELINE_DIRS_WITH_POOL)
+    entries = load_entries(dirs=ALL_PIPELINE_DIRS_WITH_POOL, header_only=True)
     if not entries:
         print("No pipeline entries found.")
         sys.exit(1)
@@ -12,3 +12,11 @@
 # Prevent test runs from mutating repo-tracked signal action logs.
 _TEST_SIGNAL_DIR = Path(mkdtemp(prefix="pipeline-signal-actions-"))
 os.environ.setdefault("PIPELINE_SIGNAL_ACTIONS_PATH", str(_TEST_SIGNAL_DIR / "signal-actions.yaml"))
+os.environ.setdefault("PIPELINE_SCORE_TELEMETRY_PATH", str(_TEST_SIGNAL_DIR / "score-telemetry.yaml"))
+
+# Keep the parsed-entry cache out of the working tree during test runs.
+os.environ.setdefault("PIPELINE_CACHE_DIR", str(Path(mkdtemp(prefix="pipeline-cache-"))))
+
+# Commands run against the real tree (e.g. standup) must not flush aged
+# entries out of pipeline/active.
+os.environ.setdefault("PIPELINE_FRESHNESS_FLUSH", "0")
@@ -0,0 +1,95 @@
+"""Tests for scripts/ats_manifest.py and incremental Greenhouse detail fetching."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import ats_manifest
+from ats_manifest import BoardManifest, posting_fingerprint
+from source_jobs import fetch_greenhouse_jobs
+
+LISTING = [
+    {"id": n, "title": f"Software Engineer {n}", "absolute_url": f"https://example.com/{n}",
+     "location": {"name": "Remote"}, "updated_at": "2026-03-14T00:00:00Z"}
+    for n in range(1, 301)
+]
+
+
+@pytest.fixture
+def board(tmp_path, monkeypatch):
+    """A 300-posting Greenhouse board served through a fake _http_get."""
+    monkeypatch.setattr(ats_manifest, "MANIFEST_DIR", tmp_path)
+    state = {"listing": [dict(job) for job in LISTING], "calls": []}
+
+    def fake_http_get(url: str, ttl: float | None = None) -> bytes:
+        state["calls"].append(url)
+        if url.endswith("/jobs"):
+            return json.dumps({"jobs": state["listing"]}).encode()
+        job_id = url.rsplit("/", 1)[1]
+        return json.dumps({"content": f"<p>Role {job_id}</p>"}).encode()
+
+    monkeypatch.setattr("source_jobs._http_get", fake_http_get)
+    return state
+
+
+def _scan() -> list[dict]:
+    return fetch_greenhouse_jobs("acme", title_keywords=["software engineer"], title_excludes=[])
+
+
+def test_quiet_board_costs_one_list_request(board):
+    first = _scan()
+    assert len(board["calls"]) == 301
+    board["calls"].clear()
+    assert _scan() == first
+    assert board["calls"] == ["https://boards-api.greenhouse.io/v1/boards/acme/jobs"]
+
+
+def test_only_new_or_changed_postings_are_fetched(board):
+    _scan()
+    board["calls"].clear()
+    board["listing"][4]["updated_at"] = "2026-03-20T00:00:00Z"
+    board["listing"].append({"id": 999, "title": "Software Engineer", "absolute_url": "https://example.com/999",
+                             "location": {"name": "Remote"}, "updated_at": "2026-03-20T00:00:00Z"})
+    jobs = _scan()
+    assert sorted(url.rsplit("/", 1)[1] for url in board["calls"][1:]) == ["5", "999"]
+    assert {j["id"]: j["description"] for j in jobs}["999"] == "Role 999"
+
+
+def test_refresh_details_refetches_everything(board):
+    _scan()
+    board["calls"].clear()
+    fetch_greenhouse_jobs("acme", title_keywords=["software engineer"], title_excludes=[], refresh_details=True)
+    assert len(board["calls"]) == 301
+
+
+def test_manifest_keeps_listed_postings_only(tmp_path):
+    manifest = BoardManifest("greenhouse", "acme", directory=tmp_path)
+    manifest.record("1", "2026-03-14", "fp1", "one")
+    manifest.record("2", "2026-03-14", "fp2", "two")
+    manifest.record("3", "2026-03-14", "fp3", "three")
+    manifest.save(["1", "2", "3"])
+
+    rescan = BoardManifest("greenhouse", "acme", directory=tmp_path)
+    assert rescan.lookup("1", "fp1") == "one"
+    rescan.save(["1", "2"])
+    reopened = BoardManifest("greenhouse", "acme", directory=tmp_path)
+    assert reopened.lookup("2", "fp2") == "two"
+    assert reopened.lookup("3", "fp3") is None
+
+
+def test_fingerprint_tracks_listing_fields():
+    job = dict(LISTING[0])
+    assert posting_fingerprint(job) == posting_fingerprint(dict(job))
+    assert posting_fingerprint(job) != posting_fingerprint({**job, "updated_at": "2026-04-01T00:00:00Z"})
+
+
+def test_unfiltered_scan_keeps_filtered_scan_details(board):
+    fetch_greenhouse_jobs("acme")
+    board["calls"].clear()
+    _scan()
+    fetch_greenhouse_jobs("acme")
+    assert len(board["calls"]) == 2
@@ -0,0 +1,42 @@
+"""Tests for scripts/benchmark_entry_cache.py"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from benchmark_entry_cache import build_fixture, run_benchmark
+
+
+def _sources(tmp_path: Path) -> list[Path]:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    paths = []
+    for name in ("a", "b"):
+        p = src_dir / f"{name}.yaml"
+        p.write_text(f"id: {name}\nstatus: research\n")
+        paths.append(p)
+    return paths
+
+
+def test_build_fixture_clones_unique_files(tmp_path):
+    target = tmp_path / "out"
+    build_fixture(target, 5, _sources(tmp_path))
+    assert len(list(target.glob("*.yaml"))) == 5
+
+
+def test_warm_pass_is_served_from_cache(tmp_path, monkeypatch):
+    import pipeline_entry_cache
+    import pipeline_repository
+
+    monkeypatch.setattr(pipeline_repository, "_REPOSITORY", None)
+    parses = []
+    real_load = pipeline_entry_cache.yaml.safe_load
+    monkeypatch.setattr(pipeline_entry_cache.yaml, "safe_load", lambda raw: parses.append(1) or real_load(raw))
+    result = run_benchmark(6, _sources(tmp_path))
+    assert result["entries"] == result["cached_records"] == 6
+    assert (result["cold_hits"], result["cold_misses"]) == (0, 6)
+    assert (result["warm_hits"], result["warm_misses"]) == (6, 0)
+    # uncached, parallel (serial below PARALLEL_MIN_FILES) and cold parse
+    # every file once; the warm pass parses none.
+    assert len(parses) == 3 * 6
@@ -0,0 +1,26 @@
+"""Tests for scripts/benchmark_http_client.py"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from benchmark_http_client import run_benchmark
+
+
+def _assert_one_pooled_connection(result: dict, count: int) -> None:
+    assert result["urlopen_connections"] == count
+    assert result["pooled_connections"] == 1
+    assert (result["connections_opened"], result["connections_reused"]) == (1, count - 1)
+
+
+def test_pooled_client_reuses_one_https_connection():
+    result = run_benchmark(5)
+    assert result["scheme"] == "https"
+    _assert_one_pooled_connection(result, 5)
+
+
+def test_pooled_client_reuses_one_plain_connection():
+    result = run_benchmark(3, tls=False)
+    assert result["scheme"] == "http"
+    _assert_one_pooled_connection(result, 3)
@@ -0,0 +1,31 @@
+"""Tests for scripts/benchmark_scoring_context.py"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from benchmark_scoring_context import build_entries, run_benchmark
+from score_context import ScoringContext
+
+SOURCES = [
+    {"id": "a", "track": "job", "status": "submitted", "target": {"organization": "Acme"}},
+    {"id": "b", "track": "grant", "status": "research", "target": {"organization": "Globex"}},
+]
+
+
+def test_build_entries_gives_unique_ids():
+    entries = build_entries(5, SOURCES)
+    assert len({e["id"] for e in entries}) == 5
+    assert SOURCES[0]["id"] == "a"
+
+
+def test_context_counts_match_full_scan():
+    result = run_benchmark(8, SOURCES, sample=8)
+    assert result["entries"] == 8 and result["sample"] == 8
+    assert result["identical"] is True
+
+
+def test_count_mismatch_is_reported(monkeypatch):
+    monkeypatch.setattr(ScoringContext, "org_count", lambda self, org, exclude_id=None: -1)
+    assert run_benchmark(8, SOURCES, sample=4)["identical"] is False
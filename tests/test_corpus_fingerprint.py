@@ -165,3 +165,34 @@ def test_get_fingerprint_rebuilds_when_stale(tmp_path, monkeypatch):
 
     assert second.built_at > stale_time, "Expected fingerprint to be rebuilt with a newer timestamp"
     assert second is not cf._cached_fingerprint or second.built_at != stale_time
+
+
+def _batch_fixture(tmp_path):
+    blocks_dir = tmp_path / "blocks"
+    blocks_dir.mkdir()
+    _write_block(blocks_dir, "tech.md", "Python TypeScript React pipeline infrastructure orchestration deployment")
+    _write_block(blocks_dir, "art.md", "Generative art installations, sound design and interactive systems")
+    descriptions = [
+        "Python engineer for pipeline infrastructure and deployment automation.",
+        "",
+        "   ",
+        "a an the",
+        "Pastry chef with sourdough fermentation experience.",
+        "Interactive sound installations and generative systems for museums, built in TypeScript.",
+    ]
+    return cf.build_corpus_fingerprint(blocks_dir=blocks_dir), descriptions
+
+
+def test_score_descriptions_matches_single_calls(tmp_path):
+    """Batch scores are identical to score_description, in input order."""
+    fp, descriptions = _batch_fixture(tmp_path)
+    assert fp.score_descriptions(descriptions) == [fp.score_description(d) for d in descriptions]
+    assert fp.score_descriptions([]) == []
+
+
+def test_score_descriptions_matches_when_two_doc_idf_applies(tmp_path, monkeypatch):
+    """If the DF filters let terms through, batch still matches the single path."""
+    fp, descriptions = _batch_fixture(tmp_path)
+    monkeypatch.setattr(cf._text_match, "MIN_DF", 1)
+    monkeypatch.setattr(cf._text_match, "MAX_DF_RATIO", 1.0)
+    assert fp.score_descriptions(descriptions) == [fp.score_description(d) for d in descriptions]
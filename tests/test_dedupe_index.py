@@ -0,0 +1,121 @@
+"""Tests for scripts/dedupe_index.py and the dedupe keys in pipeline_index."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pipeline_index
+from dedupe_index import BloomFilter, DedupeIndex, job_keys
+from pipeline_index import extract_dedupe_keys, normalize_url, title_key
+from source_jobs import deduplicate
+
+
+def _write(d: Path, entry_id: str, org: str, title: str, url: str) -> Path:
+    path = d / f"{entry_id}.yaml"
+    path.write_text(
+        f"id: {entry_id}\n"
+        f'name: "{org} {title}"\n'
+        "target:\n"
+        f'  organization: "{org}"\n'
+        f"  application_url: {url}\n"
+    )
+    return path
+
+
+def _job(company: str, title: str, url: str) -> dict:
+    return {"company_display": company, "title": title, "url": url}
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    active = tmp_path / "active"
+    closed = tmp_path / "closed"
+    active.mkdir()
+    closed.mkdir()
+    _write(active, "acme-platform-engineer", "Acme", "Platform Engineer",
+           "https://job-boards.greenhouse.io/acme/jobs/101?gh_src=feed")
+    for n in range(5):
+        _write(closed, f"old-{n}", "Globex", f"Data Engineer {n}", f"https://jobs.lever.co/globex/{n}")
+    monkeypatch.setattr(pipeline_index, "INDEX_PATH", tmp_path / "index.sqlite")
+    return {"active": active, "closed": closed, "dirs": [active, closed], "bloom": tmp_path / "bloom.pickle"}
+
+
+def test_normalize_url_drops_noise():
+    assert normalize_url("https://www.Example.com/jobs/1/?utm_source=x&b=2&a=1") == "url:example.com/jobs/1?a=1&b=2"
+    assert normalize_url("http://jobs.lever.co/acme/abc/apply") == normalize_url("https://jobs.lever.co/acme/abc")
+    assert normalize_url("https://job-boards.greenhouse.io/acme/jobs/1") == "url:boards.greenhouse.io/acme/jobs/1"
+    assert normalize_url("not a url") is None
+
+
+def test_title_and_entry_keys_agree():
+    entry = {
+        "id": "acme-sr-engineer",
+        "name": "Acme Sr. Engineer",
+        "target": {"organization": "Acme", "application_url": "https://acme.com/careers/7"},
+    }
+    keys = extract_dedupe_keys(entry)
+    assert keys == ["acme-sr-engineer", "url:acme.com/careers/7", "title:acme|sr engineer"]
+    assert title_key("ACME", "Sr Engineer") in keys
+    assert set(job_keys(_job("Acme", "Sr. Engineer", "https://acme.com/careers/7/"))) <= set(keys)
+
+
+def test_index_matches_ids_urls_and_titles(tree):
+    index = DedupeIndex(tree["dirs"], bloom_path=tree["bloom"])
+    assert "acme-platform-engineer" in index
+    assert "https://boards.greenhouse.io/acme/jobs/101" in index
+    assert "url:jobs.lever.co/globex/3" in index
+    assert title_key("Globex", "Data Engineer 2") in index
+    assert "https://boards.greenhouse.io/acme/jobs/102" not in index
+
+
+def test_index_follows_writes_and_moves(tree):
+    _write(tree["active"], "initech-sre", "Initech", "SRE", "https://initech.com/jobs/9")
+    assert "initech-sre" in DedupeIndex(tree["dirs"], bloom_path=tree["bloom"])
+
+    moved = tree["closed"] / "initech-sre.yaml"
+    (tree["active"] / "initech-sre.yaml").rename(moved)
+    index = DedupeIndex([tree["active"]], bloom_path=tree["bloom"])
+    assert "initech-sre" not in index
+    assert "initech-sre" in DedupeIndex(tree["dirs"], bloom_path=tree["bloom"])
+
+
+def test_closed_set_behind_bloom_filter_stays_exact(tree):
+    index = DedupeIndex(tree["dirs"], bloom_path=tree["bloom"], bloom_min_keys=5)
+    assert [d.name for d, _ in index._blooms] == ["closed"]
+    assert "old-4" in index
+    assert "old-5" not in index
+    assert "acme-platform-engineer" in index
+    assert tree["bloom"].exists()
+
+    # A reopened index reuses the stored filter until closed/ changes.
+    stored = tree["bloom"].stat().st_mtime_ns
+    DedupeIndex(tree["dirs"], bloom_path=tree["bloom"], bloom_min_keys=5)
+    assert tree["bloom"].stat().st_mtime_ns == stored
+    _write(tree["closed"], "old-9", "Globex", "Analyst", "https://jobs.lever.co/globex/9")
+    assert "old-9" in DedupeIndex(tree["dirs"], bloom_path=tree["bloom"], bloom_min_keys=5)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000)
+    keys = [f"key-{n}" for n in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    assert sum(f"other-{n}" in bloom for n in range(1000)) < 50
+
+
+def test_deduplicate_against_index(tree):
+    index = DedupeIndex(tree["dirs"], bloom_path=tree["bloom"], bloom_min_keys=5)
+    jobs = [
+        _job("Acme", "Platform Engineer", "https://example.com/elsewhere"),
+        _job("Acme", "Staff Engineer", "https://boards.greenhouse.io/acme/jobs/101/"),
+        _job("Globex", "Data Engineer 1", "https://careers.globex.com/1"),
+        _job("Globex", "Backend Engineer", "https://jobs.lever.co/globex/new"),
+        _job("Globex", "Backend Engineer", "https://jobs.lever.co/globex/new"),
+    ]
+    assert [job["title"] for job in deduplicate(jobs, index)] == ["Backend Engineer"]
@@ -0,0 +1,153 @@
+"""Tests for scripts/description_store.py."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import description_store
+import pipeline_entry_cache
+from description_store import (
+    blob_path,
+    description_ref,
+    externalize_description,
+    load_description,
+    migrate_entries,
+    migrate_text,
+    resolve_description,
+    store_description,
+)
+from pipeline_lib import load_entries, load_entry_by_id
+
+DESCRIPTION = "<p>We build reliable platforms.</p>\n<p>" + "Boilerplate about benefits. " * 40 + "</p>"
+
+ENTRY_TEXT = f"""\
+# auto-sourced
+id: acme-engineer
+name: Acme Engineer
+status: research
+target:
+  organization: Acme
+  description: {yaml.safe_dump(DESCRIPTION, width=80).strip().replace(chr(10), chr(10) + '    ')}
+  url: https://example.com/jobs/1
+fit:
+  score: 6.5
+"""
+
+
+@pytest.fixture
+def blob_dir(tmp_path, monkeypatch):
+    d = tmp_path / "blobs"
+    monkeypatch.setattr(description_store, "BLOB_DIR", d)
+    return d
+
+
+@pytest.fixture
+def entries_dir(tmp_path, monkeypatch):
+    d = tmp_path / "research_pool"
+    d.mkdir()
+    (d / "acme-engineer.yaml").write_text(ENTRY_TEXT)
+    (d / "plain.yaml").write_text("id: plain\nstatus: research\ntarget:\n  organization: Plain\n")
+    monkeypatch.setattr(pipeline_entry_cache, "ENTRY_CACHE_PATH", tmp_path / "cache" / "entries.pickle")
+    return d
+
+
+def test_entry_fixture_parses():
+    assert yaml.safe_load(ENTRY_TEXT)["target"]["description"] == DESCRIPTION
+
+
+def test_store_is_content_addressed_and_deduplicated(blob_dir):
+    ref, written = store_description(DESCRIPTION)
+    assert ref == description_ref(DESCRIPTION)
+    assert 0 < written < len(DESCRIPTION)
+    assert store_description(DESCRIPTION) == (ref, 0)
+    assert load_description(ref) == DESCRIPTION
+    assert len(list(blob_dir.glob("*/*.gz"))) == 1
+
+
+def test_blob_bytes_are_deterministic(blob_dir, tmp_path):
+    ref, _ = store_description(DESCRIPTION)
+    store_description(DESCRIPTION, tmp_path / "other")
+    assert blob_path(ref).read_bytes() == blob_path(ref, tmp_path / "other").read_bytes()
+
+
+def test_invalid_ref_rejected(blob_dir):
+    with pytest.raises(ValueError):
+        blob_path("sha256:../../etc/passwd")
+
+
+def test_tampered_blob_rejected(blob_dir):
+    import gzip
+
+    ref, _ = store_description(DESCRIPTION)
+    blob_path(ref).write_bytes(gzip.compress(b"something else"))
+    with pytest.raises(ValueError):
+        load_description(ref)
+    assert resolve_description({"target": {"description_ref": ref}}) == ""
+
+
+def test_resolve_description_inline_and_ref(blob_dir):
+    assert resolve_description({"target": {"description": "inline"}}) == "inline"
+    ref, _ = store_description(DESCRIPTION)
+    assert resolve_description({"target": {"description_ref": ref}}) == DESCRIPTION
+    assert resolve_description({"target": None}) == ""
+    assert resolve_description({"target": {"description_ref": "sha256:" + "0" * 64}}) == ""
+
+
+def test_externalize_keeps_key_position(blob_dir):
+    entry = {"id": "x", "target": {"organization": "A", "description": DESCRIPTION, "url": "u"}}
+    assert externalize_description(entry) > 0
+    assert list(entry["target"]) == ["organization", "description_ref", "url"]
+    assert entry["target"]["description_ref"] == description_ref(DESCRIPTION)
+
+
+def test_migrate_text_preserves_rest_of_file(blob_dir):
+    new_text, written = migrate_text(ENTRY_TEXT)
+    assert written > 0
+    assert new_text.startswith("# auto-sourced\n")
+    assert f"  description_ref: {description_ref(DESCRIPTION)}\n  url:" in new_text
+    assert migrate_text(new_text) is None
+
+
+def test_migrate_entries_reports_savings(blob_dir, entries_dir):
+    preview = migrate_entries([entries_dir], dry_run=True)
+    assert preview["migrated"] == 1 and preview["scanned"] == 2
+    assert not blob_dir.exists()
+    assert "description:" in (entries_dir / "acme-engineer.yaml").read_text()
+
+    stats = migrate_entries([entries_dir])
+    assert stats == preview
+    assert stats["saved_bytes"] == stats["inline_bytes"] - stats["blob_bytes"] > 0
+    assert "description:" not in (entries_dir / "acme-engineer.yaml").read_text()
+
+
+@pytest.mark.parametrize("header_only", [False, True])
+def test_loaders_resolve_migrated_description(blob_dir, entries_dir, header_only):
+    before = load_entries(dirs=[entries_dir])
+    migrate_entries([entries_dir])
+    after = load_entries(dirs=[entries_dir], header_only=header_only)
+    assert after[0]["target"]["description"] == DESCRIPTION
+    assert after[0]["target"]["organization"] == before[0]["target"]["organization"]
+
+
+def test_dumped_entry_keeps_reference_only(blob_dir, entries_dir):
+    migrate_entries([entries_dir])
+    entry = load_entries(dirs=[entries_dir])[0]
+    assert entry["target"]["description"] == DESCRIPTION
+    dumped = yaml.safe_load(yaml.safe_dump(entry))
+    assert "description" not in dumped["target"]
+    assert dumped["target"]["description_ref"] == description_ref(DESCRIPTION)
+
+
+def test_load_entry_by_id_resolves(blob_dir, entries_dir, monkeypatch):
+    import pipeline_lib
+
+    migrate_entries([entries_dir])
+    monkeypatch.setattr(pipeline_lib, "ALL_PIPELINE_DIRS_WITH_POOL", [entries_dir])
+    _, entry = load_entry_by_id("acme-engineer")
+    assert entry["target"]["description"] == DESCRIPTION
@@ -0,0 +1,236 @@
+"""Tests for scripts/http_cache.py against a local stand-in HTTP server."""
+
+from __future__ import annotations
+
+import gzip
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import http_cache
+import source_jobs
+from http_cache import HTTPCache
+from pipeline_entry_cache import _read_pickle
+
+BOARD = b'{"jobs": [' + b'{"id": 1, "title": "Engineer"}, ' * 50 + b'{"id": 2}]}'
+LAST_MODIFIED = "Wed, 01 Oct 2025 12:00:00 GMT"
+
+
+class _Board(BaseHTTPRequestHandler):
+    """/etag answers If-None-Match, /dated If-Modified-Since, /missing 404s."""
+
+    server: _StandIn
+
+    def do_GET(self):
+        self.server.seen.append((self.path, dict(self.headers)))
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        etag = f'"v{self.server.version}"'
+        if self.path == "/etag" and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        if self.path == "/dated" and self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = BOARD if self.server.version == 1 else b'{"jobs": []}'
+        self.send_response(200)
+        if self.path == "/etag":
+            self.send_header("ETag", etag)
+        elif self.path == "/dated":
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StandIn(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Board)
+        self.seen: list[tuple[str, dict]] = []
+        self.version = 1
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+@pytest.fixture
+def server():
+    srv = _StandIn()
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPCache(tmp_path / "http", default_ttl=0, host_ttls={})
+
+
+def test_etag_revalidation_serves_304_from_cache(server, cache):
+    url = server.url("/etag")
+    assert cache.get(url) == BOARD
+    assert cache.get(url) == BOARD
+    assert [headers.get("If-None-Match") for _, headers in server.seen] == [None, '"v1"']
+
+    server.version = 2
+    assert cache.get(url) == b'{"jobs": []}'
+    assert cache.summary()["127.0.0.1"] == {
+        "fresh": 0, "revalidated": 1, "fetched": 2, "requests": 3, "hit_rate": 0.333,
+    }
+
+
+def test_last_modified_revalidation(server, cache):
+    url = server.url("/dated")
+    cache.get(url)
+    assert cache.get(url) == BOARD
+    assert server.seen[-1][1].get("If-Modified-Since") == LAST_MODIFIED
+    assert cache.stats["127.0.0.1"]["revalidated"] == 1
+
+
+def test_within_ttl_no_request_is_made(server, cache):
+    url = server.url("/etag")
+    cache.get(url, ttl=3600)
+    assert cache.get(url, ttl=3600) == BOARD
+    assert len(server.seen) == 1
+    assert cache.stats["127.0.0.1"]["fresh"] == 1
+
+
+def test_host_ttl_overrides_default(server, tmp_path):
+    cache = HTTPCache(tmp_path / "http", default_ttl=0, host_ttls={"127.0.0.1": 3600})
+    url = server.url("/etag")
+    cache.get(url)
+    cache.get(url)
+    assert len(server.seen) == 1
+
+
+def test_bodies_are_stored_compressed(server, cache):
+    url = server.url("/etag")
+    cache.get(url)
+    record = _read_pickle(cache.path_for(url))
+    assert record["etag"] == '"v1"'
+    assert gzip.decompress(record["body"]) == BOARD
+    assert len(record["body"]) < len(BOARD)
+
+
+def test_errors_raise_and_are_not_cached(server, cache):
+    url = server.url("/missing")
+    with pytest.raises(HTTPError) as exc:
+        cache.get(url)
+    assert exc.value.code == 404
+    assert not cache.path_for(url).exists()
+    assert cache.summary() == {}
+
+
+def test_unreadable_record_is_refetched(server, cache):
+    url = server.url("/etag")
+    cache.get(url)
+    cache.path_for(url).write_bytes(b"not a pickle")
+    assert cache.get(url, ttl=3600) == BOARD
+    assert "If-None-Match" not in server.seen[-1][1]
+
+
+def test_report_and_clear(server, cache):
+    url = server.url("/etag")
+    cache.get(url)
+    cache.get(url)
+    assert "127.0.0.1" in cache.report()
+    assert "50%" in cache.report()
+    assert cache.clear("example.com") == 0
+    assert cache.clear("127.0.0.1") == 1
+    assert cache.records() == []
+
+
+def test_source_jobs_fetches_share_the_cache(server, cache, monkeypatch):
+    monkeypatch.setattr(http_cache, "_DEFAULT", cache)
+    url = server.url("/etag")
+    assert source_jobs._http_get(url) == BOARD
+    assert source_jobs._http_get(url) == BOARD
+    assert server.seen[0][1].get("User-Agent") == "application-pipeline/1.0"
+    assert server.seen[1][1].get("If-None-Match") == '"v1"'
+    assert "127.0.0.1" in http_cache.report()
+
+
+def test_disabled_cache_is_a_plain_get(server, cache, monkeypatch):
+    monkeypatch.setattr(http_cache, "_DEFAULT", cache)
+    monkeypatch.setenv("PIPELINE_HTTP_CACHE", "0")
+    url = server.url("/etag")
+    http_cache.cached_get(url)
+    http_cache.cached_get(url)
+    assert all("If-None-Match" not in headers for _, headers in server.seen)
+    assert cache.records() == []
+
+
+def test_liveness_fetches_always_revalidate(server, tmp_path, monkeypatch):
+    cache = HTTPCache(tmp_path / "http", default_ttl=3600, host_ttls={})
+    monkeypatch.setattr(http_cache, "_DEFAULT", cache)
+    url = server.url("/etag")
+    source_jobs._http_get(url)
+    source_jobs._http_get(url)
+    assert len(server.seen) == 1
+    assert source_jobs._http_get(url, ttl=0) == BOARD
+    assert len(server.seen) == 2
+    assert server.seen[1][1].get("If-None-Match") == '"v1"'
+
+
+def test_freshness_check_bypasses_ttl(monkeypatch):
+    import freshness_monitor
+
+    calls = []
+    monkeypatch.setattr(freshness_monitor, "cached_get", lambda url, **kw: calls.append(kw) or b"{}")
+    result = freshness_monitor._check_greenhouse_posting(
+        "acme-eng", "https://boards.greenhouse.io/acme/jobs/123", "greenhouse",
+    )
+    assert result["status"] == "active"
+    assert calls[0]["ttl"] == 0
+
+
+def _age(path: Path, seconds: float) -> None:
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_prune_removes_records_not_refreshed(server, cache):
+    old, recent = server.url("/etag"), server.url("/dated")
+    cache.get(old)
+    cache.get(recent)
+    _age(cache.path_for(old), 8 * 86400)
+    assert cache.prune() == 1
+    assert [r["url"] for r in cache.records()] == [recent]
+    assert cache.prune(max_age=0) == 1
+
+
+def test_revalidation_keeps_record_young(server, cache):
+    url = server.url("/etag")
+    cache.get(url)
+    _age(cache.path_for(url), 8 * 86400)
+    cache.get(url)  # 304 rewrites the record
+    assert cache.prune() == 0
+
+
+def test_prune_if_due_runs_once_per_interval(server, cache):
+    url = server.url("/etag")
+    cache.get(url)
+    _age(cache.path_for(url), 8 * 86400)
+    assert cache.prune_if_due() == 1
+    cache.get(url)
+    _age(cache.path_for(url), 8 * 86400)
+    assert cache.prune_if_due() == 0
+    _age(cache.directory / http_cache.PRUNE_MARKER, http_cache.PRUNE_INTERVAL + 60)
+    assert cache.prune_if_due() == 1
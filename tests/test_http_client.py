@@ -0,0 +1,220 @@
+"""Tests for scripts/http_client.py against a local stand-in HTTP server."""
+
+from __future__ import annotations
+
+import gzip
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import http_client
+from http_client import HTTPClient, backoff_delay
+
+BODY = b'{"jobs": [' + b'{"id": 1}, ' * 100 + b'{"id": 2}]}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StandIn
+
+    def _reply(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.seen.append((self.path, self.client_address[1], dict(self.headers)))
+        if self.path == "/gzip":
+            self._reply(200, gzip.compress(BODY), {"Content-Encoding": "gzip"})
+        elif self.path == "/missing":
+            self._reply(404, b"gone")
+        elif self.path == "/moved":
+            self._reply(302, headers={"Location": "/board"})
+        elif self.path == "/flaky":
+            self.server.failures -= 1
+            if self.server.failures >= 0:
+                self._reply(503, headers={"Retry-After": "0"})
+            else:
+                self._reply(200, BODY)
+        elif self.path == "/drop":
+            # Read the request, then close without answering.
+            self.close_connection = True
+        elif self.path == "/hangup":
+            # Advertise keep-alive, then drop the connection anyway.
+            self._reply(200, BODY)
+            self.close_connection = True
+        else:
+            self._reply(200, BODY)
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.seen.append((self.path, self.client_address[1], dict(self.headers)))
+        body = self.rfile.read(length)
+        if self.path == "/drop":
+            self.close_connection = True
+            return
+        self._reply(200, body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StandIn(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.seen: list[tuple[str, int, dict]] = []
+        self.failures = 0
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+@pytest.fixture
+def server():
+    srv = _StandIn()
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+PROXY_VARS = ("http_proxy", "https_proxy", "no_proxy", "all_proxy")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    for name in PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+    monkeypatch.setattr(http_client.time, "sleep", lambda seconds: None)
+    client = HTTPClient()
+    yield client
+    client.close()
+
+
+def test_connections_are_kept_alive(server, client):
+    for _ in range(5):
+        assert client.request(server.url("/board")).read() == BODY
+    assert (client.opened, client.reused) == (1, 4)
+    assert len({port for _, port, _ in server.seen}) == 1
+
+
+def test_gzip_is_requested_and_decoded(server, client):
+    resp = client.request(server.url("/gzip"))
+    assert resp.read() == BODY
+    assert server.seen[0][2]["Accept-Encoding"] == "gzip"
+
+
+def test_errors_match_urlopen(server, client):
+    with pytest.raises(HTTPError) as exc:
+        client.request(server.url("/missing"))
+    assert exc.value.code == 404
+    assert exc.value.read() == b"gone"
+    with pytest.raises(URLError):
+        client.request("ftp://example.com/file")
+
+
+def test_redirects_are_followed(server, client):
+    resp = client.request(server.url("/moved"))
+    assert resp.status == 200
+    assert resp.url.endswith("/board")
+
+
+def test_transient_failures_are_retried(server, client):
+    server.failures = 2
+    assert client.request(server.url("/flaky"), retries=2).read() == BODY
+    server.failures = 2
+    with pytest.raises(HTTPError):
+        client.request(server.url("/flaky"), retries=1)
+
+
+def test_client_errors_are_not_retried(server, client):
+    with pytest.raises(HTTPError):
+        client.request(server.url("/missing"), retries=3)
+    assert len(server.seen) == 1
+
+
+def test_stale_pooled_connection_is_replaced(server, client):
+    client.request(server.url("/hangup"))
+    assert client.request(server.url("/board")).read() == BODY
+    assert client.opened == 2
+
+
+def test_post_is_not_resent_after_lost_response(server, client):
+    client.request(server.url("/board"))
+    with pytest.raises(URLError):
+        client.request(server.url("/drop"), method="POST", data=b"{}")
+    assert [path for path, _, _ in server.seen].count("/drop") == 1
+
+
+def test_get_is_resent_once_on_reused_connection(server, client):
+    client.request(server.url("/board"))
+    with pytest.raises(URLError):
+        client.request(server.url("/drop"))
+    # Retried once on a fresh connection; a fresh connection is not retried.
+    assert [path for path, _, _ in server.seen].count("/drop") == 2
+
+
+def test_http_proxy_from_environment(server, client, monkeypatch):
+    monkeypatch.setenv("http_proxy", f"http://user:pw@127.0.0.1:{server.server_address[1]}")
+    assert client.request("http://jobs.example.invalid/board").read() == BODY
+    path, _, headers = server.seen[-1]
+    assert path == "http://jobs.example.invalid/board"
+    assert headers["Proxy-Authorization"] == "Basic dXNlcjpwdw=="
+
+
+def test_no_proxy_bypasses_proxy(server, client, monkeypatch):
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    assert client.request(server.url("/board")).read() == BODY
+    assert server.seen[-1][0] == "/board"
+
+
+def test_https_goes_through_connect_tunnel(client, monkeypatch):
+    monkeypatch.setenv("https_proxy", "http://proxy.internal:3128")
+    key = ("https", "boards.example.com", 443, http_client.proxy_for("https", "boards.example.com"))
+    conn, _ = client._checkout(key, 5)
+    assert (conn.host, conn.port) == ("proxy.internal", 3128)
+    assert (conn._tunnel_host, conn._tunnel_port) == ("boards.example.com", 443)
+
+
+def test_head_and_post(server, client):
+    with client.request(server.url("/board"), method="HEAD") as resp:
+        assert resp.getcode() == 200
+        assert resp.read() == b""
+    sent = b'{"ok": true}'
+    resp = client.request(server.url("/hook"), method="POST", data=sent, headers={"Content-Type": "application/json"})
+    assert resp.read() == sent
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    delays = [backoff_delay(3, base=1.0, cap=30.0) for _ in range(50)]
+    assert all(4.0 <= d <= 8.0 for d in delays)
+    assert len(set(delays)) > 1
+    assert backoff_delay(10, base=1.0, cap=5.0) <= 5.0
+
+
+def test_pipeline_market_uses_shared_client(server, monkeypatch):
+    from pipeline_market import http_request_with_retry
+
+    monkeypatch.setattr(http_client, "_DEFAULT", HTTPClient())
+    assert http_request_with_retry(server.url("/board")) == BODY
+    assert http_request_with_retry(server.url("/board")) == BODY
+    assert http_client.default_client().reused == 1
+    assert http_request_with_retry(server.url("/missing"), max_retries=3) is None
+    assert [path for path, _, _ in server.seen].count("/missing") == 1
@@ -20,6 +20,9 @@
     get_org_members,
     ingest_from_contacts_and_outreach,
     load_network,
+    load_proximity_table,
+    lookup_org_proximity,
+    org_proximity_table,
     path_strength,
     save_network,
     score_org_proximity,
@@ -546,3 +549,59 @@ def test_strength_modifier_weak_path(self):
         result = score_org_proximity(network, "Me", "TargetCo")
         # Base 8 (1-hop) - 1 (weak) = 7
         assert result["score"] <= 8
+
+
+# --- Proximity table ---
+
+
+def _random_network(seed: int) -> dict:
+    import random
+
+    rng = random.Random(seed)
+    names = ["Me"] + [f"P{i}" for i in range(14)]
+    orgs = ["Acme", "acme", "Globex", "Initech", ""]
+    nodes = [{"name": n, "organization": rng.choice(orgs)} for n in names]
+    nodes.append({"name": "p3", "organization": "Globex"})  # same person, second org
+    edges = [
+        {"from": a, "to": b, "strength": rng.randint(1, 10)}
+        for a in names for b in names if a < b and rng.random() < 0.25
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+class TestProximityTable:
+    @pytest.mark.parametrize("seed", range(8))
+    def test_matches_per_org_scoring(self, seed):
+        network = _random_network(seed)
+        table = org_proximity_table(network, "Me")
+        for org in ("Acme", "ACME", "Globex", "Initech", "", "Nowhere"):
+            assert lookup_org_proximity(table, org) == score_org_proximity(network, "Me", org)
+
+    def test_simple_network(self, simple_network):
+        table = org_proximity_table(simple_network, "A")
+        assert lookup_org_proximity(table, "OrgY") == score_org_proximity(simple_network, "A", "OrgY")
+        assert lookup_org_proximity(table, "NoSuchOrg")["score"] == COLD_SCORE
+
+    def test_loads_graph_once_per_version(self, simple_network, tmp_path, monkeypatch):
+        import network_graph
+        monkeypatch.setattr(network_graph, "NETWORK_FILE", tmp_path / "network.yaml")
+        monkeypatch.setattr(network_graph, "PROXIMITY_CACHE_PATH", tmp_path / "cache" / "proximity.json")
+        network_graph._PROXIMITY_MEMO.clear()
+        save_network(simple_network)
+        loads = []
+        real_load = network_graph.load_network
+        monkeypatch.setattr(network_graph, "load_network", lambda: loads.append(1) or real_load())
+
+        for _ in range(50):
+            assert lookup_org_proximity(load_proximity_table("A"), "OrgX")["hop_count"] == 1
+        assert len(loads) == 1
+
+        network_graph._PROXIMITY_MEMO.clear()  # new process: served from disk
+        assert load_proximity_table("A") == org_proximity_table(simple_network, "A")
+        assert len(loads) == 1
+
+        add_edge(simple_network, "A", "C", strength=9)
+        save_network(simple_network)
+        assert lookup_org_proximity(load_proximity_table("A"), "OrgY")["independent_paths"] == 3
+        assert len(loads) == 2
+        network_graph._PROXIMITY_MEMO.clear()
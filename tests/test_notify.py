@@ -46,14 +46,14 @@ def test_successful_webhook(self):
         mock_resp.status = 200
         mock_resp.__enter__ = lambda s: s
         mock_resp.__exit__ = MagicMock(return_value=False)
-        with patch("notify.urllib.request.urlopen", return_value=mock_resp):
+        with patch("notify.http_client.request", return_value=mock_resp):
             ok, msg = dispatch_webhook({"test": True}, "https://example.com/hook")
         assert ok is True
         assert "200" in msg
 
     def test_failed_webhook(self):
         import urllib.error
-        with patch("notify.urllib.request.urlopen", side_effect=urllib.error.URLError("Connection refused")):
+        with patch("notify.http_client.request", side_effect=urllib.error.URLError("Connection refused")):
             ok, msg = dispatch_webhook({"test": True}, "https://example.com/hook")
         assert ok is False
         assert "failed" in msg.lower()
@@ -93,7 +93,7 @@ def test_webhook_channel_dispatched(self, tmp_path, monkeypatch):
         mock_resp.status = 200
         mock_resp.__enter__ = lambda s: s
         mock_resp.__exit__ = MagicMock(return_value=False)
-        with patch("notify.urllib.request.urlopen", return_value=mock_resp):
+        with patch("notify.http_client.request", return_value=mock_resp):
             results = dispatch_event("weekly_brief", {"summary": "test brief"})
         assert len(results) == 1
         assert results[0]["channel"] == "webhook"
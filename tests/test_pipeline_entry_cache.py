@@ -0,0 +1,186 @@
+"""Tests for scripts/pipeline_entry_cache.py and its use in load_entries."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pipeline_entry_cache
+from pipeline_entry_cache import EntryCache, clear_entry_cache
+from pipeline_lib import load_entries
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "entries.pickle"
+    monkeypatch.setattr(pipeline_entry_cache, "ENTRY_CACHE_PATH", path)
+    monkeypatch.delenv("PIPELINE_ENTRY_CACHE", raising=False)
+    return path
+
+
+@pytest.fixture
+def entries_dir(tmp_path):
+    d = tmp_path / "active"
+    d.mkdir()
+    (d / "alpha.yaml").write_text("id: alpha\nstatus: qualified\nfit:\n  score: 7.5\n")
+    (d / "beta.yaml").write_text("id: beta\nstatus: staged\n")
+    return d
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate a file so its mtime is outside the racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_cold_load_writes_cache(cache_path, entries_dir):
+    entries = load_entries(dirs=[entries_dir])
+    assert [e["id"] for e in entries] == ["alpha", "beta"]
+    assert cache_path.exists()
+    assert len(EntryCache(cache_path)) == 2
+
+
+def test_warm_load_matches_uncached(cache_path, entries_dir):
+    for f in entries_dir.glob("*.yaml"):
+        _age(f)
+    load_entries(dirs=[entries_dir])
+    warm = load_entries(dirs=[entries_dir], include_filepath=True)
+    cold = load_entries(dirs=[entries_dir], include_filepath=True, use_cache=False)
+    assert warm == cold
+
+
+def test_warm_load_served_from_cache(cache_path, entries_dir):
+    for f in entries_dir.glob("*.yaml"):
+        _age(f)
+    load_entries(dirs=[entries_dir])
+    cache = EntryCache(cache_path)
+    # Second pass should hit on stat alone for aged files.
+    for f in sorted(entries_dir.glob("*.yaml")):
+        data, raw = cache.lookup(f)
+        assert data is not None and raw is None
+    assert cache.hits == 2 and cache.misses == 0
+
+
+def test_changed_file_is_reparsed(cache_path, entries_dir):
+    load_entries(dirs=[entries_dir])
+    (entries_dir / "alpha.yaml").write_text("id: alpha\nstatus: drafting\nfit:\n  score: 9.0\n")
+    entries = {e["id"]: e for e in load_entries(dirs=[entries_dir])}
+    assert entries["alpha"]["status"] == "drafting"
+
+
+def test_same_size_rewrite_with_same_mtime_is_detected(cache_path, entries_dir):
+    path = entries_dir / "beta.yaml"
+    load_entries(dirs=[entries_dir])
+    st = path.stat()
+    path.write_text("id: gamma\nstatus: staged\n")  # identical byte length
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    entries = {e["_file"]: e for e in load_entries(dirs=[entries_dir])}
+    assert entries["beta.yaml"]["id"] == "gamma"
+
+
+def test_returned_entries_are_independent(cache_path, entries_dir):
+    load_entries(dirs=[entries_dir])
+    first = load_entries(dirs=[entries_dir])
+    first[0]["fit"]["score"] = 0
+    second = load_entries(dirs=[entries_dir])
+    assert second[0]["fit"]["score"] == 7.5
+
+
+def test_deleted_file_is_pruned(cache_path, entries_dir):
+    load_entries(dirs=[entries_dir])
+    (entries_dir / "beta.yaml").unlink()
+    assert [e["id"] for e in load_entries(dirs=[entries_dir])] == ["alpha"]
+    assert len(EntryCache(cache_path)) == 1
+
+
+def test_partial_save_does_not_prune(cache_path, entries_dir):
+    load_entries(dirs=[entries_dir])
+    cache = EntryCache(cache_path)
+    cache.lookup(entries_dir / "alpha.yaml")
+    (entries_dir / "alpha.yaml").write_text("id: alpha\nstatus: drafting\n")
+    data, raw = cache.lookup(entries_dir / "alpha.yaml")
+    cache.store(entries_dir / "alpha.yaml", raw, {"id": "alpha", "status": "drafting"})
+    cache.save(prune=False)
+    assert len(EntryCache(cache_path)) == 2
+
+
+def test_corrupt_cache_falls_back(cache_path, entries_dir):
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_bytes(b"not a pickle")
+    entries = load_entries(dirs=[entries_dir])
+    assert len(entries) == 2
+    assert len(EntryCache(cache_path)) == 2
+
+
+def test_env_disables_cache(cache_path, entries_dir, monkeypatch):
+    monkeypatch.setenv("PIPELINE_ENTRY_CACHE", "0")
+    assert len(load_entries(dirs=[entries_dir])) == 2
+    assert not cache_path.exists()
+
+
+def test_invalid_yaml_not_cached(cache_path, entries_dir, capsys):
+    (entries_dir / "broken.yaml").write_text("id: [unterminated\n")
+    entries = load_entries(dirs=[entries_dir])
+    assert len(entries) == 2
+    assert "Skipping unparseable entry" in capsys.readouterr().err
+    assert len(EntryCache(cache_path)) == 2
+
+
+def test_clear_entry_cache(cache_path, entries_dir):
+    load_entries(dirs=[entries_dir])
+    assert clear_entry_cache() is True
+    assert clear_entry_cache() is False
+
+
+@pytest.fixture
+def parallel_threshold(monkeypatch):
+    monkeypatch.setattr(pipeline_entry_cache, "PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(pipeline_entry_cache, "PARALLEL_CHUNK_SIZE", 1)
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_parallel_load_matches_serial(cache_path, entries_dir, parallel_threshold, use_cache):
+    serial = load_entries(dirs=[entries_dir], use_cache=False)
+    assert load_entries(dirs=[entries_dir], use_cache=use_cache, parallel=True) == serial
+    if use_cache:
+        assert len(EntryCache(cache_path)) == 2
+
+
+def test_parallel_process_pool_matches_serial(entries_dir, parallel_threshold):
+    files = sorted(entries_dir.glob("*.yaml"))
+    serial = pipeline_entry_cache.parse_entry_files(files)
+    assert pipeline_entry_cache.parse_entry_files(files, parallel=True, workers=2) == serial
+
+
+def test_parallel_header_only_and_fields(cache_path, entries_dir, parallel_threshold):
+    (entries_dir / "gamma.yaml").write_text("id: gamma\ntarget:\n  organization: G\n  description: long text\n")
+    serial = load_entries(dirs=[entries_dir], use_cache=False, fields=["target"])
+    parallel = load_entries(dirs=[entries_dir], parallel=True, fields=["target"])
+    assert parallel == serial
+    assert parallel[2]["target"]["description"] == "long text"
+    assert "status" not in parallel[0]
+
+
+def test_parallel_skips_invalid_yaml(cache_path, entries_dir, parallel_threshold, capsys):
+    (entries_dir / "broken.yaml").write_text("id: [unclosed\n")
+    entries = load_entries(dirs=[entries_dir], parallel=True)
+    assert [e["id"] for e in entries] == ["alpha", "beta"]
+    assert "Skipping unparseable entry" in capsys.readouterr().err
+    assert len(EntryCache(cache_path)) == 2
+
+
+def test_parallel_below_threshold_stays_serial(entries_dir, monkeypatch):
+    monkeypatch.setattr(pipeline_entry_cache, "_parse_raws", lambda *a, **k: pytest.fail("parallel path used"))
+    assert len(load_entries(dirs=[entries_dir], use_cache=False, parallel=True)) == 2
+
+
+def test_parallel_env_opt_in(monkeypatch):
+    monkeypatch.delenv("PIPELINE_PARALLEL_LOAD", raising=False)
+    assert not pipeline_entry_cache.parallel_enabled()
+    monkeypatch.setenv("PIPELINE_PARALLEL_LOAD", "1")
+    assert pipeline_entry_cache.parallel_enabled()
@@ -0,0 +1,173 @@
+"""Tests for scripts/pipeline_entry_fields.py and header-only load_entries."""
+
+from __future__ import annotations
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pipeline_entry_cache
+from pipeline_entry_fields import (
+    LazyDict,
+    attach_lazy,
+    project_entry_text,
+    select_fields,
+    split_heavy,
+)
+from pipeline_lib import load_entries
+
+ENTRY_TEXT = """\
+# leading comment
+id: acme-engineer
+name: Acme Engineer
+status: research
+target:
+  organization: Acme
+  description: "<p>Long posting body that\\
+    \\ spans several lines</p>"
+  url: https://example.com/jobs/1
+fit:
+  score: 6.5
+tags:
+  - platform
+"""
+
+
+@pytest.fixture
+def entries_dir(tmp_path):
+    d = tmp_path / "research_pool"
+    d.mkdir()
+    (d / "acme-engineer.yaml").write_text(ENTRY_TEXT)
+    (d / "plain.yaml").write_text("id: plain\nstatus: research\ntarget:\n  organization: Plain\n")
+    return d
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "entries.pickle"
+    monkeypatch.setattr(pipeline_entry_cache, "ENTRY_CACHE_PATH", path)
+    monkeypatch.delenv("PIPELINE_ENTRY_CACHE", raising=False)
+    return path
+
+
+# --- LazyDict ---
+
+
+def test_lazy_dict_loads_on_first_access():
+    calls = []
+    d = LazyDict({"a": 1}, {"b": lambda: calls.append("b") or "heavy"})
+    assert d.pending == {"b"}
+    assert d["a"] == 1 and not calls
+    assert d.get("b") == "heavy"
+    assert d["b"] == "heavy"
+    assert calls == ["b"]
+
+
+def test_lazy_dict_behaves_like_full_dict():
+    d = LazyDict({"a": 1}, {"b": lambda: 2})
+    assert d == {"a": 1, "b": 2}
+    assert len(d) == 2
+    assert dict(d) == {"a": 1, "b": 2}
+    assert json.loads(json.dumps(d)) == {"a": 1, "b": 2}
+    assert yaml.safe_load(yaml.safe_dump(d)) == {"a": 1, "b": 2}
+    assert pickle.loads(pickle.dumps(d)) == {"a": 1, "b": 2}
+
+
+def test_lazy_dict_setitem_discards_loader():
+    d = LazyDict({}, {"b": lambda: pytest.fail("loader should not run")})
+    d["b"] = "override"
+    assert d["b"] == "override"
+
+
+def test_attach_lazy_missing_value_is_absent():
+    data = {"target": {"organization": "X"}}
+
+    def loader(path):
+        raise KeyError(path)
+
+    attach_lazy(data, [("target", "description")], loader)
+    assert "description" not in data["target"]
+    assert data["target"].get("description", "") == ""
+
+
+# --- projection helpers ---
+
+
+def test_split_heavy_does_not_mutate():
+    data = yaml.safe_load(ENTRY_TEXT)
+    light, heavy = split_heavy(data)
+    assert "description" in data["target"]
+    assert "description" not in light["target"]
+    assert heavy[("target", "description")][0] == 1
+
+
+def test_select_fields_keeps_id():
+    assert select_fields({"id": "x", "status": "s", "fit": {}}, ["status"]) == {"id": "x", "status": "s"}
+
+
+def test_project_entry_text_skips_description():
+    data, deferred = project_entry_text(ENTRY_TEXT)
+    assert deferred == [("target", "description")]
+    assert data["target"] == {"organization": "Acme", "url": "https://example.com/jobs/1"}
+    assert data["tags"] == ["platform"]
+
+
+def test_project_entry_text_selected_fields():
+    data, _ = project_entry_text(ENTRY_TEXT, ["status", "fit"])
+    assert data == {"id": "acme-engineer", "status": "research", "fit": {"score": 6.5}}
+
+
+def test_project_entry_text_flow_style_falls_back():
+    text = "id: x\ntarget: {organization: A, description: long}\n"
+    data, deferred = project_entry_text(text)
+    assert data["target"]["organization"] == "A"
+    assert "description" not in data["target"]
+    assert deferred == [("target", "description")]
+
+
+def test_project_entry_text_alias_falls_back():
+    text = "id: x\nbase: &b\n  k: 1\nfit: *b\n"
+    data, _ = project_entry_text(text, ["fit"])
+    assert data == {"id": "x", "fit": {"k": 1}}
+
+
+# --- load_entries integration ---
+
+
+@pytest.mark.parametrize("cached", [True, False])
+def test_header_only_matches_full_load(cache_path, entries_dir, monkeypatch, cached):
+    if not cached:
+        monkeypatch.setenv("PIPELINE_ENTRY_CACHE", "0")
+    full = load_entries(dirs=[entries_dir])
+    header = load_entries(dirs=[entries_dir], header_only=True)
+    assert isinstance(header[0]["target"], LazyDict)
+    assert header[0]["target"].pending == {"description"}
+    assert header == full
+    assert header[0]["target"]["description"].startswith("<p>Long posting body")
+
+
+def test_header_only_warm_cache_skips_heavy_file(cache_path, entries_dir):
+    load_entries(dirs=[entries_dir])
+    assert pipeline_entry_cache.heavy_path_for(cache_path).exists()
+    cache = pipeline_entry_cache.EntryCache(cache_path)
+    data = pipeline_entry_cache.parse_entry_file(entries_dir / "acme-engineer.yaml", cache, header_only=True)
+    assert cache._heavy is None
+    assert data["target"]["description"].startswith("<p>Long")
+    assert cache._heavy is not None
+
+
+def test_full_load_from_cache_preserves_key_order(cache_path, entries_dir):
+    load_entries(dirs=[entries_dir])
+    warm = load_entries(dirs=[entries_dir])
+    assert list(warm[0]["target"]) == ["organization", "description", "url"]
+
+
+def test_fields_projection(cache_path, entries_dir):
+    entries = load_entries(dirs=[entries_dir], fields=["status"])
+    assert entries[0] == {"id": "acme-engineer", "status": "research", "_dir": "research_pool", "_file": "acme-engineer.yaml"}
@@ -9,8 +9,10 @@
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
 
 from pipeline_entry_state import (
+    Entry,
     can_advance,
     days_until,
+    entry_views,
     format_amount,
     get_deadline,
     get_effort,
@@ -48,3 +50,70 @@ def test_state_helpers_and_days_until():
     can, reason = can_advance(entry, "qualified")
     assert can is True and "can advance" in reason
     assert days_until(date.today()) == 0
+
+
+def test_entry_view_precomputes_hot_fields():
+    data = {
+        "id": "acme-se",
+        "status": "submitted",
+        "track": "job",
+        "target": {"organization": "Acme", "portal": "greenhouse"},
+        "fit": {"score": "7.5", "identity_position": "independent-engineer"},
+        "timeline": {"submitted": "2026-03-04"},
+        "submission": {"blocks_used": {"framing": "identity/2min", "evidence": "projects/x"}},
+    }
+    entry = Entry(data)
+    assert (entry.id, entry.status, entry.track, entry.org, entry.portal) == (
+        "acme-se", "submitted", "job", "Acme", "greenhouse")
+    assert entry.score == 7.5
+    assert entry.identity_position == "independent-engineer"
+    assert entry.submitted == date(2026, 3, 4)
+    assert entry.blocks_used == ("identity/2min", "projects/x")
+    assert not hasattr(entry, "__dict__")
+
+
+def test_entry_view_tolerates_malformed_fields():
+    entry = Entry({"id": "x", "target": "Acme", "fit": {"score": "n/a"}, "timeline": None, "submission": []})
+    assert entry.org is None and entry.portal is None
+    assert entry.score is None and entry.submitted is None
+    assert entry.blocks_used == ()
+    assert Entry({"submission": {"blocks_used": ["a", "b"]}}).blocks_used == ("a", "b")
+
+
+def test_entry_view_round_trips_to_dict():
+    data = {"id": "x", "status": "research", "fit": {"score": 6}}
+    entry = Entry(data)
+    assert entry.to_dict() is data
+    assert dict(entry) == data and entry == data
+    assert entry["fit"] == {"score": 6} and entry.get("missing", "d") == "d"
+    assert "status" in entry and len(entry) == 3
+    assert Entry.of(entry) is entry
+    views = entry_views([data, entry])
+    assert views[1] is entry and views[0].to_dict() is data
+
+
+def test_report_helpers_read_dicts_directly_and_agree_with_views(monkeypatch):
+    import quarterly_report
+    import rejection_learner
+
+    data = {
+        "id": "acme-se",
+        "track": "job",
+        "target": {"portal": "greenhouse"},
+        "fit": {"score": "7.5", "identity_position": "independent-engineer"},
+        "timeline": {"submitted": "2026-03-04"},
+        "submission": {"blocks_used": {"framing": "identity/2min"}},
+    }
+    helpers = [
+        quarterly_report._get_submitted_date, quarterly_report._get_identity_position,
+        quarterly_report._get_portal, quarterly_report._get_score, quarterly_report._get_blocks_used,
+        rejection_learner._get_identity_position, rejection_learner._get_portal,
+        rejection_learner._get_blocks_used, rejection_learner._get_track, rejection_learner._get_composite_score,
+    ]
+    views = [helper(Entry(data)) for helper in helpers]
+
+    def no_wrapping(self, entry):
+        raise AssertionError("plain dict wrapped in an Entry view")
+
+    monkeypatch.setattr(Entry, "__init__", no_wrapping)
+    assert [helper(data) for helper in helpers] == views
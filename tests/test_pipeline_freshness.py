@@ -88,6 +88,7 @@ def test_flush_stale_active_jobs_moves_old_job_entries(tmp_path, monkeypatch):
 
     monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_ACTIVE", active)
     monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_RESEARCH_POOL", pool)
+    monkeypatch.delenv("PIPELINE_FRESHNESS_FLUSH", raising=False)
 
     flushed = flush_stale_active_jobs(quiet=True)
 
@@ -118,6 +119,7 @@ def test_flush_stale_active_jobs_removes_duplicates(tmp_path, monkeypatch):
 
     monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_ACTIVE", active)
     monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_RESEARCH_POOL", pool)
+    monkeypatch.delenv("PIPELINE_FRESHNESS_FLUSH", raising=False)
 
     flushed = flush_stale_active_jobs(quiet=True)
 
@@ -146,8 +148,26 @@ def test_flush_stale_exempts_all_deadline_tracks(tmp_path, monkeypatch):
 
     monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_ACTIVE", active)
     monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_RESEARCH_POOL", pool)
+    monkeypatch.delenv("PIPELINE_FRESHNESS_FLUSH", raising=False)
 
     flushed = flush_stale_active_jobs(quiet=True)
 
     assert flushed == 0
     assert len(list(active.glob("*.yaml"))) == 5
+
+
+def test_flush_can_be_disabled(tmp_path, monkeypatch):
+    """PIPELINE_FRESHNESS_FLUSH=0 leaves stale entries where they are."""
+    import yaml
+
+    active = tmp_path / "pipeline" / "active"
+    active.mkdir(parents=True)
+    entry = {"id": "old-job", "track": "job", "status": "drafting",
+             "timeline": {"date_added": (date.today() - timedelta(days=30)).isoformat()}}
+    (active / "old-job.yaml").write_text(yaml.dump(entry))
+    monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_ACTIVE", active)
+    monkeypatch.setattr(pipeline_freshness, "PIPELINE_DIR_RESEARCH_POOL", tmp_path / "pipeline" / "research_pool")
+    monkeypatch.setenv("PIPELINE_FRESHNESS_FLUSH", "0")
+
+    assert flush_stale_active_jobs(quiet=True) == 0
+    assert (active / "old-job.yaml").exists()
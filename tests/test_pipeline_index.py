@@ -0,0 +1,257 @@
+"""Tests for scripts/pipeline_index.py and the pipeline_lib query API."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pipeline_index
+from pipeline_index import (
+    connect,
+    extract_index_row,
+    query_index,
+    rebuild_index,
+    refresh_index,
+)
+from pipeline_lib import query_entries
+
+
+def _write(d: Path, entry_id: str, status: str, *, track: str = "job", score: float = 7.0,
+           org: str = "Acme", deadline: str | None = None, touched: str = "2026-03-01") -> Path:
+    lines = [
+        f"id: {entry_id}",
+        f"status: {status}",
+        f"track: {track}",
+        "target:",
+        f"  organization: {org}",
+        "fit:",
+        f"  score: {score}",
+        f'last_touched: "{touched}"',
+    ]
+    if deadline:
+        lines += ["deadline:", f"  date: {deadline}", "  type: hard"]
+    path = d / f"{entry_id}.yaml"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    active = tmp_path / "active"
+    submitted = tmp_path / "submitted"
+    active.mkdir()
+    submitted.mkdir()
+    _write(active, "alpha", "staged", score=8.2, deadline="2026-05-01")
+    _write(active, "beta", "staged", score=6.0, org="Beta Co")
+    _write(active, "gamma", "qualified", track="grant", score=9.1)
+    _write(submitted, "delta", "submitted", score=7.5, touched="2026-01-10")
+    monkeypatch.setattr(pipeline_index, "INDEX_PATH", tmp_path / "index.sqlite")
+    monkeypatch.setattr(pipeline_index, "DEFAULT_INDEX_DIRS", [active, submitted])
+    return {"active": active, "submitted": submitted, "root": tmp_path}
+
+
+def test_extract_index_row_projects_header_fields():
+    row = extract_index_row({
+        "id": "x", "status": "staged", "track": "job",
+        "target": {"organization": "Org"}, "fit": {"score": "7.5"},
+        "deadline": {"date": "2026-04-01", "type": "hard"},
+        "timeline": {"submitted": "2026-03-02"}, "last_touched": "2026-03-03",
+    })
+    assert row["organization"] == "Org"
+    assert row["score"] == 7.5
+    assert row["deadline"] == "2026-04-01"
+    assert row["submitted"] == "2026-03-02"
+
+
+def test_extract_index_row_tolerates_missing_blocks():
+    row = extract_index_row({"id": "x", "target": None, "fit": "bad"})
+    assert row["organization"] is None
+    assert row["score"] is None
+
+
+def test_query_staged_jobs_min_score(tree):
+    rows = query_index(status="staged", track="job", min_score=7)
+    assert [r["id"] for r in rows] == ["alpha"]
+
+
+def test_query_multiple_statuses_and_dirs(tree):
+    rows = query_index(status=["staged", "submitted"])
+    assert {r["id"] for r in rows} == {"alpha", "beta", "delta"}
+    rows = query_index(status=["staged", "submitted"], dirs=[tree["submitted"]])
+    assert [r["id"] for r in rows] == ["delta"]
+
+
+def test_query_date_filters(tree):
+    assert [r["id"] for r in query_index(deadline_before="2026-06-01")] == ["alpha"]
+    assert [r["id"] for r in query_index(touched_before="2026-02-01")] == ["delta"]
+
+
+def test_refresh_is_incremental(tree):
+    conn = connect()
+    first = refresh_index(conn)
+    assert first["added"] == 4
+    second = refresh_index(conn)
+    assert second == {"added": 0, "updated": 0, "removed": 0, "unchanged": 4}
+
+    _write(tree["active"], "beta", "drafting", score=6.0, org="Beta Co")
+    (tree["active"] / "gamma.yaml").unlink()
+    third = refresh_index(conn)
+    conn.close()
+    assert third["updated"] == 1
+    assert third["removed"] == 1
+    assert [r["id"] for r in query_index(status="drafting")] == ["beta"]
+
+
+def test_rebuild_from_scratch(tree):
+    query_index()
+    stats = rebuild_index()
+    assert stats["added"] == 4
+
+
+def test_corrupt_database_is_recreated(tree):
+    pipeline_index.INDEX_PATH.write_bytes(b"garbage, not sqlite" * 100)
+    assert len(query_index()) == 4
+
+
+def test_schema_version_mismatch_clears_rows(tree):
+    query_index()
+    conn = sqlite3.connect(pipeline_index.INDEX_PATH)
+    conn.execute("UPDATE meta SET value = '0' WHERE key = 'schema_version'")
+    conn.commit()
+    conn.close()
+    conn = connect()
+    assert conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+    conn.close()
+
+
+def test_unparseable_file_indexed_without_fields(tree):
+    (tree["active"] / "broken.yaml").write_text("id: [unterminated\n")
+    rows = query_index(dirs=[tree["active"]])
+    broken = [r for r in rows if r["file"] == "broken.yaml"]
+    assert broken and broken[0]["status"] is None
+
+
+def test_query_entries_returns_full_entries(tree):
+    entries = query_entries(
+        status="staged", min_score=7, include_filepath=True, dirs=[tree["active"], tree["submitted"]],
+    )
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry["id"] == "alpha"
+    assert entry["_dir"] == "active"
+    assert entry["_file"] == "alpha.yaml"
+    assert entry["_filepath"] == tree["active"] / "alpha.yaml"
+    assert entry["deadline"]["type"] == "hard"
+
+
+# --- id → path resolution ---
+
+
+def test_resolve_ids_batch(tree):
+    resolved = pipeline_index.resolve_ids(["alpha", "delta", "missing"])
+    assert resolved == {
+        "alpha": tree["active"] / "alpha.yaml",
+        "delta": tree["submitted"] / "delta.yaml",
+    }
+
+
+def test_resolve_ids_finds_renamed_file_and_reports_mismatch(tree):
+    (tree["active"] / "beta.yaml").rename(tree["active"] / "beta-old-name.yaml")
+    assert pipeline_index.resolve_ids(["beta"]) == {"beta": tree["active"] / "beta-old-name.yaml"}
+    mismatches = pipeline_index.id_mismatches()
+    assert [(m["file"], m["id"]) for m in mismatches] == [("beta-old-name.yaml", "beta")]
+
+
+def test_resolve_ids_first_dir_wins(tree):
+    _write(tree["submitted"], "alpha", "submitted")
+    assert pipeline_index.resolve_ids(["alpha"]) == {"alpha": tree["active"] / "alpha.yaml"}
+    assert pipeline_index.resolve_ids(["alpha"], [tree["submitted"], tree["active"]]) == {
+        "alpha": tree["submitted"] / "alpha.yaml",
+    }
+
+
+def test_resolve_ids_follows_moves_and_id_edits(tree):
+    pipeline_index.resolve_ids(["alpha"])
+    (tree["active"] / "alpha.yaml").rename(tree["submitted"] / "alpha.yaml")
+    assert pipeline_index.resolve_ids(["alpha"]) == {"alpha": tree["submitted"] / "alpha.yaml"}
+    _write(tree["active"], "gamma", "qualified", track="grant", score=9.1)
+    (tree["active"] / "gamma.yaml").write_text("id: gamma-renamed\nstatus: qualified\n")
+    assert pipeline_index.resolve_ids(["gamma", "gamma-renamed"]) == {
+        "gamma-renamed": tree["active"] / "gamma.yaml",
+    }
+
+
+def test_resolve_ids_skips_unchanged_dirs(tree, monkeypatch):
+    import os
+
+    for d in (tree["active"], tree["submitted"]):
+        for f in d.iterdir():
+            st = f.stat()
+            os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns - 60_000_000_000))
+        st = d.stat()
+        os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns - 60_000_000_000))
+    pipeline_index.resolve_ids(["alpha"])
+    scanned = []
+    real_scan = pipeline_index._scan_dir
+    monkeypatch.setattr(pipeline_index, "_scan_dir", lambda d: scanned.append(d) or real_scan(d))
+    assert pipeline_index.resolve_ids(["alpha", "delta"])["delta"] == tree["submitted"] / "delta.yaml"
+    assert scanned == []
+
+
+def test_note_write_forces_reindex(tree):
+    import os
+
+    path = tree["active"] / "beta.yaml"
+    pipeline_index.resolve_ids(["beta"])
+    st = path.stat()
+    text = path.read_text().replace("id: beta", "id: bet2")  # same length
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    pipeline_index.note_write(path)
+    assert pipeline_index.resolve_ids(["beta", "bet2"]) == {"bet2": path}
+
+
+def test_load_entries_by_ids(tree, monkeypatch):
+    import pipeline_lib
+    from pipeline_lib import load_entries_by_ids, load_entry_by_id
+
+    monkeypatch.setattr(pipeline_lib, "ALL_PIPELINE_DIRS_WITH_POOL", [tree["active"], tree["submitted"]])
+    loaded = load_entries_by_ids(["alpha", "delta", "nope"])
+    assert sorted(loaded) == ["alpha", "delta"]
+    assert loaded["delta"][1]["status"] == "submitted"
+    # A file named after the id but carrying a different id is still found by name.
+    (tree["active"] / "legacy.yaml").write_text("id: something-else\nstatus: staged\n")
+    filepath, data = load_entry_by_id("legacy")
+    assert filepath == tree["active"] / "legacy.yaml"
+    assert data["id"] == "something-else"
+
+
+def test_unusable_index_falls_back_to_files(tree, monkeypatch):
+    import pipeline_lib
+    from pipeline_lib import load_entry_by_id
+
+    def unwritable(path=None):
+        raise PermissionError("read-only cache dir")
+
+    monkeypatch.setattr(pipeline_lib, "ALL_PIPELINE_DIRS_WITH_POOL", [tree["active"], tree["submitted"]])
+    monkeypatch.setattr(pipeline_index, "connect", unwritable)
+    assert load_entry_by_id("delta")[1]["status"] == "submitted"
+    entries = query_entries(status="staged", min_score=7, dirs=[tree["active"], tree["submitted"]])
+    assert [e["id"] for e in entries] == ["alpha"]
+
+
+def test_disabled_cache_skips_index(tree, monkeypatch):
+    import pipeline_lib
+    from pipeline_lib import load_entry_by_id
+
+    monkeypatch.setenv("PIPELINE_ENTRY_CACHE", "0")
+    monkeypatch.setattr(pipeline_lib, "ALL_PIPELINE_DIRS_WITH_POOL", [tree["active"], tree["submitted"]])
+    assert load_entry_by_id("alpha")[0] == tree["active"] / "alpha.yaml"
+    entries = query_entries(touched_before="2026-02-01", dirs=[tree["active"], tree["submitted"]])
+    assert [e["id"] for e in entries] == ["delta"]
+    assert not (tree["root"] / "index.sqlite").exists()
@@ -4,6 +4,8 @@
 from datetime import date
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
 
 from pipeline_lib import (
@@ -24,8 +26,10 @@
     VALID_STATUSES,
     VALID_TRANSITIONS,
     VARIANTS_DIR,
+    FieldEdit,
     _extract_section_content,
     _parse_legacy_markdown,
+    apply_field_edits,
     atomic_write,
     days_until,
     detect_portal,
@@ -41,6 +45,9 @@
     load_variant,
     parse_date,
     parse_datetime,
+    update_yaml_field,
+    write_field_edits,
+    write_field_edits_bulk,
 )
 
 # --- Constants ---
@@ -700,3 +707,74 @@ def test_withdrawn_in_valid_statuses():
     """withdrawn should be a valid status (added in Tier 1 H1)."""
     assert "withdrawn" in VALID_STATUSES
     assert "withdrawn" in STATUS_ORDER
+
+
+# --- Batched field edits ---
+
+ENTRY_YAML = """\
+id: demo
+status: research
+fit:
+  score: 5.0
+timeline:
+  qualified: null
+"""
+
+
+def test_apply_field_edits_matches_chained_updates():
+    edits = [
+        FieldEdit("status", "qualified"),
+        FieldEdit("score", "7.5", nested=True, parent_key="fit"),
+        FieldEdit("qualified", '"2026-01-02"', nested=True),
+    ]
+    chained = ENTRY_YAML
+    for edit in edits:
+        chained = update_yaml_field(chained, edit.field, edit.value, nested=edit.nested, parent_key=edit.parent_key)
+    assert apply_field_edits(ENTRY_YAML, edits) == chained
+
+
+def test_apply_field_edits_validates_once(monkeypatch):
+    import pipeline_lib
+
+    calls = []
+    real = pipeline_lib.yaml.safe_load
+    monkeypatch.setattr(pipeline_lib.yaml, "safe_load", lambda text: calls.append(1) or real(text))
+    apply_field_edits(ENTRY_YAML, [FieldEdit("status", "qualified"), FieldEdit("score", "8", nested=True)])
+    assert len(calls) == 1
+
+
+def test_apply_field_edits_optional_and_create():
+    result = apply_field_edits(ENTRY_YAML, [
+        FieldEdit("submitted", "'2026-01-02'", nested=True, optional=True),
+        FieldEdit("last_touched", '"2026-01-02"', create=True),
+    ])
+    assert result == ENTRY_YAML + 'last_touched: "2026-01-02"\n'
+
+
+def test_apply_field_edits_required_missing_raises():
+    with pytest.raises(ValueError, match="'missing' not found"):
+        apply_field_edits(ENTRY_YAML, [FieldEdit("status", "qualified"), FieldEdit("missing", "x")])
+
+
+def test_write_field_edits_is_all_or_nothing(tmp_path):
+    path = tmp_path / "demo.yaml"
+    path.write_text(ENTRY_YAML)
+    with pytest.raises(ValueError, match="became invalid"):
+        write_field_edits(path, [FieldEdit("status", "qualified"), FieldEdit("score", "[unclosed", nested=True)])
+    assert path.read_text() == ENTRY_YAML
+    write_field_edits(path, [FieldEdit("status", "qualified")])
+    assert "status: qualified\n" in path.read_text()
+
+
+def test_write_field_edits_bulk_reports_failures(tmp_path, capsys):
+    good, bad = tmp_path / "good.yaml", tmp_path / "bad.yaml"
+    good.write_text(ENTRY_YAML)
+    bad.write_text("id: bad\n")
+    failures = write_field_edits_bulk({
+        good: [FieldEdit("status", "qualified")],
+        bad: [FieldEdit("status", "qualified")],
+    })
+    assert list(failures) == [bad]
+    assert "status: qualified" in good.read_text()
+    assert bad.read_text() == "id: bad\n"
+    assert "1 of 2 entry updates failed" in capsys.readouterr().err
@@ -14,6 +14,7 @@
 # --- Public functions that must exist ---
 
 REQUIRED_FUNCTIONS = [
+    "apply_field_edits",
     "atomic_write",
     "check_company_cap",
     "compute_freshness_score",
@@ -45,6 +46,8 @@
     "strip_markdown",
     "update_last_touched",
     "update_yaml_field",
+    "write_field_edits",
+    "write_field_edits_bulk",
 ]
 
 # --- Public constants that must exist ---
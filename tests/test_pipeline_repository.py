@@ -0,0 +1,106 @@
+"""Tests for scripts/pipeline_repository.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pipeline_entry_cache
+import pipeline_lib
+import pipeline_repository
+from pipeline_lib import atomic_write, load_entries, load_entry_by_id
+from pipeline_repository import get_repository, reset_repository
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def entries_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_entry_cache, "ENTRY_CACHE_PATH", tmp_path / "cache" / "entries.pickle")
+    monkeypatch.delenv("PIPELINE_ENTRY_CACHE", raising=False)
+    reset_repository()
+    d = tmp_path / "active"
+    d.mkdir()
+    for name, status in (("alpha", "qualified"), ("beta", "staged")):
+        (d / f"{name}.yaml").write_text(f"id: {name}\nstatus: {status}\n")
+        _age(d / f"{name}.yaml")
+    _age(d)
+    yield d
+    reset_repository()
+
+
+def test_repeated_loads_read_disk_cache_once(entries_dir, monkeypatch):
+    load_entries(dirs=[entries_dir])
+    reads = []
+    real_read = pipeline_entry_cache._read_pickle
+    monkeypatch.setattr(pipeline_entry_cache, "_read_pickle", lambda p: reads.append(p) or real_read(p))
+    cache = get_repository().cache
+    for _ in range(3):
+        assert [e["id"] for e in load_entries(dirs=[entries_dir])] == ["alpha", "beta"]
+    assert get_repository().cache is cache
+    assert reads == []
+    assert cache.hits >= 6
+
+
+def test_returned_entries_are_independent(entries_dir):
+    first = load_entries(dirs=[entries_dir])
+    first[0]["status"] = "mutated"
+    assert load_entries(dirs=[entries_dir])[0]["status"] == "qualified"
+
+
+def test_atomic_write_invalidates_same_size_rewrite(entries_dir):
+    path = entries_dir / "beta.yaml"
+    load_entries(dirs=[entries_dir])
+    st = path.stat()
+    atomic_write(path, "id: gamma\nstatus: staged\n")  # identical byte length
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    entries = {e["_file"]: e for e in load_entries(dirs=[entries_dir])}
+    assert entries["beta.yaml"]["id"] == "gamma"
+    assert get_repository().invalidations == 1
+
+
+def test_external_edit_is_detected_without_hook(entries_dir):
+    load_entries(dirs=[entries_dir])
+    (entries_dir / "alpha.yaml").write_text("id: alpha\nstatus: drafting\n")
+    assert load_entries(dirs=[entries_dir])[0]["status"] == "drafting"
+
+
+def test_listing_picks_up_new_and_deleted_files(entries_dir):
+    load_entries(dirs=[entries_dir])
+    (entries_dir / "gamma.yaml").write_text("id: gamma\nstatus: research\n")
+    assert [e["id"] for e in load_entries(dirs=[entries_dir])] == ["alpha", "beta", "gamma"]
+    (entries_dir / "alpha.yaml").unlink()
+    assert [e["id"] for e in load_entries(dirs=[entries_dir])] == ["beta", "gamma"]
+    assert len(pipeline_entry_cache.EntryCache(pipeline_entry_cache.ENTRY_CACHE_PATH)) == 2
+
+
+def test_cache_path_change_reopens(entries_dir, tmp_path, monkeypatch):
+    first = get_repository().cache
+    monkeypatch.setattr(pipeline_entry_cache, "ENTRY_CACHE_PATH", tmp_path / "other" / "entries.pickle")
+    assert get_repository().cache is not first
+
+
+def test_load_entry_by_id_shares_cache(entries_dir, monkeypatch):
+    monkeypatch.setattr(pipeline_lib, "ALL_PIPELINE_DIRS_WITH_POOL", [entries_dir])
+    load_entries(dirs=[entries_dir])
+    cache = get_repository().cache
+    hits, misses = cache.hits, cache.misses
+    filepath, data = load_entry_by_id("alpha")
+    assert filepath == entries_dir / "alpha.yaml"
+    assert data["status"] == "qualified"
+    assert cache.hits > hits
+    assert cache.misses == misses
+
+
+def test_invalidate_without_repository_is_noop():
+    reset_repository()
+    pipeline_repository.invalidate(Path("/nonexistent.yaml"))
+    assert pipeline_repository._REPOSITORY is None
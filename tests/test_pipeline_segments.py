@@ -0,0 +1,183 @@
+"""Tests for scripts/pipeline_segments.py."""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pipeline_entry_cache
+import pipeline_index
+import pipeline_lib
+import pipeline_segments
+from pipeline_lib import atomic_write, load_entries, load_entry_by_id, query_entries
+from pipeline_repository import reset_repository
+from pipeline_segments import pack_directory, packed_names, segment_key, segment_stats, unpack_entries
+
+ALPHA = """\
+# closed after rejection
+id: alpha
+status: outcome
+outcome: rejected
+last_touched: "2026-03-04"
+target:
+  organization: Acme
+"""
+BETA = "id: beta\nstatus: outcome\nlast_touched: 2026-04-01\ntimeline:\n  submitted: 2026-02-01\n"
+GAMMA = "id: gamma\nstatus: outcome\n"
+
+
+@pytest.fixture
+def closed_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_entry_cache, "ENTRY_CACHE_PATH", tmp_path / "cache" / "entries.pickle")
+    monkeypatch.setattr(pipeline_index, "INDEX_PATH", tmp_path / "cache" / "index.sqlite")
+    reset_repository()
+    d = tmp_path / "closed"
+    d.mkdir()
+    for name, text in (("alpha", ALPHA), ("beta", BETA), ("gamma", GAMMA)):
+        (d / f"{name}.yaml").write_text(text)
+    yield d
+    reset_repository()
+
+
+def _snapshot(d: Path) -> dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in d.glob("*.yaml")}
+
+
+def _segment_bytes(d: Path) -> int:
+    return sum(p.stat().st_size for p in (d / "_segments").iterdir())
+
+
+def test_segment_key():
+    assert segment_key({"last_touched": "2026-03-04"}) == "2026-03"
+    assert segment_key({"last_touched": date(2026, 4, 1)}) == "2026-04"
+    assert segment_key({"timeline": {"date_added": "2025-12-30"}}) == "2025-12"
+    assert segment_key({"id": "x"}) == "undated"
+
+
+def test_pack_moves_files_into_monthly_segments(closed_dir):
+    stats = pack_directory(closed_dir)
+    assert stats["packed"] == 3 and stats["skipped"] == 0
+    assert not list(closed_dir.glob("*.yaml"))
+    assert sorted(p.name for p in (closed_dir / "_segments").iterdir()) == [
+        "2026-03.jsonl.gz", "2026-04.jsonl.gz", "undated.jsonl.gz",
+    ]
+    assert segment_stats(closed_dir) == {"segments": 3, "packed": 3, "bytes": _segment_bytes(closed_dir), "loose": 0}
+
+
+def test_dry_run_writes_nothing(closed_dir):
+    before = _snapshot(closed_dir)
+    assert pack_directory(closed_dir, dry_run=True)["packed"] == 3
+    assert _snapshot(closed_dir) == before
+    assert not (closed_dir / "_segments").exists()
+
+
+def test_load_entries_reads_segments_and_loose_files(closed_dir):
+    before = load_entries(dirs=[closed_dir])
+    pack_directory(closed_dir)
+    after = load_entries(dirs=[closed_dir])
+    assert after == before
+    assert after[1]["last_touched"] == date(2026, 4, 1)
+    (closed_dir / "delta.yaml").write_text("id: delta\nstatus: outcome\n")
+    assert [e["id"] for e in load_entries(dirs=[closed_dir])] == ["alpha", "beta", "delta", "gamma"]
+    assert load_entries(dirs=[closed_dir], fields=["status"])[0] == {"id": "alpha", "status": "outcome",
+                                                                     "_dir": "closed", "_file": "alpha.yaml"}
+
+
+def test_loose_file_shadows_packed_entry(closed_dir):
+    pack_directory(closed_dir)
+    atomic_write(closed_dir / "beta.yaml", BETA.replace("status: outcome", "status: withdrawn"))
+    statuses = {e["id"]: e["status"] for e in load_entries(dirs=[closed_dir])}
+    assert statuses == {"alpha": "outcome", "beta": "withdrawn", "gamma": "outcome"}
+
+
+def test_unpack_restores_exact_text(closed_dir):
+    before = _snapshot(closed_dir)
+    pack_directory(closed_dir)
+    restored = unpack_entries(closed_dir, ["alpha"])
+    assert restored == [closed_dir / "alpha.yaml"]
+    assert (closed_dir / "alpha.yaml").read_bytes() == before["alpha.yaml"]
+    assert packed_names(closed_dir) == ["beta.yaml", "gamma.yaml"]
+    unpack_entries(closed_dir)
+    assert _snapshot(closed_dir) == before
+    assert not list((closed_dir / "_segments").iterdir())
+
+
+def test_repack_after_edit(closed_dir):
+    pack_directory(closed_dir)
+    unpack_entries(closed_dir, ["alpha"])
+    (closed_dir / "alpha.yaml").write_text(ALPHA.replace('"2026-03-04"', '"2026-05-01"'))
+    assert pack_directory(closed_dir)["packed"] == 1
+    assert packed_names(closed_dir) == ["alpha.yaml", "beta.yaml", "gamma.yaml"]
+    assert not (closed_dir / "_segments" / "2026-03.jsonl.gz").exists()
+    assert load_entries(dirs=[closed_dir])[0]["last_touched"] == "2026-05-01"
+
+
+def test_unpackable_file_stays_loose(closed_dir):
+    (closed_dir / "odd.yaml").write_text("- not\n- a mapping\n")
+    assert pack_directory(closed_dir)["skipped"] == 1
+    assert (closed_dir / "odd.yaml").exists()
+
+
+def test_query_and_id_lookup_see_packed_entries(closed_dir, monkeypatch):
+    monkeypatch.setattr(pipeline_lib, "ALL_PIPELINE_DIRS_WITH_POOL", [closed_dir])
+    pack_directory(closed_dir)
+    assert [e["id"] for e in query_entries(organization="Acme", dirs=[closed_dir])] == ["alpha"]
+    filepath, data = load_entry_by_id("beta")
+    assert filepath == closed_dir / "beta.yaml"
+    assert data["status"] == "outcome"
+    unpack_entries(closed_dir, ["beta"])
+    assert load_entry_by_id("beta")[0].exists()
+
+
+def test_cli_stats(closed_dir, capsys):
+    pack_directory(closed_dir)
+    assert pipeline_segments.main(["--dir", str(closed_dir), "--stats"]) == 0
+    assert "3 packed entries in 3 segment(s)" in capsys.readouterr().out
+    assert pipeline_segments.main(["--dir", str(closed_dir), "--unpack", "missing"]) == 1
+
+
+def test_entry_paths_and_text_cover_packed_entries(closed_dir):
+    pack_directory(closed_dir)
+    (closed_dir / "delta.yaml").write_text("id: delta\n")
+    assert [p.name for p in pipeline_segments.entry_paths(closed_dir)] == [
+        "alpha.yaml", "beta.yaml", "delta.yaml", "gamma.yaml",
+    ]
+    assert pipeline_segments.read_entry_text(closed_dir / "alpha.yaml") == ALPHA
+    assert pipeline_segments.read_entry_text(closed_dir / "delta.yaml") == "id: delta\n"
+    with pytest.raises(FileNotFoundError):
+        pipeline_segments.read_entry_text(closed_dir / "missing.yaml")
+
+
+def test_validate_checks_packed_entries(closed_dir, monkeypatch, capsys):
+    import validate
+
+    pack_directory(closed_dir)
+    monkeypatch.setattr(validate, "PIPELINE_DIRS", [closed_dir])
+    monkeypatch.setattr(validate, "REPO_ROOT", closed_dir.parent)
+    monkeypatch.setattr(sys, "argv", ["validate.py"])
+    with pytest.raises(SystemExit):
+        validate.main()
+    out = capsys.readouterr().out
+    assert "3 files checked" in out
+    assert "alpha.yaml:" in out and "Missing required field: name" in out
+
+
+def test_validate_signals_resolves_packed_entries(closed_dir, tmp_path, monkeypatch):
+    import validate_signals
+
+    signals = tmp_path / "signals"
+    signals.mkdir()
+    (signals / "conversion-log.yaml").write_text(
+        "entries:\n  - id: beta\n    submitted: 2026-02-01\n    track: job\n"
+    )
+    monkeypatch.setattr(validate_signals, "SIGNALS_DIR", signals)
+    monkeypatch.setattr(validate_signals, "ALL_PIPELINE_DIRS_WITH_POOL", [closed_dir])
+    pack_directory(closed_dir)
+    errors = []
+    assert validate_signals.validate_referential_integrity(errors) == 0
+    assert errors == []
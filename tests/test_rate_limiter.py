@@ -0,0 +1,55 @@
+"""Tests for scripts/rate_limiter.py."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import rate_limiter
+from rate_limiter import HostRateLimiter, TokenBucket
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls: list[float] = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", calls.append)
+    return calls
+
+
+def test_bucket_spaces_requests_after_burst(sleeps):
+    bucket = TokenBucket(rate=10.0, capacity=2)
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.1, 0.2], abs=0.02)
+    assert sleeps == waits[2:]
+
+
+def test_hosts_are_independent(sleeps):
+    limiter = HostRateLimiter(rate=1.0, overrides={"fast.example": (100.0, 1)})
+    assert limiter.acquire("a.example") == 0.0
+    assert limiter.acquire("b.example") == 0.0
+    assert limiter.acquire("a.example") == pytest.approx(1.0, abs=0.02)
+    limiter.acquire("fast.example")
+    assert limiter.acquire("fast.example") == pytest.approx(0.01, abs=0.005)
+    assert limiter.bucket("a.example") is limiter.bucket("a.example")
+
+
+def test_concurrent_callers_queue(sleeps):
+    bucket = TokenBucket(rate=5.0)
+    waits: list[float] = []
+    threads = [threading.Thread(target=lambda: waits.append(bucket.acquire())) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(waits) == pytest.approx([0.0, 0.2, 0.4, 0.6, 0.8], abs=0.05)
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
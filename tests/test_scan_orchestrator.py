@@ -1,6 +1,8 @@
 """Tests for scan_orchestrator.py — unified job scan across all APIs."""
 
 import sys
+import threading
+import time
 from dataclasses import asdict
 from pathlib import Path
 from unittest.mock import patch
@@ -9,7 +11,8 @@
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
 
-from scan_orchestrator import ScanResult, _log_scan_result, scan_all, scan_ats, scan_free
+from rate_limiter import HostRateLimiter
+from scan_orchestrator import ScanResult, _log_scan_result, _run_sources, _Source, scan_all, scan_ats, scan_free
 
 
 class TestScanResult:
@@ -139,6 +142,99 @@ def test_missing_config_returns_error(self):
             assert "not found" in errors[0].lower()
 
 
+class TestConcurrentScan:
+    COMPANIES = {"companies": [
+        {"name": "Alpha", "portal": "greenhouse", "board_id": "alpha"},
+        {"name": "Beta", "portal": "lever", "board_id": "beta"},
+        {"name": "Gamma", "portal": "greenhouse", "board_id": "gamma"},
+        {"name": "Delta", "portal": "unknown", "board_id": "delta"},
+    ]}
+
+    @staticmethod
+    def _job(board):
+        return {"title": "Senior Software Engineer", "company": board, "url": f"https://x/{board}"}
+
+    def test_boards_run_concurrently_in_source_order(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(board):
+            if board != "gamma":
+                barrier.wait()  # only passes if both hosts have a board in flight at once
+            return [self._job(board)]
+
+        latency = {}
+        with patch("scan_orchestrator.load_sources", return_value=self.COMPANIES), \
+             patch("scan_orchestrator.fetch_greenhouse_jobs", side_effect=fetch), \
+             patch("scan_orchestrator.fetch_lever_jobs", side_effect=fetch), \
+             patch("scan_orchestrator.filter_by_title", side_effect=lambda jobs, *_: jobs):
+            jobs, count, errors = scan_ats(latency=latency)
+        assert [j["company"] for j in jobs] == ["alpha", "beta", "gamma"]
+        assert (count, errors) == (3, [])
+        assert set(latency) == {"greenhouse/Alpha", "lever/Beta", "greenhouse/Gamma"}
+
+    def test_failing_board_is_isolated(self):
+        def fetch(board):
+            if board == "beta":
+                raise RuntimeError("boom")
+            return [self._job(board)]
+
+        with patch("scan_orchestrator.load_sources", return_value=self.COMPANIES), \
+             patch("scan_orchestrator.fetch_greenhouse_jobs", side_effect=fetch), \
+             patch("scan_orchestrator.fetch_lever_jobs", side_effect=fetch), \
+             patch("scan_orchestrator.filter_by_title", side_effect=lambda jobs, *_: jobs):
+            jobs, count, errors = scan_ats()
+        assert [j["company"] for j in jobs] == ["alpha", "gamma"]
+        assert (count, errors) == (2, ["lever/Beta: boom"])
+
+    def test_one_board_per_host_at_a_time(self):
+        lock = threading.Lock()
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        def fetcher(host):
+            def fetch(query):
+                with lock:
+                    in_flight[host] = in_flight.get(host, 0) + 1
+                    peak[host] = max(peak.get(host, 0), in_flight[host])
+                time.sleep(0.02)
+                with lock:
+                    in_flight[host] -= 1
+                return [{"q": query}]
+            return fetch
+
+        sources = [_Source(f"{host}/{n}", host, fetcher(host), [str(n)])
+                   for n in range(4) for host in ("a.example", "b.example")]
+        outcomes = _run_sources(sources, limiter=HostRateLimiter(1000.0, 10))
+        assert [jobs for jobs, _ in outcomes] == [[{"q": str(n)}] for n in range(4) for _ in range(2)]
+        assert peak == {"a.example": 1, "b.example": 1}
+
+    def test_slow_source_times_out(self):
+        release = threading.Event()
+
+        def slow(_):
+            release.wait(5)
+            return [{"title": "late"}]
+
+        sources = [_Source("slow", "a.example", slow, ["q"]), _Source("fast", "b.example", lambda q: [{"q": q}], ["q"])]
+        start = time.monotonic()
+        outcomes = _run_sources(sources, timeout=0.2)
+        release.set()
+        assert time.monotonic() - start < 3
+        assert outcomes == [(None, "timed out after 0.2s"), ([{"q": "q"}], None)]
+        assert sources[1].latency(time.monotonic()) >= 0
+
+    def test_scan_all_reports_latency(self):
+        def fake_ats(fresh_only=True, latency=None):
+            latency["greenhouse/Alpha"] = 1.5
+            return [], 1, []
+
+        with patch("scan_orchestrator.scan_ats", side_effect=fake_ats), \
+             patch("scan_orchestrator.scan_free", return_value=([], 0, [])), \
+             patch("scan_orchestrator._dedup_and_filter", return_value=[]):
+            result = scan_all(dry_run=True)
+        assert result.source_latency == {"greenhouse/Alpha": 1.5}
+
+
 class TestScanFree:
     def test_returns_tuple(self):
         """scan_free returns (jobs, sources_count, errors)."""
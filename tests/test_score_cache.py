@@ -0,0 +1,117 @@
+"""Tests for scripts/score_cache.py."""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import score_cache
+from pipeline_entry_fields import LazyDict
+from score_cache import ScoreCache, fingerprint, run_inputs, scoring_fields
+from score_context import ScoringContext
+
+DIMS = {"mission_alignment": 7, "evidence_match": 6}
+INPUTS = {"rubric": "r1", "idf": "i1"}
+
+
+def _entry(**fit) -> dict:
+    return {
+        "id": "acme-eng",
+        "track": "job",
+        "target": {"organization": "Acme"},
+        "deadline": {"type": "rolling"},
+        "fit": {"score": 6.5, "dimensions": dict(DIMS), "original_score": 6.0, **fit},
+    }
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(score_cache, "run_inputs", lambda: dict(INPUTS))
+    return ScoreCache(tmp_path / "scores.pickle")
+
+
+def _scored(cache: ScoreCache, entry: dict, path: Path) -> None:
+    _, fp = cache.lookup(path, entry, None)
+    cache.store(path, fp, DIMS, 6.5)
+    cache.save()
+
+
+def test_unchanged_entry_is_a_hit(cache, tmp_path):
+    path = tmp_path / "acme-eng.yaml"
+    assert cache.lookup(path, _entry(), None)[0] is None
+    _scored(cache, _entry(), path)
+
+    reopened = ScoreCache(cache.path)
+    assert reopened.lookup(path, _entry(), None)[0] == (DIMS, 6.5)
+    assert (reopened.hits, reopened.misses) == (1, 0)
+
+
+def test_misses_name_what_changed(cache, tmp_path, monkeypatch):
+    path = tmp_path / "acme-eng.yaml"
+    _scored(cache, _entry(), path)
+
+    edited = _entry()
+    edited["track"] = "grant"
+    assert ScoreCache(cache.path).lookup(path, edited, None)[0] is None
+
+    monkeypatch.setattr(score_cache, "run_inputs", lambda: {**INPUTS, "idf": "i2"})
+    rerun = ScoreCache(cache.path)
+    rerun.lookup(path, _entry(), None)
+    assert rerun.miss_reasons == {"acme-eng": "idf"}
+    assert rerun.summary() == "Score cache: 0 hit(s), 1 miss(es) (idf: 1)"
+
+
+def test_score_edited_on_disk_or_forced(cache, tmp_path):
+    path = tmp_path / "acme-eng.yaml"
+    _scored(cache, _entry(), path)
+
+    rerun = ScoreCache(cache.path)
+    assert rerun.lookup(path, _entry(score=9.0), None)[0] is None
+    assert rerun.lookup(path, _entry(original_score=None), None)[0] is None
+    assert list(rerun.reasons) == ["stored score", "original_score"]
+
+    forced = ScoreCache(cache.path, force=True)
+    assert forced.lookup(path, _entry(), None)[0] is None
+    assert forced.reasons == {"forced": 1}
+
+
+def test_fit_outputs_are_not_inputs():
+    assert scoring_fields(_entry()) == scoring_fields(_entry(score=1.0, dimensions={}))
+    assert scoring_fields(_entry())["fit"] == {}
+
+
+def test_context_and_date_feed_the_fingerprint():
+    entry = _entry()
+    alone = fingerprint(entry, ScoringContext([entry]), INPUTS)
+    crowded = fingerprint(entry, ScoringContext([entry, {"id": "b", "target": {"organization": "Acme"}}]), INPUTS)
+    assert alone["context"] != crowded["context"]
+    assert alone["date"] == ""
+    dated = {**entry, "deadline": {"type": "hard", "date": "2030-01-01"}}
+    assert fingerprint(dated, None, INPUTS)["date"] == date.today().isoformat()
+
+
+def test_derived_description_is_not_resolved():
+    loads = []
+    entry = _entry()
+    entry["target"] = LazyDict(
+        {"organization": "Acme", "description_ref": "sha256:abc"},
+        {"description": lambda: loads.append(1) or "text"},
+        derived=("description",),
+    )
+    assert scoring_fields(entry)["target"] == {"organization": "Acme", "description_ref": "sha256:abc"}
+    assert loads == []
+
+
+def test_run_inputs_track_shared_files(tmp_path, monkeypatch):
+    rubric = tmp_path / "rubric.yaml"
+    rubric.write_text("weights: {}\n")
+    monkeypatch.setattr(score_cache, "SHARED_INPUTS", {"rubric": rubric, "market": tmp_path / "missing.json"})
+    first = run_inputs()
+    assert first["market"] == "missing"
+    rubric.write_text("weights: {a: 1}\n")
+    assert run_inputs()["rubric"] != first["rubric"]
@@ -0,0 +1,89 @@
+"""Tests for scripts/score_context.py."""
+
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from score import _tr_track_experience, compute_dimensions, score_network_proximity
+from score_context import SUBMITTED_STATUSES, ScoringContext
+
+ORGS = ["Anthropic", "Acme", "Globex", None]
+TRACKS = ["job", "grant", "residency", None]
+STATUSES = ["research", "qualified", "submitted", "acknowledged", "interview", "outcome", "closed"]
+
+
+def _random_entries(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    entries = []
+    for i in range(n):
+        entry = {"id": f"e{rng.randrange(n)}" if i % 5 == 0 else f"e{i}", "status": rng.choice(STATUSES)}
+        org = rng.choice(ORGS)
+        if org is not None:
+            entry["target"] = {"organization": org}
+        track = rng.choice(TRACKS)
+        if track is not None:
+            entry["track"] = track
+        entries.append(entry)
+    return entries
+
+
+def _scan_org_count(entry: dict, all_entries: list[dict]) -> int:
+    org = (entry.get("target") or {}).get("organization", "")
+    return sum(
+        1 for c in all_entries
+        if (c.get("target") or {}).get("organization") == org and c.get("id") != entry.get("id")
+    )
+
+
+def _scan_track_count(entry: dict, all_entries: list[dict]) -> int:
+    track = entry.get("track", "")
+    return sum(
+        1 for e in all_entries
+        if e.get("track") == track and e.get("status") in SUBMITTED_STATUSES and e.get("id") != entry.get("id")
+    )
+
+
+def test_counts_match_per_entry_scans():
+    entries = _random_entries(300)
+    context = ScoringContext(entries)
+    for entry in entries:
+        org = (entry.get("target") or {}).get("organization", "")
+        if org:
+            assert context.org_count(org, entry.get("id")) == _scan_org_count(entry, entries)
+        assert context.submitted_in_track(entry.get("track", ""), entry.get("id")) == _scan_track_count(entry, entries)
+
+
+def test_duplicate_ids_are_all_excluded():
+    entries = [
+        {"id": "dup", "track": "job", "status": "submitted", "target": {"organization": "Acme"}},
+        {"id": "dup", "track": "job", "status": "submitted", "target": {"organization": "Acme"}},
+        {"id": "other", "track": "job", "status": "submitted", "target": {"organization": "Acme"}},
+    ]
+    context = ScoringContext(entries)
+    assert context.org_count("Acme", "dup") == 1
+    assert context.submitted_in_track("job", "dup") == 1
+    assert context.org_count("Acme", "new") == 3
+
+
+def test_of_passes_contexts_through():
+    context = ScoringContext([])
+    assert ScoringContext.of(context) is context
+    assert ScoringContext.of(None) is None
+    wrapped = ScoringContext.of([{"id": "a"}])
+    assert isinstance(wrapped, ScoringContext) and len(wrapped) == 1
+    assert not context
+
+
+def test_signals_identical_with_list_or_context(monkeypatch):
+    monkeypatch.setenv("PIPELINE_METRICS_SOURCE", "fallback")
+    entries = _random_entries(60, seed=3)
+    context = ScoringContext(entries)
+    for entry in entries:
+        assert score_network_proximity(entry, context) == score_network_proximity(entry, entries)
+        assert _tr_track_experience(entry, context) == _tr_track_experience(entry, entries)
+    for entry in entries[:5]:
+        assert compute_dimensions(entry, context) == compute_dimensions(entry, entries)
@@ -5,11 +5,24 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
 
 import score_network
 
 
+@pytest.fixture
+def write_network(tmp_path, monkeypatch):
+    """Point network_graph at a temp graph file; returns save_network."""
+    import network_graph
+    monkeypatch.setattr(network_graph, "NETWORK_FILE", tmp_path / "network.yaml")
+    monkeypatch.setattr(network_graph, "PROXIMITY_CACHE_PATH", tmp_path / "network-proximity.json")
+    network_graph._PROXIMITY_MEMO.clear()
+    yield network_graph.save_network
+    network_graph._PROXIMITY_MEMO.clear()
+
+
 def test_days_since_missing():
     assert score_network._days_since(None) is None
 
@@ -67,7 +80,7 @@ def test_score_from_graph_empty_network():
             assert result == 1
 
 
-def test_score_from_graph_with_mocked_network():
+def test_score_from_graph_with_mocked_network(write_network):
     """Graph with a direct connection should boost score."""
     mock_network = {
         "nodes": [
@@ -81,12 +94,10 @@ def test_score_from_graph_with_mocked_network():
     }
     with patch.dict(os.environ, {}, clear=False):
         os.environ.pop("PIPELINE_METRICS_SOURCE", None)
-
-        import network_graph
-        with patch.object(network_graph, "load_network", return_value=mock_network):
-            result = score_network._score_from_graph({"target": {"organization": "TargetCo"}})
-            # 1-hop direct connection should score >= 7
-            assert result >= 7
+        write_network(mock_network)
+        result = score_network._score_from_graph({"target": {"organization": "TargetCo"}})
+        # 1-hop direct connection should score >= 7
+        assert result >= 7
 
 
 def test_score_from_graph_import_failure():
@@ -98,7 +109,7 @@ def test_score_from_graph_import_failure():
             assert result == 1
 
 
-def test_score_network_max_of_entry_and_graph():
+def test_score_network_max_of_entry_and_graph(write_network):
     """Final score should be max(entry_score, graph_score)."""
     # Entry with cold network (score 1 from entry signals)
     entry = {
@@ -121,11 +132,10 @@ def test_score_network_max_of_entry_and_graph():
     }
     with patch.dict(os.environ, {}, clear=False):
         os.environ.pop("PIPELINE_METRICS_SOURCE", None)
-        import network_graph
-        with patch.object(network_graph, "load_network", return_value=mock_network):
-            score = score_network.score_network_proximity(entry)
-            # Entry signals = 1 (cold), graph = ~8 (1-hop). max() should pick graph.
-            assert score >= 7
+        write_network(mock_network)
+        score = score_network.score_network_proximity(entry)
+        # Entry signals = 1 (cold), graph = ~8 (1-hop). max() should pick graph.
+        assert score >= 7
 
 
 def test_score_bounded_1_10():
@@ -0,0 +1,64 @@
+"""Tests for scripts/score_parallel.py."""
+
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import score_parallel
+from score import _score_one
+from score_context import ScoringContext
+from score_parallel import resolve_jobs, score_entries
+
+ORGS = ["Anthropic", "Acme", "Globex", None]
+TRACKS = ["job", "grant", "residency", None]
+STATUSES = ["research", "qualified", "submitted", "interview", "closed"]
+
+
+def _random_entries(n: int, seed: int = 11) -> list[dict]:
+    rng = random.Random(seed)
+    entries = []
+    for i in range(n):
+        entry = {"id": f"e{i}", "status": rng.choice(STATUSES), "deadline": {"type": "rolling"}}
+        org = rng.choice(ORGS)
+        if org is not None:
+            entry["target"] = {"organization": org, "portal": rng.choice(["greenhouse", "email", "custom"])}
+        track = rng.choice(TRACKS)
+        if track is not None:
+            entry["track"] = track
+        entries.append(entry)
+    return entries
+
+
+def _index_of(entry: dict, context: ScoringContext) -> tuple[dict[str, int], float]:
+    return {"index": int(entry["id"][1:])}, float(len(context))
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) >= 1
+
+
+def test_parallel_matches_serial():
+    entries = _random_entries(24)
+    context = ScoringContext(entries)
+    serial = score_entries(entries, context, _score_one, jobs=1)
+    assert score_entries(entries, context, _score_one, jobs=3) == serial
+    assert serial == [_score_one(entry, context) for entry in entries]
+
+
+def test_results_keep_input_order():
+    entries = _random_entries(37)
+    results = score_entries(entries, ScoringContext(entries), _index_of, jobs=4)
+    assert [dims["index"] for dims, _ in results] == list(range(37))
+    assert {composite for _, composite in results} == {37.0}
+
+
+def test_single_job_stays_in_process(monkeypatch):
+    monkeypatch.setattr(score_parallel, "warm_shared_context", lambda: (_ for _ in ()).throw(AssertionError))
+    entries = _random_entries(3)
+    assert len(score_entries(entries, ScoringContext(entries), _index_of, jobs=1)) == 3
+    assert score_entries([], ScoringContext([]), _index_of, jobs=4) == []
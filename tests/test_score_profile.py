@@ -0,0 +1,66 @@
+"""Tests for scripts/score_profile.py."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import score
+import score_human_dimensions
+import score_profile
+from score import _score_one
+from score_context import ScoringContext
+from score_parallel import score_entries
+from score_profile import DimensionProfiler, _percentile
+
+ENTRIES = [
+    {"id": f"e{i}", "track": "job" if i % 2 else "grant", "target": {"organization": "Acme"}}
+    for i in range(6)
+]
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert _percentile(values, 50) == 50
+    assert _percentile(values, 95) == 95
+    assert _percentile([7], 95) == 7
+
+
+def test_instruments_and_restores():
+    original = score.score_deadline_feasibility
+    signal = score_human_dimensions._tr_track_experience
+    context = ScoringContext(ENTRIES)
+    with DimensionProfiler() as profiler:
+        assert score_profile.current() is profiler
+        assert score.score_deadline_feasibility.__wrapped__ is original
+        profiled = [_score_one(entry, context) for entry in ENTRIES]
+    assert score_profile.current() is None
+    assert score.score_deadline_feasibility is original
+    assert score_human_dimensions._tr_track_experience is signal
+    assert profiled == [_score_one(entry, context) for entry in ENTRIES]
+
+    report = profiler.summary()
+    assert report["deadline_feasibility"]["calls"] == len(ENTRIES)
+    assert report["track_record_fit.track_experience"]["calls"] == len(ENTRIES)
+    row = report["human_dimensions"]
+    assert row["p50_ms"] <= row["p95_ms"]
+    assert "human_dimensions" in profiler.format()
+
+
+def test_worker_samples_are_merged():
+    context = ScoringContext(ENTRIES)
+    with DimensionProfiler() as profiler:
+        score_entries(ENTRIES, context, _score_one, jobs=2)
+    assert profiler.summary()["network_proximity"]["calls"] == len(ENTRIES)
+
+
+def test_drain_and_merge():
+    profiler = DimensionProfiler(functions=[("score", "score_portal_friction", "portal_friction")])
+    profiler.samples["portal_friction"].extend([3_000_000, 1_000_000])
+    drained = profiler.drain()
+    assert drained == {"portal_friction": [3_000_000, 1_000_000]}
+    assert profiler.summary() == {}
+    profiler.merge(drained)
+    assert profiler.summary() == {"portal_friction": {"calls": 2, "p50_ms": 1.0, "p95_ms": 3.0, "total_ms": 4.0}}
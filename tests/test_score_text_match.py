@@ -6,15 +6,22 @@
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
 
 import corpus_fingerprint
 import score_text_match
+import text_match
 from score_text_match import (
+    clear_text_match_cache,
     evidence_match_text_signal,
     get_text_match_idf,
     mission_alignment_text_signal,
+    save_text_match_cache,
     score_description_against_corpus,
+    score_descriptions_against_corpus,
+    text_match_result,
     track_record_text_signal,
 )
 
@@ -50,6 +57,106 @@ def test_text_signals_use_result_scores(monkeypatch):
     assert tr_score == 3 and "cosine=0.456" in tr_reason
 
 
+# ---------------------------------------------------------------------------
+# Tests for text_match_result memoization
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def memo_env(tmp_path, monkeypatch):
+    """One entry with research text, a fixed IDF table and a counting analyze_entry."""
+    monkeypatch.setattr(text_match, "WORK_DIR", tmp_path / "work")
+    monkeypatch.setattr(score_text_match, "_TEXT_MATCH_IDF", ({"python": 1.0}, 3))
+    monkeypatch.setattr(score_text_match, "RESULT_CACHE_PATH", tmp_path / "cache" / "text-match.pickle")
+    monkeypatch.delenv("PIPELINE_TEXT_MATCH_CACHE", raising=False)
+    (tmp_path / "work" / "acme-eng").mkdir(parents=True)
+    (tmp_path / "work" / "acme-eng" / "research.md").write_text("Acme builds python tooling.\n")
+    calls = []
+
+    def fake_analyze(entry_id, entry, idf, corpus_size, research_text=None):
+        calls.append(entry_id)
+        return SimpleNamespace(mission_score=7, evidence_score=6, fit_score=5, overall_similarity=0.2)
+
+    monkeypatch.setattr(text_match, "analyze_entry", fake_analyze)
+    clear_text_match_cache()
+    yield SimpleNamespace(work=tmp_path / "work", calls=calls)
+    clear_text_match_cache()
+
+
+def _entry(blocks=None):
+    return {"id": "acme-eng", "submission": {"blocks_used": blocks or {}}}
+
+
+def test_text_signals_share_one_analysis(memo_env):
+    entry = _entry()
+    assert mission_alignment_text_signal(entry)[0] == 7
+    assert evidence_match_text_signal(entry)[0] == 6
+    assert track_record_text_signal(entry)[0] == 5
+    assert memo_env.calls == ["acme-eng"]
+
+
+def test_research_text_read_once_for_all_signals(memo_env, monkeypatch):
+    reads = []
+    real = text_match.research_text_from_file
+
+    def counting(path):
+        reads.append(path)
+        return real(path)
+
+    passed = []
+
+    def fake_analyze(entry_id, entry, idf, corpus_size, research_text=None):
+        passed.append(research_text)
+        return SimpleNamespace(mission_score=7, evidence_score=6, fit_score=5, overall_similarity=0.2)
+
+    monkeypatch.setattr(text_match, "research_text_from_file", counting)
+    monkeypatch.setattr(text_match, "analyze_entry", fake_analyze)
+    entry = _entry()
+    for signal in (mission_alignment_text_signal, evidence_match_text_signal, track_record_text_signal):
+        signal(entry)
+    # One read builds every memo key and is handed to analyze_entry.
+    assert len(reads) == 1
+    assert passed == ["Acme builds python tooling."]
+
+
+def test_research_text_change_recomputes(memo_env):
+    text_match_result(_entry())
+    (memo_env.work / "acme-eng" / "research.md").write_text("Acme pivoted to rust.\n")
+    text_match_result(_entry())
+    assert len(memo_env.calls) == 2
+
+
+def test_blocks_used_change_recomputes(memo_env):
+    text_match_result(_entry())
+    text_match_result(_entry({"framing": "framings/systems"}))
+    text_match_result(_entry({"framing": "framings/systems"}))
+    assert len(memo_env.calls) == 2
+
+
+def test_idf_change_recomputes(memo_env, monkeypatch):
+    text_match_result(_entry())
+    monkeypatch.setattr(score_text_match, "_TEXT_MATCH_IDF", ({"python": 2.0}, 4))
+    text_match_result(_entry())
+    assert len(memo_env.calls) == 2
+
+
+def test_results_persist_across_runs_when_enabled(memo_env, monkeypatch):
+    monkeypatch.setenv("PIPELINE_TEXT_MATCH_CACHE", "1")
+    text_match_result(_entry())
+    save_text_match_cache()
+    assert score_text_match.RESULT_CACHE_PATH.exists()
+
+    clear_text_match_cache()  # simulate a fresh process
+    assert text_match_result(_entry()).mission_score == 7
+    assert memo_env.calls == ["acme-eng"]
+
+
+def test_results_not_persisted_by_default(memo_env):
+    text_match_result(_entry())
+    save_text_match_cache()
+    assert not score_text_match.RESULT_CACHE_PATH.exists()
+
+
 # ---------------------------------------------------------------------------
 # Tests for score_description_against_corpus
 # ---------------------------------------------------------------------------
@@ -118,3 +225,60 @@ def test_score_description_against_corpus_too_short():
     """Very short description (< 50 chars) returns neutral defaults."""
     result = score_description_against_corpus("Engineer wanted.")
     assert result == {"mission_alignment": 5, "evidence_match": 5, "track_record_fit": 4}
+
+
+def test_score_descriptions_against_corpus_matches_single_calls(tmp_path, monkeypatch):
+    """Batch results equal per-description calls, including neutral short ones."""
+    _setup_corpus_tmp(tmp_path, monkeypatch)
+    long_match = (
+        "We are looking for an AI systems engineer to build agentic workflows "
+        "and LLM orchestration pipelines using Python, with governance frameworks "
+        "for distributed teams and structured reasoning at scale."
+    )
+    long_other = (
+        "We are hiring a chef to prepare artisanal bread and pastries in our downtown bakery. "
+        "Experience with sourdough fermentation and wood-fired ovens is required daily."
+    )
+    descriptions = [long_match, "Engineer wanted.", long_other, ""]
+    batch = score_descriptions_against_corpus(descriptions)
+    assert batch == [score_description_against_corpus(d) for d in descriptions]
+    assert batch[1] == {"mission_alignment": 5, "evidence_match": 5, "track_record_fit": 4}
+
+
+def test_score_entries_primes_corpus_scores_in_one_batch(tmp_path, monkeypatch):
+    """A scoring run batch-scores auto-sourced descriptions once; per-entry calls reuse them."""
+    import score_parallel
+
+    _setup_corpus_tmp(tmp_path, monkeypatch)
+    monkeypatch.setattr(score_text_match, "_PRIMED", None)
+    long_match = (
+        "We are looking for an AI systems engineer to build agentic workflows "
+        "and LLM orchestration pipelines using Python, with governance frameworks "
+        "for distributed teams and structured reasoning at scale across the company."
+    )
+    long_other = long_match.replace("Python", "Rust") + " Remote within the US."
+    entries = [
+        {"id": "a", "tags": ["auto-sourced"], "target": {"description": long_match}},
+        {"id": "b", "tags": ["auto-sourced"], "target": {"description": long_other}},
+        {"id": "c", "tags": [], "target": {"description": long_match}},
+    ]
+    expected = [score_description_against_corpus(e["target"]["description"]) for e in entries]
+
+    batches = []
+    real = corpus_fingerprint.CorpusFingerprint.score_descriptions
+    monkeypatch.setattr(
+        corpus_fingerprint.CorpusFingerprint, "score_descriptions",
+        lambda self, descriptions: batches.append(len(descriptions)) or real(self, descriptions),
+    )
+
+    def score_fn(entry, context):
+        return score_description_against_corpus(entry["target"]["description"]), 0.0
+
+    results = score_parallel.score_entries(entries, None, score_fn, jobs=1)
+    assert [dims for dims, _ in results] == expected
+    assert batches == [2]
+
+    # A rebuilt fingerprint invalidates the primed scores.
+    corpus_fingerprint._cached_fingerprint = None
+    score_description_against_corpus(long_match)
+    assert batches == [2, 1]
@@ -19,6 +19,7 @@
     fetch_lever_jobs,
     filter_by_freshness,
     filter_by_title,
+    write_pipeline_entry,
 )
 
 # --- _slugify ---
@@ -201,7 +202,7 @@ def test_greenhouse_description_fetched(monkeypatch):
 
     call_count = {"n": 0}
 
-    def fake_http_get(url: str) -> bytes:
+    def fake_http_get(url: str, ttl: float | None = None) -> bytes:
         call_count["n"] += 1
         if "/jobs/111" in url and url.endswith("/111"):
             return detail_payload
@@ -231,7 +232,7 @@ def test_greenhouse_description_only_for_filtered(monkeypatch):
 
     detail_calls = []
 
-    def fake_http_get(url: str) -> bytes:
+    def fake_http_get(url: str, ttl: float | None = None) -> bytes:
         if url.endswith("/1") or url.endswith("/2"):
             detail_calls.append(url)
             return json.dumps({"content": "<p>desc</p>"}).encode()
@@ -257,7 +258,7 @@ def test_greenhouse_failed_detail_gives_empty_description(monkeypatch):
          "location": {"name": "Remote"}, "updated_at": "2026-03-14T00:00:00Z"},
     ])
 
-    def fake_http_get(url: str) -> bytes:
+    def fake_http_get(url: str, ttl: float | None = None) -> bytes:
         if url.endswith("/999"):
             raise HTTPError(url, 404, "Not Found", {}, None)
         return list_payload
@@ -292,7 +293,7 @@ def test_lever_description_from_plain(monkeypatch):
         }
     ]).encode()
 
-    monkeypatch.setattr("source_jobs._http_get", lambda url: payload)
+    monkeypatch.setattr("source_jobs._http_get", lambda url, ttl=None: payload)
 
     jobs = fetch_lever_jobs("testco")
     assert len(jobs) == 1
@@ -313,7 +314,7 @@ def test_lever_description_falls_back_to_html(monkeypatch):
         }
     ]).encode()
 
-    monkeypatch.setattr("source_jobs._http_get", lambda url: payload)
+    monkeypatch.setattr("source_jobs._http_get", lambda url, ttl=None: payload)
 
     jobs = fetch_lever_jobs("testco")
     assert len(jobs) == 1
@@ -333,7 +334,7 @@ def test_lever_description_empty_when_missing(monkeypatch):
         }
     ]).encode()
 
-    monkeypatch.setattr("source_jobs._http_get", lambda url: payload)
+    monkeypatch.setattr("source_jobs._http_get", lambda url, ttl=None: payload)
 
     jobs = fetch_lever_jobs("testco")
     assert len(jobs) == 1
@@ -357,7 +358,7 @@ def test_ashby_description_from_html(monkeypatch):
         ]
     }).encode()
 
-    monkeypatch.setattr("source_jobs._http_get", lambda url: payload)
+    monkeypatch.setattr("source_jobs._http_get", lambda url, ttl=None: payload)
 
     jobs = fetch_ashby_jobs("testco")
     assert len(jobs) == 1
@@ -377,7 +378,7 @@ def test_ashby_description_empty_when_missing(monkeypatch):
         ]
     }).encode()
 
-    monkeypatch.setattr("source_jobs._http_get", lambda url: payload)
+    monkeypatch.setattr("source_jobs._http_get", lambda url, ttl=None: payload)
 
     jobs = fetch_ashby_jobs("testco")
     assert len(jobs) == 1
@@ -433,7 +434,7 @@ def test_greenhouse_uses_first_published(monkeypatch):
     ])
     detail_payload = _make_greenhouse_detail_response("<p>desc</p>")
 
-    def fake_http_get(url: str) -> bytes:
+    def fake_http_get(url: str, ttl: float | None = None) -> bytes:
         if "/jobs/42" in url and url.endswith("/42"):
             return detail_payload
         return list_payload
@@ -454,7 +455,7 @@ def test_greenhouse_falls_back_to_updated_at(monkeypatch):
     ])
     detail_payload = _make_greenhouse_detail_response("<p>desc</p>")
 
-    def fake_http_get(url: str) -> bytes:
+    def fake_http_get(url: str, ttl: float | None = None) -> bytes:
         if "/jobs/43" in url and url.endswith("/43"):
             return detail_payload
         return list_payload
@@ -475,7 +476,7 @@ def test_ashby_uses_published_at(monkeypatch):
          "descriptionHtml": "<p>desc</p>"},
     ]}).encode()
 
-    monkeypatch.setattr("source_jobs._http_get", lambda url: payload)
+    monkeypatch.setattr("source_jobs._http_get", lambda url, ttl=None: payload)
     jobs = fetch_ashby_jobs("testco")
     assert len(jobs) == 1
     assert jobs[0]["posting_date"] == "2026-02-10", f"Expected publishedAt date, got {jobs[0]['posting_date']}"
@@ -529,3 +530,29 @@ def test_date_source_persisted_in_pipeline_entry():
     }
     _, entry = create_pipeline_entry(job)
     assert entry["timeline"]["date_source"] == "first_published"
+
+
+def test_write_pipeline_entry_is_atomic_and_noted(tmp_path, monkeypatch):
+    """Sourced entries go through atomic_write, so the entry index sees them."""
+    import pipeline_index
+    import source_jobs
+    import yaml
+
+    written = []
+    monkeypatch.setattr(source_jobs, "PIPELINE_DIR_RESEARCH_POOL", tmp_path)
+    monkeypatch.setattr(pipeline_index, "note_write", written.append)
+    job = {
+        "title": "Platform Engineer",
+        "id": "321",
+        "url": "https://example.com/apply3",
+        "location": "Remote",
+        "company": "testco",
+        "company_display": "TestCo",
+        "portal": "greenhouse",
+        "company_url": "https://boards.greenhouse.io/testco",
+    }
+    entry_id, entry = create_pipeline_entry(job)
+    path = write_pipeline_entry(entry_id, entry)
+    assert written == [path]
+    assert yaml.safe_load(path.read_text())["id"] == entry_id
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
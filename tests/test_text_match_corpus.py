@@ -0,0 +1,105 @@
+"""Tests for scripts/text_match_corpus.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import text_match
+from text_match import build_corpus, get_idf, load_corpus_cache
+from text_match_corpus import CorpusIndex
+
+DOCS = {
+    "acme-eng": "Python platform engineer for kubernetes and terraform.",
+    "beta-data": "Data engineer: python, spark and terraform pipelines.",
+    "gamma-web": "Frontend engineer with react and typescript.",
+    "delta-sre": "SRE running kubernetes clusters and observability.\n\n## Custom Questions\nWhy python?",
+}
+
+
+def _write(work: Path, name: str, text: str, age_s: int = 60) -> None:
+    path = work / name / "research.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - age_s * 1_000_000_000))
+
+
+@pytest.fixture
+def work(tmp_path, monkeypatch):
+    work = tmp_path / "work"
+    for name, text in DOCS.items():
+        _write(work, name, text)
+    monkeypatch.setattr(text_match, "WORK_DIR", work)
+    monkeypatch.setattr(text_match, "CORPUS_CACHE_PATH", tmp_path / "cache" / "corpus.pickle")
+    return work
+
+
+def _reads(monkeypatch) -> list[str]:
+    reads = []
+    real = text_match.research_text_from_file
+    monkeypatch.setattr(text_match, "research_text_from_file", lambda p: reads.append(p.parent.name) or real(p))
+    return reads
+
+
+def test_idf_matches_full_rebuild(work):
+    idf, _, size = build_corpus()
+    assert get_idf() == (idf, size)
+
+
+def test_changes_update_incrementally(work, monkeypatch):
+    get_idf()
+    _write(work, "beta-data", "Data engineer: rust and kafka pipelines.", age_s=30)
+    _write(work, "eps-ml", "ML engineer training python models on kubernetes.")
+    (work / "gamma-web" / "research.md").unlink()
+    reads = _reads(monkeypatch)
+
+    index = text_match.load_corpus_index()
+    assert sorted(reads) == ["beta-data", "eps-ml"]
+    assert (index.idf(), index.corpus_size) == build_corpus()[::2]
+
+
+def test_unchanged_corpus_reads_nothing(work, monkeypatch):
+    get_idf()
+    reads = _reads(monkeypatch)
+    assert get_idf()[1] == 4
+    assert reads == []
+
+
+def test_load_corpus_cache_requires_a_cache(work):
+    assert load_corpus_cache() is None
+    get_idf()
+    assert load_corpus_cache() == get_idf()
+
+
+def test_load_corpus_cache_is_read_only(work, monkeypatch):
+    get_idf()
+    stored = text_match.CORPUS_CACHE_PATH.read_bytes()
+    _write(work, "eps-ml", "ML engineer training python models.")
+    reads = _reads(monkeypatch)
+    assert load_corpus_cache()[1] == 4
+    assert reads == []
+    assert text_match.CORPUS_CACHE_PATH.read_bytes() == stored
+
+
+def test_stats_report_staleness(work):
+    get_idf()
+    index = CorpusIndex.load(text_match.CORPUS_CACHE_PATH)
+    _write(work, "eps-ml", "ML engineer training python models.")
+    stats = index.stats(work)
+    assert stats["documents"] == 4
+    assert stats["vocabulary"] >= stats["idf_terms"] > 0
+    assert stats["bytes"] > 0
+    assert (stats["pending_added"], stats["pending_changed"], stats["pending_removed"]) == (1, 0, 0)
+
+
+def test_corrupt_cache_is_rebuilt(work):
+    text_match.CORPUS_CACHE_PATH.parent.mkdir(parents=True)
+    text_match.CORPUS_CACHE_PATH.write_bytes(b"not a pickle")
+    assert CorpusIndex.load(text_match.CORPUS_CACHE_PATH) is None
+    assert get_idf()[1] == 4
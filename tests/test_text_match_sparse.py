@@ -0,0 +1,142 @@
+"""Tests for scripts/text_match_sparse.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import text_match
+import text_match_sparse
+import text_match_vectors
+from text_match import analyze_entries, analyze_entry, compute_idf, cosine_similarity, tfidf_vector, tokenize
+from text_match_sparse import VocabularyIndex, backend_name, cosine_matrix, rowwise_cosine, sparse_available
+from text_match_vectors import reset_vector_store
+
+TEXTS = [
+    "Python platform engineer for kubernetes and terraform.",
+    "Data engineer: python, spark and terraform pipelines.",
+    "Frontend engineer with react and typescript.",
+    "SRE running kubernetes clusters and observability.",
+    "Rust compilers.",
+]
+
+
+def _vectors():
+    docs = [tokenize(t) for t in TEXTS]
+    idf = compute_idf(docs)
+    return [tfidf_vector(doc, idf) for doc in docs], idf
+
+
+@pytest.fixture
+def stdlib(monkeypatch):
+    monkeypatch.setenv("PIPELINE_TEXT_MATCH_BACKEND", "stdlib")
+
+
+@pytest.fixture
+def sparse_backend(monkeypatch):
+    # CI's sparse job sets PIPELINE_REQUIRE_SPARSE=1 so these fail, not skip.
+    if os.environ.get("PIPELINE_REQUIRE_SPARSE") != "1":
+        pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+    monkeypatch.delenv("PIPELINE_TEXT_MATCH_BACKEND", raising=False)
+    assert sparse_available()
+
+
+def test_env_forces_stdlib(stdlib):
+    assert not sparse_available()
+    assert backend_name() == "stdlib"
+
+
+def test_vocabulary_keeps_first_seen_order():
+    vocab = VocabularyIndex.of([{"b": 1.0, "a": 1.0}], [{"a": 2.0, "c": 1.0}])
+    assert vocab.columns == {"b": 0, "a": 1, "c": 2}
+    assert len(vocab) == 3
+
+
+def test_stdlib_matches_cosine_similarity(stdlib):
+    vectors, _ = _vectors()
+    vectors.append({})
+    assert cosine_matrix(vectors, vectors) == [[cosine_similarity(a, b) for b in vectors] for a in vectors]
+    assert rowwise_cosine(vectors, vectors[::-1]) == [cosine_similarity(a, b) for a, b in zip(vectors, vectors[::-1])]
+
+
+def test_empty_inputs():
+    assert cosine_matrix([], [{"a": 1.0}]) == []
+    assert cosine_matrix([{"a": 1.0}], []) == [[]]
+    assert rowwise_cosine([], []) == []
+    with pytest.raises(ValueError):
+        rowwise_cosine([{"a": 1.0}], [])
+
+
+def test_sparse_matches_stdlib(sparse_backend, monkeypatch):
+    vectors, idf = _vectors()
+    vectors.append({})
+    vocab = VocabularyIndex(idf)
+    fast_matrix = cosine_matrix(vectors, vectors, vocab)
+    fast_rows = rowwise_cosine(vectors, vectors[::-1], vocab)
+    monkeypatch.setattr(text_match_sparse, "sparse_available", lambda: False)
+    slow_matrix = cosine_matrix(vectors, vectors)
+    slow_rows = rowwise_cosine(vectors, vectors[::-1])
+    for fast, slow in zip(fast_matrix, slow_matrix):
+        assert fast == pytest.approx(slow, abs=1e-9)
+    assert fast_rows == pytest.approx(slow_rows, abs=1e-9)
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    blocks = tmp_path / "blocks"
+    work = tmp_path / "work"
+    (blocks / "identity").mkdir(parents=True)
+    (blocks / "identity" / "core.md").write_text("Systems engineer building python tooling and kubernetes platforms.\n")
+    (blocks / "identity" / "web.md").write_text("Frontend work in react, typescript and design systems.\n")
+    for name, text in zip(("acme-eng", "beta-data", "gamma-web"), TEXTS):
+        (work / name).mkdir(parents=True)
+        (work / name / "research.md").write_text(text + " Observability and terraform matter.\n")
+    monkeypatch.setattr(text_match_vectors, "BLOCKS_DIR", blocks)
+    monkeypatch.setattr(text_match_vectors, "PROFILES_DIR", tmp_path / "profiles")
+    monkeypatch.setattr(text_match_vectors, "VECTOR_STORE_PATH", tmp_path / "cache" / "vectors.pickle")
+    monkeypatch.setattr(text_match, "WORK_DIR", work)
+    reset_vector_store()
+    yield
+    reset_vector_store()
+
+
+ENTRIES = [
+    {"id": "acme-eng", "submission": {"blocks_used": {"identity": "identity/core"}}},
+    {"id": ""},
+    {"id": "missing"},
+    {"id": "beta-data", "submission": {"blocks_used": {"identity": "identity/core", "alt": "identity/web"}}},
+    {"id": "gamma-web", "submission": {"blocks_used": {"identity": "identity/web"}}},
+]
+
+
+def test_analyze_entries_aligns_with_entries(tree, stdlib):
+    _, idf = _vectors()
+    results = analyze_entries(ENTRIES, idf, len(TEXTS))
+    assert [r.entry_id if r else None for r in results] == ["acme-eng", None, None, "beta-data", "gamma-web"]
+    assert results[3] == analyze_entry("beta-data", ENTRIES[3], idf, len(TEXTS))
+
+
+def test_analyze_entries_sparse_parity(tree, sparse_backend):
+    _, idf = _vectors()
+    fast = analyze_entries(ENTRIES, idf, len(TEXTS))
+    for entry, result in zip(ENTRIES, fast):
+        slow = analyze_entry(entry["id"], entry, idf, len(TEXTS)) if entry["id"] else None
+        if slow is None:
+            assert result is None
+            continue
+        assert result.overall_similarity == pytest.approx(slow.overall_similarity, abs=1e-4)
+        assert (result.mission_score, result.evidence_score, result.fit_score) == (
+            slow.mission_score,
+            slow.evidence_score,
+            slow.fit_score,
+        )
+        assert result.per_block_similarity.keys() == slow.per_block_similarity.keys()
+        for path, sim in slow.per_block_similarity.items():
+            assert result.per_block_similarity[path] == pytest.approx(sim, abs=1e-4)
+        assert result.gap_terms == slow.gap_terms
@@ -0,0 +1,145 @@
+"""Tests for scripts/text_match_vectors.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import text_match
+import text_match_vectors
+from text_match import (
+    analyze_entry,
+    assemble_candidate_content,
+    compute_idf,
+    cosine_similarity,
+    tfidf_from_counts,
+    tfidf_vector,
+    tokenize,
+)
+from text_match_vectors import CandidateVectorStore, ContentPart, get_vector_store, join_counts, reset_vector_store
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """Blocks, a profile and research text in tmp_path, with a fresh store."""
+    blocks = tmp_path / "blocks"
+    profiles = tmp_path / "profiles"
+    work = tmp_path / "work"
+    for d in (blocks / "identity", blocks / "evidence", profiles, work / "acme-eng"):
+        d.mkdir(parents=True)
+    (blocks / "identity" / "core.md").write_text(
+        "---\ntitle: Core\n---\nSystems engineer building **python** tooling and kubernetes platforms.\n"
+    )
+    (blocks / "evidence" / "metrics.md").write_text("Cut deploy latency with terraform and kubernetes pipelines.\n")
+    (profiles / "acme-eng.json").write_text(
+        '{"artist_statement_short": "Python platforms for research teams.",'
+        ' "evidence_highlights": ["Scaled kubernetes clusters", "terraform modules"],'
+        ' "work_samples": [{"description": "Observability pipeline in python"}]}'
+    )
+    (work / "acme-eng" / "research.md").write_text(
+        "Acme needs a python engineer for kubernetes, terraform and observability platforms.\n"
+    )
+    for path in [*blocks.rglob("*.md"), profiles / "acme-eng.json"]:
+        _age(path)
+    monkeypatch.setattr(text_match_vectors, "BLOCKS_DIR", blocks)
+    monkeypatch.setattr(text_match_vectors, "PROFILES_DIR", profiles)
+    monkeypatch.setattr(text_match_vectors, "VECTOR_STORE_PATH", tmp_path / "cache" / "vectors.pickle")
+    monkeypatch.setattr(text_match, "WORK_DIR", work)
+    reset_vector_store()
+    yield tmp_path
+    reset_vector_store()
+
+
+ENTRY = {
+    "id": "acme-eng",
+    "submission": {"blocks_used": {"identity": "identity/core", "evidence": "evidence/metrics"}},
+}
+
+
+def _idf():
+    docs = [
+        tokenize("python kubernetes terraform platforms"),
+        tokenize("python observability pipelines"),
+        tokenize("react frontend design"),
+        tokenize("kubernetes terraform deploy latency"),
+    ]
+    return compute_idf(docs)
+
+
+def test_summed_counts_match_tokenizing_the_join():
+    parts = [ContentPart("Python **tooling** for kubernetes."), ContentPart("Kubernetes <b>terraform</b> python")]
+    idf = _idf()
+    expected = tfidf_vector(tokenize(" ".join(p.text for p in parts)), idf)
+    counts, total = join_counts(parts)
+    assert tfidf_from_counts(counts, total, idf) == expected
+    assert list(tfidf_from_counts(counts, total, idf)) == list(expected)
+
+
+@pytest.mark.parametrize("first", ["see <a href", "a *starred", "[link text", "[text](http://x"])
+def test_open_tail_falls_back_to_joined_text(first):
+    parts = [ContentPart(first), ContentPart("closing> python* kubernetes] done)")]
+    assert parts[0].open_tail
+    tokens = tokenize(" ".join(p.text for p in parts))
+    assert join_counts(parts) == (dict(Counter(tokens)), len(tokens))
+
+
+def test_assemble_reads_parts_in_original_order(tree):
+    assert assemble_candidate_content(ENTRY, "mission") == (
+        "Systems engineer building **python** tooling and kubernetes platforms. "
+        "Python platforms for research teams."
+    )
+    assert assemble_candidate_content(ENTRY, "fit") == (
+        "Scaled kubernetes clusters terraform modules Observability pipeline in python"
+    )
+
+
+def test_analyze_entry_reuses_store_across_entries(tree):
+    idf = _idf()
+    first = analyze_entry("acme-eng", ENTRY, idf, 4)
+    store = get_vector_store()
+    misses = store.misses
+    second = analyze_entry("acme-eng", ENTRY, idf, 4)
+    assert store.misses == misses
+    assert second == first
+    assert first.per_block_similarity["identity/core"] == round(
+        cosine_similarity(
+            tfidf_vector(tokenize(text_match.load_research_text("acme-eng")), idf),
+            tfidf_vector(tokenize("Systems engineer building **python** tooling and kubernetes platforms."), idf),
+        ),
+        4,
+    )
+
+
+def test_store_persists_and_invalidates_by_mtime(tree):
+    store = get_vector_store()
+    store.block("identity/core")
+    store.save()
+
+    reopened = CandidateVectorStore(store.path)
+    assert reopened.block("identity/core").total > 0
+    assert (reopened.hits, reopened.misses) == (1, 0)
+
+    block = tree / "blocks" / "identity" / "core.md"
+    block.write_text("Rust compilers.\n")
+    _age(block, 30)
+    assert reopened.block("identity/core").text == "Rust compilers."
+    assert reopened.misses == 1
+
+
+def test_missing_sources_are_skipped(tree):
+    store = get_vector_store()
+    assert store.block("identity/missing") is None
+    assert store.block("../outside") is None
+    assert store.profile("nobody") == {}
+    assert len(store) == 0